@@ -15,14 +15,10 @@ __version__ = '1.0.0'
 
 
 import os
+import sys
 if 'DISPLAY' not in os.environ:
-    try:
-        import matplotlib
-    except ImportError:
-        import warnings
-        warnings.warn('matplotlib not found', ImportWarning)
-    else:
-        matplotlib.use('Agg')
+    # Use the Agg backend, without importing matplotlib until it is needed.
+    os.environ.setdefault('MPLBACKEND', 'Agg')
 
 from .core.model_parameter_dictionary import ModelParameterDictionary
 from .core.model_parameter_dictionary import (MissingKeyError,
@@ -34,11 +30,52 @@ from .framework.decorators import Implements, ImplementsOrRaise
 from .framework.framework import Framework
 from .field.scalar_data_fields import FieldError
 from .grid import *
-from .plot import *
 
-from .testing.nosetester import LandlabTester
-test = LandlabTester().test
-bench = LandlabTester().bench
+
+# Attributes that are imported the first time they are used, rather than
+# with landlab, so that landlab can be imported without matplotlib or nose.
+_LAZY_ATTRIBUTES = {
+    'imshow_grid': 'landlab.plot',
+    'imshow_node_grid': 'landlab.plot',
+    'imshow_cell_grid': 'landlab.plot',
+    'imshow_grid_at_node': 'landlab.plot',
+    'LandlabTester': 'landlab.testing.nosetester',
+}
+_LAZY_SUBMODULES = ('io', 'plot')
+
+
+def __getattr__(name):
+    """Import lazy attributes on first access."""
+    import importlib
+
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    try:
+        module = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            'module {module!r} has no attribute {name!r}'.format(
+                module=__name__, name=name))
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):
+    # Modules can only define __getattr__ from Python 3.7.
+    for _name in _LAZY_SUBMODULES + tuple(_LAZY_ATTRIBUTES):
+        __getattr__(_name)
+
+
+def test(**kwds):
+    """Run the landlab tests (see LandlabTester.test)."""
+    return __getattr__('LandlabTester')(sys.modules[__name__]).test(**kwds)
+
+
+def bench(**kwds):
+    """Run the landlab benchmarks (see LandlabTester.bench)."""
+    return __getattr__('LandlabTester')(sys.modules[__name__]).bench(**kwds)
+
 
 __all__ = ['ModelParameterDictionary', 'MissingKeyError',
            'ParameterValueError', 'Component', 'Palette', 'Arena',
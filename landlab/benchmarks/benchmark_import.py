@@ -0,0 +1,31 @@
+"""Benchmark the time to import landlab.
+
+Each import is timed in a new Python process, as it is by a batch job or
+a worker of a parameter sweep, so nothing is already imported or cached
+in memory.
+"""
+import subprocess
+import sys
+
+
+def _time_import(statement='import landlab'):
+    script = '; '.join(['import time', 'start = time.time()', statement,
+                        'print(time.time() - start)'])
+    return float(subprocess.check_output([sys.executable, '-c', script]))
+
+
+def bench_import_landlab():
+    _time_import('import landlab')
+
+
+def bench_import_raster_model_grid():
+    _time_import('from landlab import RasterModelGrid')
+
+
+if __name__ == '__main__':
+    for statement in ('import numpy', 'import landlab',
+                      'from landlab import RasterModelGrid',
+                      'from landlab import imshow_grid'):
+        times = sorted(_time_import(statement) for _ in range(7))
+        print('{statement}: {t:.3f} s (median of 7)'.format(
+            statement=statement, t=times[3]))
@@ -0,0 +1,53 @@
+"""Benchmark the CellLab-CTS event queues over a fixed run length.
+
+Runs the same grain-hopping model on a RasterCTS with the compiled indexed
+priority queue (the default) and with the heap of Event objects, on lattices
+of about 10 thousand and 1 million links.
+"""
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.ca.celllab_cts import Transition
+from landlab.ca.raster_cts import RasterCTS
+
+
+def _make_model(shape, queue_type='indexed'):
+    grid = RasterModelGrid(shape)
+    node_state = np.random.RandomState(0).randint(0, 2, grid.number_of_nodes)
+    transitions = [Transition((1, 0, 0), (0, 1, 0), 1.0, 'hop right', True),
+                   Transition((0, 1, 0), (1, 0, 0), 1.0, 'hop left', True)]
+    return RasterCTS(grid, {0: 'empty', 1: 'grain'}, transitions, node_state,
+                     queue_type=queue_type)
+
+
+def _run(ca, run_length=1.0):
+    ca.run(ca.current_time + run_length)
+
+
+def bench_heap_10k_links():
+    _run(_make_model((72, 72), queue_type='heap'), run_length=10.0)
+
+
+def bench_indexed_10k_links():
+    _run(_make_model((72, 72), queue_type='indexed'), run_length=10.0)
+
+
+def bench_heap_1m_links():
+    _run(_make_model((708, 708), queue_type='heap'))
+
+
+def bench_indexed_1m_links():
+    _run(_make_model((708, 708), queue_type='indexed'))
+
+
+if __name__ == '__main__':
+    import time
+
+    for shape, run_length, label in (((72, 72), 10.0, '10k'),
+                                     ((708, 708), 1.0, '1m')):
+        for queue_type in ('heap', 'indexed'):
+            ca = _make_model(shape, queue_type=queue_type)
+            start = time.time()
+            _run(ca, run_length=run_length)
+            print('{label} links, {queue}: {t:.3f} s'.format(
+                label=label, queue=queue_type, t=time.time() - start))
@@ -83,19 +83,28 @@ node_pair : list (x number of possible link states)
     you to look up the node states and orientation corresponding to a
     particular link-state ID.
 
-event_queue : heap of Event objects
+event_queue : PriorityQueue, or heap of Event objects
     Queue containing all future transition events, sorted by time of occurrence
-    (from soonest to latest).
+    (from soonest to latest). By default (``queue_type='indexed'``) this is a
+    compiled, indexed priority queue with one slot per link: when a link is
+    rescheduled its entry is updated in place, so the queue only ever holds
+    valid events. With ``queue_type='heap'`` it is a heap of Event objects.
 
 next_update : 1d array (x number of active links)
     Time (in the future) at which the link will undergo its next transition.
-    You might notice that the update time for every scheduled transition is
-    also stored in each Event object in the event queue. Why store it twice?
-    Because a scheduled event might be invalidated after the event has been
-    scheduled (because another transition has changed one of a link's two
-    nodes, for example). The way to tell whether a scheduled event is still
-    valid is to compare its time with the corresponding transition time in the
-    *next_update* array. If they are different, the event is discarded.
+    For the heap of Event objects, you might notice that the update time for
+    every scheduled transition is also stored in each Event object in the
+    event queue. Why store it twice? Because a scheduled event might be
+    invalidated after the event has been scheduled (because another transition
+    has changed one of a link's two nodes, for example). The way to tell
+    whether a scheduled event is still valid is to compare its time with the
+    corresponding transition time in the *next_update* array. If they are
+    different, the event is discarded.
+
+next_trn_id : 1d array of ints (x number of active links)
+    Used with the indexed queue only: for each link, the index (into the
+    link-state's row of *xn_to*, *xn_rate*, etc.) of the next scheduled
+    transition, or -1 if none is scheduled.
 
 link_orientation : 1d array of ints (x number of active links)
     Orientation code for each link.
@@ -133,6 +142,10 @@ _USE_CYTHON = True
 
 if _USE_CYTHON:
     from .cfuncs import do_transition, update_link_states_and_transitions
+    from .cfuncs import (PriorityQueue, ExponentialDraws,
+                         push_transitions_to_priority_queue,
+                         update_link_states_in_priority_queue,
+                         run_priority_queue)
 
 _NEVER = 1e50
 
@@ -370,11 +383,21 @@ class CellLabCTSModel(object):
     prop_reset_value : number or object, optional
         Default or initial value for a node/cell property (e.g., 0.0).
         Must be same type as *prop_data*.
+    seed : int, optional
+        Seed for random number generation.
+    queue_type : {'indexed', 'heap'}, optional
+        Event queue to use: a compiled priority queue indexed by link
+        ('indexed'), or a heap of Event objects ('heap'). With the indexed
+        queue, run() carries out transitions in compiled code, calling back
+        into Python only for property-update functions. For a given seed
+        both give the same sequence of transitions, provided nothing else
+        draws from numpy's random number generator in the meantime (the
+        indexed queue draws its random waiting times in blocks).
     """
 
     def __init__(self, model_grid, node_state_dict, transition_list,
                  initial_node_states, prop_data=None, prop_reset_value=None,
-                 seed=0):
+                 seed=0, queue_type='indexed'):
         """Initialize the CA model.
 
         Parameters
@@ -395,7 +418,13 @@ class CellLabCTSModel(object):
             Must be same type as *prop_data*.
         seed : int, optional
             Seed for random number generation.
+        queue_type : {'indexed', 'heap'}, optional
+            Event queue to use: a compiled priority queue indexed by link
+            ('indexed'), or a heap of Event objects ('heap').
         """
+        if queue_type not in ('indexed', 'heap'):
+            raise ValueError("queue_type must be 'indexed' or 'heap'")
+
         # Are we calling this from a subclass __init__? If so, then the
         # variable self.number_of_orientations should already be defined.
         try:
@@ -476,7 +505,14 @@ class CellLabCTSModel(object):
             last_type = this_type
 
         # Create priority queue for events and next_update array for links
-        self.event_queue = []
+        self._use_priority_queue = _USE_CYTHON and queue_type == 'indexed'
+        if self._use_priority_queue:
+            self.event_queue = PriorityQueue(self.grid.number_of_links)
+            self._random_times = ExponentialDraws()
+            self.next_trn_id = np.full(self.grid.number_of_links, -1,
+                                       dtype=int)
+        else:
+            self.event_queue = []
         self.next_update = self.grid.add_zeros('link', 'next_update_time')
 
         # Assign link types from node types
@@ -741,7 +777,15 @@ class CellLabCTSModel(object):
                     change the link state to be correct
                     schedule an event
         """
-        if _USE_CYTHON:
+        if self._use_priority_queue:
+            update_link_states_in_priority_queue(
+                self.grid.active_links, self.node_state,
+                self.grid.node_at_link_tail, self.grid.node_at_link_head,
+                self.link_orientation, self.bnd_lnk.view(np.uint8),
+                self.link_state, self.n_xn, self.xn_rate, self.next_update,
+                self.next_trn_id, self.event_queue, self._random_times,
+                self.num_node_states, self.num_node_states_sq, current_time)
+        elif _USE_CYTHON:
             update_link_states_and_transitions(self.grid.active_links,
                                                self.node_state, 
                                                self.grid.node_at_link_tail,
@@ -848,6 +892,13 @@ class CellLabCTSModel(object):
             print(('push_transitions_to_event_queue():',
                    self.num_link_states, self.n_xn))
 
+        if self._use_priority_queue:
+            push_transitions_to_priority_queue(
+                self.grid.active_links, self.link_state, self.n_xn,
+                self.xn_rate, self.next_update, self.next_trn_id,
+                self.event_queue, self._random_times, 0.0)
+            return
+
         for i in self.grid.active_links:
             # for i in range(self.grid.number_of_active_links):
 
@@ -926,13 +977,42 @@ class CellLabCTSModel(object):
                 fns * self.num_node_states + tns
 
         self.link_state[link] = new_link_state
-        if self.n_xn[new_link_state] > 0:
+        if self._use_priority_queue:
+            self._schedule_in_priority_queue(link, new_link_state,
+                                             current_time)
+        elif self.n_xn[new_link_state] > 0:
             event = self.get_next_event(link, new_link_state, current_time)
             heappush(self.event_queue, event)
             self.next_update[link] = event.time
         else:
             self.next_update[link] = _NEVER
 
+    def _schedule_in_priority_queue(self, link, current_state, current_time):
+        """Choose the next transition at a link and put it on the queue.
+
+        The indexed-queue counterpart of get_next_event: the link's entry in
+        the queue is replaced (or removed, if there are no transitions out of
+        *current_state*), and *next_update* and *next_trn_id* are updated to
+        match.
+        """
+        n_xn = self.n_xn[current_state]
+        if n_xn == 0:
+            self.next_update[link] = _NEVER
+            self.next_trn_id[link] = -1
+            self.event_queue.remove(link)
+            return
+
+        next_time = _NEVER
+        for i in range(n_xn):
+            this_next = self._random_times.next_time(
+                self.xn_rate[current_state][i])
+            if this_next < next_time:
+                next_time = this_next
+                self.next_trn_id[link] = i
+
+        self.next_update[link] = next_time + current_time
+        self.event_queue.push(link, self.next_update[link])
+
     def do_transition(self, event, current_time, plot_each_transition=False,
                       plotter=None):
         """Transition state.
@@ -1125,6 +1205,10 @@ class CellLabCTSModel(object):
         """
         if node_state_grid is not None:
             self.set_node_state_grid(node_state_grid)
+
+        if self._use_priority_queue:
+            self._run_priority_queue(run_to, plot_each_transition, plotter)
+            return
        
         # Continue until we've run out of either time or events
         while self.current_time < run_to and self.event_queue:
@@ -1171,6 +1255,30 @@ class CellLabCTSModel(object):
             else:
                 self.current_time = run_to
 
+    def _run_priority_queue(self, run_to, plot_each_transition=False,
+                            plotter=None):
+        """Run the model forward, taking events from the indexed queue.
+
+        The whole event loop runs in compiled code; Python is re-entered
+        only to call property-update functions, and to update the plot if
+        *plot_each_transition* is True.
+        """
+        if not (plot_each_transition and plotter is not None):
+            plotter = None
+
+        self.current_time = run_priority_queue(
+            run_to, self.current_time, self.next_update, self.next_trn_id,
+            self.grid.node_at_link_tail, self.grid.node_at_link_head,
+            self.node_state, self.link_state, self.san,
+            self.link_orientation, self.propid, self.prop_data, self.n_xn,
+            self.xn_to, self.xn_rate, self.grid.links_at_node,
+            self.grid.active_link_dirs_at_node, self.num_node_states,
+            self.num_node_states_sq, self.prop_reset_value,
+            self.xn_propswap.view(np.uint8),
+            np.not_equal(self.xn_prop_update_fn, None).view(np.uint8),
+            self.xn_prop_update_fn, self.bnd_lnk.view(np.uint8),
+            self.event_queue, self._random_times, self, plotter)
+
 
 if __name__ == "__main__":
     import doctest
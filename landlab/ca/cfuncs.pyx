@@ -502,3 +502,532 @@ def do_transition(event,
                 event.prop_update_fn(
                     this_cts_model, tail_node, head_node, event.time)
 
+
+
+cdef class PriorityQueue:
+    """Indexed priority queue of link transition times.
+
+    Holds at most one entry for each of a fixed number of items (links),
+    keyed by item ID. The entries are kept in a binary heap that is stored
+    in flat arrays, together with the position of each item in the heap, so
+    that the scheduled time of an item can be changed (or the item removed)
+    in place. This means that no stale entries are ever left on the queue.
+    Ties in priority are broken by item ID.
+
+    Parameters
+    ----------
+    number_of_items : int
+        Number of slots in the queue (for example, the number of links in
+        the grid).
+
+    Examples
+    --------
+    >>> from landlab.ca.cfuncs import PriorityQueue
+    >>> q = PriorityQueue(5)
+    >>> q.push(3, 2.0)
+    >>> q.push(1, 4.0)
+    >>> q.push(4, 3.0)
+    >>> q.push(1, 1.0)
+    >>> len(q)
+    3
+    >>> q.peek()
+    (1, 1.0)
+    >>> q.remove(4)
+    >>> q.pop()
+    (1, 1.0)
+    >>> q.pop()
+    (3, 2.0)
+    >>> len(q)
+    0
+    """
+    cdef DTYPE_t[:] _priority
+    cdef DTYPE_INT_t[:] _heap
+    cdef DTYPE_INT_t[:] _position
+    cdef DTYPE_INT_t _size
+
+    def __init__(self, DTYPE_INT_t number_of_items):
+        self._priority = np.full(number_of_items, _NEVER, dtype=DTYPE)
+        self._heap = np.empty(number_of_items, dtype=DTYPE_INT)
+        self._position = np.full(number_of_items, -1, dtype=DTYPE_INT)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, DTYPE_INT_t item):
+        return self._position[item] >= 0
+
+    @property
+    def number_of_items(self):
+        """Number of slots in the queue."""
+        return self._position.shape[0]
+
+    def push(self, DTYPE_INT_t item, DTYPE_t priority):
+        """Add *item* to the queue, or change its priority if present."""
+        self._update(item, priority)
+
+    def remove(self, DTYPE_INT_t item):
+        """Remove *item* from the queue (if it is in the queue)."""
+        self._remove(item)
+
+    def peek(self):
+        """Return the (item, priority) at the front of the queue."""
+        if self._size == 0:
+            raise IndexError('peek into empty queue')
+        return self._heap[0], self._priority[self._heap[0]]
+
+    def pop(self):
+        """Remove and return the (item, priority) at the front of the queue."""
+        cdef DTYPE_INT_t item
+        if self._size == 0:
+            raise IndexError('pop from empty queue')
+        item = self._pop()
+        return item, self._priority[item]
+
+    def priority_of(self, DTYPE_INT_t item):
+        """Priority of *item*, or _NEVER if it is not in the queue."""
+        if self._position[item] < 0:
+            return _NEVER
+        return self._priority[item]
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef inline bint _before(self, DTYPE_INT_t a, DTYPE_INT_t b):
+        # Does item a come before item b?
+        return (self._priority[a] < self._priority[b] or
+                (self._priority[a] == self._priority[b] and a < b))
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _sift_up(self, DTYPE_INT_t i):
+        cdef DTYPE_INT_t item = self._heap[i]
+        cdef DTYPE_INT_t parent
+        while i > 0:
+            parent = (i - 1) >> 1
+            if not self._before(item, self._heap[parent]):
+                break
+            self._heap[i] = self._heap[parent]
+            self._position[self._heap[i]] = i
+            i = parent
+        self._heap[i] = item
+        self._position[item] = i
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _sift_down(self, DTYPE_INT_t i):
+        cdef DTYPE_INT_t item = self._heap[i]
+        cdef DTYPE_INT_t child
+        while True:
+            child = 2 * i + 1
+            if child >= self._size:
+                break
+            if (child + 1 < self._size and
+                    self._before(self._heap[child + 1], self._heap[child])):
+                child += 1
+            if not self._before(self._heap[child], item):
+                break
+            self._heap[i] = self._heap[child]
+            self._position[self._heap[i]] = i
+            i = child
+        self._heap[i] = item
+        self._position[item] = i
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _update(self, DTYPE_INT_t item, DTYPE_t priority):
+        cdef DTYPE_INT_t i = self._position[item]
+        cdef DTYPE_t old_priority = self._priority[item]
+        self._priority[item] = priority
+        if i < 0:
+            i = self._size
+            self._size += 1
+            self._heap[i] = item
+            self._position[item] = i
+            self._sift_up(i)
+        elif priority < old_priority:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _remove(self, DTYPE_INT_t item):
+        cdef DTYPE_INT_t i = self._position[item]
+        cdef DTYPE_INT_t last
+        if i < 0:
+            return
+        self._size -= 1
+        self._position[item] = -1
+        if i < self._size:
+            last = self._heap[self._size]
+            self._heap[i] = last
+            self._position[last] = i
+            self._sift_up(i)
+            self._sift_down(self._position[last])
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef DTYPE_INT_t _pop(self):
+        cdef DTYPE_INT_t item = self._heap[0]
+        self._remove(item)
+        return item
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef inline DTYPE_t _next_priority(self):
+        if self._size == 0:
+            return _NEVER
+        return self._priority[self._heap[0]]
+
+
+cdef class ExponentialDraws:
+    """Buffered source of exponentially distributed waiting times.
+
+    Draws standard exponential variates from numpy's global random number
+    generator in blocks, so that compiled code can take them one at a time
+    without calling back into Python. Because a block holds exactly the
+    values that successive calls to ``np.random.exponential`` would have
+    returned, a model that takes its waiting times from here reproduces one
+    that calls ``np.random.exponential`` directly (although numpy's
+    generator is advanced by a whole block at a time).
+
+    Parameters
+    ----------
+    block_size : int, optional
+        Number of variates to draw at a time.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.ca.cfuncs import ExponentialDraws
+    >>> np.random.seed(0)
+    >>> expected = [np.random.exponential(1.0 / 4.0) for i in range(5)]
+    >>> np.random.seed(0)
+    >>> draws = ExponentialDraws(block_size=2)
+    >>> [draws.next_time(4.0) for i in range(5)] == expected
+    True
+    """
+    cdef DTYPE_t[:] _buffer
+    cdef DTYPE_INT_t _next
+
+    def __init__(self, DTYPE_INT_t block_size=4096):
+        self._buffer = np.empty(block_size, dtype=DTYPE)
+        self._next = block_size
+
+    def next_time(self, DTYPE_t rate):
+        """Waiting time until an event that occurs at the given rate."""
+        return self._draw(rate)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef inline DTYPE_t _draw(self, DTYPE_t rate) except -1.0:
+        if self._next == self._buffer.shape[0]:
+            self._buffer = np.random.standard_exponential(
+                self._buffer.shape[0])
+            self._next = 0
+        self._next += 1
+        return (1.0 / rate) * self._buffer[self._next - 1]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int _schedule_next_transition(DTYPE_INT_t link,
+                                   DTYPE_INT_t current_state,
+                                   DTYPE_t current_time,
+                                   const DTYPE_INT_t[:] n_xn,
+                                   const DTYPE_t[:, :] xn_rate,
+                                   DTYPE_t[:] next_update,
+                                   DTYPE_INT_t[:] next_trn_id,
+                                   PriorityQueue event_queue,
+                                   ExponentialDraws random_times) except -1:
+    """Choose the next transition at a link and put it on the queue.
+
+    Random transition times are drawn in the same order as in
+    get_next_event, so a run driven by the indexed queue reproduces a run
+    driven by the heap of Event objects.
+    """
+    cdef DTYPE_INT_t i, k
+    cdef double next_time, this_next
+
+    if n_xn[current_state] == 0:
+        next_update[link] = _NEVER
+        next_trn_id[link] = -1
+        event_queue._remove(link)
+        return 0
+
+    if n_xn[current_state] == 1:
+        k = 0
+        next_time = random_times._draw(xn_rate[current_state, 0])
+    else:
+        k = 0
+        next_time = _NEVER
+        for i in range(n_xn[current_state]):
+            this_next = random_times._draw(xn_rate[current_state, i])
+            if this_next < next_time:
+                next_time = this_next
+                k = i
+
+    next_update[link] = next_time + current_time
+    next_trn_id[link] = k
+    event_queue._update(link, next_update[link])
+    return 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int _update_link_state_in_queue(DTYPE_INT_t link,
+                                     DTYPE_INT_t new_link_state,
+                                     DTYPE_t current_time,
+                                     const np.uint8_t[:] bnd_lnk,
+                                     DTYPE_INT_t[:] node_state,
+                                     const DTYPE_INT_t[:] node_at_link_tail,
+                                     const DTYPE_INT_t[:] node_at_link_head,
+                                     const DTYPE_INT8_t[:] link_orientation,
+                                     DTYPE_INT_t num_node_states,
+                                     DTYPE_INT_t num_node_states_sq,
+                                     DTYPE_INT_t[:] link_state,
+                                     const DTYPE_INT_t[:] n_xn,
+                                     const DTYPE_t[:, :] xn_rate,
+                                     DTYPE_t[:] next_update,
+                                     DTYPE_INT_t[:] next_trn_id,
+                                     PriorityQueue event_queue,
+                                     ExponentialDraws random_times) except -1:
+    """Set the state of a link and reschedule its next transition."""
+    # If the link connects to a boundary, we might have a different state
+    # than the one we planned
+    if bnd_lnk[link]:
+        new_link_state = (
+            link_orientation[link] * num_node_states_sq +
+            node_state[node_at_link_tail[link]] * num_node_states +
+            node_state[node_at_link_head[link]])
+
+    link_state[link] = new_link_state
+    return _schedule_next_transition(link, new_link_state, current_time,
+                                     n_xn, xn_rate, next_update, next_trn_id,
+                                     event_queue, random_times)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def push_transitions_to_priority_queue(const DTYPE_INT_t[:] active_links,
+                                       DTYPE_INT_t[:] link_state,
+                                       const DTYPE_INT_t[:] n_xn,
+                                       const DTYPE_t[:, :] xn_rate,
+                                       DTYPE_t[:] next_update,
+                                       DTYPE_INT_t[:] next_trn_id,
+                                       PriorityQueue event_queue,
+                                       ExponentialDraws random_times,
+                                       DTYPE_t current_time):
+    """Schedule a transition for every active link.
+
+    The indexed-queue counterpart of
+    CellLabCTSModel.push_transitions_to_event_queue: any transition already
+    scheduled at a link is replaced.
+    """
+    cdef DTYPE_INT_t i, link
+
+    for i in range(active_links.shape[0]):
+        link = active_links[i]
+        _schedule_next_transition(link, link_state[link], current_time, n_xn,
+                                  xn_rate, next_update, next_trn_id,
+                                  event_queue, random_times)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def update_link_states_in_priority_queue(
+        const DTYPE_INT_t[:] active_links,
+        DTYPE_INT_t[:] node_state,
+        const DTYPE_INT_t[:] node_at_link_tail,
+        const DTYPE_INT_t[:] node_at_link_head,
+        const DTYPE_INT8_t[:] link_orientation,
+        const np.uint8_t[:] bnd_lnk,
+        DTYPE_INT_t[:] link_state,
+        const DTYPE_INT_t[:] n_xn,
+        const DTYPE_t[:, :] xn_rate,
+        DTYPE_t[:] next_update,
+        DTYPE_INT_t[:] next_trn_id,
+        PriorityQueue event_queue,
+        ExponentialDraws random_times,
+        DTYPE_INT_t num_node_states,
+        DTYPE_INT_t num_node_states_sq,
+        DTYPE_t current_time):
+    """Update link states after an external change to the node states.
+
+    The indexed-queue counterpart of update_link_states_and_transitions.
+    """
+    cdef DTYPE_INT_t i, link, current_state
+
+    for i in range(active_links.shape[0]):
+        link = active_links[i]
+        current_state = (
+            link_orientation[link] * num_node_states_sq +
+            node_state[node_at_link_tail[link]] * num_node_states +
+            node_state[node_at_link_head[link]])
+        if current_state != link_state[link]:
+            _update_link_state_in_queue(link, current_state, current_time,
+                                        bnd_lnk, node_state,
+                                        node_at_link_tail, node_at_link_head,
+                                        link_orientation, num_node_states,
+                                        num_node_states_sq, link_state, n_xn,
+                                        xn_rate, next_update, next_trn_id,
+                                        event_queue, random_times)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def run_priority_queue(DTYPE_t run_to,
+                       DTYPE_t current_time,
+                       DTYPE_t[:] next_update,
+                       DTYPE_INT_t[:] next_trn_id,
+                       const DTYPE_INT_t[:] node_at_link_tail,
+                       const DTYPE_INT_t[:] node_at_link_head,
+                       DTYPE_INT_t[:] node_state,
+                       DTYPE_INT_t[:] link_state,
+                       const DTYPE_INT8_t[:] status_at_node,
+                       const DTYPE_INT8_t[:] link_orientation,
+                       DTYPE_INT_t[:] propid,
+                       prop_data,
+                       const DTYPE_INT_t[:] n_xn,
+                       const DTYPE_INT_t[:, :] xn_to,
+                       const DTYPE_t[:, :] xn_rate,
+                       const DTYPE_INT_t[:, :] links_at_node,
+                       const DTYPE_INT8_t[:, :] active_link_dirs_at_node,
+                       DTYPE_INT_t num_node_states,
+                       DTYPE_INT_t num_node_states_sq,
+                       prop_reset_value,
+                       const np.uint8_t[:, :] xn_propswap,
+                       const np.uint8_t[:, :] xn_has_callback,
+                       xn_prop_update_fn,
+                       const np.uint8_t[:] bnd_lnk,
+                       PriorityQueue event_queue,
+                       ExponentialDraws random_times,
+                       this_cts_model,
+                       plotter=None):
+    """Run the model forward, taking events from the indexed queue.
+
+    Carries out every transition scheduled up to time *run_to* without
+    returning to Python, other than to call user-supplied property-update
+    functions and, if *plotter* is given, to update the plot after each
+    transition.
+
+    Parameters
+    ----------
+    run_to : float
+        Time to run to.
+    current_time : float
+        Current time in the simulation.
+    xn_propswap : 2d array of uint8
+        Property-swap flag for each link state and transition (a uint8 view
+        of CellLabCTSModel.xn_propswap).
+    xn_has_callback : 2d array of uint8
+        Flag indicating, for each link state and transition, whether there
+        is a property-update function in *xn_prop_update_fn*.
+    plotter : CAPlotter object, optional
+        If given, the plot is updated after each transition.
+
+    Returns
+    -------
+    float
+        The new current time: *run_to*, unless the queue ran out of
+        events first.
+    """
+    cdef DTYPE_INT_t event_link
+    cdef DTYPE_t event_time
+    cdef DTYPE_INT_t tail_node, head_node
+    cdef DTYPE_INT_t old_tail_node_state, old_head_node_state
+    cdef DTYPE_INT_t this_state, k, new_link_state
+    cdef DTYPE_INT_t link, node, tmp, i, j
+
+    # Continue until we've run out of either time or events
+    while current_time < run_to and event_queue._size > 0:
+
+        # Is there an event scheduled to occur within this run? If not,
+        # simply advance current_time to the end of the run period.
+        event_time = event_queue._next_priority()
+        if event_time > run_to:
+            current_time = run_to
+            break
+
+        # If so, take the next transition event off the queue...
+        event_link = event_queue._pop()
+
+        # ... and execute the transition
+        tail_node = node_at_link_tail[event_link]
+        head_node = node_at_link_head[event_link]
+        this_state = link_state[event_link]
+        k = next_trn_id[event_link]
+        new_link_state = xn_to[this_state, k]
+
+        # Remember the previous state of each node so we can detect whether
+        # the state has changed
+        old_tail_node_state = node_state[tail_node]
+        old_head_node_state = node_state[head_node]
+
+        # Change to the new states
+        if status_at_node[tail_node] == _CORE:
+            node_state[tail_node] = ((new_link_state // num_node_states) %
+                                     num_node_states)
+        if status_at_node[head_node] == _CORE:
+            node_state[head_node] = new_link_state % num_node_states
+
+        _update_link_state_in_queue(event_link, new_link_state, event_time,
+                                    bnd_lnk, node_state, node_at_link_tail,
+                                    node_at_link_head, link_orientation,
+                                    num_node_states, num_node_states_sq,
+                                    link_state, n_xn, xn_rate, next_update,
+                                    next_trn_id, event_queue, random_times)
+
+        # Next, when the state of one of the link's nodes changes, we have
+        # to update the states of the OTHER links attached to it. This
+        # could happen to one or both nodes.
+        for j in range(2):
+            if j == 0:
+                node = tail_node
+                if node_state[node] == old_tail_node_state:
+                    continue
+            else:
+                node = head_node
+                if node_state[node] == old_head_node_state:
+                    continue
+
+            for i in range(links_at_node.shape[1]):
+                link = links_at_node[node, i]
+                if (active_link_dirs_at_node[node, i] != 0 and
+                        link != event_link):
+                    new_link_state = (
+                        link_orientation[link] * num_node_states_sq +
+                        node_state[node_at_link_tail[link]] *
+                        num_node_states +
+                        node_state[node_at_link_head[link]])
+                    _update_link_state_in_queue(
+                        link, new_link_state, event_time, bnd_lnk,
+                        node_state, node_at_link_tail, node_at_link_head,
+                        link_orientation, num_node_states,
+                        num_node_states_sq, link_state, n_xn, xn_rate,
+                        next_update, next_trn_id, event_queue, random_times)
+
+        current_time = event_time
+
+        # If requested, display a plot of the grid
+        if plotter is not None:
+            plotter.update_plot()
+
+        # If this event involves an exchange of properties (i.e., the
+        # event involves motion of an object that posses properties we
+        # want to track), implement the swap.
+        #   If the event requires a call to a user-defined callback
+        # function, we handle that here too.
+        if xn_propswap[this_state, k]:
+            tmp = propid[tail_node]
+            propid[tail_node] = propid[head_node]
+            propid[head_node] = tmp
+            if status_at_node[tail_node] != _CORE:
+                prop_data[propid[tail_node]] = prop_reset_value
+            if status_at_node[head_node] != _CORE:
+                prop_data[propid[head_node]] = prop_reset_value
+            if xn_has_callback[this_state, k]:
+                xn_prop_update_fn[this_state, k](this_cts_model, tail_node,
+                                                 head_node, event_time)
+
+    return current_time
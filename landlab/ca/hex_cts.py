@@ -37,6 +37,8 @@ class HexCTS(CellLabCTSModel):
     prop_reset_value : number or object, optional
         Default or initial value for a node/cell property (e.g., 0.0).
         Must be same type as *prop_data*.
+    queue_type : {'indexed', 'heap'}, optional
+        Event queue to use (see CellLabCTSModel).
 
     Examples
     --------
@@ -53,7 +55,8 @@ class HexCTS(CellLabCTSModel):
     """
 
     def __init__(self, model_grid, node_state_dict, transition_list,
-                 initial_node_states, prop_data=None, prop_reset_value=None):
+                 initial_node_states, prop_data=None, prop_reset_value=None,
+                 queue_type='indexed'):
         """
         HexCTS constructor: sets number of orientations to 1 and calls
         base-class constructor.
@@ -74,6 +77,8 @@ class HexCTS(CellLabCTSModel):
         prop_reset_value : number or object, optional
             Default or initial value for a node/cell property (e.g., 0.0).
             Must be same type as *prop_data*.
+        queue_type : {'indexed', 'heap'}, optional
+            Event queue to use (see CellLabCTSModel).
         """
 
         # Make sure caller has sent the right grid type
@@ -88,7 +93,8 @@ class HexCTS(CellLabCTSModel):
         # the initialization
         super(HexCTS, self).__init__(model_grid, node_state_dict,
                                      transition_list, initial_node_states,
-                                     prop_data, prop_reset_value)
+                                     prop_data, prop_reset_value,
+                                     queue_type=queue_type)
 
 
 if __name__ == '__main__':
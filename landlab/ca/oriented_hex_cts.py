@@ -39,6 +39,8 @@ class OrientedHexCTS(CellLabCTSModel):
     prop_reset_value : number or object, optional
         Default or initial value for a node/cell property (e.g., 0.0).
         Must be same type as *prop_data*.
+    queue_type : {'indexed', 'heap'}, optional
+        Event queue to use (see CellLabCTSModel).
 
     Examples
     --------
@@ -55,7 +57,8 @@ class OrientedHexCTS(CellLabCTSModel):
     """
 
     def __init__(self, model_grid, node_state_dict, transition_list,
-                 initial_node_states, prop_data=None, prop_reset_value=None):
+                 initial_node_states, prop_data=None, prop_reset_value=None,
+                 queue_type='indexed'):
         """Initialize a OrientedHexCTS.
 
         OrientedHexCTS constructor: sets number of orientations to 3 and calls
@@ -77,6 +80,8 @@ class OrientedHexCTS(CellLabCTSModel):
         prop_reset_value : number or object, optional
             Default or initial value for a node/cell property (e.g., 0.0).
             Must be same type as *prop_data*.
+        queue_type : {'indexed', 'heap'}, optional
+            Event queue to use (see CellLabCTSModel).
         """
 
         # Make sure caller has sent the right grid type
@@ -97,7 +102,8 @@ class OrientedHexCTS(CellLabCTSModel):
         super(OrientedHexCTS, self).__init__(model_grid, node_state_dict,
                                              transition_list,
                                              initial_node_states, prop_data,
-                                             prop_reset_value)
+                                             prop_reset_value,
+                                             queue_type=queue_type)
 
     def setup_array_of_orientation_codes(self):
         """
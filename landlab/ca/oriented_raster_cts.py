@@ -45,6 +45,8 @@ class OrientedRasterCTS(CellLabCTSModel):
     prop_reset_value : number or object, optional
         Default or initial value for a node/cell property (e.g., 0.0).
         Must be same type as *prop_data*.
+    queue_type : {'indexed', 'heap'}, optional
+        Event queue to use (see CellLabCTSModel).
 
     Examples
     --------
@@ -61,7 +63,8 @@ class OrientedRasterCTS(CellLabCTSModel):
     """
 
     def __init__(self, model_grid, node_state_dict, transition_list,
-                 initial_node_states, prop_data=None, prop_reset_value=None):
+                 initial_node_states, prop_data=None, prop_reset_value=None,
+                 queue_type='indexed'):
         """
         RasterCTS constructor: sets number of orientations to 2 and calls
         base-class constructor.
@@ -82,6 +85,8 @@ class OrientedRasterCTS(CellLabCTSModel):
         prop_reset_value : number or object, optional
             Default or initial value for a node/cell property (e.g., 0.0).
             Must be same type as *prop_data*.
+        queue_type : {'indexed', 'heap'}, optional
+            Event queue to use (see CellLabCTSModel).
         """
 
         if _DEBUG:
@@ -100,7 +105,8 @@ class OrientedRasterCTS(CellLabCTSModel):
         super(OrientedRasterCTS, self).__init__(model_grid, node_state_dict,
                                                 transition_list,
                                                 initial_node_states, prop_data,
-                                                prop_reset_value)
+                                                prop_reset_value,
+                                                queue_type=queue_type)
 
         if _DEBUG:
             print('ORCTS:')
@@ -131,7 +137,7 @@ class OrientedRasterCTS(CellLabCTSModel):
         # resulting array into integer format)
         dy = (self.grid.node_y[self.grid.node_at_link_head] -
               self.grid.node_y[self.grid.node_at_link_tail])
-        self.link_orientation = dy.astype(int)
+        self.link_orientation[:] = dy.astype(np.int8)
 
         if _DEBUG:
             print(self.link_orientation)
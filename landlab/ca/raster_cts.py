@@ -37,6 +37,8 @@ class RasterCTS(CellLabCTSModel):
     prop_reset_value : number or object, optional
         Default or initial value for a node/cell property (e.g., 0.0).
         Must be same type as *prop_data*.
+    queue_type : {'indexed', 'heap'}, optional
+        Event queue to use (see CellLabCTSModel).
 
     Examples
     --------
@@ -52,7 +54,8 @@ class RasterCTS(CellLabCTSModel):
     >>> rcts = RasterCTS(mg, nsd, xnlist, nsg)
     """
     def __init__(self, model_grid, node_state_dict, transition_list,
-                 initial_node_states, prop_data=None, prop_reset_value=None):
+                 initial_node_states, prop_data=None, prop_reset_value=None,
+                 queue_type='indexed'):
         """
         RasterLCA constructor: sets number of orientations to 1 and calls
         base-class constructor.
@@ -73,6 +76,8 @@ class RasterCTS(CellLabCTSModel):
         prop_reset_value : number or object, optional
             Default or initial value for a node/cell property (e.g., 0.0).
             Must be same type as *prop_data*.
+        queue_type : {'indexed', 'heap'}, optional
+            Event queue to use (see CellLabCTSModel).
         """
         # Make sure caller has sent the right grid type
         if not isinstance(model_grid, RasterModelGrid):
@@ -84,8 +89,9 @@ class RasterCTS(CellLabCTSModel):
 
         # Call the LandlabCellularAutomaton.__init__() method to do the rest of
         # the initialization
-        super(RasterCTS, self).__init__(model_grid, node_state_dict,
-            transition_list, initial_node_states, prop_data, prop_reset_value)
+        super(RasterCTS, self).__init__(
+            model_grid, node_state_dict, transition_list, initial_node_states,
+            prop_data, prop_reset_value, queue_type=queue_type)
 
 
 if __name__=='__main__':
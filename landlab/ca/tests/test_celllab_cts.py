@@ -7,10 +7,11 @@ Created on Thu Jul  9 08:20:06 2015
 @author: gtucker
 """
 
-from nose.tools import assert_equal
+import numpy as np
+from nose.tools import assert_equal, assert_true
 from numpy.testing import assert_array_equal
 from landlab import RasterModelGrid, HexModelGrid
-from landlab.ca.celllab_cts import Transition, Event
+from landlab.ca.celllab_cts import Transition, Event, _NEVER
 from landlab.ca.raster_cts import RasterCTS
 from landlab.ca.oriented_raster_cts import OrientedRasterCTS
 from landlab.ca.hex_cts import HexCTS
@@ -81,7 +82,7 @@ def test_raster_cts():
     pd = mg.add_zeros('node', 'property_data', dtype=int)
     pd[5] = 50
     ca = RasterCTS(mg, ns_dict, xn_list, node_state_grid, prop_data=pd,
-                   prop_reset_value=0)
+                   prop_reset_value=0, queue_type='heap')
 
     # Test the data structures
     assert (ca.xn_to.size==4), 'wrong size for xn_to'
@@ -129,6 +130,147 @@ def test_raster_cts():
     #assert (ca.prop_data[ca.propid[6]]==150), 'error in prop swap'
 
 
+def test_raster_cts_indexed_queue():
+    """
+    Tests implementation of one transition, with a callback function, using
+    the indexed event queue.
+    """
+    mg = RasterModelGrid(4, 4, 1.0)
+    mg.set_closed_boundaries_at_grid_edges(True, True, True, True)
+    node_state_grid = mg.add_ones('node', 'node_state_map', dtype=int)
+    node_state_grid[6] = 0
+    ns_dict = {0: 'black', 1: 'white'}
+    xn_list = []
+    xn_list.append(Transition((1, 0, 0), (0, 1, 0), 0.1, '', True,
+                              callback_function))
+    pd = mg.add_zeros('node', 'property_data', dtype=int)
+    pd[5] = 50
+    ca = RasterCTS(mg, ns_dict, xn_list, node_state_grid, prop_data=pd,
+                   prop_reset_value=0)
+
+    # There is one slot per link, and only link 8 has a transition scheduled
+    assert_equal(ca.event_queue.number_of_items, mg.number_of_links)
+    assert_equal(len(ca.event_queue), 1)
+    assert_equal(ca.event_queue.peek()[0], 8)
+    assert_equal(ca.next_trn_id[8], 0)
+
+    # Rescheduling the link replaces its entry rather than adding another
+    ca.event_queue.push(8, 1.0)
+    ca.next_update[8] = 1.0
+    assert_equal(len(ca.event_queue), 1)
+
+    ca.run(2.0)
+
+    assert_equal(ca.current_time, 1.0)
+    assert_equal(ca.node_state[5], 0)
+    assert_equal(ca.node_state[6], 1)
+    assert_equal(ca.prop_data[ca.propid[6]], 50)
+    assert_equal(len(ca.event_queue), 0)
+
+
+def test_update_link_state_with_indexed_queue():
+    """Test update_link_state and do_transition with the default queue."""
+    mg = RasterModelGrid(4, 4, 1.0)
+    mg.set_closed_boundaries_at_grid_edges(True, True, True, True)
+    node_state_grid = mg.add_ones('node', 'node_state_map', dtype=int)
+    node_state_grid[6] = 0
+    ns_dict = {0: 'black', 1: 'white'}
+    xn_list = [Transition((1, 0, 0), (0, 1, 0), 0.1, '', True),
+               Transition((0, 1, 0), (1, 0, 0), 0.1, '', True)]
+    ca = RasterCTS(mg, ns_dict, xn_list, node_state_grid)
+
+    # Links 8 (nodes 5 to 6) and 12 (nodes 6 to 10) have transitions
+    # scheduled
+    assert_equal(len(ca.event_queue), 2)
+
+    # Putting link 8 into a state with no transitions takes it off the queue
+    ca.update_link_state(8, 3, 0.0)
+    assert_equal(ca.link_state[8], 3)
+    assert_equal(ca.next_update[8], _NEVER)
+    assert_equal(ca.next_trn_id[8], -1)
+    assert_true(8 not in ca.event_queue)
+    assert_equal(len(ca.event_queue), 1)
+
+    # ... and putting it back into state 2 gives it a new entry
+    ca.update_link_state(8, 2, 1.0)
+    assert_equal(ca.link_state[8], 2)
+    assert_equal(ca.next_trn_id[8], 0)
+    assert_true(ca.next_update[8] > 1.0)
+    assert_equal(ca.event_queue.priority_of(8), ca.next_update[8])
+    assert_equal(len(ca.event_queue), 2)
+
+    # Nodes 5 and 6 swap states: links 8 and 11 (nodes 5 to 9) are
+    # rescheduled, and link 12, now joining two 1s, is taken off the queue
+    ev = Event(ca.next_update[8], 8, 1, True)
+    ca.do_transition(ev, ev.time)
+    assert_equal(ca.node_state[5], 0)
+    assert_equal(ca.node_state[6], 1)
+    assert_array_equal(ca.link_state[[8, 11, 12]], [1, 1, 3])
+    for link in (8, 11):
+        assert_true(ca.next_update[link] > ev.time)
+        assert_equal(ca.event_queue.priority_of(link), ca.next_update[link])
+    assert_equal(ca.next_update[12], _NEVER)
+    assert_equal(len(ca.event_queue), 2)
+
+
+def test_indexed_queue_matches_heap():
+    """Test that both event queues give the same sequence of transitions."""
+    def make_model(queue_type):
+        mg = RasterModelGrid(10, 12, 1.0)
+        nsg = np.random.RandomState(1).randint(0, 3, mg.number_of_nodes)
+        xn_list = [Transition((1, 0, 0), (0, 1, 0), 1.0, '', True),
+                   Transition((0, 1, 0), (1, 0, 0), 0.5, '', True),
+                   Transition((1, 2, 0), (2, 2, 0), 0.3),
+                   Transition((1, 2, 0), (1, 1, 0), 0.2)]
+        pd = np.arange(mg.number_of_nodes, dtype=float)
+        return RasterCTS(mg, {0: 'a', 1: 'b', 2: 'c'}, xn_list, nsg,
+                         prop_data=pd, prop_reset_value=-1.0,
+                         queue_type=queue_type)
+
+    heap_ca = make_model('heap')
+    heap_ca.run(20.0)
+    indexed_ca = make_model('indexed')
+    indexed_ca.run(20.0)
+
+    assert_equal(indexed_ca.current_time, heap_ca.current_time)
+    assert_array_equal(indexed_ca.node_state, heap_ca.node_state)
+    assert_array_equal(indexed_ca.propid, heap_ca.propid)
+    assert_array_equal(indexed_ca.prop_data, heap_ca.prop_data)
+    assert_array_equal(indexed_ca.next_update, heap_ca.next_update)
+
+
+def test_compiled_run_calls_prop_update_fn():
+    """Test that the compiled run loop calls back into Python correctly."""
+    def make_model(queue_type, calls):
+        def record_call(ca, node1, node2, time_now):
+            calls.append((node1, node2, time_now, ca.node_state[node1],
+                          ca.node_state[node2]))
+
+        mg = HexModelGrid(8, 8, 1.0)
+        nsg = np.random.RandomState(2).randint(0, 2, mg.number_of_nodes)
+        xn_list = [Transition((1, 0, 0), (0, 1, 0), 1.0, '', True,
+                              record_call),
+                   Transition((0, 1, 0), (1, 0, 0), 0.5, '', True)]
+        return HexCTS(mg, {0: 'a', 1: 'b'}, xn_list, nsg,
+                      queue_type=queue_type)
+
+    # Both models draw from numpy's global random number generator, so run
+    # one after the other.
+    heap_calls = []
+    heap_ca = make_model('heap', heap_calls)
+    for run_to in (0.5, 2.0, 10.0):
+        heap_ca.run(run_to)
+    indexed_calls = []
+    indexed_ca = make_model('indexed', indexed_calls)
+    for run_to in (0.5, 2.0, 10.0):
+        indexed_ca.run(run_to)
+    assert_equal(indexed_ca.current_time, 10.0)
+
+    assert_equal(len(indexed_calls), len(heap_calls))
+    assert_equal(indexed_calls, heap_calls)
+    assert_array_equal(indexed_ca.node_state, heap_ca.node_state)
+
+
 def test_oriented_raster_cts():
     """Tests instantiation of an OrientedRasterCTS() object"""
     mg = RasterModelGrid(3, 3, 1.0)
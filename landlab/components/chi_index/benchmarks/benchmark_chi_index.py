@@ -0,0 +1,85 @@
+"""Benchmark calculating chi and normalized steepness indices.
+
+Calculates chi with *ChiFinder* (with mean and true node spacing) and the
+steepness index with *SteepnessFinder* on an eroded raster landscape, and
+chi for several reference concavities, both with
+*calculate_chi_for_concavities* and with a call to *calculate_chi* for
+each. Run as a script, the landscape is 1,000 by 1,000 nodes, or the
+number of rows and columns given as an argument.
+"""
+import sys
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import (FlowRouter, FastscapeEroder, ChiFinder,
+                                SteepnessFinder)
+
+
+_CONCAVITIES = np.linspace(0.3, 0.7, 9)
+
+
+def _make_landscape(shape=(200, 200)):
+    grid = RasterModelGrid(shape, 100.)
+    z = grid.add_zeros('node', 'topographic__elevation')
+    z[grid.core_nodes] = np.random.RandomState(0).rand(
+        grid.number_of_core_nodes)
+    fr = FlowRouter(grid)
+    sp = FastscapeEroder(grid, K_sp=1.e-4)
+    for _ in range(5):
+        z[grid.core_nodes] += 1.
+        fr.route_flow()
+        sp.run_one_step(1000.)
+    fr.route_flow()
+    return grid
+
+
+def bench_chi():
+    ChiFinder(_make_landscape(), min_drainage_area=1.e4).calculate_chi()
+
+
+def bench_chi_with_true_dx():
+    ChiFinder(_make_landscape(), min_drainage_area=1.e4,
+              use_true_dx=True).calculate_chi()
+
+
+def bench_chi_for_concavities():
+    ChiFinder(_make_landscape(), min_drainage_area=1.e4,
+              ).calculate_chi_for_concavities(_CONCAVITIES)
+
+
+def bench_steepness():
+    SteepnessFinder(_make_landscape(),
+                    min_drainage_area=1.e4).calculate_steepnesses()
+
+
+if __name__ == '__main__':
+    import time
+
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    grid = _make_landscape((n_rows, n_rows))
+
+    for use_true_dx in (False, True):
+        cf = ChiFinder(grid, min_drainage_area=1.e4, use_true_dx=use_true_dx)
+        start = time.time()
+        cf.calculate_chi()
+        print('calculate_chi, use_true_dx={dx}: {t:.3f} s'.format(
+            dx=use_true_dx, t=time.time() - start))
+
+        start = time.time()
+        for concavity in _CONCAVITIES:
+            cf.calculate_chi(reference_concavity=concavity)
+        print('calculate_chi for {n} concavities, one at a time: '
+              '{t:.3f} s'.format(n=len(_CONCAVITIES), t=time.time() - start))
+
+        start = time.time()
+        cf.calculate_chi_for_concavities(_CONCAVITIES)
+        print('calculate_chi_for_concavities, {n} concavities: '
+              '{t:.3f} s'.format(n=len(_CONCAVITIES), t=time.time() - start))
+        grid.delete_field('node', 'channel__chi_index')
+
+    sf = SteepnessFinder(grid, min_drainage_area=1.e4)
+    start = time.time()
+    with np.errstate(divide='ignore'):
+        sf.calculate_steepnesses()
+    print('calculate_steepnesses: {t:.3f} s'.format(t=time.time() - start))
@@ -0,0 +1,103 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+
+
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
+
+DTYPE_INT = np.int
+ctypedef np.int_t DTYPE_INT_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _integrate_chi_avg_dx(const DTYPE_INT_t[:] upstr_order,
+                          const DTYPE_FLOAT_t[:, :] integrand,
+                          const DTYPE_INT_t[:] receivers,
+                          DTYPE_FLOAT_t[:, :] chi):
+    """Sum the chi integrand downstream to upstream, for each concavity.
+
+    Parameters
+    ----------
+    upstr_order : ndarray of int, shape (n_channel_nodes, )
+        Nodes of the channel network in upstream order.
+    integrand : ndarray of float, shape (n_channel_nodes, n_concavities)
+        The value (A0/A)**concavity, in upstream order.
+    receivers : ndarray of int, shape (n_nodes, )
+        Receiver node of each node.
+    chi : ndarray of float, shape (n_nodes, n_concavities)
+        Chi at each node. Values at nodes of the channel network are
+        overwritten.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.chi_index.cfuncs import _integrate_chi_avg_dx
+    >>> chi = np.zeros((4, 2))
+    >>> _integrate_chi_avg_dx(np.array([0, 1, 2, 3]),
+    ...                       np.array([[1., 2.], [1., 2.], [1., 2.],
+    ...                                 [1., 2.]]),
+    ...                       np.array([0, 0, 1, 1]), chi)
+    >>> chi.tolist()
+    [[1.0, 2.0], [2.0, 4.0], [3.0, 6.0], [3.0, 6.0]]
+    """
+    cdef long n_nodes = upstr_order.shape[0]
+    cdef long n_concavities = chi.shape[1]
+    cdef long i, k
+    cdef long node, receiver
+
+    with nogil:
+        for i in range(n_nodes):
+            node = upstr_order[i]
+            receiver = receivers[node]
+            for k in range(n_concavities):
+                chi[node, k] = chi[receiver, k] + integrand[i, k]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _integrate_chi_each_dx(const DTYPE_INT_t[:] upstr_order,
+                           const DTYPE_FLOAT_t[:, :] half_integrand,
+                           const DTYPE_INT_t[:] receivers,
+                           const DTYPE_INT_t[:] links,
+                           const DTYPE_FLOAT_t[:] link_lengths,
+                           DTYPE_INT_t bad_index,
+                           DTYPE_FLOAT_t[:, :] chi):
+    """Integrate chi along each link with the trapezium rule.
+
+    Parameters
+    ----------
+    upstr_order : ndarray of int, shape (n_channel_nodes, )
+        Nodes of the channel network in upstream order.
+    half_integrand : ndarray of float, shape (n_nodes, n_concavities)
+        Half the value of (A0/A)**concavity, in node order.
+    receivers : ndarray of int, shape (n_nodes, )
+        Receiver node of each node.
+    links : ndarray of int, shape (n_nodes, )
+        Link to the receiver of each node.
+    link_lengths : ndarray of float
+        Length of each link, including diagonals.
+    bad_index : int
+        Value of *links* at nodes without a receiver. Chi is not changed
+        at these nodes.
+    chi : ndarray of float, shape (n_nodes, n_concavities)
+        Chi at each node.
+    """
+    cdef long n_nodes = upstr_order.shape[0]
+    cdef long n_concavities = chi.shape[1]
+    cdef long i, k
+    cdef long node, receiver, link
+    cdef double length
+
+    with nogil:
+        for i in range(n_nodes):
+            node = upstr_order[i]
+            link = links[node]
+            if link != bad_index:
+                receiver = receivers[node]
+                length = link_lengths[link]
+                for k in range(n_concavities):
+                    chi[node, k] = chi[receiver, k] + (
+                        half_integrand[node, k] +
+                        half_integrand[receiver, k]) * length
@@ -10,10 +10,8 @@ from six.moves import range  # this is Python 3's generator, not P2's list
 from landlab import ModelParameterDictionary, Component, FieldError, \
                     FIXED_VALUE_BOUNDARY, BAD_INDEX_VALUE, CLOSED_BOUNDARY
 import numpy as np
-try:
-    from itertools import izip
-except ImportError:
-    izip = zip
+
+from .cfuncs import _integrate_chi_avg_dx, _integrate_chi_each_dx
 
 
 class ChiFinder(Component):
@@ -189,8 +187,97 @@ class ChiFinder(Component):
         """
         self._mask.fill(True)
         self.chi.fill(0.)
-        # test for new kwds:
         reftheta = kwds.get('reference_concavity', self._reftheta)
+        (valid_upstr_order, valid_upstr_areas, A0,
+         use_true_dx) = self._channel_nodes_and_areas(**kwds)
+        if not use_true_dx:
+            chi_integrand = (A0/valid_upstr_areas)**reftheta
+            mean_dx = self.mean_channel_node_spacing(valid_upstr_order)
+            self.integrate_chi_avg_dx(valid_upstr_order, chi_integrand,
+                                      self.chi, mean_dx)
+        else:
+            chi_integrand = self.grid.zeros('node')
+            chi_integrand[valid_upstr_order] = (A0/valid_upstr_areas)**reftheta
+            self.integrate_chi_each_dx(valid_upstr_order, chi_integrand,
+                                       self.chi)
+        # stamp over the closed nodes, as it's possible they can receive infs
+        # if min_drainage_area < grid.cell_area_at_node
+        self.chi[self.grid.status_at_node == CLOSED_BOUNDARY] = 0.
+        self._mask[valid_upstr_order] = False
+
+    def calculate_chi_for_concavities(self, reference_concavities, **kwds):
+        """Calculate chi for each of several reference concavities.
+
+        Chi is integrated for all the concavities in a single pass over the
+        channel network, which is much quicker than calling
+        :func:`calculate_chi` once for each. Each column of the returned
+        array is identical to the chi that :func:`calculate_chi` would give
+        with that concavity. The *channel__chi_index* field is not changed,
+        but the mask retrieved with :func:`hillslope_mask` is updated.
+
+        This method can take the same parameters (other than
+        *reference_concavity*) as provided at instantiation, which override
+        the existing values.
+
+        Parameters
+        ----------
+        reference_concavities : array_like of float
+            The reference concavities to use in the calculation.
+
+        Returns
+        -------
+        ndarray of float, shape (n_nodes, n_concavities)
+            Chi at each node, for each concavity.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab import RasterModelGrid, CLOSED_BOUNDARY
+        >>> from landlab.components import FlowRouter
+        >>> mg = RasterModelGrid((3, 5), 1.)
+        >>> for nodes in (mg.nodes_at_right_edge, mg.nodes_at_bottom_edge,
+        ...               mg.nodes_at_top_edge):
+        ...     mg.status_at_node[nodes] = CLOSED_BOUNDARY
+        >>> _ = mg.add_field('node', 'topographic__elevation', mg.node_x)
+        >>> fr = FlowRouter(mg)
+        >>> _ = fr.route_flow()
+        >>> cf = ChiFinder(mg, min_drainage_area=1., reference_area=3.)
+        >>> chi = cf.calculate_chi_for_concavities([0., 1.])
+        >>> chi[mg.core_nodes]
+        array([[ 2. ,  2. ],
+               [ 3. ,  3.5],
+               [ 4. ,  6.5]])
+        >>> cf.calculate_chi(reference_concavity=1.)
+        >>> cf.chi_indices[mg.core_nodes]
+        array([ 2. ,  3.5,  6.5])
+        """
+        self._mask.fill(True)
+        reftheta = np.array(reference_concavities, dtype=float, ndmin=1)
+        (valid_upstr_order, valid_upstr_areas, A0,
+         use_true_dx) = self._channel_nodes_and_areas(**kwds)
+        chi = np.zeros((self.grid.number_of_nodes, reftheta.size))
+        if not use_true_dx:
+            chi_integrand = np.empty((valid_upstr_order.size, reftheta.size))
+            for (k, theta) in enumerate(reftheta):
+                chi_integrand[:, k] = (A0/valid_upstr_areas)**theta
+            _integrate_chi_avg_dx(
+                valid_upstr_order.astype(np.int, copy=False), chi_integrand,
+                self._receivers(), chi)
+            chi *= self.mean_channel_node_spacing(valid_upstr_order)
+        else:
+            half_integrand = np.zeros_like(chi)
+            for (k, theta) in enumerate(reftheta):
+                half_integrand[valid_upstr_order, k] = (
+                    A0/valid_upstr_areas)**theta
+            half_integrand *= 0.5
+            self._integrate_each_dx(valid_upstr_order, half_integrand, chi)
+        chi[self.grid.status_at_node == CLOSED_BOUNDARY] = 0.
+        self._mask[valid_upstr_order] = False
+        return chi
+
+    def _channel_nodes_and_areas(self, **kwds):
+        """Get channel nodes in upstream order, and the parameters for chi.
+        """
         min_drainage = kwds.get('min_drainage_area', self.min_drainage)
         A0 = kwds.get('reference_area', self._A0)
         if A0 is None:
@@ -207,28 +294,27 @@ class ChiFinder(Component):
             upstr_order] >= min_drainage]
         valid_upstr_areas = self.grid.at_node['drainage_area'][
             valid_upstr_order]
-        if not use_true_dx:
-            chi_integrand = (A0/valid_upstr_areas)**reftheta
-            mean_dx = self.mean_channel_node_spacing(valid_upstr_order)
-            self.integrate_chi_avg_dx(valid_upstr_order, chi_integrand,
-                                      self.chi, mean_dx)
-        else:
-            chi_integrand = self.grid.zeros('node')
-            chi_integrand[valid_upstr_order] = (A0/valid_upstr_areas)**reftheta
-            self.integrate_chi_each_dx(valid_upstr_order, chi_integrand,
-                                       self.chi)
-        # stamp over the closed nodes, as it's possible they can receive infs
-        # if min_drainage_area < grid.cell_area_at_node
-        self.chi[self.grid.status_at_node == CLOSED_BOUNDARY] = 0.
-        self._mask[valid_upstr_order] = False
+        return valid_upstr_order, valid_upstr_areas, A0, use_true_dx
+
+    def _receivers(self):
+        return self.grid.at_node['flow__receiver_node'].astype(np.int,
+                                                               copy=False)
+
+    def _integrate_each_dx(self, valid_upstr_order, half_integrand, chi):
+        _integrate_chi_each_dx(
+            np.asarray(valid_upstr_order, dtype=np.int), half_integrand,
+            self._receivers(),
+            self.grid.at_node['flow__link_to_receiver_node'].astype(
+                np.int, copy=False),
+            self.grid._length_of_link_with_diagonals, BAD_INDEX_VALUE, chi)
 
     def integrate_chi_avg_dx(self, valid_upstr_order, chi_integrand,
                              chi_array, mean_dx):
         """
         Calculates chi at each channel node by summing chi_integrand.
 
-        This method assumes a uniform, mean spacing between nodes. Method is
-        deliberately split out for potential cythonization at a later stage.
+        This method assumes a uniform, mean spacing between nodes. The sum
+        is done in a single compiled pass over the channel nodes.
 
         Parameters
         ----------
@@ -267,12 +353,12 @@ class ChiFinder(Component):
                [ 1.5,  3. ,  4.5,  0. ],
                [ 0. ,  0. ,  0. ,  0. ]])
         """
-        receivers = self.grid.at_node['flow__receiver_node']
         # because chi_array is all zeros, BC cases where node is receiver
         # resolve themselves
-        for (node, integrand) in izip(valid_upstr_order, chi_integrand):
-            dstr_node = receivers[node]
-            chi_array[node] = chi_array[dstr_node] + integrand
+        _integrate_chi_avg_dx(
+            np.asarray(valid_upstr_order, dtype=np.int),
+            np.asarray(chi_integrand, dtype=float)[:, np.newaxis],
+            self._receivers(), chi_array[:, np.newaxis])
         chi_array *= mean_dx
 
     def integrate_chi_each_dx(self, valid_upstr_order, chi_integrand_at_nodes,
@@ -280,9 +366,9 @@ class ChiFinder(Component):
         """
         Calculates chi at each channel node by summing chi_integrand*dx.
 
-        This method accounts explicitly for spacing between each node. Method
-        is deliberately split out for potential cythonization at a later
-        stage. Uses a trapezium integration method.
+        This method accounts explicitly for spacing between each node, and
+        is done in a single compiled pass over the channel nodes. Uses a
+        trapezium integration method.
 
         Parameters
         ----------
@@ -352,22 +438,12 @@ class ChiFinder(Component):
                [   0. ,  100. ,  200.        ,  300.        ,    0. ],
                [   0. ,    0. ,    0.        ,    0.        ,    0. ]])
         """
-        receivers = self.grid.at_node['flow__receiver_node']
-        links = self.grid.at_node['flow__link_to_receiver_node']
-        link_lengths = self.grid._length_of_link_with_diagonals
         # because chi_array is all zeros, BC cases where node is receiver
         # resolve themselves
-        half_integrand = 0.5 * chi_integrand_at_nodes
-        for node in valid_upstr_order:
-            dstr_node = receivers[node]
-            dstr_link = links[node]
-            if dstr_link != BAD_INDEX_VALUE:
-                dstr_length = link_lengths[dstr_link]
-                half_head_val = half_integrand[node]
-                half_tail_val = half_integrand[dstr_node]
-                mean_val = half_head_val + half_tail_val
-                chi_to_add = mean_val * dstr_length
-                chi_array[node] = chi_array[dstr_node] + chi_to_add
+        half_integrand = 0.5 * np.asarray(chi_integrand_at_nodes, dtype=float)
+        self._integrate_each_dx(valid_upstr_order,
+                                half_integrand[:, np.newaxis],
+                                chi_array[:, np.newaxis])
 
     def mean_channel_node_spacing(self, ch_nodes):
         """
@@ -0,0 +1,95 @@
+"""
+Unit tests for landlab.components.chi_index.channel_chi
+"""
+from nose.tools import assert_equal
+from numpy.testing import assert_array_equal
+import numpy as np
+
+from landlab import RasterModelGrid, BAD_INDEX_VALUE
+from landlab.components import FlowRouter, FastscapeEroder, ChiFinder
+
+
+def _eroded_landscape(shape=(20, 25), seed=0):
+    grid = RasterModelGrid(shape, 100.)
+    z = grid.add_zeros('node', 'topographic__elevation')
+    z[grid.core_nodes] = np.random.RandomState(seed).rand(
+        grid.number_of_core_nodes)
+    fr = FlowRouter(grid)
+    sp = FastscapeEroder(grid, K_sp=1.e-4)
+    for _ in range(10):
+        z[grid.core_nodes] += 1.
+        fr.route_flow()
+        sp.run_one_step(1000.)
+    fr.route_flow()
+    return grid
+
+
+def _integrate_chi_avg_dx(grid, upstr_order, integrand, mean_dx):
+    receivers = grid.at_node['flow__receiver_node']
+    chi = grid.zeros('node')
+    for (node, value) in zip(upstr_order, integrand):
+        chi[node] = chi[receivers[node]] + value
+    return chi * mean_dx
+
+
+def _integrate_chi_each_dx(grid, upstr_order, integrand_at_nodes):
+    receivers = grid.at_node['flow__receiver_node']
+    links = grid.at_node['flow__link_to_receiver_node']
+    lengths = grid._length_of_link_with_diagonals
+    half_integrand = 0.5 * integrand_at_nodes
+    chi = grid.zeros('node')
+    for node in upstr_order:
+        if links[node] != BAD_INDEX_VALUE:
+            receiver = receivers[node]
+            chi[node] = chi[receiver] + (
+                half_integrand[node] +
+                half_integrand[receiver]) * lengths[links[node]]
+    return chi
+
+
+def test_integrate_chi_avg_dx():
+    """Test compiled integration matches a node-by-node sum."""
+    grid = _eroded_landscape()
+    order = grid.at_node['flow__upstream_node_order']
+    integrand = np.random.RandomState(1).rand(order.size)
+    cf = ChiFinder(grid, min_drainage_area=1.)
+    chi = grid.zeros('node')
+    cf.integrate_chi_avg_dx(order, integrand, chi, 1.5)
+    assert_array_equal(chi,
+                       _integrate_chi_avg_dx(grid, order, integrand, 1.5))
+
+
+def test_integrate_chi_each_dx():
+    """Test compiled trapezium integration matches a node-by-node sum."""
+    grid = _eroded_landscape()
+    order = grid.at_node['flow__upstream_node_order']
+    integrand = np.random.RandomState(1).rand(grid.number_of_nodes)
+    cf = ChiFinder(grid, min_drainage_area=1.)
+    chi = grid.zeros('node')
+    cf.integrate_chi_each_dx(order, integrand, chi)
+    assert_array_equal(chi, _integrate_chi_each_dx(grid, order, integrand))
+
+
+def test_calculate_chi_for_concavities():
+    """Test chi for several concavities matches one at a time."""
+    grid = _eroded_landscape()
+    concavities = [0.3, 0.45, 0.5, 0.8]
+    for use_true_dx in (False, True):
+        cf = ChiFinder(grid, min_drainage_area=1.e4, use_true_dx=use_true_dx)
+        chi = cf.calculate_chi_for_concavities(concavities)
+        mask = cf.hillslope_mask.copy()
+
+        assert_equal(chi.shape, (grid.number_of_nodes, len(concavities)))
+        for (k, concavity) in enumerate(concavities):
+            cf.calculate_chi(reference_concavity=concavity)
+            assert_array_equal(chi[:, k], cf.chi_indices)
+            assert_array_equal(mask, cf.hillslope_mask)
+        grid.delete_field('node', 'channel__chi_index')
+
+
+def test_calculate_chi_for_one_concavity():
+    grid = _eroded_landscape()
+    cf = ChiFinder(grid, min_drainage_area=1.e4)
+    chi = cf.calculate_chi_for_concavities(0.5)
+    cf.calculate_chi()
+    assert_array_equal(chi, cf.chi_indices.reshape((-1, 1)))
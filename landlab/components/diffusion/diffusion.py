@@ -44,11 +44,21 @@ class LinearDiffuser(Component):
     the diffusivity at each patch will be the mean vector sum of that at the
     bounding links.
 
+    The solver keyword chooses how the 'simple' method steps through time.
+    The default, 'explicit', subdivides each timestep to satisfy the
+    Courant-Friedrichs-Lewy condition. 'implicit' (backward Euler) and
+    'crank_nicolson' are unconditionally stable, and take a single step of
+    any length: they build a sparse matrix from the fluxes across the grid's
+    active links, factorize it once, and reuse the factorization for as
+    long as the boundary conditions, diffusivity and timestep stay the same.
+    These solvers work on any grid (e.g., raster, hex or Voronoi).
+
     The primary method of this class is :func:`run_one_step`.
 
     Construction::
 
-        LinearDiffuser(grid, linear_diffusivity=None, method='simple')
+        LinearDiffuser(grid, linear_diffusivity=None, method='simple',
+                       solver='explicit')
 
     Parameters
     ----------
@@ -74,6 +84,9 @@ class LinearDiffuser(Component):
         performed on a raster. 'on_diagonals' pretends that the "faces" of a
         cell with 8 links are represented by a stretched regular octagon set
         within the true cell.
+    solver : {'explicit', 'implicit', 'crank_nicolson'}
+        The time-stepping scheme. The implicit schemes can only be used with
+        the 'simple' method.
 
     Examples
     --------
@@ -128,6 +141,17 @@ class LinearDiffuser(Component):
     ...     dfn2.run_one_step(dt)
     >>> np.all(z2[mg2.core_nodes] < z1[mg2.core_nodes])
     True
+
+    The implicit solvers take a long timestep in a single solve.
+
+    >>> from landlab import HexModelGrid
+    >>> hg = HexModelGrid(7, 7)
+    >>> z = hg.add_zeros('node', 'topographic__elevation')
+    >>> z[hg.core_nodes] = 1.
+    >>> ld = LinearDiffuser(hg, linear_diffusivity=1., solver='implicit')
+    >>> ld.run_one_step(1000.)
+    >>> np.all(z[hg.core_nodes] < 0.01)
+    True
     """
 
     _name = 'LinearDiffuser'
@@ -158,10 +182,16 @@ class LinearDiffuser(Component):
 
     @use_file_name_or_kwds
     def __init__(self, grid, linear_diffusivity=None, method='simple',
-                 **kwds):
+                 solver='explicit', **kwds):
         self._grid = grid
         self._bc_set_code = self.grid.bc_set_code
         assert method in ('simple', 'resolve_on_patches', 'on_diagonals')
+        assert solver in ('explicit', 'implicit', 'crank_nicolson')
+        if solver != 'explicit' and method != 'simple':
+            raise ValueError('the ' + solver + ' solver can only be used ' +
+                             "with method='simple'")
+        self._solver = solver
+        self._implicit_lu = None
         if method == 'resolve_on_patches':
             assert isinstance(self.grid, RasterModelGrid)
             self._use_patches = True
@@ -360,6 +390,8 @@ class LinearDiffuser(Component):
         vals = self.grid.at_node[self.values_to_diffuse]
         self.fixed_grad_offsets = (vals[self.fixed_grad_nodes] -
                                    vals[self.fixed_grad_anchors])
+        # the implicit matrix depends on which nodes are core & fixed grad
+        self._implicit_lu = None
         if self._use_diags:
             self._all_d8_active_links = np.union1d(
                 self.grid.active_links, self.grid._diag_active_links)
@@ -425,6 +457,13 @@ class LinearDiffuser(Component):
             dt_links = self._CFL_actives_prefactor / kd_activelinks
             self.dt = np.nanmin(dt_links)
 
+        if self._solver != 'explicit':
+            if type(self._kd) is not np.ndarray:
+                kd_activelinks = np.broadcast_to(
+                    kd_activelinks, self.grid.active_links.shape)
+            self._diffuse_implicit(dt, kd_activelinks)
+            return self.grid
+
         if self._use_patches:
             # need this else diffusivities on inactive links deform off-angle
             # calculations
@@ -549,12 +588,92 @@ class LinearDiffuser(Component):
 
         return self.grid
 
+    def _diffuse_implicit(self, dt, kd_activelinks):
+        """Take one implicit or Crank-Nicolson step of length dt.
+
+        The matrix of the linear system, and its LU factorization, are
+        kept until the boundary conditions, the diffusivities on the active
+        links or dt change.
+        """
+        mg = self.grid
+        vals = mg.at_node[self.values_to_diffuse]
+        theta = 1. if self._solver == 'implicit' else 0.5
+
+        if (self._implicit_lu is None or dt != self._implicit_dt or
+                not np.array_equal(kd_activelinks, self._implicit_kd)):
+            self._build_implicit_system(dt, kd_activelinks, theta)
+
+        if theta < 1.:
+            rhs = vals + (1. - theta) * dt * self._laplacian.dot(vals)
+        else:
+            rhs = vals.copy()
+        rhs[self.fixed_grad_nodes] = self.fixed_grad_offsets
+        vals[:] = self._implicit_lu.solve(rhs)
+
+        self.dt = dt
+        self.g[mg.active_links] = mg.calc_grad_at_link(vals)[mg.active_links]
+        self.qs[mg.active_links] = -kd_activelinks * self.g[mg.active_links]
+        self.dqsds[:] = -self._laplacian.dot(vals)
+
+    def _build_implicit_system(self, dt, kd_activelinks, theta):
+        """Build and factorize the matrix for an implicit step.
+
+        The rows of the (sparse) Laplacian, L, give the rate of change at
+        each core node due to the fluxes across the faces of its cell; rows
+        for all other nodes are empty. The system solved for the new values
+        is (I - theta * dt * L) z = rhs, except that the rows for fixed
+        gradient nodes instead pin each node to its anchor.
+        """
+        from scipy.sparse import coo_matrix, identity
+        from scipy.sparse.linalg import splu
+
+        mg = self.grid
+        n_nodes = mg.number_of_nodes
+        links = mg.active_links
+        tails = mg.node_at_link_tail[links]
+        heads = mg.node_at_link_head[links]
+        coeff = (kd_activelinks * mg.width_of_face[mg.face_at_link[links]] /
+                 mg.length_of_link[links])
+
+        area = np.zeros(n_nodes)
+        area[mg.node_at_cell] = mg.area_of_cell
+        is_core = np.zeros(n_nodes, dtype=bool)
+        is_core[mg.core_nodes] = True
+
+        rows = []
+        cols = []
+        data = []
+        for node, other in ((tails, heads), (heads, tails)):
+            core = is_core[node]
+            c = coeff[core] / area[node[core]]
+            rows.extend([node[core], node[core]])
+            cols.extend([other[core], node[core]])
+            data.extend([c, -c])
+        self._laplacian = coo_matrix(
+            (np.concatenate(data), (np.concatenate(rows),
+                                    np.concatenate(cols))),
+            shape=(n_nodes, n_nodes)).tocsr()
+
+        # fixed gradient nodes aren't core, so their rows are just z = offset
+        # + z_anchor
+        anchors = coo_matrix(
+            (-np.ones(self.fixed_grad_nodes.size),
+             (self.fixed_grad_nodes, self.fixed_grad_anchors)),
+            shape=(n_nodes, n_nodes))
+        matrix = (identity(n_nodes, format='csr') -
+                  theta * dt * self._laplacian + anchors)
+
+        self._implicit_lu = splu(matrix.tocsc())
+        self._implicit_dt = dt
+        self._implicit_kd = np.array(kd_activelinks)
+
     def run_one_step(self, dt, **kwds):
         """Run the diffuser for one timestep, dt.
 
         If the imposed timestep dt is longer than the Courant-Friedrichs-Lewy
         condition for the diffusion, this timestep will be internally divided
-        as the component runs, as needed.
+        as the component runs, as needed (unless one of the implicit solvers
+        is used, in which case the step is taken in one go).
 
         Parameters
         ----------
@@ -121,3 +121,58 @@ def test_diffusion():
                             5.80291603e-05,   4.34416626e-04])
 
     assert_array_almost_equal(mg.at_node['topographic__elevation'], z_target)
+
+
+def test_implicit_solvers_match_explicit():
+    """Test the implicit solvers converge on the explicit solution."""
+    z_final = {}
+    for solver in ('explicit', 'implicit', 'crank_nicolson'):
+        mg = RasterModelGrid((12, 15), 10.)
+        z = mg.add_zeros('node', 'topographic__elevation')
+        z[:] = np.random.RandomState(0).rand(mg.number_of_nodes)
+        kd = 1. + mg.node_x / 100.
+        dfn = LinearDiffuser(mg, linear_diffusivity=kd, solver=solver)
+        for i in range(100):
+            dfn.run_one_step(0.2)
+        z_final[solver] = z
+
+    assert_array_almost_equal(z_final['crank_nicolson'],
+                              z_final['explicit'], decimal=2)
+    assert_array_almost_equal(z_final['implicit'], z_final['explicit'],
+                              decimal=2)
+
+
+def test_implicit_factorization_is_reused():
+    mg = RasterModelGrid((6, 7), 1.)
+    z = mg.add_zeros('node', 'topographic__elevation')
+    z[mg.core_nodes] = 1.
+    dfn = LinearDiffuser(mg, linear_diffusivity=1., solver='implicit')
+    dfn.run_one_step(10.)
+    lu = dfn._implicit_lu
+    dfn.run_one_step(10.)
+    assert_is(dfn._implicit_lu, lu)
+
+    mg.set_closed_boundaries_at_grid_edges(True, False, False, False)
+    dfn.run_one_step(10.)
+    assert dfn._implicit_lu is not lu
+    lu = dfn._implicit_lu
+
+    dfn.run_one_step(5.)
+    assert dfn._implicit_lu is not lu
+
+
+def test_implicit_conserves_mass_on_hex_grid():
+    from landlab import HexModelGrid
+
+    hg = HexModelGrid(8, 8, 10.)
+    z = hg.add_zeros('node', 'topographic__elevation')
+    z[:] = np.random.RandomState(1).rand(hg.number_of_nodes)
+    hg.status_at_node[hg.boundary_nodes] = 4
+    area = hg.area_of_cell[hg.cell_at_node[hg.core_nodes]]
+    mass = (z[hg.core_nodes] * area).sum()
+
+    dfn = LinearDiffuser(hg, linear_diffusivity=5., solver='implicit')
+    dfn.run_one_step(1.e6)
+
+    assert np.isclose((z[hg.core_nodes] * area).sum(), mass)
+    assert np.allclose(z[hg.core_nodes], z[hg.core_nodes].mean(), atol=1.e-4)
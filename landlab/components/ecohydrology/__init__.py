@@ -0,0 +1,10 @@
+"""Drive coupled soil moisture and vegetation components over many storms.
+
+*BatchedEcohydrology* advances the *SoilMoisture* and *Vegetation*
+components over a sequence of storm-interstorm periods with one compiled
+call, rather than one call to each component per period.
+"""
+from .batched_ecohydrology import BatchedEcohydrology, collect_storms
+
+
+__all__ = ['BatchedEcohydrology', 'collect_storms', ]
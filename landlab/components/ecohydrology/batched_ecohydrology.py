@@ -0,0 +1,352 @@
+"""Advance coupled soil moisture and vegetation over many storms at once.
+
+An ecohydrology model alternates calls to *SoilMoisture.update* and
+*Vegetation.update* for every storm and interstorm period. Each call
+processes one period for all of the cells. *BatchedEcohydrology* instead
+advances both components over a whole sequence of periods with one
+compiled call, in which each cell is carried through every period in turn.
+The results are the same as those of the alternating calls.
+
+Examples
+--------
+>>> import numpy as np
+>>> from landlab import RasterModelGrid
+>>> from landlab.components import SoilMoisture, Vegetation
+>>> from landlab.components.ecohydrology import BatchedEcohydrology
+
+>>> grid = RasterModelGrid((4, 5))
+>>> grid.at_cell['vegetation__plant_functional_type'] = np.array(
+...     [0, 0, 1, 1, 2, 3])
+>>> sm = SoilMoisture(grid)
+>>> veg = Vegetation(grid)
+>>> grid.at_cell['soil_moisture__initial_saturation_fraction'] = np.full(
+...     grid.number_of_cells, 0.5)
+>>> eco = BatchedEcohydrology(sm, veg)
+
+Run three storms, each followed by a day-long interstorm.
+
+>>> eco.run_storms([2., 4., 1.], [24., 24., 24.], [10., 0., 25.],
+...                PET=4., PET30=4.)
+>>> grid.at_cell['soil_moisture__saturation_fraction']
+array([ 0.65582578,  0.65582578,  0.60861882,  0.60861882,  0.54712118,
+        0.65571289])
+>>> eco.current_time  # doctest: +ELLIPSIS
+0.00901209...
+
+Or run a year of storms and get a summary of each year as it is completed.
+
+>>> Tr = np.full(400, 2.)
+>>> Tb = np.full(400, 22.)
+>>> P = np.tile([10., 0., 0., 5.], 100)
+>>> for year, summary in eco.yield_annual_summaries(Tr, Tb, P, PET=4.,
+...                                                 PET30=4.):
+...     print(year, summary['vegetation__live_biomass'].round(1))
+0 [  12.1   12.1  301.6  301.6  506.3    0. ]
+1 [   1.     1.   383.6  383.6  706.6    0. ]
+"""
+import numpy as np
+
+from .cfuncs import run_storms
+
+
+_DAYS_PER_YEAR = 365.25
+
+# The quantities summarized over a year, and how
+_SUMMARIES = (
+    ('soil_moisture__saturation_fraction', 'mean'),
+    ('vegetation__water_stress', 'mean'),
+    ('surface__evapotranspiration', 'total'),
+    ('surface__runoff', 'total'),
+    ('soil_moisture__root_zone_leakage', 'total'),
+    ('vegetation__live_biomass', 'mean'),
+    ('vegetation__dead_biomass', 'mean'),
+    ('vegetation__cover_fraction', 'mean'),
+)
+
+
+def collect_storms(intervals):
+    """Storm durations, interstorm durations and depths from intervals.
+
+    Consecutive intervals with rain are combined into one storm, and
+    consecutive intervals without rain into one interstorm, so that
+    subdivided storms and interstorms (from, for instance,
+    *PrecipitationDistribution.yield_storm_interstorm_duration_intensity*)
+    can be given to *BatchedEcohydrology*.
+
+    Parameters
+    ----------
+    intervals : iterable of tuple of float
+        Duration and rainfall rate of each interval (hours, and mm per
+        hour).
+
+    Returns
+    -------
+    tuple of ndarray
+        Durations of storms, durations of the interstorms that follow
+        them, and storm depths (hours, hours and mm).
+
+    Examples
+    --------
+    >>> from landlab.components.ecohydrology import collect_storms
+    >>> Tr, Tb, P = collect_storms([(2., 1.), (1., 2.), (10., 0.),
+    ...                             (1., 4.), (5., 0.), (5., 0.)])
+    >>> Tr
+    array([ 3.,  1.])
+    >>> Tb
+    array([ 10.,  10.])
+    >>> P
+    array([ 4.,  4.])
+    """
+    storms = []
+    storm_duration, interstorm_duration, depth = 0., 0., 0.
+    for duration, intensity in intervals:
+        if intensity > 0.:
+            if interstorm_duration > 0.:
+                storms.append((storm_duration, interstorm_duration, depth))
+                storm_duration, interstorm_duration, depth = 0., 0., 0.
+            storm_duration += duration
+            depth += duration * intensity
+        else:
+            interstorm_duration += duration
+    if storm_duration > 0. or interstorm_duration > 0.:
+        storms.append((storm_duration, interstorm_duration, depth))
+
+    if len(storms) == 0:
+        return np.empty(0), np.empty(0), np.empty(0)
+    return tuple(np.array(column, dtype=float) for column in zip(*storms))
+
+
+class BatchedEcohydrology(object):
+
+    """Advance soil moisture and vegetation over sequences of storms.
+
+    The soil moisture and vegetation components are used for their
+    parameters and their fields, which hold the state of the model between
+    calls. After each call the fields hold the values after the last
+    storm-interstorm period, exactly as if *SoilMoisture.update* and
+    *Vegetation.update* had been called for each period in turn.
+
+    Forcings that vary between cells (storm depth, potential
+    evapotranspiration and its 30 day mean) can be given for each period as
+    arrays of shape (number of periods, number of cells), for each cell
+    only as arrays of shape (1, number of cells), for each period only as
+    arrays of shape (number of periods, ), or as scalars. One-dimensional
+    arrays are always read as values for each period, even if there are as
+    many periods as cells.
+
+    Parameters
+    ----------
+    soil_moisture : SoilMoisture
+        A soil moisture component.
+    vegetation : Vegetation
+        A vegetation component, on the same grid.
+    current_time : float, optional
+        Time at the start of the first period (years).
+    """
+
+    def __init__(self, soil_moisture, vegetation, current_time=0.):
+        if soil_moisture.grid is not vegetation.grid:
+            raise ValueError('components must share a grid')
+
+        self._sm = soil_moisture
+        self._veg = vegetation
+        self._grid = soil_moisture.grid
+        self.current_time = current_time
+
+    @property
+    def grid(self):
+        """The grid of the coupled components."""
+        return self._grid
+
+    def _as_forcing(self, values, n_storms, name):
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 1:
+            if len(values) not in (1, n_storms):
+                raise ValueError(
+                    '{name} has one value for each of {n} periods but there '
+                    'are {n_storms} (give values at cells with shape '
+                    '(1, number of cells))'.format(
+                        name=name, n=len(values), n_storms=n_storms))
+            values = values.reshape((-1, 1))
+        try:
+            return np.broadcast_to(values,
+                                   (n_storms, self._grid.number_of_cells))
+        except ValueError:
+            raise ValueError(
+                '{name} must be a scalar, or of shape (number of periods, ), '
+                '(1, number of cells) or (number of periods, number of '
+                'cells)'.format(name=name))
+
+    def _parameters(self):
+        sm, veg = self._sm, self._veg
+        n_cells = self._grid.number_of_cells
+        soil = np.empty((11, n_cells))
+        for row, values in enumerate((
+                sm._zr, sm._soil_pc, sm._soil_fc, sm._soil_sc, sm._soil_wp,
+                sm._soil_hgw, sm._soil_beta, sm._soil_Ib, sm._soil_Iv,
+                sm._interception_cap, sm._LAIR_max)):
+            soil[row] = values
+        vegetation = np.empty((7, n_cells))
+        for row, values in enumerate((
+                veg._WUE, veg._LAI_max, veg._cb, veg._cd, veg._ksg,
+                veg._kdd, veg._kws)):
+            vegetation[row] = values
+        return soil, vegetation
+
+    def _read_state(self):
+        at_cell = self._grid.at_cell
+        state = np.empty((12, self._grid.number_of_cells))
+        state[0] = at_cell['soil_moisture__initial_saturation_fraction']
+        state[1] = at_cell['vegetation__live_leaf_area_index']
+        state[2] = at_cell['vegetation__cover_fraction']
+        state[3] = self._veg._Blive_ini
+        state[4] = self._veg._Bdead_ini
+        state[5] = at_cell['vegetation__dead_leaf_area_index']
+        state[6] = at_cell['soil_moisture__root_zone_leakage']
+        state[7] = at_cell['surface__evapotranspiration']
+        state[8] = at_cell['surface__runoff']
+        state[9] = at_cell['vegetation__water_stress']
+        state[10] = getattr(self._sm, '_Sini', 0.)
+        state[11] = getattr(self._sm, '_ETmax', 0.)
+        return state
+
+    def _write_state(self, state):
+        at_cell = self._grid.at_cell
+        at_cell['soil_moisture__initial_saturation_fraction'][:] = state[0]
+        at_cell['soil_moisture__saturation_fraction'][:] = state[0]
+        at_cell['vegetation__live_leaf_area_index'][:] = state[1]
+        at_cell['vegetation__cover_fraction'][:] = state[2]
+        at_cell['vegetation__live_biomass'][:] = state[3]
+        at_cell['vegetation__dead_biomass'][:] = state[4]
+        at_cell['vegetation__dead_leaf_area_index'][:] = state[5]
+        at_cell['soil_moisture__root_zone_leakage'][:] = state[6]
+        at_cell['surface__evapotranspiration'][:] = state[7]
+        at_cell['surface__runoff'][:] = state[8]
+        at_cell['vegetation__water_stress'][:] = state[9]
+        self._sm._Sini = state[10].copy()
+        self._sm._ETmax = state[11].copy()
+        self._veg._Blive_ini = at_cell['vegetation__live_biomass']
+        self._veg._Bdead_ini = at_cell['vegetation__dead_biomass']
+
+    def _run(self, Tr, Tb, P, PET, PET30, switch, totals):
+        if len(Tr) == 0:
+            return
+        soil, vegetation = self._parameters()
+        state = self._read_state()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            run_storms(
+                np.ascontiguousarray(self._sm._vegtype, dtype=np.int), soil,
+                vegetation, self._sm._fbare, self._sm._soil_Ew,
+                self._sm._runon, self._veg._w, self._veg._Tdmax,
+                self._veg._ETthresholdup, self._veg._ETthresholddown, Tr, Tb,
+                P, PET, PET30, switch, state, totals)
+        self._write_state(state)
+
+    def _prepare(self, Tr, Tb, P, PET, PET30, PETthreshold_switch):
+        Tr = np.ascontiguousarray(Tr, dtype=float)
+        Tb = np.ascontiguousarray(Tb, dtype=float)
+        n_storms = len(Tr)
+        if len(Tb) != n_storms:
+            raise ValueError('storm and interstorm durations must be the '
+                             'same length')
+        switch = np.ascontiguousarray(
+            np.broadcast_to(PETthreshold_switch, (n_storms, )), dtype=np.int)
+
+        at_cell = self._grid.at_cell
+        if PET is None:
+            PET = at_cell[
+                'surface__potential_evapotranspiration_rate'].reshape((1, -1))
+        if PET30 is None:
+            PET30 = at_cell[
+                'surface__potential_evapotranspiration_30day_mean'].reshape(
+                    (1, -1))
+
+        return (Tr, Tb, self._as_forcing(P, n_storms, 'P'),
+                self._as_forcing(PET, n_storms, 'PET'),
+                self._as_forcing(PET30, n_storms, 'PET30'), switch)
+
+    def run_storms(self, Tr, Tb, P, PET=None, PET30=None,
+                   PETthreshold_switch=0):
+        """Advance soil moisture and vegetation over storm periods.
+
+        Parameters
+        ----------
+        Tr : array_like of float
+            Storm durations (hours).
+        Tb : array_like of float
+            Durations of the interstorms that follow the storms (hours).
+        P : array_like of float
+            Storm depths (mm), for each period and cell (see the class
+            description for the shapes accepted).
+        PET : array_like of float, optional
+            Potential evapotranspiration rates. If not given, the current
+            values of the field are used for every period. To give values
+            at cells that are the same for every period, use an array of
+            shape (1, number of cells).
+        PET30 : array_like of float, optional
+            30 day means of the potential evapotranspiration rate. If not
+            given, the current values of the field are used for every
+            period.
+        PETthreshold_switch : int or array_like of int, optional
+            1 to use the growth threshold of the potential
+            evapotranspiration for vegetation, otherwise the dormancy
+            threshold.
+        """
+        Tr, Tb, P, PET, PET30, switch = self._prepare(
+            Tr, Tb, P, PET, PET30, PETthreshold_switch)
+        totals = np.zeros((len(_SUMMARIES), self._grid.number_of_cells))
+        self._run(Tr, Tb, P, PET, PET30, switch, totals)
+
+        for duration in (Tb + Tr).tolist():
+            self.current_time += duration/(24.*_DAYS_PER_YEAR)
+
+    def yield_annual_summaries(self, Tr, Tb, P, PET=None, PET30=None,
+                               PETthreshold_switch=0):
+        """Advance soil moisture and vegetation, a year at a time.
+
+        Periods are grouped by the year in which they start, and each year
+        is run with one compiled call. Summaries at cells are yielded as
+        each year is completed, so that they need not all be kept in
+        memory. Means and totals are taken over the periods of a year,
+        with the values at the end of each period.
+
+        Parameters
+        ----------
+        Tr, Tb, P, PET, PET30, PETthreshold_switch
+            As for *run_storms*.
+
+        Yields
+        ------
+        tuple of (int, dict)
+            The year, and a dict of means (soil moisture, water stress,
+            biomass and vegetation cover) or totals (evapotranspiration,
+            runoff and leakage) at cells over the year, keyed by field
+            name.
+        """
+        Tr, Tb, P, PET, PET30, switch = self._prepare(
+            Tr, Tb, P, PET, PET30, PETthreshold_switch)
+
+        year_of_storm = np.empty(len(Tr), dtype=int)
+        time = self.current_time
+        for storm, duration in enumerate((Tb + Tr).tolist()):
+            year_of_storm[storm] = int(np.floor(time))
+            time += duration/(24.*_DAYS_PER_YEAR)
+
+        (starts, ) = np.where(np.diff(year_of_storm) != 0)
+        starts = np.concatenate(([0], starts + 1, [len(Tr)]))
+        for start, stop in zip(starts[:-1], starts[1:]):
+            if stop <= start:
+                continue
+            totals = np.zeros((len(_SUMMARIES), self._grid.number_of_cells))
+            self._run(Tr[start:stop], Tb[start:stop], P[start:stop],
+                      PET[start:stop], PET30[start:stop],
+                      switch[start:stop], totals)
+            for duration in (Tb[start:stop] + Tr[start:stop]).tolist():
+                self.current_time += duration/(24.*_DAYS_PER_YEAR)
+
+            summary = {}
+            for (name, how), total in zip(_SUMMARIES, totals):
+                if how == 'mean':
+                    total /= stop - start
+                summary[name] = total
+            yield year_of_storm[start], summary
@@ -0,0 +1,86 @@
+"""Benchmark a year of coupled soil moisture and vegetation updates.
+
+Runs 1,000 storm-interstorm periods on grids of 100 and 10,000 cells,
+once by calling *SoilMoisture.update* and *Vegetation.update* for every
+period and once with *BatchedEcohydrology*. The per-period overhead of the
+components dominates on the small grid.
+"""
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import SoilMoisture, Vegetation
+from landlab.components.ecohydrology import BatchedEcohydrology
+
+
+_N_STORMS = 1000
+
+
+def _make_components(shape=(102, 102)):
+    grid = RasterModelGrid(shape)
+    rng = np.random.RandomState(0)
+    n_cells = grid.number_of_cells
+    grid.at_cell['vegetation__plant_functional_type'] = rng.randint(
+        0, 6, n_cells)
+    sm = SoilMoisture(grid)
+    veg = Vegetation(grid)
+    grid.at_cell['soil_moisture__initial_saturation_fraction'] = rng.uniform(
+        0.05, 1., n_cells)
+    grid.at_cell['vegetation__live_leaf_area_index'] = rng.uniform(
+        0., 2., n_cells)
+    grid.at_cell['vegetation__cover_fraction'] = rng.uniform(0., 1., n_cells)
+    return sm, veg
+
+
+def _forcing():
+    rng = np.random.RandomState(1)
+    return (rng.exponential(2., _N_STORMS), rng.exponential(6.5, _N_STORMS),
+            rng.choice([0., 1., 10., 40.], _N_STORMS),
+            rng.uniform(0., 8., _N_STORMS), rng.uniform(0., 8., _N_STORMS))
+
+
+def _run_each_storm(sm, veg):
+    grid = sm.grid
+    current_time = 0.
+    for Tr, Tb, P, PET, PET30 in zip(*_forcing()):
+        grid.at_cell['rainfall__daily_depth'] = np.full(
+            grid.number_of_cells, P)
+        grid.at_cell['surface__potential_evapotranspiration_rate'] = np.full(
+            grid.number_of_cells, PET)
+        grid.at_cell['surface__potential_evapotranspiration_30day_mean'] = (
+            np.full(grid.number_of_cells, PET30))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            current_time = sm.update(current_time, Tr=Tr, Tb=Tb)
+            veg.update(Tr=Tr, Tb=Tb)
+
+
+def _run_batched(sm, veg):
+    Tr, Tb, P, PET, PET30 = _forcing()
+    BatchedEcohydrology(sm, veg).run_storms(Tr, Tb, P, PET=PET, PET30=PET30)
+
+
+def bench_each_storm_100():
+    _run_each_storm(*_make_components((12, 12)))
+
+
+def bench_batched_100():
+    _run_batched(*_make_components((12, 12)))
+
+
+def bench_each_storm_10k():
+    _run_each_storm(*_make_components())
+
+
+def bench_batched_10k():
+    _run_batched(*_make_components())
+
+
+if __name__ == '__main__':
+    import timeit
+
+    for shape, label in (((12, 12), '100'), ((102, 102), '10k')):
+        for run in (_run_each_storm, _run_batched):
+            components = [_make_components(shape) for _ in range(3)]
+            t = min(timeit.repeat(lambda: run(*components.pop()), number=1,
+                                  repeat=3))
+            print('{label} cells, {name}: {t:.3f} s'.format(
+                label=label, name=run.__name__.lstrip('_'), t=t))
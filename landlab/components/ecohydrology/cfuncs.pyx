@@ -0,0 +1,145 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+
+from landlab.components.soil_moisture.cfuncs cimport soil_moisture_at_cell
+from landlab.components.vegetation_dynamics.cfuncs cimport vegetation_at_cell
+
+
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
+
+DTYPE_INT = np.int
+ctypedef np.int_t DTYPE_INT_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def run_storms(const DTYPE_INT_t[:] vegtype,
+               const DTYPE_FLOAT_t[:, :] soil,
+               const DTYPE_FLOAT_t[:, :] veg,
+               double fbare, double soil_Ew, double runon, double w,
+               double Tdmax, double threshold_up, double threshold_down,
+               const DTYPE_FLOAT_t[:] Tr,
+               const DTYPE_FLOAT_t[:] Tb,
+               const DTYPE_FLOAT_t[:, :] P,
+               const DTYPE_FLOAT_t[:, :] PET,
+               const DTYPE_FLOAT_t[:, :] PET30,
+               const DTYPE_INT_t[:] PETthreshold_switch,
+               DTYPE_FLOAT_t[:, :] state,
+               DTYPE_FLOAT_t[:, :] totals):
+    """Advance soil moisture and vegetation over a sequence of storms.
+
+    For each cell in turn, soil moisture and then vegetation are updated
+    for every storm-interstorm period, exactly as by alternate calls to
+    *SoilMoisture.update* and *Vegetation.update*.
+
+    Parameters
+    ----------
+    vegtype : ndarray of int, shape (n_cells, )
+        Plant functional type of each cell.
+    soil : ndarray of float, shape (11, n_cells)
+        Soil moisture parameters at cells. Rows are root depth, porosity,
+        field capacity, stomatal closure, wilting point, hygroscopic
+        point, deep percolation constant, bare and vegetated infiltration
+        capacities, interception capacity and reference leaf area index.
+    veg : ndarray of float, shape (7, n_cells)
+        Vegetation parameters at cells. Rows are water use efficiency,
+        maximum leaf area index, specific leaf areas of live and dead
+        biomass, senescence and decay coefficients and maximum drought
+        induced foliage loss rate.
+    Tr, Tb : ndarray of float, shape (n_storms, )
+        Storm and interstorm durations (hours).
+    P, PET, PET30 : ndarray of float, shape (n_storms, n_cells)
+        Storm depths, potential evapotranspiration rates and their 30 day
+        means.
+    PETthreshold_switch : ndarray of int, shape (n_storms, )
+        1 to use the growth threshold of the PET, otherwise the dormancy
+        threshold.
+    state : ndarray of float, shape (12, n_cells)
+        State of each cell, updated in place. Rows are saturation fraction,
+        live leaf area index, cover fraction, live biomass and dead biomass
+        (at the start of a period), then dead leaf area index, leakage,
+        actual evapotranspiration, runoff, water stress, saturation
+        fraction after the storm and maximum evapotranspiration (of the
+        last period).
+    totals : ndarray of float, shape (8, n_cells)
+        Sums over periods, incremented in place, of saturation fraction,
+        water stress, actual evapotranspiration, runoff, leakage, live
+        biomass, dead biomass and cover fraction.
+    """
+    cdef int n_storms = Tr.shape[0]
+    cdef int cell, storm
+    cdef long pft
+    cdef double so, lai_live, lai_dead, cover, b_live, b_dead
+    cdef double leakage, eta, runoff, stress, sini, et_max
+    cdef double fr, sc, threshold
+
+    with nogil:
+        for cell in range(vegtype.shape[0]):
+            pft = vegtype[cell]
+            so = state[0, cell]
+            lai_live = state[1, cell]
+            cover = state[2, cell]
+            b_live = state[3, cell]
+            b_dead = state[4, cell]
+            lai_dead = state[5, cell]
+            leakage = state[6, cell]
+            eta = state[7, cell]
+            runoff = state[8, cell]
+            stress = state[9, cell]
+            sini = state[10, cell]
+            et_max = state[11, cell]
+
+            for storm in range(n_storms):
+                fr = lai_live / soil[10, cell]
+                if fr > 1.:
+                    fr = 1.
+                if pft == 0:
+                    sc = soil[3, cell]*fr+(1-fr)*soil[2, cell]
+                else:
+                    sc = soil[3, cell]
+
+                so = soil_moisture_at_cell(
+                    P[storm, cell], PET[storm, cell], fr, cover, sc,
+                    soil[0, cell], soil[1, cell], soil[2, cell],
+                    soil[4, cell], soil[5, cell], soil[6, cell],
+                    soil[7, cell], soil[8, cell], soil[9, cell], fbare,
+                    soil_Ew, runon, Tb[storm], so, &leakage, &eta, &runoff,
+                    &stress, &sini, &et_max)
+
+                if PETthreshold_switch[storm] == 1:
+                    threshold = threshold_up
+                else:
+                    threshold = threshold_down
+
+                vegetation_at_cell(
+                    pft, veg[0, cell], veg[1, cell], veg[2, cell],
+                    veg[3, cell], veg[4, cell], veg[5, cell], veg[6, cell],
+                    w, Tdmax, threshold, PET[storm, cell],
+                    PET30[storm, cell], eta, stress, Tb[storm], Tr[storm],
+                    b_live, b_dead, &lai_live, &lai_dead, &cover, &b_live,
+                    &b_dead)
+
+                totals[0, cell] += so
+                totals[1, cell] += stress
+                totals[2, cell] += eta
+                totals[3, cell] += runoff
+                totals[4, cell] += leakage
+                totals[5, cell] += b_live
+                totals[6, cell] += b_dead
+                totals[7, cell] += cover
+
+            state[0, cell] = so
+            state[1, cell] = lai_live
+            state[2, cell] = cover
+            state[3, cell] = b_live
+            state[4, cell] = b_dead
+            state[5, cell] = lai_dead
+            state[6, cell] = leakage
+            state[7, cell] = eta
+            state[8, cell] = runoff
+            state[9, cell] = stress
+            state[10, cell] = sini
+            state[11, cell] = et_max
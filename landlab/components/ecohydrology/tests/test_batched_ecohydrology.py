@@ -0,0 +1,248 @@
+"""
+Unit tests for landlab.components.ecohydrology.batched_ecohydrology
+"""
+from nose.tools import assert_equal, assert_raises
+from numpy.testing import assert_array_equal, assert_array_almost_equal
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import SoilMoisture, Vegetation
+from landlab.components.ecohydrology import (BatchedEcohydrology,
+                                             collect_storms)
+
+
+_OUT_NAMES = ('soil_moisture__initial_saturation_fraction',
+              'soil_moisture__saturation_fraction',
+              'soil_moisture__root_zone_leakage',
+              'surface__evapotranspiration', 'surface__runoff',
+              'vegetation__water_stress', 'vegetation__live_biomass',
+              'vegetation__dead_biomass', 'vegetation__live_leaf_area_index',
+              'vegetation__dead_leaf_area_index',
+              'vegetation__cover_fraction')
+
+
+def _setup_components(seed=1):
+    grid = RasterModelGrid((10, 12))
+    random = np.random.RandomState(seed)
+    grid.at_cell['vegetation__plant_functional_type'] = random.randint(
+        0, 6, grid.number_of_cells)
+    sm = SoilMoisture(grid)
+    veg = Vegetation(grid)
+    grid.at_cell['soil_moisture__initial_saturation_fraction'] = (
+        random.uniform(0.05, 1., grid.number_of_cells))
+    grid.at_cell['vegetation__live_leaf_area_index'] = random.uniform(
+        0., 2., grid.number_of_cells)
+    grid.at_cell['vegetation__cover_fraction'] = random.uniform(
+        0., 1., grid.number_of_cells)
+    return grid, sm, veg
+
+
+def _forcing(n_storms, seed=5):
+    random = np.random.RandomState(seed)
+    return (random.exponential(3., n_storms),
+            random.exponential(60., n_storms),
+            random.choice([0., 1., 10., 60.], n_storms),
+            random.uniform(0., 9., n_storms),
+            random.uniform(0., 9., n_storms),
+            random.randint(0, 2, n_storms))
+
+
+def _run_each_storm(grid, sm, veg, forcing):
+    Tr, Tb, P, PET, PET30, switch = forcing
+    current_time = 0.
+    for storm in range(len(Tr)):
+        grid.at_cell['rainfall__daily_depth'] = np.full(
+            grid.number_of_cells, P[storm])
+        grid.at_cell['surface__potential_evapotranspiration_rate'] = np.full(
+            grid.number_of_cells, PET[storm])
+        grid.at_cell['surface__potential_evapotranspiration_30day_mean'] = (
+            np.full(grid.number_of_cells, PET30[storm]))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            current_time = sm.update(current_time, Tr=Tr[storm],
+                                     Tb=Tb[storm])
+            veg.update(PETthreshold_switch=switch[storm], Tb=Tb[storm],
+                       Tr=Tr[storm])
+    return current_time
+
+
+def test_same_as_each_storm():
+    """Test batched storms give the same result as one storm at a time."""
+    forcing = _forcing(300)
+    grid, sm, veg = _setup_components()
+    current_time = _run_each_storm(grid, sm, veg, forcing)
+
+    batched_grid, batched_sm, batched_veg = _setup_components()
+    eco = BatchedEcohydrology(batched_sm, batched_veg)
+    eco.run_storms(*forcing)
+
+    assert_equal(eco.current_time, current_time)
+    for name in _OUT_NAMES:
+        assert_array_equal(batched_grid.at_cell[name], grid.at_cell[name])
+
+
+def test_run_storms_in_parts():
+    """Test running storms in parts is the same as all at once."""
+    forcing = _forcing(100)
+    grid, sm, veg = _setup_components()
+    eco = BatchedEcohydrology(sm, veg)
+    eco.run_storms(*forcing)
+
+    in_parts_grid, in_parts_sm, in_parts_veg = _setup_components()
+    eco = BatchedEcohydrology(in_parts_sm, in_parts_veg)
+    eco.run_storms(*[values[:40] for values in forcing])
+    eco.run_storms(*[values[40:] for values in forcing])
+
+    for name in _OUT_NAMES:
+        assert_array_equal(in_parts_grid.at_cell[name], grid.at_cell[name])
+
+
+def test_forcing_at_cells():
+    """Test forcing that varies between cells."""
+    grid, sm, veg = _setup_components()
+    n_cells = grid.number_of_cells
+    PET = np.linspace(0., 8., n_cells).reshape((1, -1)).repeat(4, axis=0)
+    eco = BatchedEcohydrology(sm, veg)
+    eco.run_storms([2.] * 4, [20.] * 4, [5., 0., 0., 5.], PET=PET, PET30=PET)
+
+    for cell in (0, n_cells // 2, n_cells - 1):
+        _, sm_at_cell, veg_at_cell = _setup_components()
+        eco = BatchedEcohydrology(sm_at_cell, veg_at_cell)
+        eco.run_storms([2.] * 4, [20.] * 4, [5., 0., 0., 5.],
+                       PET=PET[0, cell], PET30=PET[0, cell])
+        assert_equal(
+            grid.at_cell['soil_moisture__saturation_fraction'][cell],
+            sm_at_cell.grid.at_cell['soil_moisture__saturation_fraction'][
+                cell])
+
+
+def test_annual_summaries_forcing_at_cells():
+    """Test forcing at cells, from fields or arrays, for annual summaries."""
+    Tr, Tb, P, _, _, switch = _forcing(300)
+    grid, sm, veg = _setup_components()
+    PET = np.linspace(0., 8., grid.number_of_cells)
+    eco = BatchedEcohydrology(sm, veg)
+    summaries = list(eco.yield_annual_summaries(
+        Tr, Tb, P, PET=PET.reshape((1, -1)), PET30=PET.reshape((1, -1)),
+        PETthreshold_switch=switch))
+
+    field_grid, field_sm, field_veg = _setup_components()
+    field_grid.at_cell['surface__potential_evapotranspiration_rate'] = PET
+    field_grid.at_cell[
+        'surface__potential_evapotranspiration_30day_mean'] = PET
+    eco = BatchedEcohydrology(field_sm, field_veg)
+    field_summaries = list(eco.yield_annual_summaries(
+        Tr, Tb, P, PETthreshold_switch=switch))
+
+    run_grid, run_sm, run_veg = _setup_components()
+    eco = BatchedEcohydrology(run_sm, run_veg)
+    eco.run_storms(Tr, Tb, P, PET=PET.reshape((1, -1)),
+                   PET30=PET.reshape((1, -1)), PETthreshold_switch=switch)
+
+    assert_equal(len(summaries), len(field_summaries))
+    for (_, summary), (_, field_summary) in zip(summaries, field_summaries):
+        for name in summary:
+            assert_array_equal(summary[name], field_summary[name])
+    for name in _OUT_NAMES:
+        assert_array_equal(grid.at_cell[name], field_grid.at_cell[name])
+        assert_array_equal(grid.at_cell[name], run_grid.at_cell[name])
+
+
+def test_one_dimensional_forcing_is_for_periods():
+    """Test 1D forcing is for each period when there are as many cells."""
+    grid, sm, veg = _setup_components()
+    n_storms = grid.number_of_cells
+    Tr, Tb, P, PET, PET30, switch = _forcing(n_storms)
+    eco = BatchedEcohydrology(sm, veg)
+    eco.run_storms(Tr, Tb, P, PET=PET, PET30=PET30,
+                   PETthreshold_switch=switch)
+
+    each_grid, each_sm, each_veg = _setup_components()
+    _run_each_storm(each_grid, each_sm, each_veg,
+                    (Tr, Tb, P, PET, PET30, switch))
+    for name in _OUT_NAMES:
+        assert_array_equal(grid.at_cell[name], each_grid.at_cell[name])
+
+
+def test_forcing_of_wrong_shape():
+    grid, sm, veg = _setup_components()
+    eco = BatchedEcohydrology(sm, veg)
+    PET = np.ones(grid.number_of_cells)
+    assert_raises(ValueError, eco.run_storms, [1., 2.], [10., 10.], 1.,
+                  PET, PET)
+    summaries = eco.yield_annual_summaries([1., 2.], [10., 10.], 1., PET,
+                                           PET)
+    assert_raises(ValueError, next, summaries)
+    assert_raises(ValueError, eco.run_storms, [1., 2.], [10., 10.], 1.,
+                  np.ones((2, 3)), 1.)
+
+
+def test_annual_summaries():
+    """Test summaries of each year of storms."""
+    forcing = _forcing(300)
+    grid, sm, veg = _setup_components()
+    eco = BatchedEcohydrology(sm, veg)
+    summaries = list(eco.yield_annual_summaries(*forcing))
+
+    each_grid, each_sm, each_veg = _setup_components()
+    current_time = _run_each_storm(each_grid, each_sm, each_veg, forcing)
+
+    assert_equal([year for year, _ in summaries],
+                 list(range(int(current_time) + 1)))
+    assert_equal(eco.current_time, current_time)
+    for name in _OUT_NAMES:
+        assert_array_equal(grid.at_cell[name], each_grid.at_cell[name])
+
+    total_runoff = sum(summary['surface__runoff']
+                       for _, summary in summaries)
+    for _, summary in summaries:
+        assert_equal(np.all(summary['vegetation__cover_fraction'] <= 1.),
+                     True)
+        assert_equal(np.all(summary['vegetation__water_stress'] >= 0.), True)
+    assert_equal(total_runoff.shape, (grid.number_of_cells, ))
+
+
+def test_annual_summary_of_one_year():
+    """Test means and totals for storms of a single year."""
+    forcing = _forcing(3)
+    grid, sm, veg = _setup_components()
+    eco = BatchedEcohydrology(sm, veg)
+    ((year, summary), ) = list(eco.yield_annual_summaries(*forcing))
+
+    each_grid, each_sm, each_veg = _setup_components()
+    runoff = np.zeros(each_grid.number_of_cells)
+    saturation = np.zeros(each_grid.number_of_cells)
+    for storm in range(3):
+        _run_each_storm(each_grid, each_sm, each_veg,
+                        [values[storm:storm + 1] for values in forcing])
+        runoff += each_grid.at_cell['surface__runoff']
+        saturation += each_grid.at_cell['soil_moisture__saturation_fraction']
+
+    assert_equal(year, 0)
+    assert_array_equal(summary['surface__runoff'], runoff)
+    assert_array_almost_equal(
+        summary['soil_moisture__saturation_fraction'], saturation / 3.)
+
+
+def test_mismatched_durations():
+    grid, sm, veg = _setup_components()
+    eco = BatchedEcohydrology(sm, veg)
+    assert_raises(ValueError, eco.run_storms, [1., 2.], [10.], 1., 1., 1.)
+
+
+def test_components_on_different_grids():
+    _, sm, _ = _setup_components()
+    _, _, veg = _setup_components()
+    assert_raises(ValueError, BatchedEcohydrology, sm, veg)
+
+
+def test_collect_storms():
+    Tr, Tb, P = collect_storms([(10., 0.), (1., 2.), (4., 0.), (2., 1.),
+                                (1., 3.)])
+    assert_array_equal(Tr, [0., 1., 3.])
+    assert_array_equal(Tb, [10., 4., 0.])
+    assert_array_equal(P, [0., 2., 5.])
+
+
+def test_collect_no_storms():
+    Tr, Tb, P = collect_storms([])
+    assert_equal((len(Tr), len(Tb), len(P)), (0, 0, 0))
@@ -73,7 +73,7 @@ class Flexure(Component):
     Construction::
 
         Flexure(grid, eet=65e3, youngs=7e10, method='airy', rho_mantle=3300.,
-                gravity=9.80665)
+                gravity=9.80665, solver='fft')
 
     Parameters
     ----------
@@ -89,6 +89,10 @@ class Flexure(Component):
         Density of the mantle (kg / m^3).
     gravity : float, optional
         Acceleration due to gravity (m / s^2).
+    solver : {'fft', 'direct'}, optional
+        How to sum the deflections due to every loaded node when *method* is
+        'flexure': either as a convolution carried out with fast Fourier
+        transforms, or directly, node by node.
 
     Examples
     --------
@@ -164,7 +168,7 @@ class Flexure(Component):
 
     @use_file_name_or_kwds
     def __init__(self, grid, eet=65e3, youngs=7e10, method='airy',
-                 rho_mantle=3300., gravity=9.80665, **kwds):
+                 rho_mantle=3300., gravity=9.80665, solver='fft', **kwds):
         """Initialize the flexure component.
 
         Parameters
@@ -181,15 +185,21 @@ class Flexure(Component):
             Density of the mantle (kg / m^3).
         gravity : float, optional
             Acceleration due to gravity (m / s^2).
+        solver : {'fft', 'direct'}, optional
+            Solver to use for the 'flexure' method.
         """
         if method not in ('airy', 'flexure'):
             raise ValueError(
                 '{method}: method not understood'.format(method=method))
+        if solver not in ('fft', 'direct'):
+            raise ValueError(
+                '{solver}: solver not understood'.format(solver=solver))
 
         self._grid = grid
 
         self._youngs = youngs
         self._method = method
+        self._solver = solver
         self._rho_mantle = rho_mantle
         self._gravity = gravity
         self.eet = eet
@@ -221,6 +231,7 @@ class Flexure(Component):
         self._r = self._create_kei_func_grid(self._grid.shape,
                                              (self.grid.dy, self.grid.dx),
                                              self.alpha)
+        self._kei_spectrum = None
 
     @property
     def youngs(self):
@@ -247,6 +258,11 @@ class Flexure(Component):
         """Name of method used to calculate deflections."""
         return self._method
 
+    @property
+    def solver(self):
+        """Name of solver used for the 'flexure' method."""
+        return self._solver
+
     @property
     def alpha(self):
         """Flexure parameter (m)."""
@@ -262,6 +278,54 @@ class Flexure(Component):
 
         return kei(np.sqrt(dx ** 2 + dy ** 2) / alpha)
 
+    @staticmethod
+    def _create_kei_func_spectrum(r, fft_shape):
+        """Fourier transform of the Kelvin-function kernel.
+
+        Lays out the kernel, *r*, which holds the kei function at every
+        positive row and column offset, over all positive and negative
+        offsets of an array of shape *fft_shape* (with wrap-around), so
+        that a circular convolution of a zero-padded load with it gives the
+        same result as summing the deflections due to each load.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab.components.flexure import Flexure
+        >>> r = np.arange(6.).reshape((2, 3))
+        >>> spectrum = Flexure._create_kei_func_spectrum(r, (3, 5))
+        >>> np.fft.irfft2(spectrum, (3, 5)).round(6) + 0.
+        array([[ 0.,  1.,  2.,  2.,  1.],
+               [ 3.,  4.,  5.,  5.,  4.],
+               [ 3.,  4.,  5.,  5.,  4.]])
+        """
+        n_rows, n_cols = r.shape
+        kernel = np.zeros(fft_shape, dtype=float)
+        kernel[:n_rows, :n_cols] = r
+        kernel[:n_rows, fft_shape[1] - n_cols + 1:] = r[:, :0:-1]
+        kernel[fft_shape[0] - n_rows + 1:] = kernel[n_rows - 1:0:-1]
+
+        return np.fft.rfft2(kernel)
+
+    def _subside_grid_fft(self, w, load):
+        """Add the deflections due to a grid of loads to *w*.
+
+        The loads are convolved with the kei kernel using fast Fourier
+        transforms. The transform of the kernel is calculated the first time
+        this is called and then kept until the kernel changes.
+        """
+        from scipy.fftpack import next_fast_len
+
+        fft_shape = tuple(next_fast_len(2 * n - 1) for n in w.shape)
+        if self._kei_spectrum is None:
+            c = - 1. / (2. * np.pi * self.gamma_mantle * self.alpha ** 2.)
+            self._kei_spectrum = self._create_kei_func_spectrum(
+                self._r * c, fft_shape)
+
+        dz = np.fft.irfft2(np.fft.rfft2(load, fft_shape) * self._kei_spectrum,
+                           fft_shape)
+        w += dz[:w.shape[0], :w.shape[1]]
+
     def update(self, n_procs=1):
         """Update fields with current loading conditions.
 
@@ -293,7 +357,8 @@ class Flexure(Component):
         deflection : ndarray of float, optional
             Buffer to place resulting deflection values.
         n_procs : int, optional
-            Number of processors to use for calculations.
+            Number of processors to use for calculations (*direct* solver
+            only).
 
         Returns
         -------
@@ -303,13 +368,16 @@ class Flexure(Component):
         if deflection is None:
             deflection = np.empty(self.shape, dtype=np.float)
 
-        from .cfuncs import subside_grid_in_parallel
-
         w = deflection.reshape(self._grid.shape)
         load = loads.reshape(self._grid.shape)
 
-        subside_grid_in_parallel(w, load * self._grid.dx * self._grid.dy,
-                                 self._r, self.alpha, self.gamma_mantle,
-                                 n_procs)
+        if self._solver == 'fft':
+            self._subside_grid_fft(w, load * self._grid.dx * self._grid.dy)
+        else:
+            from .cfuncs import subside_grid_in_parallel
+
+            subside_grid_in_parallel(w, load * self._grid.dx * self._grid.dy,
+                                     self._r, self.alpha, self.gamma_mantle,
+                                     n_procs)
 
         return deflection
@@ -87,3 +87,42 @@ def test_field_initialized_to_zero():
     for name in flex.grid['node']:
         field = flex.grid['node'][name]
         assert_true(np.all(field == 0.))
+
+
+def test_fft_solver_matches_direct():
+    dz = {}
+    for solver in ('direct', 'fft'):
+        grid = RasterModelGrid((21, 34), spacing=(5e3, 2e3))
+        flex = Flexure(grid, method='flexure', eet=20e3, solver=solver)
+        load = grid.at_node['lithosphere__overlying_pressure_increment']
+        load[:] = np.random.RandomState(0).rand(grid.number_of_nodes) * 1e7
+        flex.update()
+        dz[solver] = grid.at_node['lithosphere_surface__elevation_increment']
+    np.testing.assert_allclose(dz['fft'], dz['direct'], rtol=1e-10)
+
+
+def test_fft_kernel_spectrum_is_cached():
+    grid = RasterModelGrid((10, 12), spacing=10e3)
+    flex = Flexure(grid, method='flexure')
+    load = grid.at_node['lithosphere__overlying_pressure_increment']
+    load[55] = 1e9
+    flex.update()
+    spectrum = flex._kei_spectrum
+    flex.update()
+    assert_true(flex._kei_spectrum is spectrum)
+
+    flex.eet = 30e3
+    assert_true(flex._kei_spectrum is None)
+    flex.update()
+    dz = grid.at_node['lithosphere_surface__elevation_increment'].copy()
+
+    flex = Flexure(grid, method='flexure', eet=30e3, solver='direct')
+    flex.update()
+    np.testing.assert_allclose(
+        grid.at_node['lithosphere_surface__elevation_increment'], dz,
+        rtol=1e-10)
+
+
+def test_bad_solver():
+    grid = RasterModelGrid((10, 12), spacing=10e3)
+    assert_raises(ValueError, Flexure, grid, solver='spectral')
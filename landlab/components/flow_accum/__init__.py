@@ -1,7 +1,7 @@
 from .flow_accum_bw import (make_ordered_node_array,
                             find_drainage_area_and_discharge,
-                            flow_accumulation)
+                            flow_accumulation, accumulate_weights)
 
 
 __all__ = ['make_ordered_node_array', 'find_drainage_area_and_discharge',
-           'flow_accumulation', ]
+           'flow_accumulation', 'accumulate_weights', ]
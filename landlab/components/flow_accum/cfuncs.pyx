@@ -5,27 +5,149 @@ cimport cython
 
 DTYPE = np.int
 ctypedef np.int_t DTYPE_INT_t
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
 
 
 @cython.boundscheck(False)
-cpdef _add_to_stack(DTYPE_INT_t l, DTYPE_INT_t j,
-                    np.ndarray[DTYPE_INT_t, ndim=1] s,
-                    np.ndarray[DTYPE_INT_t, ndim=1] delta,
-                    np.ndarray[DTYPE_INT_t, ndim=1] donors):
+@cython.wraparound(False)
+def _add_to_stack(np.ndarray[DTYPE_INT_t, ndim=1] base_nodes,
+                  DTYPE_INT_t j,
+                  np.ndarray[DTYPE_INT_t, ndim=1] s,
+                  np.ndarray[DTYPE_INT_t, ndim=1] delta,
+                  np.ndarray[DTYPE_INT_t, ndim=1] donors,
+                  np.ndarray[DTYPE_INT_t, ndim=1] queue):
+    """Add each base node, and all nodes upstream of it, to the stack.
 
+    Nodes are added in the same (depth-first) order as the recursive
+    add_to_stack procedure of Braun and Willett (2012), but the recursion is
+    replaced by an explicit last-in-first-out queue so that there is no limit
+    on the length of a flow path. Node IDs are written to *s* starting at
+    index *j*; the index of the next free element of *s* is returned.
+    *queue* is scratch space, with at least as many elements as *s*, that can
+    be reused between calls.
     """
-    Adds node l to the stack and increments the current index (j).
-    """
-    cdef int m, n, delta_l, delta_lplus1
-
-    s[j] = l
-    j += 1
-    delta_l = delta[l]
-    delta_lplus1 = delta[l+1]
-
-    for n in range(delta_l, delta_lplus1):
-        m = donors[n]
-        if m != l:
-            j = _add_to_stack(m, j, s, delta, donors)
-    
+    cdef DTYPE_INT_t n_nodes = s.shape[0]
+    cdef DTYPE_INT_t n_base = base_nodes.shape[0]
+    cdef DTYPE_INT_t i, n, l, m, top
+
+    if queue.shape[0] < n_nodes:
+        raise ValueError('queue is shorter than the stack')
+
+    for i in range(n_base):
+        queue[0] = base_nodes[i]
+        top = 1
+        while top > 0 and j < n_nodes:
+            top -= 1
+            l = queue[top]
+            s[j] = l
+            j += 1
+            # Queue the donors in reverse so they are popped in order
+            for n in range(delta[l + 1] - 1, delta[l] - 1, -1):
+                m = donors[n]
+                if m != l and top < n_nodes:
+                    queue[top] = m
+                    top += 1
+
     return j
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _accumulate_bw(np.ndarray[DTYPE_INT_t, ndim=1] s,
+                   np.ndarray[DTYPE_INT_t, ndim=1] r,
+                   np.ndarray[DTYPE_FLOAT_t, ndim=2] values):
+    """Accumulate values from upstream to downstream, in place.
+
+    Iterates backward through the stack, *s*, adding the value at each donor
+    to the value at its receiver. Each row of *values* is accumulated
+    independently, but in the same pass.
+    """
+    cdef DTYPE_INT_t n_values = values.shape[0]
+    cdef DTYPE_INT_t i, k, donor, recvr
+
+    for i in range(s.shape[0] - 1, -1, -1):
+        donor = s[i]
+        recvr = r[donor]
+        if donor != recvr:
+            for k in range(n_values):
+                values[k, recvr] += values[k, donor]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _add_to_downstream_nodes(np.ndarray[DTYPE_INT_t, ndim=1] start_nodes,
+                             np.ndarray[DTYPE_INT_t, ndim=1] r,
+                             np.ndarray[DTYPE_FLOAT_t, ndim=2] values,
+                             np.ndarray[DTYPE_FLOAT_t, ndim=2] increments):
+    """Add increments to the values at every node along flow paths.
+
+    For each start node, the column of *increments* for it is added to the
+    values at the start node and at every node downstream of it, down to
+    (and including) the node that is its own receiver. Each row of *values*
+    is a separate quantity. The number of nodes visited is returned.
+    """
+    cdef DTYPE_INT_t n_values = values.shape[0]
+    cdef DTYPE_INT_t n_visited = 0
+    cdef DTYPE_INT_t i, k, node
+
+    for i in range(start_nodes.shape[0]):
+        node = start_nodes[i]
+        while True:
+            for k in range(n_values):
+                values[k, node] += increments[k, i]
+            n_visited += 1
+            if r[node] == node:
+                break
+            node = r[node]
+
+    return n_visited
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _find_insertion_points(np.ndarray[DTYPE_INT_t, ndim=1] nodes,
+                           np.ndarray[DTYPE_INT_t, ndim=1] receiver_at,
+                           np.ndarray[DTYPE_INT_t, ndim=1] s,
+                           np.ndarray[DTYPE_FLOAT_t, ndim=1] n_upstream,
+                           np.ndarray[DTYPE_INT_t, ndim=1] out):
+    """Find where to insert the blocks of nodes into a stack.
+
+    In a stack, the nodes upstream of any node (including the node itself)
+    follow it as a contiguous block, and the blocks of the donors of a node
+    are in order of increasing ID. A node, with the nodes upstream of it, is
+    inserted after its receiver and after the blocks of those of the
+    receiver's other donors that have smaller IDs. A node that is its own
+    receiver goes before the first block of the stack with a larger base
+    node. Finding the position hops over whole blocks, using the number of
+    nodes upstream of each node, *n_upstream*.
+
+    Parameters
+    ----------
+    nodes : ndarray of int
+        Nodes to insert.
+    receiver_at : ndarray of int
+        Position in *s* of the receiver of each node, or -1 if the node is
+        its own receiver.
+    s : ndarray of int
+        The stack, without the nodes to insert.
+    n_upstream : ndarray of float
+        Number of nodes upstream of each node of the stack, including the
+        node itself.
+    out : ndarray of int
+        Position in *s* before which to insert each node.
+    """
+    cdef DTYPE_INT_t n_nodes = s.shape[0]
+    cdef DTYPE_INT_t i, p, end, node
+
+    for i in range(nodes.shape[0]):
+        node = nodes[i]
+        if receiver_at[i] < 0:
+            p = 0
+            end = n_nodes
+        else:
+            p = receiver_at[i] + 1
+            end = receiver_at[i] + <DTYPE_INT_t>n_upstream[s[receiver_at[i]]]
+        while p < end and s[p] < node:
+            p += <DTYPE_INT_t>n_upstream[s[p]]
+        out[i] = p
@@ -22,10 +22,20 @@ If you simply want the ordered list by itself, use::
 
     s = make_ordered_node_array(r, b)
 
+To accumulate any other quantities (for instance, sediment fluxes) down the
+same flow network, use::
+
+    acc = accumulate_weights(s, r, weights)
+
+where weights may hold several arrays of node values, all of which are
+accumulated in a single pass through the stack.
+
 Created: GT Nov 2013
 """
 from six.moves import range
-from .cfuncs import _add_to_stack
+
+from landlab.core.utils import as_id_array
+from .cfuncs import _add_to_stack, _accumulate_bw
 
 import numpy
 
@@ -34,17 +44,20 @@ class _DrainageStack():
     """
     The _DrainageStack() class implements Braun & Willett's add_to_stack
     function (as a method) and also keeps track of the counter (j) and the
-    stack (s). It is used by the make_ordered_node_array() function.
+    stack (s). The make_ordered_node_array() function does the same job for
+    all the baselevel nodes at once.
     """
     def __init__(self, delta, D):
         """
-        Initializes the index counter j to zero, creates the stack array s,
-        and stores references to delta and D.
+        Initializes the index counter j to zero, creates the stack array s
+        and the queue used to add nodes to it, and stores references to
+        delta and D.
         """
         self.j = 0
         self.s = numpy.zeros(len(D), dtype=int)
         self.delta = delta
         self.D = D
+        self._queue = numpy.empty(len(D), dtype=int)
 
     def add_to_stack(self, l):
         """
@@ -61,8 +74,9 @@ class _DrainageStack():
         >>> ds.s
         array([4, 1, 0, 2, 5, 6, 3, 8, 7, 9])
         """
-        # we invoke cython here to attempt to suppress Python's RecursionLimit
-        self.j = _add_to_stack(l, self.j, self.s, self.delta, self.D)
+        # cython, without recursion, so there is no limit on path length
+        self.j = _add_to_stack(numpy.array([l], dtype=int), self.j, self.s,
+                               self.delta, self.D, self._queue)
 
 
 def _make_number_of_donors_array(r):
@@ -156,7 +170,7 @@ def _make_array_of_donors(r, delta):
     Table 1 (except that here the ID numbers are one less, because we number
     indices from zero).
 
-    Vectorized - inefficiently! - DEJH, 5/20/14
+    Vectorized with a stable sort.
 
     Examples
     --------
@@ -168,29 +182,9 @@ def _make_array_of_donors(r, delta):
     >>> D
     array([0, 2, 1, 4, 5, 7, 6, 3, 8, 9])
     """
-    np = len(r)
-    w = numpy.zeros(np, dtype=int)
-    D = numpy.zeros(np, dtype=int)
-
-    for i in range(np):
-        ri = r[i]
-        D[delta[ri]+w[ri]] = i
-        w[ri] += 1
-
-    return D
-
-    #DEJH notes that for reasons he's not clear on, this looped version is
-    #actually much slower!
-    #D = numpy.zeros(np, dtype=int)
-    #wri_fin = numpy.bincount(r)
-    #wri_fin_nz = wri_fin.nonzero()[0]
-    #wri_fin_nz_T = wri_fin_nz.reshape((wri_fin_nz.size,1))
-    #logical = numpy.tile(r,(wri_fin_nz.size,1))==wri_fin_nz_T
-    #cum_logical = numpy.cumsum(logical, axis=1)
-    #wri = numpy.sum(numpy.where(logical, cum_logical-1,0) ,axis=0)
-    #D_index = delta[r] + wri
-    #D[D_index] = numpy.arange(r.size)
-    #return D
+    # A stable sort groups the donors by receiver while keeping them in order
+    # of increasing ID within each group, as the original B&W loop does.
+    return numpy.argsort(r, kind='mergesort')
 
 
 def make_ordered_node_array(receiver_nodes, baselevel_nodes):
@@ -211,17 +205,21 @@ def make_ordered_node_array(receiver_nodes, baselevel_nodes):
     >>> s = make_ordered_node_array(r, b)
     >>> s
     array([4, 1, 0, 2, 5, 6, 3, 8, 7, 9])
+
+    The stack is built without recursion, so flow paths can be of any length.
+
+    >>> r = np.arange(-1, 99999)
+    >>> r[0] = 0
+    >>> make_ordered_node_array(r, np.array([0]))[-3:]
+    array([99997, 99998, 99999])
     """
     nd = _make_number_of_donors_array(receiver_nodes)
     delta = _make_delta_array(nd)
     D = _make_array_of_donors(receiver_nodes, delta)
-    dstack = _DrainageStack(delta, D)
-    len_bl_nodes = baselevel_nodes.size
     s = numpy.zeros(D.size, dtype=int)
-    add_it = dstack.add_to_stack
-    for k in baselevel_nodes:
-        add_it(k) #don't think this is a bottleneck, so no C++
-    return dstack.s
+    _add_to_stack(numpy.asarray(baselevel_nodes, dtype=int), 0, s, delta, D,
+                  numpy.empty_like(s))
+    return s
 
 
 def find_drainage_area_and_discharge(s, r, node_cell_area=1.0, runoff=1.0,
@@ -273,32 +271,65 @@ def find_drainage_area_and_discharge(s, r, node_cell_area=1.0, runoff=1.0,
     array([  1.,   3.,   1.,   1.,  10.,   4.,   3.,   2.,   1.,   1.])
     """
 
-    # Number of points
-    np = len(s)
-
     # Initialize the drainage_area and discharge arrays. Drainage area starts
     # out as the area of the cell in question, then (unless the cell has no
     # donors) grows from there. Discharge starts out as the cell's local runoff
     # rate times the cell's surface area.
-    drainage_area = numpy.zeros(np, dtype=int) + node_cell_area
-    discharge = numpy.zeros(np, dtype=int) + node_cell_area*runoff
+    weights = numpy.empty((2, len(s)), dtype=float)
+    weights[0] = node_cell_area
+    weights[1] = node_cell_area * runoff
 
     # Optionally zero out drainage area and discharge at boundary nodes
     if boundary_nodes is not None:
-        drainage_area[boundary_nodes] = 0
-        discharge[boundary_nodes] = 0
-
-    # Iterate backward through the list, which means we work from upstream to
-    # downstream.
-    num_pts = len(s)
-    for i in range(np-1, -1, -1):
-        donor = s[i]
-        recvr = r[donor]
-        if donor != recvr:
-            drainage_area[recvr] += drainage_area[donor]
-            discharge[recvr] += discharge[donor]
-
-    return drainage_area, discharge
+        weights[:, boundary_nodes] = 0
+
+    # Work backward through the stack, from upstream to downstream.
+    _accumulate_bw(as_id_array(s), as_id_array(r), weights)
+
+    return weights[0], weights[1]
+
+
+def accumulate_weights(s, r, weights):
+    """Accumulate one or more node quantities down a flow network.
+
+    Each node's value is added to those of all the nodes downstream of it,
+    exactly as drainage area is accumulated. Several quantities can be
+    accumulated in a single reverse pass through the stack by providing them
+    as the rows of a 2D array.
+
+    Parameters
+    ----------
+    s : ndarray of int
+        Ordered (downstream to upstream) array of node IDs
+    r : ndarray of int
+        Receiver IDs for each node
+    weights : array_like
+        Values at nodes, either as an array of length number of nodes, or an
+        array of shape (number of quantities, number of nodes).
+
+    Returns
+    -------
+    ndarray
+        Accumulated values, with the same shape as *weights*.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.flow_accum import accumulate_weights
+    >>> r = np.array([2, 5, 2, 7, 5, 5, 6, 5, 7, 8])-1
+    >>> s = np.array([4, 1, 0, 2, 5, 6, 3, 8, 7, 9])
+    >>> accumulate_weights(s, r, np.ones(10))
+    array([  1.,   3.,   1.,   1.,  10.,   4.,   3.,   2.,   1.,   1.])
+
+    >>> weights = np.vstack((np.ones(10), np.arange(10.)))
+    >>> accumulate_weights(s, r, weights)
+    array([[  1.,   3.,   1.,   1.,  10.,   4.,   3.,   2.,   1.,   1.],
+           [  0.,   3.,   2.,   3.,  45.,  22.,  17.,  16.,   8.,   9.]])
+    """
+    acc = numpy.array(weights, dtype=float, ndmin=2)
+    _accumulate_bw(as_id_array(s), as_id_array(r), acc)
+
+    return acc.reshape(numpy.shape(weights))
 
 
 def flow_accumulation(receiver_nodes, baselevel_nodes, node_cell_area=1.0,
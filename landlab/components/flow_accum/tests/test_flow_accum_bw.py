@@ -0,0 +1,121 @@
+"""Test the drainage stack and flow accumulation of flow_accum_bw.
+
+Results are compared with straightforward implementations of the recursive
+Braun & Willett (2012) stack and the loop through it that accumulates flow.
+"""
+import sys
+
+import numpy as np
+from numpy.testing import assert_array_equal
+from nose.tools import assert_equal
+
+from landlab.components.flow_accum import (make_ordered_node_array,
+                                           find_drainage_area_and_discharge,
+                                           accumulate_weights,
+                                           flow_accumulation)
+from landlab.components.flow_accum.flow_accum_bw import (
+    _DrainageStack, _make_number_of_donors_array, _make_delta_array,
+    _make_array_of_donors)
+
+
+def _random_d8_receivers(shape, seed):
+    """Receivers to the lowest of each node and its 8 neighbors."""
+    (n_rows, n_cols) = shape
+    z = np.full((n_rows + 2, n_cols + 2), np.inf)
+    z[1:-1, 1:-1] = np.random.RandomState(seed).rand(n_rows, n_cols)
+    ids = np.full((n_rows + 2, n_cols + 2), -1, dtype=int)
+    ids[1:-1, 1:-1] = np.arange(n_rows * n_cols).reshape(shape)
+
+    offsets = [(row, col) for row in (-1, 0, 1) for col in (-1, 0, 1)]
+    z_around = np.stack([z[1 + row:n_rows + 1 + row, 1 + col:n_cols + 1 + col]
+                         for (row, col) in offsets])
+    ids_around = np.stack([
+        ids[1 + row:n_rows + 1 + row, 1 + col:n_cols + 1 + col]
+        for (row, col) in offsets])
+    lowest = np.argmin(z_around, axis=0)
+    receivers = np.choose(lowest, ids_around).flatten()
+    return receivers, np.where(receivers == np.arange(receivers.size))[0]
+
+
+def _recursive_stack(receivers, baselevel_nodes):
+    """The stack as built by the recursive add_to_stack procedure."""
+    donors = [[] for _ in range(receivers.size)]
+    for node, receiver in enumerate(receivers):
+        if node != receiver:
+            donors[receiver].append(node)
+
+    stack = []
+
+    def add_to_stack(node):
+        stack.append(node)
+        for donor in donors[node]:
+            add_to_stack(donor)
+
+    for node in baselevel_nodes:
+        add_to_stack(node)
+    return np.array(stack)
+
+
+def _accumulate_in_loop(s, r, values):
+    values = np.array(values, dtype=float)
+    for donor in s[::-1]:
+        if r[donor] != donor:
+            values[..., r[donor]] += values[..., donor]
+    return values
+
+
+def test_stack_matches_recursive_stack():
+    for seed in range(5):
+        r, b = _random_d8_receivers((20, 30), seed)
+        assert_equal(b.size > 5, True)
+        assert_array_equal(make_ordered_node_array(r, b),
+                           _recursive_stack(r, b))
+
+
+def test_drainage_stack_one_baselevel_node_at_a_time():
+    r, b = _random_d8_receivers((15, 17), 1)
+    delta = _make_delta_array(_make_number_of_donors_array(r))
+    stack = _DrainageStack(delta, _make_array_of_donors(r, delta))
+    for node in b:
+        stack.add_to_stack(node)
+    assert_equal(stack.j, r.size)
+    assert_array_equal(stack.s, _recursive_stack(r, b))
+
+
+def test_accumulation_matches_loop():
+    for seed in range(5):
+        r, b = _random_d8_receivers((20, 30), seed)
+        s = make_ordered_node_array(r, b)
+        random = np.random.RandomState(seed)
+        area = random.rand(r.size)
+        runoff = random.rand(r.size)
+
+        a, q = find_drainage_area_and_discharge(s, r, area, runoff,
+                                                boundary_nodes=b[:2])
+        area[b[:2]] = 0.
+        runoff[b[:2]] = 0.
+        assert_array_equal(a, _accumulate_in_loop(s, r, area))
+        assert_array_equal(q, _accumulate_in_loop(s, r, area * runoff))
+
+
+def test_accumulate_several_weights():
+    r, b = _random_d8_receivers((20, 30), 7)
+    s = make_ordered_node_array(r, b)
+    weights = np.random.RandomState(8).rand(3, r.size)
+
+    acc = accumulate_weights(s, r, weights)
+    assert_equal(acc.shape, weights.shape)
+    for row in range(3):
+        assert_array_equal(acc[row], _accumulate_in_loop(s, r, weights[row]))
+        assert_array_equal(accumulate_weights(s, r, weights[row]), acc[row])
+
+
+def test_long_single_flow_path():
+    n_nodes = 5 * sys.getrecursionlimit() + 10 ** 4
+    r = np.arange(-1, n_nodes - 1)
+    r[0] = 0
+
+    a, q, s = flow_accumulation(r, np.array([0]))
+    assert_array_equal(s, np.arange(n_nodes))
+    assert_array_equal(a, np.arange(n_nodes, 0, -1))
+    assert_array_equal(q, a)
@@ -0,0 +1,64 @@
+"""Benchmark steepest-descent flow directions on large rasters.
+
+Compares the compiled raster sweep used by FlowRouter with the (previous)
+sweep over the d8 active links, for grids of 1 million and 16 million nodes.
+"""
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components.flow_routing import FlowRouter
+
+
+def _make_router(shape, method='D8'):
+    rmg = RasterModelGrid(shape)
+    np.random.seed(0)
+    rmg.add_field('node', 'topographic__elevation',
+                  np.random.rand(rmg.number_of_nodes) + 0.001 * rmg.node_y)
+    return FlowRouter(rmg, method=method)
+
+
+def bench_d8_link_sweep_1m():
+    fr = _make_router((1000, 1000))
+    fr._route_by_active_links(fr.grid.at_node['topographic__elevation'])
+
+
+def bench_d8_raster_kernel_1m():
+    fr = _make_router((1000, 1000))
+    fr._route_raster_steepest_descent(
+        fr.grid.at_node['topographic__elevation'])
+
+
+def bench_d4_link_sweep_1m():
+    fr = _make_router((1000, 1000), method='D4')
+    fr._route_by_active_links(fr.grid.at_node['topographic__elevation'])
+
+
+def bench_d4_raster_kernel_1m():
+    fr = _make_router((1000, 1000), method='D4')
+    fr._route_raster_steepest_descent(
+        fr.grid.at_node['topographic__elevation'])
+
+
+def bench_d8_link_sweep_16m():
+    fr = _make_router((4000, 4000))
+    fr._route_by_active_links(fr.grid.at_node['topographic__elevation'])
+
+
+def bench_d8_raster_kernel_16m():
+    fr = _make_router((4000, 4000))
+    fr._route_raster_steepest_descent(
+        fr.grid.at_node['topographic__elevation'])
+
+
+if __name__ == '__main__':
+    import timeit
+
+    for shape, label in (((1000, 1000), '1m'), ((4000, 4000), '16m')):
+        fr = _make_router(shape)
+        z = fr.grid.at_node['topographic__elevation']
+        for name in ('_route_by_active_links',
+                     '_route_raster_steepest_descent'):
+            func = getattr(fr, name)
+            t = min(timeit.repeat(lambda: func(z), number=1, repeat=3))
+            print('{label} nodes, {name}: {t:.3f} s'.format(label=label,
+                                                            name=name, t=t))
@@ -55,3 +55,443 @@ def adjust_flow_receivers(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
             receiver[dst_id] = src_id
             steepest_slope[dst_id] = - link_slope[i]
             receiver_link[dst_id] = active_links[i]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def raster_steepest_descent(shape, double dx, double dy,
+                            np.ndarray[DTYPE_FLOAT_t, ndim=1] z,
+                            np.ndarray[np.int8_t, ndim=1] status,
+                            np.ndarray[np.uint8_t, ndim=1] active_link,
+                            bint diagonals,
+                            np.ndarray[DTYPE_INT_t, ndim=1] receiver,
+                            np.ndarray[DTYPE_FLOAT_t, ndim=1] steepest_slope,
+                            np.ndarray[DTYPE_INT_t, ndim=1] receiver_link,
+                            np.ndarray[DTYPE_INT_t, ndim=1] sink):
+    """Find D8 or D4 steepest-descent receivers on a raster in one sweep.
+
+    Receivers are found arithmetically from the row and column of each node
+    rather than from link lists, and neighbors are visited in order of
+    increasing link ID so that ties are broken exactly as in
+    :func:`adjust_flow_receivers`. Fixed-value and fixed-gradient boundary
+    nodes are their own receivers.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Number of rows and columns of nodes.
+    dx : float
+        Spacing between columns.
+    dy : float
+        Spacing between rows.
+    z : array_like
+        Node elevations.
+    status : array_like
+        Boundary status of each node.
+    active_link : array_like
+        Flag for each link (diagonal links numbered after the orthogonal
+        links) that is 1 if the link is active.
+    diagonals : bool
+        If True, route along diagonal links as well (D8).
+    receiver : array_like
+        Output array of flow receivers at nodes.
+    steepest_slope : array_like
+        Output array of downhill-positive slopes to receivers.
+    receiver_link : array_like
+        Output array of links to receivers (or -1).
+    sink : array_like
+        Output buffer (of size at least number of nodes) for the IDs of
+        sink nodes.
+
+    Returns
+    -------
+    int
+        Number of sink nodes written to *sink*.
+    """
+    cdef DTYPE_INT_t n_rows = shape[0]
+    cdef DTYPE_INT_t n_cols = shape[1]
+    cdef DTYPE_INT_t links_per_row = 2 * n_cols - 1
+    cdef DTYPE_INT_t n_links = n_rows * links_per_row - n_cols
+    cdef DTYPE_INT_t patches_per_row = n_cols - 1
+    cdef double diagonal_length = np.sqrt(dy ** 2. + dx ** 2.)
+    cdef DTYPE_INT_t n_sinks = 0
+    cdef DTYPE_INT_t row, col, node, nbr, link, recvr, recvr_link
+    cdef double z_node, slope, max_slope
+    cdef np.int8_t node_status
+
+    for row in range(n_rows):
+        for col in range(n_cols):
+            node = row * n_cols + col
+            recvr = node
+            recvr_link = -1
+            max_slope = 0.
+            node_status = status[node]
+
+            if node_status == 0 or node_status == 3:
+                z_node = z[node]
+                # Orthogonal neighbors, in order S, W, E, N
+                if row > 0:
+                    nbr = node - n_cols
+                    link = (row - 1) * links_per_row + n_cols - 1 + col
+                    if active_link[link] and z_node > z[nbr]:
+                        slope = (z_node - z[nbr]) / dy
+                        if slope > max_slope:
+                            max_slope, recvr, recvr_link = slope, nbr, link
+                if col > 0:
+                    nbr = node - 1
+                    link = row * links_per_row + col - 1
+                    if active_link[link] and z_node > z[nbr]:
+                        slope = (z_node - z[nbr]) / dx
+                        if slope > max_slope:
+                            max_slope, recvr, recvr_link = slope, nbr, link
+                if col < n_cols - 1:
+                    nbr = node + 1
+                    link = row * links_per_row + col
+                    if active_link[link] and z_node > z[nbr]:
+                        slope = (z_node - z[nbr]) / dx
+                        if slope > max_slope:
+                            max_slope, recvr, recvr_link = slope, nbr, link
+                if row < n_rows - 1:
+                    nbr = node + n_cols
+                    link = row * links_per_row + n_cols - 1 + col
+                    if active_link[link] and z_node > z[nbr]:
+                        slope = (z_node - z[nbr]) / dy
+                        if slope > max_slope:
+                            max_slope, recvr, recvr_link = slope, nbr, link
+
+                # Diagonal neighbors, in order SW, SE, NW, NE
+                if diagonals:
+                    if row > 0 and col > 0:
+                        nbr = node - n_cols - 1
+                        link = (n_links +
+                                2 * ((row - 1) * patches_per_row + col - 1))
+                        if active_link[link] and z_node > z[nbr]:
+                            slope = (z_node - z[nbr]) / diagonal_length
+                            if slope > max_slope:
+                                max_slope, recvr, recvr_link = (slope, nbr,
+                                                                link)
+                    if row > 0 and col < n_cols - 1:
+                        nbr = node - n_cols + 1
+                        link = (n_links +
+                                2 * ((row - 1) * patches_per_row + col) + 1)
+                        if active_link[link] and z_node > z[nbr]:
+                            slope = (z_node - z[nbr]) / diagonal_length
+                            if slope > max_slope:
+                                max_slope, recvr, recvr_link = (slope, nbr,
+                                                                link)
+                    if row < n_rows - 1 and col > 0:
+                        nbr = node + n_cols - 1
+                        link = (n_links +
+                                2 * (row * patches_per_row + col - 1) + 1)
+                        if active_link[link] and z_node > z[nbr]:
+                            slope = (z_node - z[nbr]) / diagonal_length
+                            if slope > max_slope:
+                                max_slope, recvr, recvr_link = (slope, nbr,
+                                                                link)
+                    if row < n_rows - 1 and col < n_cols - 1:
+                        nbr = node + n_cols + 1
+                        link = n_links + 2 * (row * patches_per_row + col)
+                        if active_link[link] and z_node > z[nbr]:
+                            slope = (z_node - z[nbr]) / diagonal_length
+                            if slope > max_slope:
+                                max_slope, recvr, recvr_link = (slope, nbr,
+                                                                link)
+
+            receiver[node] = recvr
+            steepest_slope[node] = max_slope
+            receiver_link[node] = recvr_link
+            if recvr == node:
+                sink[n_sinks] = node
+                n_sinks += 1
+
+    return n_sinks
+
+
+cdef inline bint _precedes(DTYPE_FLOAT_t * key, DTYPE_INT_t * order,
+                           DTYPE_INT_t i, DTYPE_INT_t j):
+    """True if heap entry *i* should be popped before heap entry *j*."""
+    return key[i] < key[j] or (key[i] == key[j] and order[i] < order[j])
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def priority_flood_fill(np.ndarray[DTYPE_FLOAT_t, ndim=1] z,
+                        np.ndarray[DTYPE_INT_t, ndim=2] nbrs,
+                        np.ndarray[DTYPE_INT_t, ndim=1] seeds,
+                        np.ndarray[DTYPE_FLOAT_t, ndim=1] filled):
+    """Fill depressions to their spill elevation by priority flood.
+
+    This is the "improved" priority-flood of Barnes et al. (2014): nodes are
+    visited lowest-first from the seed (outlet) nodes using a binary heap,
+    while nodes that lie below the current water level are passed through a
+    plain FIFO queue, so that the interiors of depressions cost O(1) each.
+
+    Parameters
+    ----------
+    z : array_like
+        Node elevations.
+    nbrs : array_like of int, shape (n_nodes, n_neighbors)
+        Neighbors of every node, padded with -1.
+    seeds : array_like of int
+        Nodes from which the flood starts (i.e., the outlets of the grid).
+    filled : array_like
+        Output array that holds the elevation to which each node is filled.
+        Nodes that can not be reached from any seed are not flooded.
+    """
+    cdef DTYPE_INT_t n_nodes = z.shape[0]
+    cdef DTYPE_INT_t n_nbrs = nbrs.shape[1]
+    cdef DTYPE_INT_t n_seeds = seeds.shape[0]
+    cdef np.ndarray[DTYPE_FLOAT_t, ndim=1] heap_key = np.empty(
+        n_nodes, dtype=DTYPE_FLOAT)
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] heap_order = np.empty(
+        n_nodes, dtype=DTYPE_INT)
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] heap_node = np.empty(
+        n_nodes, dtype=DTYPE_INT)
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] pit_queue = np.empty(
+        n_nodes, dtype=DTYPE_INT)
+    cdef np.ndarray[np.uint8_t, ndim=1] visited = np.zeros(
+        n_nodes, dtype=np.uint8)
+    cdef DTYPE_FLOAT_t * key = <DTYPE_FLOAT_t *>heap_key.data
+    cdef DTYPE_INT_t * order = <DTYPE_INT_t *>heap_order.data
+    cdef DTYPE_INT_t heap_size = 0
+    cdef DTYPE_INT_t n_pushed = 0
+    cdef DTYPE_INT_t pit_head = 0
+    cdef DTYPE_INT_t pit_tail = 0
+    cdef DTYPE_INT_t node, nbr, i, k, parent, child
+    cdef DTYPE_FLOAT_t level, tmp_key
+    cdef DTYPE_INT_t tmp_order, tmp_node
+
+    filled[:] = z
+
+    for i in range(n_seeds):
+        node = seeds[i]
+        if visited[node]:
+            continue
+        visited[node] = 1
+        # push the seed onto the heap
+        child = heap_size
+        heap_size += 1
+        heap_key[child] = z[node]
+        heap_order[child] = n_pushed
+        heap_node[child] = node
+        n_pushed += 1
+        while child > 0:
+            parent = (child - 1) // 2
+            if not _precedes(key, order, child, parent):
+                break
+            tmp_key = heap_key[child]
+            tmp_order = heap_order[child]
+            tmp_node = heap_node[child]
+            heap_key[child] = heap_key[parent]
+            heap_order[child] = heap_order[parent]
+            heap_node[child] = heap_node[parent]
+            heap_key[parent] = tmp_key
+            heap_order[parent] = tmp_order
+            heap_node[parent] = tmp_node
+            child = parent
+
+    while heap_size > 0 or pit_head < pit_tail:
+        if pit_head < pit_tail:
+            node = pit_queue[pit_head]
+            pit_head += 1
+        else:
+            # pop the lowest node off the heap
+            node = heap_node[0]
+            heap_size -= 1
+            heap_key[0] = heap_key[heap_size]
+            heap_order[0] = heap_order[heap_size]
+            heap_node[0] = heap_node[heap_size]
+            parent = 0
+            while True:
+                child = 2 * parent + 1
+                if child >= heap_size:
+                    break
+                if (child + 1 < heap_size and
+                        _precedes(key, order, child + 1, child)):
+                    child += 1
+                if not _precedes(key, order, child, parent):
+                    break
+                tmp_key = heap_key[child]
+                tmp_order = heap_order[child]
+                tmp_node = heap_node[child]
+                heap_key[child] = heap_key[parent]
+                heap_order[child] = heap_order[parent]
+                heap_node[child] = heap_node[parent]
+                heap_key[parent] = tmp_key
+                heap_order[parent] = tmp_order
+                heap_node[parent] = tmp_node
+                parent = child
+
+        level = filled[node]
+        for k in range(n_nbrs):
+            nbr = nbrs[node, k]
+            if nbr == -1 or visited[nbr]:
+                continue
+            visited[nbr] = 1
+            if z[nbr] <= level:
+                filled[nbr] = level
+                pit_queue[pit_tail] = nbr
+                pit_tail += 1
+            else:
+                child = heap_size
+                heap_size += 1
+                heap_key[child] = z[nbr]
+                heap_order[child] = n_pushed
+                heap_node[child] = nbr
+                n_pushed += 1
+                while child > 0:
+                    parent = (child - 1) // 2
+                    if not _precedes(key, order, child, parent):
+                        break
+                    tmp_key = heap_key[child]
+                    tmp_order = heap_order[child]
+                    tmp_node = heap_node[child]
+                    heap_key[child] = heap_key[parent]
+                    heap_order[child] = heap_order[parent]
+                    heap_node[child] = heap_node[parent]
+                    heap_key[parent] = tmp_key
+                    heap_order[parent] = tmp_order
+                    heap_node[parent] = tmp_node
+                    child = parent
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def find_lakes_from_pits(np.ndarray[DTYPE_FLOAT_t, ndim=1] z,
+                         np.ndarray[DTYPE_FLOAT_t, ndim=1] filled,
+                         np.ndarray[DTYPE_INT_t, ndim=2] nbrs,
+                         np.ndarray[DTYPE_INT_t, ndim=1] pits,
+                         np.ndarray[np.uint8_t, ndim=1] is_baselevel,
+                         np.ndarray[DTYPE_INT_t, ndim=1] lake_map,
+                         np.ndarray[DTYPE_INT_t, ndim=1] outlet_map):
+    """Map the lake that holds each pit on a priority-flood filled surface.
+
+    Starting from each pit in turn, the lake is grown over all connected
+    nodes that lie below the pit's fill level. Nodes that sit exactly at
+    the fill level (i.e., on a flat spillway) are then tested in the order
+    they were found. The first that is either a baselevel node or has a
+    neighbor with a lower fill level is the lake outlet; the others are
+    added to the lake (with zero depth) and the lake keeps growing. A lake
+    that grows over a flat spillway into a lake already mapped from an
+    earlier pit is merged into it.
+
+    Parameters
+    ----------
+    z : array_like
+        Node elevations.
+    filled : array_like
+        Fill elevations, as calculated by :func:`priority_flood_fill`.
+    nbrs : array_like of int, shape (n_nodes, n_neighbors)
+        Neighbors of every node, padded with -1.
+    pits : array_like of int
+        Pit nodes, in the order they are to be processed. Each lake is coded
+        with the ID of the first of its pits.
+    is_baselevel : array_like of bool
+        Flags nodes that are baselevel (outlet) nodes of the grid.
+    lake_map : array_like of int
+        Output array of the lake code of every node, or -1 if not in a lake.
+        Must be initialized to -1.
+    outlet_map : array_like of int
+        Output array of the outlet node of every lake node, or -1 if not in
+        a lake.
+    """
+    cdef DTYPE_INT_t n_nodes = z.shape[0]
+    cdef DTYPE_INT_t n_nbrs = nbrs.shape[1]
+    cdef DTYPE_INT_t n_pits = pits.shape[0]
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] lake_nodes = np.empty(
+        n_nodes, dtype=DTYPE_INT)
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] candidates = np.empty(
+        n_nodes, dtype=DTYPE_INT)
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] candidate_of = np.empty(
+        n_nodes, dtype=DTYPE_INT)
+    cdef DTYPE_INT_t i, k, pit, node, nbr, outlet, joins_lake
+    cdef DTYPE_INT_t n_lake, head, n_candidates, next_candidate
+    cdef DTYPE_FLOAT_t level
+    cdef bint can_drain
+
+    candidate_of.fill(-1)
+
+    for i in range(n_pits):
+        pit = pits[i]
+        if lake_map[pit] != -1 or is_baselevel[pit]:
+            continue
+        level = filled[pit]
+
+        # A "pit" that can already drain is not the bottom of a lake.
+        can_drain = False
+        for k in range(n_nbrs):
+            nbr = nbrs[pit, k]
+            if nbr != -1 and filled[nbr] < level:
+                can_drain = True
+        if can_drain:
+            continue
+
+        lake_map[pit] = pit
+        lake_nodes[0] = pit
+        n_lake = 1
+        head = 0
+        n_candidates = 0
+        next_candidate = 0
+        outlet = -1
+        joins_lake = -1
+        while True:
+            # flood everything connected that lies below the fill level
+            while head < n_lake:
+                node = lake_nodes[head]
+                head += 1
+                for k in range(n_nbrs):
+                    nbr = nbrs[node, k]
+                    if nbr == -1 or lake_map[nbr] == pit:
+                        continue
+                    if lake_map[nbr] != -1:
+                        # we have reached an earlier lake at the same level
+                        joins_lake = lake_map[nbr]
+                        outlet = outlet_map[nbr]
+                        continue
+                    if z[nbr] < level:
+                        if filled[nbr] == level:
+                            lake_map[nbr] = pit
+                            lake_nodes[n_lake] = nbr
+                            n_lake += 1
+                    elif z[nbr] == level and candidate_of[nbr] != pit:
+                        candidate_of[nbr] = pit
+                        candidates[n_candidates] = nbr
+                        n_candidates += 1
+
+            if joins_lake != -1:
+                break
+
+            # test the spillway nodes, in the order they were found
+            while next_candidate < n_candidates:
+                node = candidates[next_candidate]
+                next_candidate += 1
+                if lake_map[node] != -1:
+                    continue
+                can_drain = is_baselevel[node]
+                for k in range(n_nbrs):
+                    nbr = nbrs[node, k]
+                    if nbr != -1 and filled[nbr] < level:
+                        can_drain = True
+                if can_drain:
+                    outlet = node
+                else:
+                    lake_map[node] = pit
+                    lake_nodes[n_lake] = node
+                    n_lake += 1
+                break
+
+            if outlet != -1 or head == n_lake:
+                break
+
+        if joins_lake != -1:
+            # the two lakes are one, connected over a flat spillway
+            for k in range(n_lake):
+                lake_map[lake_nodes[k]] = joins_lake
+                outlet_map[lake_nodes[k]] = outlet
+        elif outlet == -1:
+            # no way out of this lake; leave it unflooded
+            for k in range(n_lake):
+                lake_map[lake_nodes[k]] = -1
+        else:
+            for k in range(n_lake):
+                outlet_map[lake_nodes[k]] = outlet
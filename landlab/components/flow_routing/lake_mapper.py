@@ -8,11 +8,13 @@ from __future__ import print_function
 
 import numpy as np
 from landlab import (ModelParameterDictionary, Component, FieldError,
-                     FIXED_VALUE_BOUNDARY, CLOSED_BOUNDARY)
+                     FIXED_VALUE_BOUNDARY, FIXED_GRADIENT_BOUNDARY,
+                     CLOSED_BOUNDARY)
 from landlab.core.utils import as_id_array
 from landlab.core.model_parameter_dictionary import MissingKeyError
 from landlab.components.flow_accum import flow_accum_bw
 from landlab.grid.base import BAD_INDEX_VALUE as LOCAL_BAD_INDEX_VALUE
+from .cfuncs import priority_flood_fill, find_lakes_from_pits
 # LOCAL_BAD_INDEX_VALUE = np.iinfo(np.int32).max
 import landlab
 
@@ -55,7 +57,7 @@ class DepressionFinderAndRouter(Component):
 
     Construction::
 
-        DepressionFinderAndRouter(grid, grid, routing='D8')
+        DepressionFinderAndRouter(grid, routing='D8', priority_flood=False)
 
     Parameters
     ----------
@@ -65,6 +67,17 @@ class DepressionFinderAndRouter(Component):
         If grid is a raster type, controls whether lake connectivity can
         occur on diagonals ('D8', default), or only orthogonally ('D4').
         Has no effect if grid is not a raster.
+    priority_flood : bool (optional)
+        If True, map the depressions with a single priority-flood pass over
+        the grid, rather than by growing each lake outward from its pit one
+        node at a time. This is much faster for large grids and for large
+        lakes. Each depression is filled exactly to the elevation at which
+        it spills, so the depths and extents of the lakes are correct; the
+        default method gets them wrong for some arrangements of nested and
+        adjoining depressions, and there the two methods differ. Where the
+        default method is right the lakes are the same (up to the choice
+        between equally valid outlets on flat spillways), but each lake is
+        coded with the lowest ID of the pits it contains.
 
     Examples
     --------
@@ -121,6 +134,23 @@ class DepressionFinderAndRouter(Component):
     Because rereoute_flow defaults to True, the flow connectivity fields
     created by the FlowRouter will have now been modified to route flow over
     the depressions in the surface. The topogrphy itself is not modified.
+
+    Here the priority-flood method finds the same lake, and routes flow
+    across it in the same way:
+
+    >>> fr.run_one_step()
+    >>> df = DepressionFinderAndRouter(mg, priority_flood=True)
+    >>> df.map_depressions()
+    >>> mg.at_node['drainage_area'].reshape(mg.shape)
+    array([[ 0.  ,  0.  ,  0.  ,  0.  ,  0.  ,  0.  ,  0.  ],
+           [ 0.25,  0.25,  0.25,  0.25,  0.25,  0.25,  0.  ],
+           [ 5.25,  5.25,  3.75,  2.  ,  1.  ,  0.25,  0.  ],
+           [ 0.25,  0.25,  1.25,  1.25,  0.5 ,  0.25,  0.  ],
+           [ 0.25,  0.25,  0.5 ,  0.5 ,  1.  ,  0.25,  0.  ],
+           [ 0.25,  0.25,  0.25,  0.25,  0.25,  0.25,  0.  ],
+           [ 0.  ,  0.  ,  0.  ,  0.  ,  0.  ,  0.  ,  0.  ]])
+    >>> df.lake_outlets
+    array([15])
     """
 
     _name = 'DepressionFinderAndRouter'
@@ -150,7 +180,7 @@ class DepressionFinderAndRouter(Component):
             'otherwise BAD_INDEX_VALUE'
     }
 
-    def __init__(self, grid, routing='D8', **kwds):
+    def __init__(self, grid, routing='D8', priority_flood=False, **kwds):
         """Create a DepressionFinderAndRouter.
 
         Constructor assigns a copy of the grid, sets the current time, and
@@ -164,8 +194,12 @@ class DepressionFinderAndRouter(Component):
             If grid is a raster type, controls whether lake connectivity can
             occur on diagonals ('D8', default), or only orthogonally ('D4').
             Has no effect if grid is not a raster.
+        priority_flood : bool (optional)
+            If True, map depressions with a priority-flood algorithm
+            (default is False).
         """
         self._grid = grid
+        self._priority_flood = priority_flood
         self._bc_set_code = self.grid.bc_set_code
         if routing is not 'D8':
             assert routing is 'D4'
@@ -355,20 +389,20 @@ class DepressionFinderAndRouter(Component):
         # If we have a raster grid, handle the diagonal active links too
         # (At the moment, their data structure is a bit different)
         # TODO: update the diagonal link data structures
-        # DEJH doesn't understand why this can't be vectorized as above...
         if self._D8:
-            for i in range(len(self._grid._diag_active_links)):
-                h = self._grid._diag_activelink_tonode[i]
-                t = self._grid._diag_activelink_fromnode[i]
-                if self._elev[h] > self._elev[t]:
-                    self.is_pit[h] = False
-                elif self._elev[t] > self._elev[h]:
-                    self.is_pit[t] = False
-                elif self._elev[h] == self._elev[t]:
-                    if self._grid.status_at_node[h] == FIXED_VALUE_BOUNDARY:
-                        self.is_pit[t] = False
-                    elif self._grid.status_at_node[t] == FIXED_VALUE_BOUNDARY:
-                        self.is_pit[h] = False
+            h_diag = as_id_array(h_diag)
+            t_diag = as_id_array(t_diag)
+            self.is_pit[h_diag[self._elev[h_diag] >
+                               self._elev[t_diag]]] = False
+            self.is_pit[t_diag[self._elev[t_diag] >
+                               self._elev[h_diag]]] = False
+            is_flat = self._elev[h_diag] == self._elev[t_diag]
+            h_is_outlet = (self._grid.status_at_node[h_diag] ==
+                           FIXED_VALUE_BOUNDARY)
+            t_is_outlet = (self._grid.status_at_node[t_diag] ==
+                           FIXED_VALUE_BOUNDARY)
+            self.is_pit[t_diag[is_flat & h_is_outlet]] = False
+            self.is_pit[h_diag[is_flat & ~h_is_outlet & t_is_outlet]] = False
 
         # Record the number of pits and the IDs of pit nodes.
         self.number_of_pits = np.count_nonzero(self.is_pit)
@@ -592,6 +626,43 @@ class DepressionFinderAndRouter(Component):
         self.unique_lake_outlets = np.array(self.depression_outlets
                                             )[self._unique_pits]
 
+    def _identify_depressions_and_outlets_by_priority_flood(self):
+        """Find depression and lakes on a topographic surface in one pass.
+
+        Fill the surface up to the spill elevation of every depression with a
+        priority flood started from the grid's baselevel nodes, then map the
+        lake that holds each pit on the filled surface.
+        """
+        status = self._grid.status_at_node
+        is_baselevel = ((status == FIXED_VALUE_BOUNDARY) |
+                        (status == FIXED_GRADIENT_BOUNDARY))
+        nbrs = np.ascontiguousarray(self._node_nbrs, dtype=np.int_)
+        elev = np.asarray(self._elev, dtype=float)
+
+        filled = np.empty_like(elev)
+        priority_flood_fill(elev, nbrs,
+                            np.where(is_baselevel)[0].astype(np.int_),
+                            filled)
+        self._fill_elev = filled
+        find_lakes_from_pits(elev, filled, nbrs,
+                             self.pit_node_ids.astype(np.int_),
+                             is_baselevel.view(np.uint8), self._lake_map,
+                             self.depression_outlet_map)
+
+        in_lake = self._lake_map != LOCAL_BAD_INDEX_VALUE
+        self.flood_status[self.pit_node_ids] = _UNFLOODED
+        self.flood_status[in_lake] = _FLOODED
+        self.depression_depth[in_lake] = filled[in_lake] - elev[in_lake]
+
+        self._unique_pits = np.equal(self._lake_map[self.pit_node_ids],
+                                     self.pit_node_ids)
+        self.depression_outlets = list(
+            self.depression_outlet_map[self.pit_node_ids])
+        self._pits_flooded = np.count_nonzero(self._unique_pits)
+
+        self.unique_lake_outlets = np.array(self.depression_outlets
+                                            )[self._unique_pits]
+
     def map_depressions(self, pits='flow__sink_flag', reroute_flow=True):
         """Map depressions/lakes in a topographic surface.
 
@@ -674,14 +745,20 @@ class DepressionFinderAndRouter(Component):
         self.flood_status.fill(_UNFLOODED)
         self.flood_status[self.pit_node_ids] = _PIT
 
-        self._identify_depressions_and_outlets()
+        if self._priority_flood:
+            self._identify_depressions_and_outlets_by_priority_flood()
+        else:
+            self._identify_depressions_and_outlets()
 
         if reroute_flow and ('flow__receiver_node' in
                              self._grid.at_node.keys()):
             self.receivers = self._grid.at_node['flow__receiver_node']
             self.sinks = self._grid.at_node['flow__sink_flag']
             self.grads = self._grid.at_node['topographic__steepest_slope']
-            self._route_flow()
+            if self._priority_flood:
+                self._route_flow_by_priority_flood()
+            else:
+                self._route_flow()
             self._reaccumulate_flow()
 
     def _route_flow(self):
@@ -756,6 +833,106 @@ class DepressionFinderAndRouter(Component):
                             where_receiver_in_diag]
         self.sinks[self.pit_node_ids] = False
 
+    def _route_flow_by_priority_flood(self):
+        """Route flow across lake flats, which have already been identified.
+
+        The routing is the same as that of :func:`_route_flow`, but all of the
+        lakes are handled together, one ring of nodes out from the outlets at
+        a time, rather than one lake after another.
+        """
+        lake_outlets = as_id_array(self.lake_outlets)
+        lake_codes = self.lake_codes
+        self._handle_outlet_nodes_by_fill_elevation(np.unique(lake_outlets))
+
+        routed = np.zeros(self._grid.number_of_nodes, dtype=bool)
+        routed[lake_outlets] = True
+        nodes_on_front = lake_outlets
+        codes_on_front = lake_codes
+        while nodes_on_front.size > 0:
+            all_nbrs = self._node_nbrs[nodes_on_front]
+            in_lake = np.logical_and(
+                all_nbrs != -1,
+                self._lake_map[all_nbrs] == codes_on_front.reshape((-1, 1)))
+            in_lake[in_lake] = np.logical_not(routed[all_nbrs[in_lake]])
+            (drains_from, unique_indxs) = np.unique(
+                np.where(in_lake, all_nbrs, -1), return_index=True)
+            # the first occurrence of each node is its receiver, as
+            # in _route_flow. The first entry is always -1.
+            good_nbrs = drains_from != -1
+            drains_from = drains_from[good_nbrs]
+            drains_to = nodes_on_front[unique_indxs[good_nbrs] //
+                                       all_nbrs.shape[1]]
+            self.receivers[drains_from] = drains_to
+            self.grads[drains_from] = 0.
+            routed[drains_from] = True
+            nodes_on_front = drains_from
+            codes_on_front = self._lake_map[drains_from]
+
+        # now rewire the link connectivity (of the outlets, too):
+        nodes_in_lake = np.union1d(np.where(self.lake_at_node)[0],
+                                   lake_outlets)
+        where_receiver_in_ortho = np.equal(
+            self.receivers[nodes_in_lake].reshape((nodes_in_lake.size, 1)),
+            self.grid.neighbors_at_node[nodes_in_lake, :])
+        receiver_in_ortho = where_receiver_in_ortho.sum(axis=1).astype(bool)
+        self.grid.at_node['flow__link_to_receiver_node'][
+            nodes_in_lake[receiver_in_ortho]] = self.grid.links_at_node[
+                nodes_in_lake][where_receiver_in_ortho]
+        if self._D8:
+            where_receiver_in_diag = np.equal(
+                self.receivers[nodes_in_lake].reshape(
+                    (nodes_in_lake.size, 1)),
+                self.grid._diagonal_neighbors_at_node[nodes_in_lake, :])
+            receiver_in_diag = where_receiver_in_diag.sum(
+                axis=1).astype(bool)
+            self.grid.at_node['flow__link_to_receiver_node'][
+                nodes_in_lake[receiver_in_diag]] = \
+                self.grid._diagonal_links_at_node[nodes_in_lake][
+                    where_receiver_in_diag]
+        self.sinks[self.pit_node_ids[
+            self.lake_at_node[self.pit_node_ids]]] = False
+
+    def _handle_outlet_nodes_by_fill_elevation(self, outlet_nodes):
+        """Ensure the outlet nodes drain away from their lakes.
+
+        This does the job of :func:`_handle_outlet_node` for all the lakes
+        at once. Each outlet that is not a boundary node is routed down its
+        steepest slope to a neighbor with a lower fill elevation (i.e., a
+        node that is not part of any lake that spills over this outlet).
+
+        Parameters
+        ----------
+        outlet_nodes : array_like of int
+            The (unique) outlet nodes.
+        """
+        is_bc = self._grid.status_at_node[outlet_nodes] != 0
+        self.receivers[outlet_nodes[is_bc]] = outlet_nodes[is_bc]
+        outlet_nodes = outlet_nodes[~is_bc]
+        if outlet_nodes.size == 0:
+            return
+
+        nbrs = self._node_nbrs[outlet_nodes]
+        if isinstance(self._grid, landlab.grid.raster.RasterModelGrid):
+            link_l = self._link_lengths[:nbrs.shape[1]]
+        else:  # Voronoi
+            link_l = self._link_lengths[
+                self._grid.links_at_node[outlet_nodes, :]]
+        eff_slopes = ((self._elev[outlet_nodes].reshape((-1, 1)) -
+                       self._elev[nbrs]) / link_l)
+        can_drain = np.logical_and(
+            nbrs != -1,
+            self._fill_elev[nbrs] <
+            self._fill_elev[outlet_nodes].reshape((-1, 1)))
+        eff_slopes[~can_drain] = -np.inf
+        # of the steepest, take the lowest node ID, as _handle_outlet_node
+        is_steepest = np.logical_and(
+            can_drain,
+            eff_slopes == eff_slopes.max(axis=1).reshape((-1, 1)))
+        lowest = np.where(is_steepest, nbrs,
+                          self._grid.number_of_nodes).min(axis=1)
+        self.receivers[outlet_nodes] = lowest
+        self.grads[outlet_nodes] = eff_slopes.max(axis=1)
+
     def _reaccumulate_flow(self):
         """Update drainage area, discharge, and upstream order.
 
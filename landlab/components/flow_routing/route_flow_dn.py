@@ -16,6 +16,7 @@ from __future__ import print_function
 import landlab
 import warnings
 from landlab.components.flow_routing import flow_direction_DN
+from landlab.components.flow_routing.cfuncs import raster_steepest_descent
 from landlab.components.flow_accum import flow_accum_bw
 from landlab import FieldError, Component
 from landlab import ModelParameterDictionary
@@ -37,11 +38,17 @@ class FlowRouter(Component):
     the grid. This is because under Landlab definitions, perimeter nodes lack
     cells, so cannot accumulate any discharge.
 
+    On a raster, flow directions are found by a single compiled sweep over
+    the nodes that writes receivers, slopes and receiver links straight into
+    the output fields (ties are broken as for the general link-based sweep,
+    which is still used for other grid types).
+
     The primary method of this class is :func:`run_one_step`.
 
     Construction::
 
-        FlowRouter(grid, method='D8', runoff_rate=None)
+        FlowRouter(grid, method='D8', runoff_rate=None, incremental=False,
+                   incremental_threshold=0.25)
 
     Parameters
     ----------
@@ -56,6 +63,43 @@ class FlowRouter(Component):
         'water__unit_flux_in'. If both the field and argument are present at
         the time of initialization, runoff_rate will *overwrite* the field.
         If neither are set, defaults to spatially constant unit input.
+    incremental : bool, optional
+        If True, only update the upstream node order, drainage area and
+        discharge for the nodes upstream of nodes whose receivers have
+        changed since the last call to :func:`route_flow`, and for the nodes
+        along their old and new paths downstream. The upstream node order is
+        identical to that of a full update, and drainage area and discharge
+        agree to within rounding. Counts of the nodes updated and skipped are
+        kept in the *reroute_counts* dictionary.
+    incremental_threshold : float, optional
+        If, in incremental mode, the nodes upstream of nodes with new
+        receivers are more than this fraction of the grid's nodes, do a full
+        update instead.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components.flow_routing import FlowRouter
+    >>> mg = RasterModelGrid((6, 8))
+    >>> z = mg.add_field('node', 'topographic__elevation',
+    ...                  mg.node_x + 0.1 * mg.node_y)
+    >>> fr = FlowRouter(mg, incremental=True, incremental_threshold=0.5)
+    >>> fr.run_one_step()
+
+    Dig a pit. Only the nodes that now drain into it, and the nodes along
+    the paths they used to drain along, are updated.
+
+    >>> z[20] = 0.
+    >>> fr.run_one_step()
+    >>> mg.at_node['drainage_area'][16:24]
+    array([  2.,   2.,   1.,   1.,  12.,   2.,   1.,   0.])
+    >>> fr.reroute_counts['full_updates']
+    1
+    >>> fr.reroute_counts['incremental_updates']
+    1
+    >>> fr.reroute_counts['nodes_skipped']
+    27
     """
 
     _name = 'DNFlowRouter'
@@ -118,9 +162,16 @@ class FlowRouter(Component):
     }
 
     @use_file_name_or_kwds
-    def __init__(self, grid, method='D8', runoff_rate=None, **kwds):
+    def __init__(self, grid, method='D8', runoff_rate=None, incremental=False,
+                 incremental_threshold=0.25, **kwds):
         # We keep a local reference to the grid
         self._grid = grid
+        self._incremental = incremental
+        self._incremental_threshold = incremental_threshold
+        self.reroute_counts = {'full_updates': 0,
+                               'incremental_updates': 0,
+                               'nodes_recomputed': 0,
+                               'nodes_skipped': 0}
         self._bc_set_code = self.grid.bc_set_code
         if method in ('D8', 'D4', None):
             self.method = method
@@ -230,11 +281,26 @@ class FlowRouter(Component):
             self._activelink_from = d8f
             self._activelink_to = d8t
             # needs modifying in the loop if D4 (now done)
+            # flag the active d8 links for the compiled raster kernel
+            self._active_link_flag = numpy.zeros(
+                self.grid.number_of_links +
+                2 * (self.grid.number_of_node_rows - 1) *
+                (self.grid.number_of_node_columns - 1), dtype=numpy.uint8)
+            self._active_link_flag[dal] = 1
+            self._sink_buffer = numpy.empty(self.grid.number_of_nodes,
+                                            dtype=int)
         else:
             self._active_links = self.grid.active_links
             self._activelink_from = self.grid._activelink_fromnode
             self._activelink_to = self.grid._activelink_tonode
 
+        # closed cells can't contribute
+        self._node_cell_area = self.grid.cell_area_at_node.copy()
+        self._node_cell_area[self.grid.closed_boundary_nodes] = 0.
+
+        # anything saved for incremental updates is now out of date
+        self._last_receiver = None
+
     def route_flow(self, **kwds):
         """Route surface-water flow over a landscape.
 
@@ -332,10 +398,35 @@ class FlowRouter(Component):
         # be provided as grid
         elevs = self._grid['node']['topographic__elevation']
 
-        node_cell_area = self._grid.cell_area_at_node.copy()
-        node_cell_area[self._grid.closed_boundary_nodes] = 0.
-        # closed cells can't contribute
+        if self._is_raster and self._can_route_in_place(elevs):
+            # Compiled sweep that writes directly into the output fields
+            receiver, steepest_slope, sink, recvr_link = (
+                self._route_raster_steepest_descent(elevs))
+        else:
+            receiver, steepest_slope, sink, recvr_link = (
+                self._route_by_active_links(elevs))
+
+        # TODO: either need a way to calculate and return the *length* of the
+        # flow links, OR the caller has to handle the raster / non-raster case.
+
+        # Calculate drainage area, discharge, and ...
+        a, q, s = self._accumulate_flow(receiver, sink)
+
+        # added DEJH March 2014:
+        # store the generated data in the grid
+        self._grid['node']['drainage_area'][:] = a
+        self._grid['node']['flow__receiver_node'][:] = receiver
+        self._grid['node']['topographic__steepest_slope'][:] = steepest_slope
+        self._grid['node']['surface_water__discharge'][:] = q
+        self._grid['node']['flow__upstream_node_order'][:] = s
+        self._grid['node']['flow__link_to_receiver_node'][:] = recvr_link
+        self._grid['node']['flow__sink_flag'].fill(False)
+        self._grid['node']['flow__sink_flag'][sink] = True
 
+        return self._grid
+
+    def _route_by_active_links(self, elevs):
+        """Find flow directions by sweeping over the (d8) active links."""
         # Calculate the downhill-positive slopes at the d8 active links
         if self.method == 'D8':
             link_slope = - self._grid._calculate_gradients_at_d8_active_links(
@@ -352,42 +443,230 @@ class FlowRouter(Component):
         # Calculate flow directions
         if self.method == 'D4':
             num_d4_active = self._grid.number_of_active_links  # only d4
-            receiver, steepest_slope, sink, recvr_link = \
-                flow_direction_DN.flow_directions(elevs, self._active_links,
-                                         self._activelink_from[:num_d4_active],
-                                         self._activelink_to[:num_d4_active],
-                                         link_slope,
-                                         grid=self._grid,
-                                         baselevel_nodes=baselevel_nodes)
+            return flow_direction_DN.flow_directions(
+                elevs, self._active_links,
+                self._activelink_from[:num_d4_active],
+                self._activelink_to[:num_d4_active], link_slope,
+                grid=self._grid, baselevel_nodes=baselevel_nodes)
         else:  # Voronoi or D8
-            receiver, steepest_slope, sink, recvr_link = \
-                flow_direction_DN.flow_directions(elevs, self._active_links,
-                                     self._activelink_from,
-                                     self._activelink_to, link_slope,
-                                     grid=self._grid,
-                                     baselevel_nodes=baselevel_nodes)
+            return flow_direction_DN.flow_directions(
+                elevs, self._active_links, self._activelink_from,
+                self._activelink_to, link_slope, grid=self._grid,
+                baselevel_nodes=baselevel_nodes)
 
-        # TODO: either need a way to calculate and return the *length* of the
-        # flow links, OR the caller has to handle the raster / non-raster case.
+    def _accumulate_flow(self, receiver, sink):
+        """Find drainage area, discharge and upstream order of nodes.
 
-        # Calculate drainage area, discharge, and ...
-        a, q, s = flow_accum_bw.flow_accumulation(
-            receiver, sink, node_cell_area=node_cell_area,
-            runoff_rate=self._grid.at_node['water__unit_flux_in'])
+        In incremental mode, the results of the previous call are updated
+        if possible; otherwise they are calculated for the whole grid.
+        """
+        runoff_rate = self._grid.at_node['water__unit_flux_in']
+
+        if not self._incremental:
+            a, q, s = flow_accum_bw.flow_accumulation(
+                receiver, sink, node_cell_area=self._node_cell_area,
+                runoff_rate=runoff_rate)
+        elif (self._last_receiver is not None and
+                numpy.array_equal(runoff_rate, self._last_runoff_rate)):
+            updated = self._update_flow_accumulation(receiver)
+            if updated is not None:
+                return updated
+
+        if self._incremental:
+            # Also count the nodes upstream of each node (including itself);
+            # the nodes upstream of a node follow it in the upstream order.
+            s = flow_accum_bw.make_ordered_node_array(receiver, sink)
+            accumulated = flow_accum_bw.accumulate_weights(
+                s, receiver, self._weights_at_node(runoff_rate))
+            self._save_flow_accumulation(receiver, accumulated, s)
+            self._last_runoff_rate = numpy.array(runoff_rate, dtype=float)
+            a, q = accumulated[0], accumulated[1]
+
+        self.reroute_counts['full_updates'] += 1
+        self.reroute_counts['nodes_recomputed'] += receiver.size
+
+        return a, q, s
+
+    def _weights_at_node(self, runoff_rate, nodes=Ellipsis):
+        """Cell area, runoff and a count of one at nodes, as three rows."""
+        area = self._node_cell_area[nodes]
+        weights = numpy.empty((3, area.size), dtype=float)
+        weights[0] = area
+        weights[1] = area * numpy.broadcast_to(
+            runoff_rate, self._node_cell_area.shape)[nodes]
+        weights[2] = 1.
+        return weights
+
+    def _save_flow_accumulation(self, receiver, accumulated, s):
+        """Keep the results of flow accumulation for an incremental update.
+
+        *accumulated* holds drainage area, discharge and the number of nodes
+        upstream of each node, as rows. Along with these, save the position
+        of each node in the upstream order, *s*.
+        """
+        self._last_receiver = receiver.copy()
+        self._accumulated = accumulated
+        self._last_order = s
+        self._position_in_order = numpy.empty_like(s)
+        self._position_in_order[s] = numpy.arange(s.size)
+
+    def _update_flow_accumulation(self, receiver):
+        """Update flow accumulation for the subtrees whose receivers changed.
+
+        A node whose receiver has changed moves, together with all the nodes
+        upstream of it (its subtree), to its new receiver. These nodes are a
+        contiguous slice of the upstream node order. The totals of each
+        moved subtree are subtracted along its old path downstream and,
+        once the moved nodes have been re-accumulated among themselves,
+        added along its new path. The moved slices are then spliced into
+        the upstream node order where a full update would put them. Drainage
+        area and discharge agree with those of a full update to within
+        rounding; the upstream node order is identical.
 
-        # added DEJH March 2014:
-        # store the generated data in the grid
-        self._grid['node']['drainage_area'][:] = a
-        self._grid['node']['flow__receiver_node'][:] = receiver
-        self._grid['node']['topographic__steepest_slope'][:] = steepest_slope
-        self._grid['node']['surface_water__discharge'][:] = q
-        self._grid['node']['flow__upstream_node_order'][:] = s
-        self._grid['node']['flow__link_to_receiver_node'][:] = recvr_link
-        self._grid['node']['flow__sink_flag'][:] = numpy.zeros_like(receiver,
-                                                                    dtype=bool)
-        self._grid['node']['flow__sink_flag'][sink] = True
+        Returns
+        -------
+        tuple of ndarray or None
+            Tuple of (drainage_area, discharge, upstream_order), or None if
+            too many nodes need updating.
+        """
+        from landlab.components.flow_accum.cfuncs import (
+            _add_to_downstream_nodes, _find_insertion_points)
+
+        n_nodes = receiver.size
+        accumulated = self._accumulated
+        order = self._last_order
+        (changed, ) = numpy.where(receiver != self._last_receiver)
+
+        # The slices of the upstream order that move, keeping only the
+        # outermost of nested slices
+        start = numpy.sort(self._position_in_order[changed])
+        end = start + accumulated[2, order[start]].astype(int)
+        is_outermost = numpy.ones(start.size, dtype=bool)
+        is_outermost[1:] = start[1:] >= numpy.maximum.accumulate(end)[:-1]
+        start, end = start[is_outermost], end[is_outermost]
+        slice_size = end - start
+        n_moved = slice_size.sum()
+
+        if n_moved > self._incremental_threshold * n_nodes:
+            return None
+
+        n_visited = 0
+        if n_moved > 0:
+            # Positions in the upstream order of the moved nodes
+            moved_at = (numpy.repeat(start - numpy.cumsum(slice_size) +
+                                     slice_size, slice_size) +
+                        numpy.arange(n_moved))
+
+            # Take the moved subtrees off their old paths downstream
+            heads = order[start]
+            heads = heads[self._last_receiver[heads] != heads]
+            n_visited += _add_to_downstream_nodes(
+                self._last_receiver[heads], receiver, accumulated,
+                - accumulated[:, heads])
+
+            # Order and accumulate the moved nodes among themselves
+            nodes = numpy.sort(order[moved_at])
+            local_receiver = numpy.searchsorted(nodes, receiver[nodes])
+            is_local = nodes[local_receiver.clip(max=n_moved - 1)] == (
+                receiver[nodes])
+            local_receiver[~ is_local] = numpy.where(~ is_local)[0]
+            (roots, ) = numpy.where(local_receiver == numpy.arange(n_moved))
+            local_order = flow_accum_bw.make_ordered_node_array(
+                local_receiver, roots)
+            accumulated[:, nodes] = flow_accum_bw.accumulate_weights(
+                local_order, local_receiver,
+                self._weights_at_node(self._last_runoff_rate, nodes))
+
+            # Find where each new subtree goes among the nodes that stay
+            is_kept = numpy.ones(n_nodes, dtype=bool)
+            is_kept[moved_at] = False
+            kept = order[is_kept]
+            roots = nodes[roots]
+            receiver_at = self._position_in_order[receiver[roots]]
+            receiver_at -= numpy.searchsorted(moved_at, receiver_at)
+            is_sink = receiver[roots] == roots
+            receiver_at[is_sink] = -1
+            insert_at = numpy.empty_like(roots)
+            _find_insertion_points(roots, receiver_at, kept,
+                                   accumulated[2], insert_at)
+
+            # Splice the subtrees in. Subtrees inserted at the same place go
+            # deepest receiver first, then by ID, and new sinks go last.
+            subtree_size = accumulated[2, roots].astype(int)
+            subtree_start = numpy.cumsum(subtree_size) - subtree_size
+            depth = numpy.where(is_sink, - n_nodes, receiver_at)
+            by_position = numpy.lexsort((roots, - depth, insert_at))
+            subtree_size = subtree_size[by_position]
+            offset = numpy.cumsum(subtree_size) - subtree_size
+            within = numpy.arange(n_moved) - numpy.repeat(offset,
+                                                          subtree_size)
+
+            new_order = numpy.empty_like(order)
+            new_order[numpy.repeat(insert_at[by_position] + offset,
+                                   subtree_size) + within] = nodes[
+                local_order[numpy.repeat(subtree_start[by_position],
+                                         subtree_size) + within]]
+            shift = numpy.cumsum(numpy.bincount(
+                insert_at[by_position], weights=subtree_size,
+                minlength=kept.size + 1).astype(int))
+            new_order[numpy.arange(kept.size) + shift[:-1]] = kept
+
+            # Add the moved subtrees to their new paths downstream
+            roots = roots[~ is_sink]
+            n_visited += _add_to_downstream_nodes(
+                receiver[roots], receiver, accumulated,
+                accumulated[:, roots])
+
+            self._last_receiver[changed] = receiver[changed]
+            self._last_order = new_order
+            self._position_in_order[new_order] = numpy.arange(n_nodes)
+
+        n_updated = min(n_moved + n_visited, n_nodes)
+        self.reroute_counts['incremental_updates'] += 1
+        self.reroute_counts['nodes_recomputed'] += n_updated
+        self.reroute_counts['nodes_skipped'] += n_nodes - n_updated
+
+        return accumulated[0], accumulated[1], self._last_order
+
+    def _can_route_in_place(self, elevs):
+        """Check that the compiled raster kernel can fill the fields."""
+        at_node = self._grid.at_node
+        return (elevs.dtype == numpy.float64 and
+                self._grid.status_at_node.dtype == numpy.int8 and
+                at_node['flow__receiver_node'].dtype == numpy.int_ and
+                at_node['topographic__steepest_slope'].dtype ==
+                numpy.float64 and
+                at_node['flow__link_to_receiver_node'].dtype == numpy.int_ and
+                all(at_node[name].flags.c_contiguous for name in (
+                    'flow__receiver_node', 'topographic__steepest_slope',
+                    'flow__link_to_receiver_node')))
+
+    def _route_raster_steepest_descent(self, elevs):
+        """Find D8/D4 flow directions on a raster with a compiled sweep.
+
+        Receivers, slopes and receiver links are written directly into the
+        grid fields; results are identical to those found by sweeping over
+        the active links.
 
-        return self._grid
+        Returns
+        -------
+        tuple of ndarray
+            Tuple of (receiver, steepest_slope, sink, receiver_link).
+        """
+        at_node = self._grid.at_node
+        receiver = at_node['flow__receiver_node']
+        steepest_slope = at_node['topographic__steepest_slope']
+        recvr_link = at_node['flow__link_to_receiver_node']
+
+        n_sinks = raster_steepest_descent(
+            self._grid.shape, self._grid.dx, self._grid.dy,
+            numpy.ascontiguousarray(elevs), self._grid.status_at_node,
+            self._active_link_flag, self.method == 'D8', receiver,
+            steepest_slope, recvr_link, self._sink_buffer)
+
+        sink = self._sink_buffer[:n_sinks]
+
+        return receiver, steepest_slope, sink, recvr_link
 
     def run_one_step(self, **kwds):
         """Route surface-water flow over a landscape.
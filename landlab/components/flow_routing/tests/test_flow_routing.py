@@ -23,9 +23,9 @@ except ImportError:
                                        assert_dict_equal)
 
 import landlab
-from landlab import RasterModelGrid, RadialModelGrid, FieldError
+from landlab import RasterModelGrid, RadialModelGrid, HexModelGrid
 from landlab.components.flow_routing import FlowRouter
-from landlab import CLOSED_BOUNDARY
+from landlab import CLOSED_BOUNDARY, FIXED_VALUE_BOUNDARY
 from landlab import BAD_INDEX_VALUE as XX
 
 
@@ -426,3 +426,125 @@ def test_voronoi_closedinternal():
     assert_array_almost_equal(vmg.at_node['drainage_area'][vmg.core_nodes],
                               A_target_internal)
     assert_almost_equal(vmg.at_node['drainage_area'][12], A_target_outlet)
+
+
+def test_raster_kernel_matches_link_sweep():
+    """Test the compiled raster router against the active-link sweep."""
+    np.random.seed(42)
+    for method in ('D8', 'D4'):
+        for spacing in ((1., 1.), (3., 2.)):
+            mg = RasterModelGrid((8, 11), spacing=spacing)
+            z = mg.add_field('node', 'topographic__elevation',
+                             np.random.randint(0, 4, mg.number_of_nodes) +
+                             0.1 * mg.node_y)
+            status = np.array(mg.status_at_node)
+            status[mg.nodes_at_left_edge] = CLOSED_BOUNDARY
+            status[[30, 57]] = CLOSED_BOUNDARY
+            status[45] = 1
+            mg.status_at_node = status
+            fr = FlowRouter(mg, method=method)
+
+            (receiver, slope, sink, link) = fr._route_by_active_links(z)
+            fr.route_flow()
+
+            assert_array_equal(mg.at_node['flow__receiver_node'], receiver)
+            assert_array_equal(mg.at_node['topographic__steepest_slope'],
+                               slope)
+            assert_array_equal(mg.at_node['flow__link_to_receiver_node'],
+                               link)
+            assert_array_equal(
+                np.where(mg.at_node['flow__sink_flag'])[0], sink)
+
+
+def test_incremental_matches_full_update():
+    """Test incremental rerouting against routing from scratch."""
+    np.random.seed(7)
+    mg = RasterModelGrid((15, 20))
+    z = mg.add_field('node', 'topographic__elevation',
+                     np.random.rand(mg.number_of_nodes) + 0.2 * mg.node_x)
+    fr = FlowRouter(mg, incremental=True, incremental_threshold=0.5)
+    fr.route_flow()
+
+    mg_full = RasterModelGrid((15, 20))
+    z_full = mg_full.add_zeros('node', 'topographic__elevation')
+    fr_full = FlowRouter(mg_full)
+
+    for _ in range(10):
+        z[np.random.randint(mg.number_of_nodes, size=3)] += np.random.randn(3)
+        fr.route_flow()
+        z_full[:] = z
+        fr_full.route_flow()
+        for name in ('drainage_area', 'surface_water__discharge',
+                     'flow__upstream_node_order', 'flow__receiver_node'):
+            assert_array_equal(mg.at_node[name], mg_full.at_node[name])
+
+    assert_equal(fr.reroute_counts['full_updates'] +
+                 fr.reroute_counts['incremental_updates'], 11)
+    assert_true(fr.reroute_counts['nodes_skipped'] > 0)
+
+
+def test_incremental_matches_full_update_with_runoff():
+    """Test incremental rerouting with D4, D8 and hex grids and runoff."""
+    for (grid_type, method) in ((RasterModelGrid, 'D8'),
+                                (RasterModelGrid, 'D4'),
+                                (HexModelGrid, None)):
+        grids = []
+        for _ in range(2):
+            if grid_type is HexModelGrid:
+                grid = HexModelGrid(12, 10)
+            else:
+                grid = RasterModelGrid((15, 20))
+            random = np.random.RandomState(3)
+            grid.add_field('node', 'topographic__elevation',
+                           random.rand(grid.number_of_nodes) +
+                           0.05 * grid.node_x)
+            grid.add_field('node', 'water__unit_flux_in',
+                           random.rand(grid.number_of_nodes))
+            grids.append(grid)
+        (mg, mg_full) = grids
+        kwds = {} if method is None else {'method': method}
+        fr = FlowRouter(mg, incremental=True, incremental_threshold=0.9,
+                        **kwds)
+        fr_full = FlowRouter(mg_full, **kwds)
+        fr.route_flow()
+
+        z = mg.at_node['topographic__elevation']
+        random = np.random.RandomState(4)
+        for _ in range(20):
+            z[random.randint(mg.number_of_nodes, size=5)] += random.randn(5)
+            mg_full.at_node['topographic__elevation'][:] = z
+            fr.route_flow()
+            fr_full.route_flow()
+            for name in ('flow__upstream_node_order', 'flow__receiver_node'):
+                assert_array_equal(mg.at_node[name], mg_full.at_node[name])
+            for name in ('drainage_area', 'surface_water__discharge'):
+                assert_array_almost_equal(mg.at_node[name],
+                                          mg_full.at_node[name])
+        assert_equal(fr.reroute_counts['incremental_updates'], 20)
+
+
+def test_incremental_update_is_local_with_one_outlet():
+    """Test that a local change to a single-outlet grid updates few nodes."""
+    mg = RasterModelGrid((60, 60))
+    z = mg.add_field('node', 'topographic__elevation',
+                     mg.node_x + mg.node_y + 0.01 * np.random.RandomState(
+                         0).rand(mg.number_of_nodes))
+    mg.status_at_node[mg.boundary_nodes] = CLOSED_BOUNDARY
+    mg.status_at_node[1] = FIXED_VALUE_BOUNDARY
+    fr = FlowRouter(mg, incremental=True)
+    fr.route_flow()
+    assert_equal(mg.at_node['drainage_area'][1], mg.number_of_core_nodes)
+
+    recomputed = fr.reroute_counts['nodes_recomputed']
+    z[30 * 60 + 30] += 5.
+    fr.route_flow()
+    assert_equal(fr.reroute_counts['incremental_updates'], 1)
+    assert_true(fr.reroute_counts['nodes_recomputed'] - recomputed <
+                mg.number_of_nodes // 20)
+
+    mg_full = RasterModelGrid((60, 60))
+    mg_full.add_field('node', 'topographic__elevation', z.copy())
+    mg_full.status_at_node[:] = mg.status_at_node
+    FlowRouter(mg_full).route_flow()
+    for name in ('flow__upstream_node_order', 'drainage_area'):
+        assert_array_equal(mg.at_node[name], mg_full.at_node[name])
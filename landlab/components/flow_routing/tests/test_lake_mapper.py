@@ -706,8 +706,137 @@ def test_D8_D4_route():
                                   0].sum())
 
 
+@with_setup(setup_dans_grid)
+def test_priority_flood_rerouting():
+    """
+    Test that the priority-flood method reroutes flow as the default one.
+    """
+    lf_pf = DepressionFinderAndRouter(mg, priority_flood=True)
+    fr.route_flow()
+    lf_pf.map_depressions()
+    assert_array_equal(mg.at_node['flow__receiver_node'], r_new)
+    assert_array_almost_equal(mg.at_node['drainage_area'], A_new)
+    assert_array_equal(mg.at_node['flow__upstream_node_order'], s_new)
+    assert_array_equal(mg.at_node['flow__link_to_receiver_node'], links_new)
+    assert_array_equal(lf_pf.depression_outlet_map, depr_outlet_target)
+
+
+@with_setup(setup_D4_grid)
+def test_priority_flood_D8_D4_fill():
+    """
+    Test the priority-flood method against known D8 and D4 lakes.
+    """
+    lfD8 = DepressionFinderAndRouter(mg1, routing='D8', priority_flood=True)
+    lfD4 = DepressionFinderAndRouter(mg2, routing='D4', priority_flood=True)
+    lfD8.map_depressions(pits=None, reroute_flow=False)
+    lfD4.map_depressions(pits=None, reroute_flow=False)
+    assert_equal(lfD8.number_of_lakes, 1)
+    assert_equal(lfD4.number_of_lakes, 3)
+
+    correct_D8_depths = np.zeros(7*7, dtype=float)
+    correct_D8_depths[lake_nodes] = 2.
+    correct_D4_depths = correct_D8_depths.copy()
+    correct_D4_depths[lake_nodes[5:]] = 4.
+    correct_D4_depths[lake_nodes[-2]] = 3.
+    assert_array_almost_equal(mg1.at_node['depression__depth'],
+                              correct_D8_depths)
+    assert_array_almost_equal(mg2.at_node['depression__depth'],
+                              correct_D4_depths)
+    assert_array_equal(lfD4.lake_codes, [10, 32, 38])
+
+
+def test_priority_flood_composite_pits():
+    """
+    Test the priority-flood method with several pits inset in one lake.
+    """
+    mg = RasterModelGrid(10, 10, 1.)
+    z = mg.add_field('node', 'topographic__elevation', mg.node_x.copy())
+    z.reshape((10, 10))[3:8, 3:8] = 0.
+    z[57] = -1.
+    z[44] = -2.
+    z[54] = -10.
+    fr = FlowRouter(mg)
+    lf = DepressionFinderAndRouter(mg, priority_flood=True)
+    fr.route_flow()
+    lf.map_depressions()
+
+    flow_sinks_target = np.zeros(100, dtype=bool)
+    flow_sinks_target[mg.boundary_nodes] = True
+    assert_array_equal(mg.at_node['flow__sink_flag'], flow_sinks_target)
+    assert_almost_equal(mg.at_node['drainage_area'
+                                   ].reshape((10, 10))[1:-1, 1].sum(), 8.**2)
+
+    lake = np.zeros((10, 10), dtype=bool)
+    lake[3:8, 3:8] = True
+    assert_array_equal(lf.lake_at_node, lake.flat)
+    assert_equal(lf.number_of_lakes, 1)
+    # any of the nodes on the lower rim of the lake is a valid outlet
+    assert_equal(z[lf.lake_outlets[0]], 2.)
+    assert_almost_equal(lf.lake_areas[0], 25.)
+    assert_almost_equal(lf.lake_volumes[0], 63.)
+
+
+def test_priority_flood_matches_default():
+    """
+    Test the two methods give the same results for several separate lakes.
+    """
+    mg1 = RasterModelGrid((10, 10), 1.)
+    mg2 = RasterModelGrid((10, 10), 1.)
+    z = mg1.node_x.copy()
+    z[[33, 43]] = 1.
+    z[37] = 4.
+    z[74:76] = 1.
+    z[58] = 6.5
+    z[88] = 6.
+    mg1.add_field('node', 'topographic__elevation', z)
+    mg2.add_field('node', 'topographic__elevation', z.copy())
+    FlowRouter(mg1).route_flow()
+    FlowRouter(mg2).route_flow()
+
+    lf1 = DepressionFinderAndRouter(mg1)
+    lf2 = DepressionFinderAndRouter(mg2, priority_flood=True)
+    lf1.map_depressions()
+    lf2.map_depressions()
+
+    assert_equal(lf2.number_of_lakes, 5)
+    assert_array_equal(lf1.lake_map, lf2.lake_map)
+    assert_array_equal(lf1.lake_outlets, lf2.lake_outlets)
+    for name in ('depression__depth', 'depression__outlet_node',
+                 'flow__receiver_node', 'drainage_area',
+                 'flow__upstream_node_order', 'flow__sink_flag'):
+        assert_array_almost_equal(mg1.at_node[name], mg2.at_node[name])
+
 if __name__=='__main__':
     setup_dans_grid()
     test_initial_routing()
     test_pits_as_IDs()
     test_rerouting_with_supplied_pits()
+
+
+def test_priority_flood_fills_to_spill_elevation():
+    """
+    Test the priority-flood method fills every depression to its spill level.
+    """
+    for seed in range(20):
+        mg = RasterModelGrid((12, 12), 1.)
+        z = mg.add_field('node', 'topographic__elevation',
+                         5. * np.random.RandomState(seed).rand(144))
+        FlowRouter(mg).route_flow()
+        lf = DepressionFinderAndRouter(mg, priority_flood=True)
+        lf.map_depressions(reroute_flow=False)
+
+        # The lowest surface above z from which water can run off the
+        # grid, found by lowering a flooded surface until nothing changes
+        nbrs = np.hstack((mg.neighbors_at_node,
+                          mg._diagonal_neighbors_at_node))
+        is_core = mg.status_at_node == landlab.CORE_NODE
+        filled = np.where(is_core, np.inf, z)
+        while True:
+            lowest_nbr = np.where(nbrs == -1, np.inf, filled[nbrs]).min(axis=1)
+            new = np.where(is_core, np.maximum(z, lowest_nbr), z)
+            if np.array_equal(new, filled):
+                break
+            filled = new
+
+        assert_array_almost_equal(mg.at_node['depression__depth'],
+                                  filled - z)
@@ -0,0 +1,65 @@
+"""Benchmark the LandslideProbability Monte Carlo simulations.
+
+Compares running the simulations one core node at a time (with
+calculate_factor_of_safety) with running them for blocks of nodes at once
+(with calculate_landslide_probability), on a grid of 10,000 nodes.
+"""
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components.landslides import LandslideProbability
+
+
+def _make_component(shape=(100, 100), number_of_simulations=250,
+                    chunk_size=None):
+    grid = RasterModelGrid(shape, spacing=10.)
+    rng = np.random.RandomState(0)
+    n_nodes = grid.number_of_nodes
+    grid.at_node['topographic__slope'] = rng.uniform(0.2, 1.2, n_nodes)
+    grid.at_node['topographic__specific_contributing_area'] = rng.uniform(
+        30., 900., n_nodes)
+    grid.at_node['soil__transmissivity'] = rng.uniform(5., 20., n_nodes)
+    grid.at_node['soil__mode_total_cohesion'] = rng.uniform(
+        30., 900., n_nodes)
+    grid.at_node['soil__minimum_total_cohesion'] = (
+        grid.at_node['soil__mode_total_cohesion'] - 20.)
+    grid.at_node['soil__maximum_total_cohesion'] = (
+        grid.at_node['soil__mode_total_cohesion'] + 20.)
+    grid.at_node['soil__internal_friction_angle'] = rng.uniform(
+        26., 40., n_nodes)
+    grid.at_node['soil__thickness'] = rng.uniform(1., 3., n_nodes)
+    grid.at_node['soil__density'] = np.full(n_nodes, 2000.)
+    return LandslideProbability(
+        grid, number_of_simulations=number_of_simulations,
+        chunk_size=chunk_size, seed=0)
+
+
+def _run_node_by_node(ls):
+    for node in ls.grid.core_nodes:
+        ls.calculate_factor_of_safety(node)
+
+
+def bench_node_by_node():
+    _run_node_by_node(_make_component())
+
+
+def bench_chunked():
+    _make_component().calculate_landslide_probability()
+
+
+def bench_chunked_without_distribution():
+    ls = _make_component()
+    ls.save_distribution = False
+    ls.calculate_landslide_probability()
+
+
+if __name__ == '__main__':
+    import timeit
+
+    ls = _make_component()
+    for label, func in (
+            ('node by node', lambda: _run_node_by_node(ls)),
+            ('chunked', ls.calculate_landslide_probability)):
+        t = min(timeit.repeat(func, number=1, repeat=3))
+        print('10k nodes, 250 simulations, {label}: {t:.3f} s'.format(
+            label=label, t=t))
@@ -5,6 +5,48 @@ from ...utils.decorators import use_file_name_or_kwds
 import numpy as np
 
 
+# Number of (node, simulation) pairs to evaluate at once by default
+_DEFAULT_SAMPLES_PER_CHUNK = 2 ** 20
+
+
+def _triangular(random_sample, left, mode, right):
+    """Draw from triangular distributions by inverting their CDFs.
+
+    Unlike *numpy.random.triangular*, distributions may be degenerate
+    (*left* equal to *right*), as they are where a soil property does not
+    vary.
+
+    Parameters
+    ----------
+    random_sample : ndarray
+        Samples from the uniform distribution over [0, 1).
+    left, mode, right : array_like
+        Lower limits, modes and upper limits of the distributions.
+
+    Returns
+    -------
+    ndarray
+        Samples, with the shape of *random_sample*.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.landslides.landslide import _triangular
+    >>> _triangular(np.array([0., 0.5, 1.]), 1., 2., 3.)
+    array([ 1.,  2.,  3.])
+    >>> _triangular(np.array([[0.25], [0.75]]), np.array([[1.], [2.]]),
+    ...             np.array([[1.], [2.]]), np.array([[1.], [4.]]))
+    array([[ 1.],
+           [ 3.]])
+    """
+    base = right - left
+    left_base = mode - left
+    return np.where(
+        random_sample * base <= left_base,
+        left + np.sqrt(random_sample * left_base * base),
+        right - np.sqrt((1. - random_sample) * (right - mode) * base))
+
+
 # %% Instantiate Object
 
 
@@ -25,7 +67,8 @@ class LandslideProbability(Component):
 
     Construction::
         LandslideProbability(grid, number_of_simulations"=250,
-        rechare_minimum=5., groundwater__recharge_maximum=120.)
+        rechare_minimum=5., groundwater__recharge_maximum=120.,
+        chunk_size=None, seed=None, save_distribution=True)
 
     Parameters
     ----------
@@ -39,6 +82,16 @@ class LandslideProbability(Component):
     groundwater__recharge_maximum: float, optional
         User provided maximum annual maximum recharge
         recharge (mm/day).
+    chunk_size: int, optional
+        Number of nodes for which the Monte Carlo simulations are run at
+        once. Memory use grows with chunk_size * number_of_simulations.
+        Results do not depend on chunk_size.
+    seed: int, optional
+        Seed for the random number generator. If not given, draws are
+        taken from numpy's global random number generator.
+    save_distribution: bool, optional
+        Store the factor-of-safety distribution at every node in
+        *landslide__factor_of_safety_histogram*.
 
     Examples
     --------
@@ -114,6 +167,18 @@ class LandslideProbability(Component):
     >>> isinstance(LS_prob.landslide__factor_of_safety_histogram[
     ...      core_nodes[0]], np.ndarray) == True
     True
+
+    Simulations are run for blocks of nodes at a time. Seed the component's
+    random number generator to make a run reproducible, whatever the size
+    of the blocks.
+
+    >>> LS_prob = LandslideProbability(grid, chunk_size=2, seed=1945)
+    >>> LS_prob.calculate_landslide_probability()
+    >>> prob_fail = grid.at_node['landslide__probability_of_failure'].copy()
+    >>> LS_prob = LandslideProbability(grid, chunk_size=5, seed=1945)
+    >>> LS_prob.calculate_landslide_probability()
+    >>> np.all(grid.at_node['landslide__probability_of_failure'] == prob_fail)
+    True
     """
 
 # component name
@@ -208,7 +273,8 @@ class LandslideProbability(Component):
     @use_file_name_or_kwds
     def __init__(self, grid, number_of_simulations=250.,
                  groundwater__recharge_minimum=20.,
-                 groundwater__recharge_maximum=120., **kwds):
+                 groundwater__recharge_maximum=120., chunk_size=None,
+                 seed=None, save_distribution=True, **kwds):
 
         """
         Parameters
@@ -221,8 +287,12 @@ class LandslideProbability(Component):
             Minimum annual maximum recharge (mm/d)
         groundwater__recharge_maximum: float, optional
             Maximum annual maximum rechage (mm/d)
-        g: float, optional
-            acceleration due to gravity (m/sec^2)
+        chunk_size: int, optional
+            Number of nodes to simulate at once (None)
+        seed: int, optional
+            Seed for the random number generator (None)
+        save_distribution: bool, optional
+            Store factor-of-safety distributions at nodes (True)
         """
 
         # Store grid and parameters and do unit conversions
@@ -231,6 +301,16 @@ class LandslideProbability(Component):
         self.recharge_min = groundwater__recharge_minimum/1000.0  # mm->m
         self.recharge_max = groundwater__recharge_maximum/1000.0
         self.g = 9.81
+        if chunk_size is None:
+            chunk_size = max(1, _DEFAULT_SAMPLES_PER_CHUNK // int(self.n))
+        elif chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer')
+        self.chunk_size = int(chunk_size)
+        self.save_distribution = save_distribution
+        if seed is None:
+            self._random = np.random
+        else:
+            self._random = np.random.RandomState(seed)
 
         super(LandslideProbability, self).__init__(grid)
 
@@ -327,11 +407,80 @@ class LandslideProbability(Component):
         # probability: No. unstable values/total No. of values (n)
         self.landslide__probability_of_failure = self.FS_L1/self.n
 
+    def calculate_factor_of_safety_at_nodes(self, nodes):
+
+        """
+        Method calculates the factor-of-safety stability index at a block of
+        nodes at once. Parameter distributions are sampled 'n' times at each
+        node, as in 'calculate_factor_of_safety', but the samples for all of
+        the nodes are drawn and evaluated as arrays. The samples of each
+        node are drawn one after another (5 * n of them, node by node), so
+        each node takes the same draws from a seeded generator however the
+        nodes are split into blocks.
+
+        Parameters
+        ----------
+        nodes: ndarray of int
+            IDs of the nodes.
+
+        Returns
+        -------
+        tuple of ndarray
+            Mean relative wetness, mean factor-of-safety and probability of
+            failure at each node, and the factor-of-safety distribution at
+            each node (number of nodes x n).
+        """
+        n = int(self.n)
+        at_node = self.grid.at_node
+
+        def _at_nodes(name):
+            return at_node[name][nodes].reshape((-1, 1)).astype(float)
+
+        a = _at_nodes('topographic__specific_contributing_area')
+        theta = _at_nodes('topographic__slope')
+        Tmode = _at_nodes('soil__transmissivity')
+        Cmode = _at_nodes('soil__mode_total_cohesion')
+        Cmin = _at_nodes('soil__minimum_total_cohesion')
+        Cmax = _at_nodes('soil__maximum_total_cohesion')
+        phi_mode = _at_nodes('soil__internal_friction_angle')
+        rho = _at_nodes('soil__density')
+        hs_mode = _at_nodes('soil__thickness')
+
+        # draw node by node, so that the draws at a node don't depend on
+        # the other nodes of the block
+        random_sample = self._random.random_sample((len(nodes), 5, n))
+
+        # same distributions as calculate_factor_of_safety
+        T = _triangular(random_sample[:, 0],
+                        Tmode - (0.3 * Tmode), Tmode, Tmode + (0.3 * Tmode))
+        C = _triangular(random_sample[:, 1], Cmin, Cmode, Cmax)
+        phi = _triangular(random_sample[:, 2],
+                          phi_mode - 0.18 * phi_mode, phi_mode,
+                          phi_mode + 0.32 * phi_mode)
+        hs = _triangular(random_sample[:, 3],
+                         hs_mode - 0.3 * hs_mode, hs_mode,
+                         hs_mode + 0.3 * hs_mode)
+        hs[hs <= 0.] = 0.0001
+        Re = self.recharge_min + (
+            self.recharge_max - self.recharge_min) * random_sample[:, 4]
+
+        sin_theta = np.sin(np.arctan(theta))
+        cos_theta = np.cos(np.arctan(theta))
+
+        C_dim = C / (hs * rho * self.g)  # dimensionless cohesion
+        Rel_wetness = (Re / T) * (a / sin_theta)  # relative wetness
+        np.minimum(Rel_wetness, 1.0, out=Rel_wetness)
+        Y = np.tan(np.radians(phi)) * (1 - (Rel_wetness * 0.5))
+        FS = (C_dim / sin_theta) + (cos_theta * (Y / sin_theta))
+
+        return (Rel_wetness.mean(axis=1), FS.mean(axis=1),
+                np.count_nonzero(FS <= 1.0, axis=1) / float(self.n), FS)
+
     def calculate_landslide_probability(self, **kwds):
 
         """
-        Method creates arrays for output variables then loops through all
-        the core nodes to run the method 'calculate_factor_of_safety.'
+        Method creates arrays for output variables then runs the Monte Carlo
+        simulations for blocks of 'chunk_size' core nodes at a time.
         Some output variables are assigned as fields to nodes. One output
         parameter is an factor-of-safety distribution at each node.
 
@@ -340,7 +489,8 @@ class LandslideProbability(Component):
         self.landslide__factor_of_safety_histogram: numpy.ndarray([
             self.grid.number_of_nodes, self.n], dtype=float)
             This is an output - distribution of factor-of-safety from
-            Monte Carlo simulations (units='None')
+            Monte Carlo simulations (units='None'). It is None if the
+            component was created with save_distribution=False.
         """
 
         # Create arrays for data with -9999 as default to store output
@@ -349,19 +499,22 @@ class LandslideProbability(Component):
         self.mean_FS = -9999*np.ones(self.grid.number_of_nodes, dtype='float')
         self.prob_fail = -9999*np.ones(
             self.grid.number_of_nodes, dtype='float')
-        self.landslide__factor_of_safety_histogram = -9999*np.ones(
-            [self.grid.number_of_nodes, self.n], dtype='float')
-        # Run factor of safety Monte Carlo for all core nodes in domain
-        # i refers to each core node id
-        for i in self.grid.core_nodes:
-            self.calculate_factor_of_safety(i)
-            # Populate storage arrays with calculated values
-            self.mean_Relative_Wetness[i] = self.soil__mean_relative_wetness
-            self.mean_FS[i] = self.landslide__mean_factor_of_safety
-            self.prob_fail[i] = self.landslide__probability_of_failure
-            self.landslide__factor_of_safety_histogram[i] = (
-                self.FS_distribution)
-            # stores FS values from last loop (node)
+        if self.save_distribution:
+            self.landslide__factor_of_safety_histogram = -9999*np.ones(
+                [self.grid.number_of_nodes, int(self.n)], dtype='float')
+        else:
+            self.landslide__factor_of_safety_histogram = None
+        # Run factor of safety Monte Carlo for all core nodes in domain,
+        # a block of core nodes at a time
+        core_nodes = self.grid.core_nodes
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for start in range(0, len(core_nodes), self.chunk_size):
+                nodes = core_nodes[start:start + self.chunk_size]
+                (self.mean_Relative_Wetness[nodes], self.mean_FS[nodes],
+                 self.prob_fail[nodes], FS) = (
+                     self.calculate_factor_of_safety_at_nodes(nodes))
+                if self.save_distribution:
+                    self.landslide__factor_of_safety_histogram[nodes] = FS
         # replace unrealistic values in arrays
         self.mean_Relative_Wetness[
             self.mean_Relative_Wetness < 0.] = 0.  # so can't be negative
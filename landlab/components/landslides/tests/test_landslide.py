@@ -2,7 +2,7 @@
 Unit tests for landlab.components.landslides.landslide
 """
 from nose.tools import assert_equal, assert_true, assert_raises, with_setup
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 try:
     from nose.tools import assert_is_instance
 except ImportError:
@@ -114,3 +114,89 @@ def test_field_initialized_to_zero():
         field = LS_prob.grid['node'][name]
         assert_array_almost_equal(field, np.zeros(
            LS_prob.grid.number_of_nodes))
+
+
+def _grid_with_soil(shape=(6, 7)):
+    grid = RasterModelGrid(shape, spacing=10.)
+    n_nodes = grid.number_of_nodes
+    grid.at_node['topographic__slope'] = np.linspace(0.2, 1.2, n_nodes)
+    grid.at_node['topographic__specific_contributing_area'] = np.full(
+        n_nodes, 100.)
+    grid.at_node['soil__transmissivity'] = np.full(n_nodes, 10.)
+    grid.at_node['soil__mode_total_cohesion'] = np.full(n_nodes, 500.)
+    grid.at_node['soil__minimum_total_cohesion'] = np.full(n_nodes, 450.)
+    grid.at_node['soil__maximum_total_cohesion'] = np.full(n_nodes, 550.)
+    grid.at_node['soil__internal_friction_angle'] = np.full(n_nodes, 30.)
+    grid.at_node['soil__thickness'] = np.full(n_nodes, 2.)
+    grid.at_node['soil__density'] = np.full(n_nodes, 2000.)
+    return grid
+
+
+def test_seed_is_reproducible():
+    grid = _grid_with_soil()
+    LandslideProbability(
+        grid, seed=42, chunk_size=7).calculate_landslide_probability()
+    prob_fail = grid.at_node['landslide__probability_of_failure'].copy()
+    mean_fs = grid.at_node['landslide__mean_factor_of_safety'].copy()
+
+    LandslideProbability(
+        grid, seed=42, chunk_size=7).calculate_landslide_probability()
+    assert_array_almost_equal(
+        grid.at_node['landslide__probability_of_failure'], prob_fail,
+        decimal=12)
+    assert_array_almost_equal(
+        grid.at_node['landslide__mean_factor_of_safety'], mean_fs,
+        decimal=12)
+
+
+def test_seed_is_reproducible_for_any_chunk_size():
+    results = []
+    for chunk_size in (1, 4, 7, 100):
+        grid = _grid_with_soil()
+        ls = LandslideProbability(grid, seed=42, chunk_size=chunk_size)
+        ls.calculate_landslide_probability()
+        results.append((grid.at_node['landslide__probability_of_failure'],
+                        grid.at_node['landslide__mean_factor_of_safety'],
+                        grid.at_node['soil__mean_relative_wetness'],
+                        ls.landslide__factor_of_safety_histogram))
+    for result in results[1:]:
+        for actual, expected in zip(result, results[0]):
+            assert_array_equal(actual, expected)
+
+
+def test_chunked_matches_node_by_node():
+    grid = _grid_with_soil()
+    ls = LandslideProbability(grid, number_of_simulations=5000, seed=1,
+                              chunk_size=4)
+    ls.calculate_landslide_probability()
+
+    np.random.seed(2)
+    for node in grid.core_nodes:
+        ls.calculate_factor_of_safety(node)
+        assert_true(abs(ls.landslide__probability_of_failure -
+                        grid.at_node['landslide__probability_of_failure'][
+                            node]) < 0.05)
+        assert_true(abs(ls.landslide__mean_factor_of_safety /
+                        grid.at_node['landslide__mean_factor_of_safety'][
+                            node] - 1.) < 0.03)
+
+    assert_equal(ls.landslide__factor_of_safety_histogram.shape,
+                 (grid.number_of_nodes, 5000))
+    assert_true(np.all(
+        ls.landslide__factor_of_safety_histogram[grid.boundary_nodes] ==
+        -9999.))
+
+
+def test_without_distribution():
+    grid = _grid_with_soil()
+    ls = LandslideProbability(grid, seed=0, save_distribution=False)
+    ls.calculate_landslide_probability()
+    assert_true(ls.landslide__factor_of_safety_histogram is None)
+    assert_true(np.all(
+        grid.at_node['landslide__probability_of_failure'][
+            grid.core_nodes] >= 0.))
+
+
+def test_bad_chunk_size():
+    grid = _grid_with_soil()
+    assert_raises(ValueError, LandslideProbability, grid, chunk_size=0)
@@ -0,0 +1,168 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+
+
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
+
+DTYPE_INT = np.int
+ctypedef np.int_t DTYPE_INT_t
+
+
+cdef extern from "math.h":
+    double fabs(double x) nogil
+    double pow(double x, double y) nogil
+    double sqrt(double x) nogil
+
+
+cdef double _SEVEN_OVER_THREE = 7.0 / 3.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def calc_water_depth_and_slope_at_link(const DTYPE_INT_t[:] active_links,
+                                       const DTYPE_INT_t[:] node_at_link_tail,
+                                       const DTYPE_INT_t[:] node_at_link_head,
+                                       const DTYPE_FLOAT_t[:] length_of_link,
+                                       const DTYPE_FLOAT_t[:] z,
+                                       const DTYPE_FLOAT_t[:] h,
+                                       DTYPE_FLOAT_t[:] h_links,
+                                       DTYPE_FLOAT_t[:] slope):
+    """Water depth and water-surface slope at active links, in place.
+
+    The flow depth at a link is the difference between the higher of the
+    water surfaces at its two nodes and the higher of the two bed
+    elevations (Bates et al., 2010).
+    """
+    cdef DTYPE_INT_t i, link, tail, head
+    cdef double w_tail, w_head, w_max, z_max
+
+    with nogil:
+        for i in range(active_links.shape[0]):
+            link = active_links[i]
+            tail = node_at_link_tail[link]
+            head = node_at_link_head[link]
+            w_tail = h[tail] + z[tail]
+            w_head = h[head] + z[head]
+            w_max = w_head if w_head > w_tail else w_tail
+            z_max = z[head] if z[head] > z[tail] else z[tail]
+            h_links[link] = w_max - z_max
+            slope[link] = (w_head - w_tail) / length_of_link[link]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def update_discharge_at_link(const DTYPE_INT_t[:] links,
+                             const DTYPE_INT_t[:] neighbor_links,
+                             const DTYPE_INT_t[:] other_neighbor_links,
+                             const DTYPE_FLOAT_t[:] q_old,
+                             DTYPE_FLOAT_t[:] q,
+                             const DTYPE_FLOAT_t[:] h_links,
+                             const DTYPE_FLOAT_t[:] slope,
+                             double theta, double g, double dt,
+                             double mannings_n_squared):
+    """Inertial update of discharge (de Almeida et al., 2012), in place.
+
+    Updates the discharge, *q*, at each of *links* from the discharges
+    before the update, *q_old*, at the link and at its two neighbors that
+    lie parallel to it. A neighbor of -1 means that there is no neighbor,
+    and so no discharge.
+    """
+    cdef DTYPE_INT_t i, link, neighbor, other_neighbor
+    cdef double q_neighbors
+
+    with nogil:
+        for i in range(links.shape[0]):
+            link = links[i]
+            neighbor = neighbor_links[i]
+            other_neighbor = other_neighbor_links[i]
+            q_neighbors = 0.
+            if neighbor != -1:
+                q_neighbors = q_old[neighbor]
+            if other_neighbor != -1:
+                q_neighbors = q_neighbors + q_old[other_neighbor]
+
+            q[link] = ((
+                theta * q_old[link] + (1. - theta) / 2. * q_neighbors -
+                g * h_links[link] * dt * slope[link]) / (
+                    1. + g * dt * mannings_n_squared * fabs(q_old[link]) /
+                    pow(h_links[link], _SEVEN_OVER_THREE)))
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def limit_discharge_at_link(DTYPE_FLOAT_t[:] q,
+                            const DTYPE_FLOAT_t[:] h_links,
+                            double g, double dt, double dx, double froude):
+    """Limit discharge on steep slopes, in place.
+
+    Where the flow is supercritical (its Froude number exceeds *froude*)
+    the discharge is reduced to that with the limiting Froude number;
+    where the discharge would move more than a quarter of the water at the
+    link in one time step, it is reduced to one fifth of it.
+    """
+    cdef DTYPE_INT_t link
+    cdef double q_link, h, froude_number, q_courant
+
+    with nogil:
+        for link in range(q.shape[0]):
+            q_link = q[link]
+            h = h_links[link]
+            froude_number = (q_link / h) / sqrt(g * h)
+            q_courant = q_link * dt / dx
+            if q_link > 0.:
+                if q_courant > h / 4.:
+                    q[link] = ((h * dx) / 5.) / dt
+                elif froude_number > froude:
+                    q[link] = h * (sqrt(g * h) * froude)
+            elif q_link < 0.:
+                if fabs(q_courant) > h / 4.:
+                    q[link] = 0. - (h * dx / 5.) / dt
+                elif fabs(froude_number) > froude:
+                    q[link] = 0. - (h * sqrt(g * h) * froude)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def update_water_depth_at_node(const DTYPE_INT_t[:] node_at_cell,
+                               const DTYPE_INT_t[:, :] link_at_cell_face,
+                               const DTYPE_FLOAT_t[:, :] width_of_cell_face,
+                               const DTYPE_FLOAT_t[:, :] dir_of_cell_face,
+                               const DTYPE_FLOAT_t[:] area_of_cell,
+                               const np.int8_t[:] status_at_node,
+                               const DTYPE_FLOAT_t[:] q,
+                               const DTYPE_FLOAT_t[:] rainfall_intensity,
+                               double dt,
+                               DTYPE_FLOAT_t[:] dhdt,
+                               DTYPE_FLOAT_t[:] h):
+    """Update water depth at core nodes from the divergence of discharge.
+
+    The rate of change of water depth, *dhdt*, at each node with a cell is
+    the rainfall intensity at the node less the net outflux of discharge
+    across the faces of the cell, per unit cell area. Water depths, *h*,
+    are then updated at core nodes. Both are updated in place.
+    *rainfall_intensity* has a value for every node (a uniform rate can be
+    given as a broadcast array).
+    """
+    cdef DTYPE_INT_t cell, face, node
+    cdef DTYPE_INT_t n_faces = link_at_cell_face.shape[1]
+    cdef double net_flux
+
+    with nogil:
+        for cell in range(node_at_cell.shape[0]):
+            node = node_at_cell[cell]
+            net_flux = 0.
+            for face in range(n_faces):
+                net_flux = net_flux - (
+                    q[link_at_cell_face[cell, face]] *
+                    width_of_cell_face[cell, face]) * dir_of_cell_face[cell,
+                                                                       face]
+            dhdt[node] = (rainfall_intensity[node] -
+                          net_flux / area_of_cell[cell])
+            if status_at_node[node] == 0:
+                h[node] = h[node] + dhdt[node] * dt
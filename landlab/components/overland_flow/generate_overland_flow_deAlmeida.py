@@ -90,9 +90,9 @@ from landlab import Component, FieldError
 import numpy as np
 from landlab.grid.structured_quad import links
 from landlab.utils.decorators import use_file_name_or_kwds
-
-
-_SEVEN_OVER_THREE = 7.0 / 3.0
+from .cfuncs import (calc_water_depth_and_slope_at_link,
+                     update_discharge_at_link, limit_discharge_at_link,
+                     update_water_depth_at_node)
 
 
 class OverlandFlow(Component):
@@ -124,8 +124,8 @@ class OverlandFlow(Component):
         Acceleration due to gravity (m/s^2).
     theta : float, optional
         Weighting factor from de Almeida et al., 2012.
-    rainfall_intensity : float, optional
-        Rainfall intensity.
+    rainfall_intensity : float or array of float, optional
+        Rainfall intensity, everywhere or at each node.
 
 
 
@@ -195,8 +195,8 @@ class OverlandFlow(Component):
             Acceleration due to gravity (m/s^2).
         theta : float, optional
             Weighting factor from de Almeida et al., 2012.
-        rainfall_intensity : float, optional
-            Rainfall intensity.
+        rainfall_intensity : float or array of float, optional
+            Rainfall intensity, everywhere or at each node.
         """
         super(OverlandFlow, self).__init__(grid, **kwds)
 
@@ -284,6 +284,11 @@ class OverlandFlow(Component):
 
         return self.dt
 
+    @property
+    def water_surface__gradient(self):
+        """Gradient of the water surface at active links."""
+        return self.slope[self.grid.active_links]
+
     def set_up_neighbor_arrays(self):
         """Create and initialize link neighbor arrays.
 
@@ -340,12 +345,33 @@ class OverlandFlow(Component):
         self.east_neighbors = links.horizontal_east_link_neighbor(
             self.grid.shape, self.horizontal_active_link_ids)
 
+        # The compiled discharge update expects link IDs as native ints.
+        for name in ('horizontal_ids', 'vertical_ids', 'west_neighbors',
+                     'east_neighbors', 'north_neighbors', 'south_neighbors'):
+            setattr(self, name, np.ascontiguousarray(getattr(self, name),
+                                                     dtype=np.int))
+
         # Set up arrays for discharge in the horizontal & vertical directions.
         self.q_horizontal = np.zeros(links.number_of_horizontal_links(
             self.grid.shape))
         self.q_vertical = np.zeros(links.number_of_vertical_links(
             self.grid.shape))
 
+        # Scratch arrays that are reused every time step, so that stepping
+        # the model allocates no new arrays.
+        self._q_old = np.empty(self.grid.number_of_links)
+        self._too_shallow = np.empty(self.grid.number_of_nodes, dtype=bool)
+
+        # Links, face widths and directions of the links that cross the
+        # faces of each cell, for calculating the flux divergence of
+        # discharge.
+        node_at_cell = self.grid.node_at_cell
+        self._link_at_cell_face = self.grid.links_at_node[node_at_cell]
+        self._width_of_cell_face = self.grid.width_of_face[
+            self.grid.face_at_link[self._link_at_cell_face]]
+        self._dir_of_cell_face = self.grid.link_dirs_at_node[
+            node_at_cell].astype(float)
+
         # Once the neighbor arrays are set up, we change the flag to True!
         self.neighbor_flag = True
 
@@ -393,24 +419,13 @@ class OverlandFlow(Component):
 
             # Per Bates et al., 2010, this solution needs to find difference
             # between the highest water surface in the two cells and the
-            # highest bed elevation
-            zmax = self._grid.map_max_of_link_nodes_to_link(self.z)
-            w = self.h + self.z
-            wmax = self._grid.map_max_of_link_nodes_to_link(w)
-            hflow = wmax[self._grid.active_links] - zmax[
-                self._grid.active_links]
-
-            # Insert this water depth into an array of water depths at the
-            # links.
-            self.h_links[self.active_links] = hflow
-
-            # Now we calculate the slope of the water surface elevation at
-            # active links
-            self.water_surface__gradient = (
-                self.grid.calc_grad_at_link(w)[self.grid.active_links])
-
-            # And insert these values into an array of all links
-            self.slope[self.active_links] = self.water_surface__gradient
+            # highest bed elevation. Insert this water depth into an array of
+            # water depths at the links, along with the slope of the water
+            # surface at active links.
+            calc_water_depth_and_slope_at_link(
+                self.active_links, self.grid.node_at_link_tail,
+                self.grid.node_at_link_head, self.grid.length_of_link,
+                self.z, self.h, self.h_links, self.slope)
 
             # If the user chooses to set boundary links to the neighbor value,
             # we set the discharge array to have the boundary links set to
@@ -418,45 +433,20 @@ class OverlandFlow(Component):
             if self.default_fixed_links is True:
                 self.q[self.grid.fixed_links] = self.q[self.active_neighbors]
 
-            # Now we can calculate discharge. To handle links with neighbors
-            # that do not exist, we will do a fancy indexing trick. Non-
-            # existent links or inactive links have an index of '-1', which in
-            # Python, looks to the end of a list or array. To accommodate these
-            # '-1' indices, we will simply insert an value of 0.0 discharge (in
-            # units of L^2/T) to the end of the discharge array.
-            self.q = np.append(self.q, [0])
-
-            horiz = self.horizontal_ids
-            vert = self.vertical_ids
-            # Now we calculate discharge in the horizontal direction
-            self.q[horiz] = ((
-                self.theta * self.q[horiz] + (1. - self.theta) / 2. *
-                (self.q[self.west_neighbors] + self.q[self.east_neighbors]) -
-                self.g * self.h_links[self.horizontal_ids] * dt_local *
-                self.slope[self.horizontal_ids]) / (
-                    1 + self.g * dt_local * self.mannings_n ** 2. *
-                    abs(self.q[horiz]) / self.h_links[self.horizontal_ids] **
-                    _SEVEN_OVER_THREE))
-
-            # ... and in the vertical direction
-            self.q[vert] = ((
-                self.theta * self.q[vert] + (1 - self.theta) / 2. *
-                (self.q[self.north_neighbors] + self.q[self.south_neighbors]) -
-                self.g * self.h_links[self.vertical_ids] * dt_local *
-                self.slope[self.vertical_ids]) / (
-                    1 + self.g * dt_local * self.mannings_n ** 2. *
-                    abs(self.q[vert]) / self.h_links[self.vertical_ids] **
-                    _SEVEN_OVER_THREE))
-
-            # Now to return the array to its original length (length of number
-            # of all links), we delete the extra 0.0 value from the end of the
-            # array.
-            self.q = np.delete(self.q, len(self.q) - 1)
-
-            # And put the horizontal and vertical arrays back together, to
-            # create the discharge array.
-            # self.q = np.concatenate((self.q_vertical, self.q_horizontal),
-            #                         axis=0)
+            # Now we can calculate discharge, first in the horizontal
+            # direction and then in the vertical. Both use the discharge from
+            # the start of the time step. Non-existent links or inactive links
+            # have a neighbor index of '-1' and contribute no discharge.
+            self._q_old[:] = self.q
+            n_squared = self.mannings_n ** 2.
+            update_discharge_at_link(
+                self.horizontal_ids, self.west_neighbors, self.east_neighbors,
+                self._q_old, self.q, self.h_links, self.slope,
+                self.theta, self.g, dt_local, n_squared)
+            update_discharge_at_link(
+                self.vertical_ids, self.north_neighbors, self.south_neighbors,
+                self._q_old, self.q, self.h_links, self.slope,
+                self.theta, self.g, dt_local, n_squared)
 
             # Updating the discharge array to have the boundary links set to
             # their neighbor
@@ -464,81 +454,26 @@ class OverlandFlow(Component):
                 self.q[self.grid.fixed_links] = self.q[self.active_neighbors]
 
             if self.steep_slopes is True:
-                # To prevent water from draining too fast for our time steps...
-                # Our Froude number.
-                Fr = 0.8
-                # Our two limiting factors, the froude number and courant
-                # number.
-                # Looking a calculated q to be compared to our Fr number.
-                calculated_q = (self.q / self.h_links) / np.sqrt(self.g *
-                                                                 self.h_links)
-
-                # Looking at our calculated q and comparing it to Courant no.,
-                q_courant = self.q * dt_local / self.grid.dx
-
-                # Water depth split equally between four links..
-                water_div_4 = self.h_links / 4.
-
-                # IDs where water discharge is positive...
-                (positive_q, ) = np.where(self.q > 0)
-
-                # ... and negative.
-                (negative_q, ) = np.where(self.q < 0)
-
-                # Where does our calculated q exceed the Froude number? If q
-                # does exceed the Froude number, we are getting supercritical
-                # flow and discharge needs to be reduced to maintain stability.
-                (Froude_logical, ) = np.where((calculated_q) > Fr)
-                (Froude_abs_logical, ) = np.where(abs(calculated_q) > Fr)
-
-                # Where does our calculated q exceed the Courant number and
-                # water depth divided amongst 4 links? If the calculated q
-                # exceeds the Courant number and is greater than the water
-                # depth divided by 4 links, we reduce discharge to maintain
-                # stability.
-                (water_logical, ) = np.where(q_courant > water_div_4)
-                (water_abs_logical, ) = np.where(abs(q_courant) > water_div_4)
-
-                # Where are these conditions met? For positive and negative q,
-                # there are specific rules to reduce q. This step finds where
-                # the discharge values are positive or negative and where
-                # discharge exceeds the Froude or Courant number.
-                self.if_statement_1 = np.intersect1d(positive_q,
-                                                     Froude_logical)
-                self.if_statement_2 = np.intersect1d(negative_q,
-                                                     Froude_abs_logical)
-                self.if_statement_3 = np.intersect1d(positive_q, water_logical)
-                self.if_statement_4 = np.intersect1d(negative_q,
-                                                     water_abs_logical)
-
-                # Rules 1 and 2 reduce discharge by the Froude number.
-                self.q[self.if_statement_1] = (
-                    self.h_links[self.if_statement_1] *
-                    (np.sqrt(self.g * self.h_links[self.if_statement_1]) * Fr))
-
-                self.q[self.if_statement_2] = (
-                    0. - (self.h_links[self.if_statement_2] *
-                          np.sqrt(self.g * self.h_links[self.if_statement_2]) *
-                          Fr))
-
-                # Rules 3 and 4 reduce discharge by the Courant number.
-                self.q[self.if_statement_3] = (((
-                    self.h_links[self.if_statement_3] * self.grid.dx) / 5.) /
-                    dt_local)
-
-                self.q[self.if_statement_4] = (0. - (self.h_links[
-                    self.if_statement_4] * self.grid.dx / 5.) / dt_local)
+                # To prevent water from draining too fast for our time steps,
+                # reduce discharge where it exceeds our Froude number (0.8)
+                # or where it would remove more than the water depth divided
+                # amongst 4 links within one time step (the Courant number).
+                limit_discharge_at_link(self.q, self.h_links, self.g,
+                                        dt_local, self.grid.dx, 0.8)
 
             # Once stability has been restored, we calculate the change in
             # water depths on all core nodes by finding the difference between
             # inputs (rainfall) and the inputs/outputs (flux divergence of
             # discharge)
-            self.dhdt = (self.rainfall_intensity -
-                         self.grid.calc_flux_div_at_node(self.q))
-
-            # Updating our water depths...
-            self.h[self.core_nodes] = (self.h[self.core_nodes] +
-                                       self.dhdt[self.core_nodes] * dt_local)
+            rainfall_intensity = np.broadcast_to(
+                np.asarray(self.rainfall_intensity, dtype=float),
+                self.dhdt.shape)
+            self.dhdt[:] = rainfall_intensity
+            update_water_depth_at_node(
+                self.grid.node_at_cell, self._link_at_cell_face,
+                self._width_of_cell_face, self._dir_of_cell_face,
+                self.grid.area_of_cell, self.grid.status_at_node, self.q,
+                rainfall_intensity, dt_local, self.dhdt, self.h)
 
             # To prevent divide by zero errors, a minimum threshold water depth
             # must be maintained. To reduce mass imbalances, this is set to
@@ -547,12 +482,8 @@ class OverlandFlow(Component):
             # as it showed the smallest amount of mass creation in the grid
             # during testing.
             if self.steep_slopes is True:
-                self.h[self.h < self.h_init] = self.h_init * 10.0 ** -3
-
-            # And reset our field values with the newest water depth and
-            # discharge.
-            self.grid.at_node['surface_water__depth'] = self.h
-            self.grid.at_link['surface_water__discharge'] = self.q
+                np.less(self.h, self.h_init, out=self._too_shallow)
+                self.h[self._too_shallow] = self.h_init * 10.0 ** -3
 
             if dt is np.inf:
                 break
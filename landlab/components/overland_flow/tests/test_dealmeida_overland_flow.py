@@ -162,3 +162,79 @@ def test_deAlm_analytical_imposed_dt_long():
     hdeAlm = hdeAlm[1][1:]
     hdeAlm = np.append(hdeAlm, [0])
     np.testing.assert_almost_equal(h_analytical, hdeAlm, decimal=1)
+
+
+def test_deAlm_fields_updated_in_place():
+    grid = RasterModelGrid((10, 12), spacing=10.)
+    grid.add_field('node', 'topographic__elevation', 0.01 * grid.node_y)
+    h = grid.add_zeros('node', 'surface_water__depth')
+    h[grid.core_nodes] = 0.1
+    deAlm = OverlandFlow(grid, steep_slopes=True)
+    q = grid.at_link['surface_water__discharge']
+
+    deAlm.run_one_step(dt=50.)
+
+    assert_true(grid.at_node['surface_water__depth'] is h)
+    assert_true(grid.at_link['surface_water__discharge'] is q)
+    assert_true(np.any(q != 0.))
+    np.testing.assert_array_equal(
+        deAlm.water_surface__gradient,
+        grid.at_link['water_surface__gradient'][grid.active_links])
+
+
+def test_deAlm_discharge_matches_de_almeida_update():
+    grid = RasterModelGrid((6, 7), spacing=10.)
+    z = grid.add_field('node', 'topographic__elevation', 0.05 * grid.node_x)
+    h = grid.add_zeros('node', 'surface_water__depth')
+    h[grid.core_nodes] = 0.2
+    deAlm = OverlandFlow(grid, mannings_n=0.03, theta=0.8)
+
+    dt = deAlm.calc_time_step()
+    deAlm.overland_flow(dt)
+
+    h_init = deAlm.h_init
+    w = (0.2 + h_init) * (grid.status_at_node == 0) + h_init * (
+        grid.status_at_node != 0) + z
+    links = grid.active_links
+    h_links = (np.maximum(w[grid.node_at_link_tail],
+                          w[grid.node_at_link_head]) -
+               np.maximum(z[grid.node_at_link_tail],
+                          z[grid.node_at_link_head]))[links]
+    slope = grid.calc_grad_at_link(w)[links]
+    q_expected = - 9.81 * h_links * dt * slope
+
+    np.testing.assert_array_almost_equal(
+        grid.at_link['surface_water__discharge'][links], q_expected)
+
+
+def test_deAlm_rainfall_at_nodes():
+    grid = RasterModelGrid((6, 7), spacing=10.)
+    grid.add_zeros('node', 'topographic__elevation')
+    h = grid.add_zeros('node', 'surface_water__depth')
+    h[grid.core_nodes] = 0.2
+    rainfall = np.linspace(0., 1e-4, grid.number_of_nodes)
+    deAlm = OverlandFlow(grid, rainfall_intensity=rainfall)
+
+    h_before = h.copy()
+    dt = deAlm.calc_time_step()
+    deAlm.overland_flow(dt)
+
+    q = grid.at_link['surface_water__discharge']
+    dhdt = rainfall - grid.calc_flux_div_at_node(q)
+    core = grid.core_nodes
+    np.testing.assert_array_almost_equal(h[core],
+                                         h_before[core] + dhdt[core] * dt)
+    np.testing.assert_array_almost_equal(deAlm.dhdt, dhdt)
+
+
+def test_deAlm_uniform_rainfall_as_array():
+    depths = []
+    for rainfall in (1e-5, np.full(42, 1e-5)):
+        grid = RasterModelGrid((6, 7), spacing=10.)
+        grid.add_field('node', 'topographic__elevation', 0.05 * grid.node_x)
+        h = grid.add_zeros('node', 'surface_water__depth')
+        h[grid.core_nodes] = 0.2
+        deAlm = OverlandFlow(grid, rainfall_intensity=rainfall)
+        deAlm.run_one_step(dt=20.)
+        depths.append(h)
+    np.testing.assert_array_equal(depths[0], depths[1])
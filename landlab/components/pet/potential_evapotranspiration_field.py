@@ -8,6 +8,10 @@ _VALID_METHODS = set(['Constant', 'PriestleyTaylor', 'MeasuredRadiationPT',
                       'Cosine'])
 
 
+# Julian days run from 0 to 365
+_DAYS_PER_YEAR = 366
+
+
 def _assert_method_is_valid(method):
     if method not in _VALID_METHODS:
         raise ValueError('%s: Invalid method name' % method)
@@ -232,6 +236,36 @@ class PotentialEvapotranspiration(Component):
 
         self._cell_values = self.grid['cell']
 
+        # Extraterrestrial radiation depends only on the day of the year
+        self._Ra_at_day = self._extraterrestrial_radiation(
+            np.arange(_DAYS_PER_YEAR, dtype=float))
+
+    def _extraterrestrial_radiation(self, J):
+        """Extraterrestrial radiation on each Julian day, *J*."""
+        # Solar Declination Angle - ASCE-EWRI Task Committee Report,
+        # Jan-2005 - Eqn 24,(51)
+        sdecl = 0.409 * np.sin(((np.pi / 180.0) * J) - 1.39)
+
+        # Inverse Relative Distance Factor - ASCE-EWRI Task Committee Report,
+        # Jan-2005 - Eqn 23,(50)
+        dr = 1 + (0.033 * np.cos(np.pi / 180.0 * J))
+
+        # To calculate ws - ASCE-EWRI Task Committee Report,
+        # Jan-2005 - Eqn 29,(61)
+        x = 1.0 - (((np.tan(self._phi)) ** 2.0) * (np.tan(sdecl) ** 2.0))
+        x[x <= 0] = 0.00001
+        # Sunset Hour Angle - ASCE-EWRI Task Committee Report,
+        # Jan-2005 - Eqn 28,(60)
+        ws = ((np.pi / 2.0) -
+              np.arctan((- 1 * np.tan(self._phi) * np.tan(sdecl)) /
+                        (x ** 2.0)))
+
+        # Extraterrestrial radmodel.docx - ASCE-EWRI Task Committee Report,
+        # Jan-2005 - Eqn 21, (48)
+        return (11.57 * (24.0 / np.pi) * 4.92 * dr *
+                ((ws * np.sin(self._phi) * np.sin(sdecl)) +
+                 (np.cos(self._phi) * np.cos(sdecl) * (np.sin(ws)))))
+
     def update(self, current_time=None, const_potential_evapotranspiration=12.,
                Tmin=0., Tmax=1., Tavg=0.5, obs_radiation=350., **kwds):
         """Update fields with current conditions.
@@ -303,33 +337,8 @@ class PotentialEvapotranspiration(Component):
         # Jan-2005 - Eqn 5, (36)
         self._delta = (4098.0 * self._es)/((237.3 + Tavg) ** 2.0)
 
-        # Solar Declination Angle - ASCE-EWRI Task Committee Report,
-        # Jan-2005 - Eqn 24,(51)
-        self._sdecl = 0.409 * np.sin(((np.pi / 180.0) * self._J) - 1.39)
-
-        # Inverse Relative Distance Factor - ASCE-EWRI Task Committee Report,
-        # Jan-2005 - Eqn 23,(50)
-        self._dr = 1 + (0.033 * np.cos(np.pi / 180.0 * self._J))
-
-        # To calculate ws - ASCE-EWRI Task Committee Report,
-        # Jan-2005 - Eqn 29,(61)
-        self._x = 1.0 - (((np.tan(self._phi)) ** 2.0) *
-                         (np.tan(self._sdecl) ** 2.0))
-        if self._x <= 0:
-            self._x = 0.00001
-            # Sunset Hour Angle - ASCE-EWRI Task Committee Report,
-            # Jan-2005 - Eqn 28,(60)
-        self._ws = ((np.pi / 2.0) -
-                    np.arctan((- 1 * np.tan(self._phi) *
-                               np.tan(self._sdecl)) / (self._x ** 2.0)))
-
-        # Extraterrestrial radmodel.docx - ASCE-EWRI Task Committee Report,
-        # Jan-2005 - Eqn 21, (48)
-        self._Ra = (
-                    11.57 * (24.0 / np.pi) * 4.92 * self._dr *
-                    ((self._ws * np.sin(self._phi) * np.sin(self._sdecl)) +
-                     (np.cos(self._phi) * np.cos(self._sdecl) *
-                     (np.sin(self._ws)))))
+        # Extraterrestrial radiation, looked up for the Julian day
+        self._Ra = self._Ra_at_day[int(self._J)]
 
         # Clear-sky Solar Radiation - ASCE-EWRI Task Committee Report,
         # Jan-2005 - Eqn 19, (47)
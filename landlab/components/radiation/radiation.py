@@ -6,6 +6,9 @@ import numpy as np
 
 _VALID_METHODS = set(['Grid'])
 
+# Julian days run from 0 to 365
+_DAYS_PER_TABLE = 366
+
 
 def _assert_method_is_valid(method):
     if method not in _VALID_METHODS:
@@ -185,39 +188,42 @@ class Radiation(Component):
 
         self._nodal_values = self.grid['node']
         self._cell_values = self.grid['cell']
+        self._elevation = None
+        self._table = None
+        self._update_terrain()
+
+    def _update_terrain(self):
+        """Update slope and aspect if the elevation has changed.
+
+        Any table of ratios to a flat surface is discarded, as it is no
+        longer valid.
+        """
+        elevation = self._nodal_values['topographic__elevation']
+        if (self._elevation is not None and
+                np.array_equal(elevation, self._elevation)):
+            return
+
+        self._elevation = elevation.copy()
         self._slope, self._aspect = \
-            grid.calculate_slope_aspect_at_nodes_burrough(
+            self.grid.calculate_slope_aspect_at_nodes_burrough(
                 vals='topographic__elevation')
 #        self._slope = grid.calc_slope_of_node( \
 #                                elevs = 'topographic__elevation')
 #        self._aspect =
         self._cell_values['Slope'] = self._slope
         self._cell_values['Aspect'] = self._aspect
+        self._cos_slope = np.cos(self._slope)
+        self._sin_slope = np.sin(self._slope)
+        self._table = None
 
-    def update(self, current_time, hour=12., **kwds):
-        """Update fields with current loading conditions.
-
-        Parameters
-        ----------
-        current_time: float
-              Current time (years).
-        hour: float, optional
-              Hour of the day.
-        """
-        self._t = hour
-        self._radf = self._cell_values['radiation__ratio_to_flat_surface']
-        self._Rs = self._cell_values['radiation__incoming_shortwave_flux']
-        self._Rnet = self._cell_values['radiation__net_shortwave_flux']
-
-        self._julian = np.floor((current_time - np.floor(current_time)) *
-                                365.25)    # Julian day
-
+    def _calc_sun_position(self, julian, hour):
+        """Position of the sun, and radiation on a flat surface."""
         self._phi = np.radians(self._latitude)    # Latitude in Radians
 
         self._delta = 23.45 * np.radians(
-            np.cos(2*np.pi / 365 * (172 - self._julian)))   # Declination angle
+            np.cos(2*np.pi / 365 * (172 - julian)))   # Declination angle
 
-        self._tau = (self._t + 12.0) * np.pi / 12.0     # Hour angle
+        self._tau = (hour + 12.0) * np.pi / 12.0     # Hour angle
 
         self._alpha = np.arcsin(np.sin(self._delta) * np.sin(self._phi) +
                                 np.cos(self._delta) * np.cos(self._phi) *
@@ -251,14 +257,109 @@ class Radiation(Component):
                           self._Rsflat)
         # flat surface Net incoming shortwave radiation
 
-        self._sloped = (np.cos(self._slope) * np.sin(self._alpha) +
-                        np.sin(self._slope) * np.cos(self._alpha) *
+    def _calc_ratio_to_flat(self):
+        """Ratio of radiation on the sloped surface to a flat surface."""
+        self._sloped = (self._cos_slope * np.sin(self._alpha) +
+                        self._sin_slope * np.cos(self._alpha) *
                         np.cos(self._phisun - self._aspect))
 
-        self._radf = self._sloped / self._flat
+        radf = self._sloped / self._flat
+
+        radf[radf <= 0.] = 0.
+        radf[radf > 6.] = 6.
+
+        return radf
+
+    def precompute_ratio_to_flat(self, hours=12., filename=None):
+        """Tabulate the ratio to a flat surface for every day of the year.
+
+        The ratio of radiation on the sloped surface to that on a flat
+        surface depends only on the day of the year, the hour and the
+        topography. Once tabulated for some hours of the day, *update*
+        looks up the ratio for those hours rather than calculating it.
+        Ratios are stored as 32-bit floats, so looked up values differ
+        from calculated values by about one part in ten million. The
+        table is discarded if the topography changes.
+
+        Parameters
+        ----------
+        hours : float or iterable of float, optional
+            Hours of the day at which to tabulate ratios.
+        filename : str, optional
+            If given, keep the table in a memory-mapped .npy file of this
+            name, rather than in memory.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.components import Radiation
+        >>> import numpy as np
+
+        >>> grid = RasterModelGrid((5, 4), spacing=(0.2, 0.2))
+        >>> z = grid.add_field('node', 'topographic__elevation',
+        ...                    grid.node_y ** 2 + grid.node_x)
+        >>> rad = Radiation(grid)
+        >>> rad.update(0.5)
+        >>> ratio = grid.at_cell['radiation__ratio_to_flat_surface'].copy()
+
+        >>> rad.precompute_ratio_to_flat(hours=(9., 12.))
+        >>> rad.update(0.5)
+        >>> np.allclose(grid.at_cell['radiation__ratio_to_flat_surface'],
+        ...             ratio, rtol=1e-6)
+        True
+        """
+        hours = np.array(hours, dtype=float).reshape((-1, ))
+        shape = (len(hours), _DAYS_PER_TABLE, self.grid.number_of_cells)
+        if filename is None:
+            table = np.empty(shape, dtype=np.float32)
+        else:
+            table = np.lib.format.open_memmap(filename, mode='w+',
+                                              dtype=np.float32, shape=shape)
+        Rsflat = np.empty(shape[:2])
+        Rnetflat = np.empty(shape[:2])
+
+        self._update_terrain()
+        for row, hour in enumerate(hours):
+            for julian in range(_DAYS_PER_TABLE):
+                self._calc_sun_position(float(julian), hour)
+                table[row, julian] = self._calc_ratio_to_flat()
+                Rsflat[row, julian] = self._Rsflat
+                Rnetflat[row, julian] = self._Rnetflat
+
+        self._table = table
+        self._table_hours = list(hours)
+        self._Rsflat_table = Rsflat
+        self._Rnetflat_table = Rnetflat
+
+    def update(self, current_time, hour=12., **kwds):
+        """Update fields with current loading conditions.
+
+        Ratios to a flat surface are looked up if they have been tabulated
+        with *precompute_ratio_to_flat* for this hour, and calculated
+        otherwise.
+
+        Parameters
+        ----------
+        current_time: float
+              Current time (years).
+        hour: float, optional
+              Hour of the day.
+        """
+        self._update_terrain()
+
+        self._t = hour
+
+        self._julian = np.floor((current_time - np.floor(current_time)) *
+                                365.25)    # Julian day
 
-        self._radf[self._radf <= 0.] = 0.
-        self._radf[self._radf > 6.] = 6.
+        if self._table is not None and hour in self._table_hours:
+            row, julian = self._table_hours.index(hour), int(self._julian)
+            self._radf = self._table[row, julian].astype(float)
+            self._Rsflat = self._Rsflat_table[row, julian]
+            self._Rnetflat = self._Rnetflat_table[row, julian]
+        else:
+            self._calc_sun_position(self._julian, self._t)
+            self._radf = self._calc_ratio_to_flat()
 
         self._Rs = self._Rsflat * self._radf
         # Sloped surface Toatl Incoming Shortwave Radn
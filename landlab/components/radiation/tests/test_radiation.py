@@ -101,4 +101,75 @@ def test_field_initialized_to_zero():
         if name == 'Slope' or name == 'Aspect':
             continue
         field = rad.grid['cell'][name]
-        assert_array_almost_equal(field, np.zeros(rad.grid.number_of_cells))
\ No newline at end of file
+        assert_array_almost_equal(field, np.zeros(rad.grid.number_of_cells))
+
+
+def _setup_sloped_grid():
+    grid = RasterModelGrid((10, 12), spacing=10e0)
+    grid.add_field('node', 'topographic__elevation',
+                   grid.node_x * 0.3 + (grid.node_y - 40.) ** 2 * 0.01)
+    return grid
+
+
+def _outputs(grid):
+    return [grid.at_cell[name].copy() for name in
+            ('radiation__ratio_to_flat_surface',
+             'radiation__incoming_shortwave_flux',
+             'radiation__net_shortwave_flux')]
+
+
+def test_precomputed_ratio_to_flat():
+    grid = _setup_sloped_grid()
+    rad = Radiation(grid)
+    tabulated_grid = _setup_sloped_grid()
+    tabulated = Radiation(tabulated_grid)
+    tabulated.precompute_ratio_to_flat(hours=(8., 12.))
+
+    for current_time in np.linspace(0., 2., 37):
+        for hour in (8., 12., 15.):
+            rad.update(current_time, hour=hour)
+            tabulated.update(current_time, hour=hour)
+            for actual, expected in zip(_outputs(tabulated_grid),
+                                        _outputs(grid)):
+                assert_array_almost_equal(actual, expected, decimal=4)
+
+
+def test_precomputed_ratio_to_flat_in_file():
+    import os
+    import tempfile
+
+    grid = _setup_sloped_grid()
+    rad = Radiation(grid)
+    rad.precompute_ratio_to_flat()
+    rad.update(0.25)
+    expected = _outputs(grid)
+
+    tmp_dir = tempfile.mkdtemp()
+    filename = os.path.join(tmp_dir, 'ratio_to_flat.npy')
+    try:
+        rad = Radiation(grid)
+        rad.precompute_ratio_to_flat(filename=filename)
+        rad.update(0.25)
+        for actual, expected_values in zip(_outputs(grid), expected):
+            assert_array_almost_equal(actual, expected_values)
+        table = np.load(filename)
+        assert_equal(table.shape, (1, 366, grid.number_of_cells))
+        assert_equal(table.dtype, np.float32)
+        del table, rad
+    finally:
+        os.remove(filename)
+        os.rmdir(tmp_dir)
+
+
+def test_table_discarded_when_topography_changes():
+    grid = _setup_sloped_grid()
+    rad = Radiation(grid)
+    rad.precompute_ratio_to_flat()
+
+    grid.at_node['topographic__elevation'][:] = 0.
+    rad.update(0.5)
+    assert_array_almost_equal(
+        grid.at_cell['radiation__ratio_to_flat_surface'],
+        np.ones(grid.number_of_cells))
+    assert_array_almost_equal(grid.at_cell['Slope'],
+                              np.zeros(grid.number_of_cells))
@@ -35,7 +35,8 @@ class SinkFiller(Component):
 
     Construction::
 
-        SinkFiller(grid, routing='D8', apply_slope=False, fill_slope=1.e-5):
+        SinkFiller(grid, routing='D8', apply_slope=False, fill_slope=1.e-5,
+                   priority_flood=False):
 
     Parameters
     ----------
@@ -55,6 +56,9 @@ class SinkFiller(Component):
     fill_slope : float (m/m)
         The slope added to the top surface of filled pits to allow flow
         routing across them, if apply_slope.
+    priority_flood : bool
+        If True, find the pits with the (much faster) priority-flood method
+        of the DepressionFinderAndRouter. Default is False.
 
     Examples
     --------
@@ -125,7 +129,7 @@ class SinkFiller(Component):
 
     @use_file_name_or_kwds
     def __init__(self, grid, routing='D8', apply_slope=False,
-                 fill_slope=1.e-5, **kwds):
+                 fill_slope=1.e-5, priority_flood=False, **kwds):
         self._grid = grid
         if routing is not 'D8':
             assert routing is 'D4'
@@ -140,6 +144,7 @@ class SinkFiller(Component):
                 self.num_nbrs = 4
         self._fill_slope = fill_slope
         self._apply_slope = apply_slope
+        self._priority_flood = priority_flood
         self.initialize()
 
     def initialize(self, input_stream=None):
@@ -194,7 +199,9 @@ class SinkFiller(Component):
                                                    'sediment_fill__depth',
                                                    noclobber=False)
 
-        self._lf = DepressionFinderAndRouter(self._grid, routing=self._routing)
+        self._lf = DepressionFinderAndRouter(
+            self._grid, routing=self._routing,
+            priority_flood=self._priority_flood)
         self._fr = FlowRouter(self._grid, method=self._routing)
 
     def fill_pits(self, **kwds):
@@ -327,6 +327,25 @@ def test_filler_inclined2():
     assert_equal(mg.at_node['flow__sink_flag'][mg.core_nodes].sum(), 0)
 
 
+@with_setup(setup_dans_grid3)
+def test_filler_inclined2_priority_flood():
+    """
+    Tests an inclined fill into an inclined surface, found by priority flood.
+    """
+    hf = SinkFiller(mg, apply_slope=True, priority_flood=True)
+    hf.fill_pits()
+    hole1 = np.array([4.00009091, 4.00018182, 4.00027273, 4.00063636,
+                      4.00045455, 4.00036364, 4.00081818, 4.00072727,
+                      4.00054545])
+    hole2 = np.array([7.16666667, 7.33333333, 7.66666667, 7.5])
+    assert_array_almost_equal(mg.at_node['topographic__elevation'][lake1],
+                              hole1)
+    assert_array_almost_equal(mg.at_node['topographic__elevation'][lake2],
+                              hole2)
+    fr.route_flow()
+    assert_equal(mg.at_node['flow__sink_flag'][mg.core_nodes].sum(), 0)
+
+
 @with_setup(setup_dans_grid4)
 def test_stupid_shaped_hole():
     """
@@ -0,0 +1,218 @@
+"""Benchmark daily SoilMoisture updates on large grids.
+
+Updates soil moisture over one storm-interstorm period on grids of
+100,000 and 1,000,000 cells with a mix of plant functional types and a mix
+of dry, wet and saturating storms, so that every branch of the soil-water
+loss function is exercised.
+
+The compiled update is compared with the per-cell Python loop that it
+replaced, kept here as ``_update_with_python_loop``: both are run on the
+same inputs, their outputs are checked to be identical, and both are
+timed. The Python loop is only timed on the smaller grid.
+"""
+import time
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from landlab import RasterModelGrid
+from landlab.components.soil_moisture import SoilMoisture
+
+
+_OUTPUTS = ('soil_moisture__initial_saturation_fraction',
+            'soil_moisture__saturation_fraction',
+            'soil_moisture__root_zone_leakage', 'surface__evapotranspiration',
+            'surface__runoff', 'vegetation__water_stress')
+
+
+def _make_component(shape):
+    grid = RasterModelGrid(shape)
+    rng = np.random.RandomState(0)
+    n_cells = grid.number_of_cells
+    grid.at_cell['vegetation__plant_functional_type'] = rng.randint(
+        0, 6, n_cells)
+    sm = SoilMoisture(grid)
+    grid.at_cell['surface__potential_evapotranspiration_rate'] = rng.uniform(
+        0., 8., n_cells)
+    grid.at_cell['soil_moisture__initial_saturation_fraction'] = rng.uniform(
+        0.05, 1., n_cells)
+    grid.at_cell['vegetation__live_leaf_area_index'] = rng.uniform(
+        0., 4., n_cells)
+    grid.at_cell['vegetation__cover_fraction'] = rng.uniform(0., 1., n_cells)
+    grid.at_cell['rainfall__daily_depth'] = rng.choice(
+        [0., 2., 30., 120.], n_cells)
+    return sm
+
+
+def _update_with_python_loop(sm, Tb=24.):
+    """Update soil moisture one cell at a time, as SoilMoisture used to."""
+    values = sm.grid.at_cell
+    P_ = values['rainfall__daily_depth']
+    PET = values['surface__potential_evapotranspiration_rate']
+    SO = values['soil_moisture__initial_saturation_fraction']
+    vegcover = values['vegetation__cover_fraction']
+    water_stress = values['vegetation__water_stress']
+    S = values['soil_moisture__saturation_fraction']
+    D = values['soil_moisture__root_zone_leakage']
+    ETA = values['surface__evapotranspiration']
+    runoff = values['surface__runoff']
+    fr = values['vegetation__live_leaf_area_index'] / sm._LAIR_max
+    fr[fr > 1.] = 1.
+    Sini = np.zeros(SO.shape)
+    ETmax = np.zeros(SO.shape)
+
+    for cell in range(0, sm.grid.number_of_cells):
+        P = P_[cell]
+        s = SO[cell]
+        fbare = sm._fbare
+        ZR = sm._zr[cell]
+        pc = sm._soil_pc[cell]
+        fc = sm._soil_fc[cell]
+        scc = sm._soil_sc[cell]
+        wp = sm._soil_wp[cell]
+        hgw = sm._soil_hgw[cell]
+        beta = sm._soil_beta[cell]
+        if sm._vegtype[cell] == 0:   # 0 - GRASS
+            sc = scc*fr[cell]+(1-fr[cell])*fc
+        else:
+            sc = scc
+
+        Inf_cap = (sm._soil_Ib[cell]*(1-vegcover[cell]) +
+                   sm._soil_Iv[cell]*vegcover[cell])
+        Int_cap = min(vegcover[cell]*sm._interception_cap[cell], P)
+        Peff = max(P-Int_cap, 0.)
+        mu = (Inf_cap/1000.0)/(pc*ZR*(np.exp(beta*(1.-fc))-1.))
+        Ep = max((PET[cell]*fr[cell] +
+                 fbare*PET[cell]*(1.-fr[cell])) -
+                 Int_cap, 0.0001)
+        ETmax[cell] = Ep
+        nu = ((Ep / 24.) / 1000.) / (pc*ZR)
+        nuw = ((sm._soil_Ew/24.)/1000.)/(pc*ZR)
+        sini = SO[cell] + ((Peff+sm._runon)/(pc*ZR*1000.))
+
+        if sini > 1.:
+            runoff[cell] = (sini-1.)*pc*ZR*1000.
+            sini = 1.
+        else:
+            runoff[cell] = 0.
+
+        if sini >= fc:
+            tfc = (1./(beta*(mu-nu)))*(beta*(fc-sini) + np.log((
+                   nu-mu+mu*np.exp(beta*(sini-fc)))/nu))
+            tsc = ((fc-sc)/nu)+tfc
+            twp = ((sc-wp)/(nu-nuw))*np.log(nu/nuw)+tsc
+
+            if Tb < tfc:
+                s = abs(sini-(1./beta)*np.log(((nu-mu+mu *
+                        np.exp(beta*(sini-fc)))*np.exp(beta*(nu-mu)*Tb) -
+                        mu*np.exp(beta*(sini-fc)))/(nu-mu)))
+                D[cell] = ((pc*ZR*1000.)*(sini-s))-(Tb*(Ep/24.))
+                ETA[cell] = (Tb*(Ep/24.))
+
+            elif Tb >= tfc and Tb < tsc:
+                s = fc-(nu*(Tb-tfc))
+                D[cell] = ((pc*ZR*1000.)*(sini-fc))-((tfc)*(Ep/24.))
+                ETA[cell] = (Tb*(Ep/24.))
+
+            elif Tb >= tsc and Tb < twp:
+                s = (wp+(sc-wp)*((nu/(nu-nuw))*np.exp((-1)*((nu-nuw) /
+                     (sc-wp))*(Tb-tsc))-(nuw/(nu-nuw))))
+                D[cell] = ((pc*ZR*1000.)*(sini-fc))-(tfc*Ep/24.)
+                ETA[cell] = (1000.*ZR*pc*(sini-s))-D[cell]
+
+            else:
+                s = (hgw+(wp-hgw)*np.exp((-1)*(nuw/(wp-hgw)) *
+                     max(Tb-twp, 0.)))
+                D[cell] = ((pc*ZR*1000.)*(sini-fc))-(tfc*Ep/24.)
+                ETA[cell] = (1000.*ZR*pc*(sini-s))-D[cell]
+
+        elif sini < fc and sini >= sc:
+            tsc = (sini-sc)/nu
+            twp = ((sc-wp)/(nu-nuw))*np.log(nu/nuw)+tsc
+
+            if Tb < tsc:
+                s = sini - nu*Tb
+                D[cell] = 0.
+                ETA[cell] = 1000.*ZR*pc*(sini-s)
+
+            elif Tb >= tsc and Tb < twp:
+                s = (wp+(sc-wp)*((nu/(nu-nuw))*np.exp((-1) *
+                     ((nu-nuw)/(sc-wp))*(Tb-tsc))-(nuw/(nu-nuw))))
+                D[cell] = 0
+                ETA[cell] = (1000.*ZR*pc*(sini-s))
+
+            else:
+                s = hgw+(wp-hgw)*np.exp((-1)*(nuw/(wp-hgw))*(Tb-twp))
+                D[cell] = 0.
+                ETA[cell] = (1000.*ZR*pc*(sini-s))
+
+        elif sini < sc and sini >= wp:
+            twp = (((sc-wp)/(nu-nuw))*np.log(1+(nu-nuw)*(sini-wp) /
+                   (nuw*(sc-wp))))
+
+            if Tb < twp:
+                s = (wp+((sc-wp)/(nu-nuw))*((np.exp((-1)*((nu-nuw) /
+                     (sc-wp))*Tb))*(nuw+((nu-nuw)/(sc-wp))*(sini-wp))-nuw))
+                D[cell] = 0.
+                ETA[cell] = (1000.*ZR*pc*(sini-s))
+
+            else:
+                s = hgw+(wp-hgw)*np.exp((-1)*(nuw/(wp-hgw))*(Tb-twp))
+                D[cell] = 0.
+                ETA[cell] = (1000.*ZR*pc*(sini-s))
+
+        else:
+            s = hgw+(sini-hgw)*np.exp((-1)*(nuw/(wp-hgw))*Tb)
+            D[cell] = 0.
+            ETA[cell] = (1000.*ZR*pc*(sini-s))
+
+        water_stress[cell] = min(((max(((sc - (s+sini)/2.) /
+                                 (sc - wp)), 0.))**4.), 1.0)
+        S[cell] = s
+        SO[cell] = s
+        Sini[cell] = sini
+
+    return Sini, ETmax
+
+
+def _update_compiled(sm, Tb=24.):
+    sm.update(0., Tb=Tb)
+    return sm._Sini, sm._ETmax
+
+
+def _assert_updates_match(shape):
+    compiled = _make_component(shape)
+    python_loop = _make_component(shape)
+    assert_array_equal(_update_compiled(compiled),
+                       _update_with_python_loop(python_loop))
+    for name in _OUTPUTS:
+        assert_array_equal(compiled.grid.at_cell[name],
+                           python_loop.grid.at_cell[name])
+
+
+def bench_update_100k():
+    _update_compiled(_make_component((318, 318)))
+
+
+def bench_python_loop_100k():
+    _update_with_python_loop(_make_component((318, 318)))
+
+
+def bench_update_1m():
+    _update_compiled(_make_component((1002, 1002)))
+
+
+if __name__ == '__main__':
+    _assert_updates_match((318, 318))
+
+    for shape, label, updates in (
+            ((318, 318), '100k', (_update_with_python_loop,
+                                  _update_compiled)),
+            ((1002, 1002), '1m', (_update_compiled, ))):
+        for update in updates:
+            sm = _make_component(shape)
+            start = time.time()
+            update(sm)
+            print('{label} cells, {name}: {t:.3f} s'.format(
+                label=label, name=update.__name__.lstrip('_'),
+                t=time.time() - start))
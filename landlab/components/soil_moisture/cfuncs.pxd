@@ -0,0 +1,7 @@
+cdef double soil_moisture_at_cell(
+        double P, double PET, double fr, double vegcover, double sc,
+        double ZR, double pc, double fc, double wp, double hgw, double beta,
+        double Ib, double Iv, double interception_cap, double fbare,
+        double soil_Ew, double runon, double Tb, double so,
+        double * D, double * ETA, double * runoff, double * water_stress,
+        double * Sini, double * ETmax) nogil
@@ -0,0 +1,179 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+
+
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
+
+
+cdef extern from "math.h":
+    double exp(double x) nogil
+    double log(double x) nogil
+    double fabs(double x) nogil
+    double pow(double x, double y) nogil
+
+
+@cython.cdivision(True)
+cdef double soil_moisture_at_cell(
+        double P, double PET, double fr, double vegcover, double sc,
+        double ZR, double pc, double fc, double wp, double hgw, double beta,
+        double Ib, double Iv, double interception_cap, double fbare,
+        double soil_Ew, double runon, double Tb, double so,
+        double * D, double * ETA, double * runoff, double * water_stress,
+        double * Sini, double * ETmax) nogil:
+    """Soil moisture at a cell after one storm-interstorm period.
+
+    Returns the saturation fraction at the end of the period, given that at
+    its start, *so*, and sets the leakage, actual evapotranspiration,
+    runoff, water stress, saturation fraction after the storm and maximum
+    evapotranspiration of the period.
+    """
+    cdef double s, Inf_cap, Int_cap, Peff, mu, Ep, nu, nuw, sini
+    cdef double tfc, tsc, twp, stress
+
+    Inf_cap = Ib*(1-vegcover) + Iv*vegcover   # Infiltration capacity
+    Int_cap = vegcover*interception_cap       # Interception capacity
+    if P < Int_cap:
+        Int_cap = P
+    Peff = P-Int_cap                          # Effective precipitation depth
+    if 0. > Peff:
+        Peff = 0.
+    mu = (Inf_cap/1000.0)/(pc*ZR*(exp(beta*(1.-fc))-1.))
+    Ep = (PET*fr + fbare*PET*(1.-fr)) - Int_cap  # mm/d
+    if 0.0001 > Ep:
+        Ep = 0.0001
+    ETmax[0] = Ep
+    nu = ((Ep / 24.) / 1000.) / (pc*ZR)       # Loss function parameter
+    nuw = ((soil_Ew/24.)/1000.)/(pc*ZR)       # Loss function parameter
+    sini = so + ((Peff+runon)/(pc*ZR*1000.))
+
+    if sini > 1.:
+        runoff[0] = (sini-1.)*pc*ZR*1000.
+        sini = 1.
+    else:
+        runoff[0] = 0.
+
+    if sini >= fc:
+        tfc = (1./(beta*(mu-nu)))*(beta*(fc-sini) + log((
+               nu-mu+mu*exp(beta*(sini-fc)))/nu))
+        tsc = ((fc-sc)/nu)+tfc
+        twp = ((sc-wp)/(nu-nuw))*log(nu/nuw)+tsc
+
+        if Tb < tfc:
+            s = fabs(sini-(1./beta)*log(((nu-mu+mu *
+                     exp(beta*(sini-fc)))*exp(beta*(nu-mu)*Tb) -
+                     mu*exp(beta*(sini-fc)))/(nu-mu)))
+            D[0] = ((pc*ZR*1000.)*(sini-s))-(Tb*(Ep/24.))
+            ETA[0] = (Tb*(Ep/24.))
+
+        elif Tb >= tfc and Tb < tsc:
+            s = fc-(nu*(Tb-tfc))
+            D[0] = ((pc*ZR*1000.)*(sini-fc))-((tfc)*(Ep/24.))
+            ETA[0] = (Tb*(Ep/24.))
+
+        elif Tb >= tsc and Tb < twp:
+            s = (wp+(sc-wp)*((nu/(nu-nuw))*exp(-(((nu-nuw) /
+                 (sc-wp))*(Tb-tsc)))-(nuw/(nu-nuw))))
+            D[0] = ((pc*ZR*1000.)*(sini-fc))-(tfc*Ep/24.)
+            ETA[0] = (1000.*ZR*pc*(sini-s))-D[0]
+
+        else:
+            s = Tb-twp
+            if 0. > s:
+                s = 0.
+            s = (hgw+(wp-hgw)*exp(-(nuw/(wp-hgw)) * s))
+            D[0] = ((pc*ZR*1000.)*(sini-fc))-(tfc*Ep/24.)
+            ETA[0] = (1000.*ZR*pc*(sini-s))-D[0]
+
+    elif sini < fc and sini >= sc:
+        tsc = (sini-sc)/nu
+        twp = ((sc-wp)/(nu-nuw))*log(nu/nuw)+tsc
+
+        if Tb < tsc:
+            s = sini - nu*Tb
+        elif Tb >= tsc and Tb < twp:
+            s = (wp+(sc-wp)*((nu/(nu-nuw))*exp(-(
+                 ((nu-nuw)/(sc-wp))*(Tb-tsc)))-(nuw/(nu-nuw))))
+        else:
+            s = hgw+(wp-hgw)*exp(-(nuw/(wp-hgw))*(Tb-twp))
+        D[0] = 0.
+        ETA[0] = (1000.*ZR*pc*(sini-s))
+
+    elif sini < sc and sini >= wp:
+        twp = (((sc-wp)/(nu-nuw))*log(1+(nu-nuw)*(sini-wp) /
+               (nuw*(sc-wp))))
+
+        if Tb < twp:
+            s = (wp+((sc-wp)/(nu-nuw))*((exp(-(((nu-nuw) /
+                 (sc-wp))*Tb)))*(nuw+((nu-nuw)/(sc-wp))*(sini-wp)) - nuw))
+        else:
+            s = hgw+(wp-hgw)*exp(-(nuw/(wp-hgw))*(Tb-twp))
+        D[0] = 0.
+        ETA[0] = (1000.*ZR*pc*(sini-s))
+
+    else:
+        s = hgw+(sini-hgw)*exp(-(nuw/(wp-hgw))*Tb)
+        D[0] = 0.
+        ETA[0] = (1000.*ZR*pc*(sini-s))
+
+    stress = ((sc - (s+sini)/2.) / (sc - wp))
+    if 0. > stress:
+        stress = 0.
+    stress = pow(stress, 4.)
+    if 1.0 < stress:
+        stress = 1.0
+    water_stress[0] = stress
+    Sini[0] = sini
+
+    return s
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def update_soil_moisture(const DTYPE_FLOAT_t[:] P,
+                         const DTYPE_FLOAT_t[:] PET,
+                         const DTYPE_FLOAT_t[:] fr,
+                         const DTYPE_FLOAT_t[:] vegcover,
+                         const DTYPE_FLOAT_t[:] sc,
+                         const DTYPE_FLOAT_t[:] zr,
+                         const DTYPE_FLOAT_t[:] soil_pc,
+                         const DTYPE_FLOAT_t[:] soil_fc,
+                         const DTYPE_FLOAT_t[:] soil_wp,
+                         const DTYPE_FLOAT_t[:] soil_hgw,
+                         const DTYPE_FLOAT_t[:] soil_beta,
+                         const DTYPE_FLOAT_t[:] soil_Ib,
+                         const DTYPE_FLOAT_t[:] soil_Iv,
+                         const DTYPE_FLOAT_t[:] interception_cap,
+                         double fbare, double soil_Ew, double runon,
+                         double Tb,
+                         DTYPE_FLOAT_t[:] SO,
+                         DTYPE_FLOAT_t[:] S,
+                         DTYPE_FLOAT_t[:] D,
+                         DTYPE_FLOAT_t[:] ETA,
+                         DTYPE_FLOAT_t[:] runoff,
+                         DTYPE_FLOAT_t[:] water_stress,
+                         DTYPE_FLOAT_t[:] Sini,
+                         DTYPE_FLOAT_t[:] ETmax):
+    """Update soil moisture at every cell over one storm-interstorm period.
+
+    Infiltration, interception and the piecewise soil-water loss function
+    (Laio et al., 2001) are evaluated for each cell in turn, exactly as in
+    the per-cell formulation of *SoilMoisture.update*. The saturation
+    fraction at the start of the period, *SO*, and all outputs are updated
+    in place.
+    """
+    cdef int cell
+    cdef double s
+
+    with nogil:
+        for cell in range(SO.shape[0]):
+            s = soil_moisture_at_cell(
+                P[cell], PET[cell], fr[cell], vegcover[cell], sc[cell],
+                zr[cell], soil_pc[cell], soil_fc[cell], soil_wp[cell],
+                soil_hgw[cell], soil_beta[cell], soil_Ib[cell], soil_Iv[cell],
+                interception_cap[cell], fbare, soil_Ew, runon, Tb, SO[cell],
+                &D[cell], &ETA[cell], &runoff[cell], &water_stress[cell],
+                &Sini[cell], &ETmax[cell])
+            S[cell] = s
+            SO[cell] = s
@@ -1,6 +1,7 @@
 from landlab import Component
 from ...utils.decorators import use_file_name_or_kwds
 import numpy as np
+from .cfuncs import update_soil_moisture
 
 _VALID_METHODS = set(['Grid', 'Multi'])
 
@@ -10,6 +11,10 @@ def assert_method_is_valid(method):
         raise ValueError('%s: Invalid method name' % method)
 
 
+def _as_float(array):
+    return np.ascontiguousarray(array, dtype=float)
+
+
 class SoilMoisture(Component):
     """
     Landlab component that simulates root-zone average soil moisture at each
@@ -444,130 +449,22 @@ class SoilMoisture(Component):
         self._Sini = np.zeros(self._SO.shape)
         self._ETmax = np.zeros(self._SO.shape)
 
-        for cell in range(0, self.grid.number_of_cells):
-            P = P_[cell]
-            # print cell
-            s = self._SO[cell]
-            fbare = self._fbare
-            ZR = self._zr[cell]
-            pc = self._soil_pc[cell]
-            fc = self._soil_fc[cell]
-            scc = self._soil_sc[cell]
-            wp = self._soil_wp[cell]
-            hgw = self._soil_hgw[cell]
-            beta = self._soil_beta[cell]
-            if self._vegtype[cell] == 0:   # 0 - GRASS
-                sc = scc*self._fr[cell]+(1-self._fr[cell])*fc
-            else:
-                sc = scc
-
-            Inf_cap = (self._soil_Ib[cell]*(1-self._vegcover[cell]) +
-                       self._soil_Iv[cell]*self._vegcover[cell])
-            # Infiltration capacity
-            Int_cap = min(self._vegcover[cell]*self._interception_cap[cell],
-                          P)
-            # Interception capacity
-            Peff = max(P-Int_cap, 0.)         # Effective precipitation depth
-            mu = (Inf_cap/1000.0)/(pc*ZR*(np.exp(beta*(1.-fc))-1.))
-            Ep = max((self._PET[cell]*self._fr[cell] +
-                     fbare*self._PET[cell]*(1.-self._fr[cell])) -
-                     Int_cap, 0.0001)  # mm/d
-            self._ETmax[cell] = Ep
-            nu = ((Ep / 24.) / 1000.) / (pc*ZR)   # Loss function parameter
-            nuw = ((self._soil_Ew/24.)/1000.)/(pc*ZR)
-            # Loss function parameter
-            sini = self._SO[cell] + ((Peff+self._runon)/(pc*ZR*1000.))
-
-            if sini > 1.:
-                self._runoff[cell] = (sini-1.)*pc*ZR*1000.
-                # print 'Runoff =', self._runoff
-                sini = 1.
-            else:
-                self._runoff[cell] = 0.
-
-            if sini >= fc:
-                tfc = (1./(beta*(mu-nu)))*(beta*(fc-sini) + np.log((
-                       nu-mu+mu*np.exp(beta*(sini-fc)))/nu))
-                tsc = ((fc-sc)/nu)+tfc
-                twp = ((sc-wp)/(nu-nuw))*np.log(nu/nuw)+tsc
-
-                if Tb < tfc:
-                    s = abs(sini-(1./beta)*np.log(((nu-mu+mu *
-                            np.exp(beta*(sini-fc)))*np.exp(beta*(nu-mu)*Tb) -
-                            mu*np.exp(beta*(sini-fc)))/(nu-mu)))
-
-                    self._D[cell] = ((pc*ZR*1000.)*(sini-s))-(Tb*(Ep/24.))
-                    self._ETA[cell] = (Tb*(Ep/24.))
-
-                elif Tb >= tfc and Tb < tsc:
-                    s = fc-(nu*(Tb-tfc))
-                    self._D[cell] = ((pc*ZR*1000.)*(sini-fc))-((tfc)*(Ep/24.))
-                    self._ETA[cell] = (Tb*(Ep/24.))
-
-                elif Tb >= tsc and Tb < twp:
-                    s = (wp+(sc-wp)*((nu/(nu-nuw))*np.exp((-1)*((nu-nuw) /
-                         (sc-wp))*(Tb-tsc))-(nuw/(nu-nuw))))
-                    self._D[cell] = ((pc*ZR*1000.)*(sini-fc))-(tfc*Ep/24.)
-                    self._ETA[cell] = (1000.*ZR*pc*(sini-s))-self._D[cell]
-
-                else:
-                    s = (hgw+(wp-hgw)*np.exp((-1)*(nuw/(wp-hgw)) *
-                         max(Tb-twp, 0.)))
-                    self._D[cell] = ((pc*ZR*1000.)*(sini-fc))-(tfc*Ep/24.)
-                    self._ETA[cell] = (1000.*ZR*pc*(sini-s))-self._D[cell]
-
-            elif sini < fc and sini >= sc:
-                tfc = 0.
-                tsc = (sini-sc)/nu
-                twp = ((sc-wp)/(nu-nuw))*np.log(nu/nuw)+tsc
-
-                if Tb < tsc:
-                    s = sini - nu*Tb
-                    self._D[cell] = 0.
-                    self._ETA[cell] = 1000.*ZR*pc*(sini-s)
-
-                elif Tb >= tsc and Tb < twp:
-                    s = (wp+(sc-wp)*((nu/(nu-nuw))*np.exp((-1) *
-                         ((nu-nuw)/(sc-wp))*(Tb-tsc))-(nuw/(nu-nuw))))
-                    self._D[cell] = 0
-                    self._ETA[cell] = (1000.*ZR*pc*(sini-s))
-
-                else:
-                    s = hgw+(wp-hgw)*np.exp((-1)*(nuw/(wp-hgw))*(Tb-twp))
-                    self._D[cell] = 0.
-                    self._ETA[cell] = (1000.*ZR*pc*(sini-s))
-
-            elif sini < sc and sini >= wp:
-                tfc = 0
-                tsc = 0
-                twp = (((sc-wp)/(nu-nuw))*np.log(1+(nu-nuw)*(sini-wp) /
-                       (nuw*(sc-wp))))
-
-                if Tb < twp:
-                    s = (wp+((sc-wp)/(nu-nuw))*((np.exp((-1)*((nu-nuw) /
-                         (sc-wp))*Tb))*(nuw+((nu-nuw)/(sc-wp))*(sini-wp))-nuw))
-                    self._D[cell] = 0.
-                    self._ETA[cell] = (1000.*ZR*pc*(sini-s))
-
-                else:
-                    s = hgw+(wp-hgw)*np.exp((-1)*(nuw/(wp-hgw))*(Tb-twp))
-                    self._D[cell] = 0.
-                    self._ETA[cell] = (1000.*ZR*pc*(sini-s))
-
-            else:
-                tfc = 0.
-                tsc = 0.
-                twp = 0.
-
-                s = hgw+(sini-hgw)*np.exp((-1)*(nuw/(wp-hgw))*Tb)
-                self._D[cell] = 0.
-                self._ETA[cell] = (1000.*ZR*pc*(sini-s))
-
-            self._water_stress[cell] = min(((max(((sc - (s+sini)/2.) /
-                                           (sc - wp)), 0.))**4.), 1.0)
-            self._S[cell] = s
-            self._SO[cell] = s
-            self._Sini[cell] = sini
+        # Soil saturation degree at stomatal closure for grass varies with
+        # the fraction of live leaves
+        sc = np.where(self._vegtype == 0,
+                      self._soil_sc*self._fr+(1-self._fr)*self._soil_fc,
+                      self._soil_sc)
+
+        update_soil_moisture(
+            _as_float(P_), _as_float(self._PET), _as_float(self._fr),
+            _as_float(self._vegcover), _as_float(sc), _as_float(self._zr),
+            _as_float(self._soil_pc), _as_float(self._soil_fc),
+            _as_float(self._soil_wp), _as_float(self._soil_hgw),
+            _as_float(self._soil_beta), _as_float(self._soil_Ib),
+            _as_float(self._soil_Iv), _as_float(self._interception_cap),
+            self._fbare, self._soil_Ew, self._runon, Tb, self._SO, self._S,
+            self._D, self._ETA, self._runoff, self._water_stress, self._Sini,
+            self._ETmax)
 
         current_time += (Tb+Tr)/(24.*365.25)
         return current_time
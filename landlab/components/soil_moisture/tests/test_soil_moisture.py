@@ -119,4 +119,41 @@ def test_field_initialized_to_zero():
         assert_array_almost_equal(field, np.zeros(SM.grid.number_of_nodes))
     for name in SM.grid['cell']:
         field = SM.grid['cell'][name]
-        assert_array_almost_equal(field, np.zeros(SM.grid.number_of_cells))
\ No newline at end of file
+        assert_array_almost_equal(field, np.zeros(SM.grid.number_of_cells))
+
+
+def test_update_one_cell_per_vegetation_type():
+    grid = RasterModelGrid((4, 5))
+    grid.at_cell['vegetation__plant_functional_type'] = np.arange(6)
+    sm = SoilMoisture(grid)
+    grid.at_cell['surface__potential_evapotranspiration_rate'] = np.array(
+        [4., 5., 6., 3., 2., 1.])
+    grid.at_cell['soil_moisture__initial_saturation_fraction'] = np.array(
+        [0.9, 0.5, 0.3, 0.2, 0.6, 0.12])
+    grid.at_cell['vegetation__live_leaf_area_index'] = np.array(
+        [1., 2., 3., 0., 0.5, 1.])
+    grid.at_cell['vegetation__cover_fraction'] = np.array(
+        [0.5, 0.6, 0.7, 0., 0.2, 0.3])
+    grid.at_cell['rainfall__daily_depth'] = np.array(
+        [100., 0., 10., 0., 5., 0.])
+
+    current_time = sm.update(0., Tb=48.)
+
+    assert_array_almost_equal(current_time, 48. / (24. * 365.25))
+    assert_array_almost_equal(
+        grid.at_cell['soil_moisture__saturation_fraction'],
+        [0.644639, 0.453488, 0.300537, 0.178671, 0.598055, 0.119857])
+    assert_array_almost_equal(
+        grid.at_cell['soil_moisture__root_zone_leakage'],
+        [40.408195, 0., 0., 0., 2.618162, 0.])
+    assert_array_almost_equal(
+        grid.at_cell['surface__evapotranspiration'],
+        [5.433333, 10., 8.3, 1.375707, 2.5, 0.079714])
+    assert_array_almost_equal(
+        grid.at_cell['surface__runoff'], [86.6, 0., 0., 0., 0., 0.])
+    assert_array_almost_equal(
+        grid.at_cell['vegetation__water_stress'],
+        [0., 0., 0., 0.244690, 0., 1.])
+    assert_array_almost_equal(
+        grid.at_cell['soil_moisture__initial_saturation_fraction'],
+        grid.at_cell['soil_moisture__saturation_fraction'])
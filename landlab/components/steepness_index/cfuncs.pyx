@@ -0,0 +1,85 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+
+
+DTYPE_INT = np.int
+ctypedef np.int_t DTYPE_INT_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _find_channels(const DTYPE_INT_t[:] valid_dstr_order,
+                   const DTYPE_INT_t[:] receivers):
+    """Split a channel network into unique reaches.
+
+    Working through the channel heads in downstream order, each reach
+    starts at a node not yet in a reach and follows receivers down to (and
+    including) the first node already in a reach, or to the end of the
+    flow path.
+
+    Parameters
+    ----------
+    valid_dstr_order : ndarray of int
+        Nodes of the channel network in downstream order.
+    receivers : ndarray of int, shape (n_nodes, )
+        Receiver node of each node.
+
+    Returns
+    -------
+    tuple of ndarray of int
+        The nodes of every reach, from top to bottom, one reach after
+        another, and the offset into this array of the start of each reach
+        (with a final offset to the end of the last reach).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.steepness_index.cfuncs import _find_channels
+    >>> (nodes, offsets) = _find_channels(np.array([4, 3, 2, 1, 0]),
+    ...                                   np.array([0, 0, 1, 1, 2]))
+    >>> nodes.tolist()
+    [4, 2, 1, 0, 3, 1]
+    >>> offsets.tolist()
+    [0, 4, 6]
+    """
+    cdef long n_nodes = receivers.shape[0]
+    cdef long n_valid = valid_dstr_order.shape[0]
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] channel_nodes = np.empty(
+        2 * n_nodes, dtype=DTYPE_INT)
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] offsets = np.empty(
+        n_nodes + 1, dtype=DTYPE_INT)
+    cdef np.ndarray[np.uint8_t, ndim=1] incorporated = np.zeros(
+        n_nodes, dtype=np.uint8)
+    cdef DTYPE_INT_t[:] nodes_out = channel_nodes
+    cdef DTYPE_INT_t[:] offsets_out = offsets
+    cdef np.uint8_t[:] is_incorporated = incorporated
+    cdef long n_channels = 0
+    cdef long n_channel_nodes = 0
+    cdef long i
+    cdef long node, next_node
+    cdef bint at_incorporated_node
+
+    with nogil:
+        offsets_out[0] = 0
+        for i in range(n_valid):
+            node = valid_dstr_order[i]
+            if is_incorporated[node]:
+                continue
+            is_incorporated[node] = 1
+            nodes_out[n_channel_nodes] = node
+            n_channel_nodes += 1
+            at_incorporated_node = False
+            while not at_incorporated_node:
+                next_node = receivers[node]
+                if next_node == node:
+                    break
+                nodes_out[n_channel_nodes] = next_node
+                n_channel_nodes += 1
+                at_incorporated_node = is_incorporated[next_node]
+                is_incorporated[next_node] = 1
+                node = next_node
+            n_channels += 1
+            offsets_out[n_channels] = n_channel_nodes
+
+    return channel_nodes[:n_channel_nodes], offsets[:n_channels + 1]
@@ -16,6 +16,7 @@ from landlab.components.flow_routing.lake_mapper import \
 from landlab.components.flow_routing.route_flow_dn import FlowRouter
 from landlab.grid.base import BAD_INDEX_VALUE
 from landlab.utils.decorators import use_file_name_or_kwds
+from .cfuncs import _find_channels
 import numpy as np
 
 
@@ -182,37 +183,39 @@ class SteepnessFinder(Component):
         # get an array of only nodes with A above threshold:
         valid_dstr_order = (upstr_order[self.grid.at_node['drainage_area'][
             upstr_order] >= min_drainage])[::-1]
-        valid_dstr_elevs = self.grid.at_node['topographic__elevation'][
-            valid_dstr_order]
-        valid_dstr_areas = self.grid.at_node['drainage_area'][valid_dstr_order]
         # note elevs are guaranteed to be in order, UNLESS a fill
         # algorithm has been used.
-        nodes_incorporated = self.grid.zeros('node', dtype=bool)
-        # now do each poss channel in turn
-        # get the head of the first (longest!) channel:
-        for dstr_order_index in range(valid_dstr_order.size):
-            this_ch_top_node = valid_dstr_order[dstr_order_index]  # top node
-            if not nodes_incorporated[this_ch_top_node]:
-                nodes_incorporated[this_ch_top_node] = True
-                nodes_in_channel = [this_ch_top_node, ]
-                penultimate_node = this_ch_top_node
-                current_node_incorporated = False
-                while not current_node_incorporated:
-                    next_node = self.grid.at_node['flow__receiver_node'][
-                        penultimate_node]
-                    if next_node == penultimate_node:  # end of flow path
-                        break
-                    nodes_in_channel.append(next_node)
-                    current_node_incorporated = nodes_incorporated[next_node]
-                    # ^ this is a COPY op, so we're free to update the array
-                    nodes_incorporated[next_node] = True
-                    penultimate_node = next_node
-                # by here, we have a full, unique reach in nodes_in_channel
-                # it incorporates a single, duplicate node at the lower end
+        # split the network into unique reaches, starting from the head of
+        # the first (longest!) channel. Each reach incorporates a single,
+        # duplicate node at the lower end.
+        (channel_nodes, offsets) = _find_channels(
+            valid_dstr_order.astype(np.int, copy=False),
+            self.grid.at_node['flow__receiver_node'].astype(np.int,
+                                                            copy=False))
+        if not (elev_step or discretization_length):
+            # all the nodes; much easier as links work. The final node of
+            # each reach gets trimmed off, leaving every node once.
+            is_top_of_reach = np.ones(channel_nodes.size, dtype=bool)
+            is_top_of_reach[offsets[1:] - 1] = False
+            ch_nodes = channel_nodes[is_top_of_reach]
+            assert np.all(self.grid.at_node['topographic__steepest_slope'][
+                channel_nodes] >= 0.)
+            log_A = np.log10(self.grid.at_node['drainage_area'][ch_nodes])
+            log_S = np.log10(self.grid.at_node['topographic__steepest_slope'][
+                ch_nodes])
+            # we're potentially propagating nans here if S<=0
+            log_ksn = log_S + reftheta * log_A
+            self.ksn[ch_nodes] = 10.**log_ksn
+            self._mask[channel_nodes] = False
+        else:
+            # now do each poss channel in turn
+            for (start, stop) in zip(offsets[:-1], offsets[1:]):
+                ch_nodes = channel_nodes[start:stop]
+                # ^ this is top-to-bottom
                 # Now, if this segment long enough?
                 if elev_step:
-                    top_elev = self._elev[nodes_in_channel[0]]
-                    base_elev = self._elev[nodes_in_channel[-1]]
+                    top_elev = self._elev[ch_nodes[0]]
+                    base_elev = self._elev[ch_nodes[-1]]
                     # work up the channel from the base to make new interp pts
                     interp_pt_elevs = np.arange(base_elev, top_elev,
                                                 elev_step)
@@ -221,16 +224,12 @@ class SteepnessFinder(Component):
                         break
                     # now we can fairly closely follow the Geomorphtools
                     # algorithm:
-                    ch_nodes = np.array(nodes_in_channel)
-                    # ^ this is top-to-bottom
                     ch_A = self.grid.at_node['drainage_area'][ch_nodes]
                     ch_dists = self.channel_distances_downstream(ch_nodes)
                     ch_S = self.interpolate_slopes_with_step(ch_nodes,
                                                              ch_dists,
                                                              interp_pt_elevs)
                 else:
-                    # all the nodes; much easier as links work
-                    ch_nodes = np.array(nodes_in_channel)
                     ch_dists = self.channel_distances_downstream(ch_nodes)
                     ch_A = self.grid.at_node['drainage_area'][ch_nodes]
                     ch_S = self.grid.at_node['topographic__steepest_slope'][
@@ -0,0 +1,92 @@
+"""
+Unit tests for landlab.components.steepness_index.channel_steepness
+"""
+from numpy.testing import assert_array_equal
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import FlowRouter, FastscapeEroder, SteepnessFinder
+from landlab.components.steepness_index.cfuncs import _find_channels
+
+
+def _eroded_landscape(shape=(20, 25), seed=0):
+    grid = RasterModelGrid(shape, 100.)
+    z = grid.add_zeros('node', 'topographic__elevation')
+    z[grid.core_nodes] = np.random.RandomState(seed).rand(
+        grid.number_of_core_nodes)
+    fr = FlowRouter(grid)
+    sp = FastscapeEroder(grid, K_sp=1.e-4)
+    for _ in range(10):
+        z[grid.core_nodes] += 1.
+        fr.route_flow()
+        sp.run_one_step(1000.)
+    fr.route_flow()
+    return grid
+
+
+def _channels(dstr_order, receivers):
+    """Split a network into reaches one node at a time."""
+    incorporated = np.zeros(receivers.size, dtype=bool)
+    channels = []
+    for top_node in dstr_order:
+        if incorporated[top_node]:
+            continue
+        incorporated[top_node] = True
+        channel = [top_node]
+        node = top_node
+        while receivers[node] != node:
+            node = receivers[node]
+            channel.append(node)
+            if incorporated[node]:
+                break
+            incorporated[node] = True
+        channels.append(channel)
+    return channels
+
+
+def test_find_channels():
+    """Test compiled reaches match those found node by node."""
+    grid = _eroded_landscape()
+    dstr_order = grid.at_node['flow__upstream_node_order'][::-1]
+    receivers = grid.at_node['flow__receiver_node']
+
+    (nodes, offsets) = _find_channels(dstr_order, receivers)
+    channels = _channels(dstr_order, receivers)
+
+    assert_array_equal(offsets, np.cumsum([0] + [len(ch) for ch in channels]))
+    assert_array_equal(nodes, np.concatenate(channels))
+
+
+def test_steepness_at_each_node():
+    """Test vectorized ksn matches ksn calculated channel by channel."""
+    grid = _eroded_landscape()
+    sf = SteepnessFinder(grid, min_drainage_area=1.e4,
+                         reference_concavity=0.45)
+    sf.calculate_steepnesses()
+
+    area = grid.at_node['drainage_area']
+    slope = grid.at_node['topographic__steepest_slope']
+    upstr_order = grid.at_node['flow__upstream_node_order']
+    ksn = grid.zeros('node')
+    mask = grid.ones('node', dtype=bool)
+    for channel in _channels(upstr_order[area[upstr_order] >= 1.e4][::-1],
+                             grid.at_node['flow__receiver_node']):
+        ch_nodes = np.array(channel)
+        ksn[ch_nodes[:-1]] = 10. ** (np.log10(slope[ch_nodes[:-1]]) +
+                                     0.45 * np.log10(area[ch_nodes[:-1]]))
+        mask[ch_nodes] = False
+
+    assert_array_equal(sf.steepness_indices, ksn)
+    assert_array_equal(sf.hillslope_mask, mask)
+
+
+def test_discretized_steepness():
+    """Test segments are fitted to every channel."""
+    grid = _eroded_landscape()
+    sf = SteepnessFinder(grid, min_drainage_area=1.e4,
+                         discretization_length=500.)
+    sf.calculate_steepnesses()
+
+    channel_nodes = ~ sf.hillslope_mask
+    assert np.any(channel_nodes)
+    assert np.all(sf.steepness_indices[~ channel_nodes] == 0.)
@@ -53,44 +53,37 @@ def erode_avoiding_pits(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
             node_dz[src_id] = (node_z[src_id] - z_dst_after) * 0.999999
 
 
-def erode_with_link_alpha_varthresh(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
-                                    np.ndarray[DTYPE_INT_t, ndim=1] dst_nodes,
-                                    np.ndarray[DTYPE_FLOAT_t, ndim=1] threshsxdt,
-                                    np.ndarray[DTYPE_FLOAT_t, ndim=1] alpha,
-                                    DTYPE_FLOAT_t n,
-                                    np.ndarray[DTYPE_FLOAT_t, ndim=1] z):
-    """Erode node elevations using alpha scaled by link length.
-
-    Parameters
-    ----------
-    src_nodes : array_like
-        Ordered upstream node ids.
-    dst_nodes : array_like
-        Node ids of nodes receiving flow.
-    threshsxdt : array_like
-        Incision thresholds at nodes multiplied by the timestep.
-    alpha : array_like
-        Erosion factor scaled by link length to the *n - 1*.
-    n : float
-        Exponent.
-    z : array_like
-        Node elevations.
+cdef void _erode_with_link_alpha(DTYPE_INT_t * src_nodes,
+                                 DTYPE_INT_t * dst_nodes,
+                                 DTYPE_FLOAT_t * threshsxdt,
+                                 DTYPE_FLOAT_t threshxdt,
+                                 DTYPE_FLOAT_t * alpha,
+                                 DTYPE_FLOAT_t n,
+                                 DTYPE_FLOAT_t * z,
+                                 DTYPE_INT_t start,
+                                 DTYPE_INT_t stop) nogil:
+    """Erode the nodes at positions *start* to *stop* of the stack.
+
+    If *threshsxdt* is NULL, the uniform threshold *threshxdt* is used;
+    otherwise thresholds are read from *threshsxdt* by node ID.
     """
-    cdef unsigned int n_nodes = src_nodes.size
-    cdef unsigned int src_id
-    cdef unsigned int dst_id
-    cdef unsigned int i
-    cdef double threshxdt
+    cdef DTYPE_INT_t src_id
+    cdef DTYPE_INT_t dst_id
+    cdef DTYPE_INT_t i
+    cdef double thresh
     cdef double z_diff
     cdef double prev_z
     cdef double next_z
     cdef double f
     cdef double excess_thresh
 
-    for i in range(n_nodes):
+    for i in range(start, stop):
         src_id = src_nodes[i]
         dst_id = dst_nodes[src_id]
-        threshxdt = threshsxdt[i]
+        if threshsxdt == NULL:
+            thresh = threshxdt
+        else:
+            thresh = threshsxdt[src_id]
 
         if src_id != dst_id:
             next_z = z[src_id]
@@ -99,7 +92,7 @@ def erode_with_link_alpha_varthresh(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
             while True:
                 z_diff = next_z - z[dst_id]
                 f = alpha[src_id] * pow(z_diff, n - 1.)
-                excess_thresh = f * z_diff - threshxdt
+                excess_thresh = f * z_diff - thresh
                 if excess_thresh < 0.:
                     excess_thresh = 0.
                 next_z = next_z - ((next_z - z[src_id] + excess_thresh) /
@@ -112,12 +105,39 @@ def erode_with_link_alpha_varthresh(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
                 else:
                     break
 
-                prev_z = next_z;
+                prev_z = next_z
 
             if next_z < z[src_id]:
                 z[src_id] = next_z
 
 
+def erode_with_link_alpha_varthresh(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
+                                    np.ndarray[DTYPE_INT_t, ndim=1] dst_nodes,
+                                    np.ndarray[DTYPE_FLOAT_t, ndim=1] threshsxdt,
+                                    np.ndarray[DTYPE_FLOAT_t, ndim=1] alpha,
+                                    DTYPE_FLOAT_t n,
+                                    np.ndarray[DTYPE_FLOAT_t, ndim=1] z):
+    """Erode node elevations using alpha scaled by link length.
+
+    Parameters
+    ----------
+    src_nodes : array_like
+        Ordered upstream node ids.
+    dst_nodes : array_like
+        Node ids of nodes receiving flow.
+    threshsxdt : array_like
+        Incision thresholds at nodes multiplied by the timestep.
+    alpha : array_like
+        Erosion factor scaled by link length to the *n - 1*.
+    n : float
+        Exponent.
+    z : array_like
+        Node elevations.
+    """
+    erode_with_link_alpha_in_range(src_nodes, dst_nodes, threshsxdt, alpha,
+                                   n, z, 0, src_nodes.size)
+
+
 def erode_with_link_alpha_fixthresh(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
                                     np.ndarray[DTYPE_INT_t, ndim=1] dst_nodes,
                                     DTYPE_FLOAT_t threshxdt,
@@ -141,42 +161,59 @@ def erode_with_link_alpha_fixthresh(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
     z : array_like
         Node elevations.
     """
-    cdef unsigned int n_nodes = src_nodes.size
-    cdef unsigned int src_id
-    cdef unsigned int dst_id
-    cdef unsigned int i
-    cdef double z_diff
-    cdef double prev_z
-    cdef double next_z
-    cdef double f
-    cdef double excess_thresh
+    erode_with_link_alpha_in_range(src_nodes, dst_nodes, threshxdt, alpha,
+                                   n, z, 0, src_nodes.size)
 
-    for i in range(n_nodes):
-        src_id = src_nodes[i]
-        dst_id = dst_nodes[src_id]
-
-        if src_id != dst_id:
-            next_z = z[src_id]
-            prev_z = 0.
 
-            while True:
-
-                z_diff = next_z - z[dst_id]
-                f = alpha[src_id] * pow(z_diff, n - 1.)
-                excess_thresh = f * z_diff - threshxdt
-                if excess_thresh < 0.:
-                    excess_thresh = 0.
-                next_z = next_z - ((next_z - z[src_id] + excess_thresh) /
-                                   (1. + n * f))
-                if next_z < z[dst_id]:
-                   next_z = z[dst_id] + 1.e-15  # maintain connectivity
-                if next_z != 0.:
-                    if fabs((next_z - prev_z)/next_z) < 1.48e-08 or n == 1.:
-                        break
-                else:
-                    break
-
-                prev_z = next_z;
+@cython.boundscheck(False)
+def erode_with_link_alpha_in_range(
+        np.ndarray[DTYPE_INT_t, ndim=1, mode='c'] src_nodes,
+        np.ndarray[DTYPE_INT_t, ndim=1, mode='c'] dst_nodes,
+        threshsxdt,
+        np.ndarray[DTYPE_FLOAT_t, ndim=1, mode='c'] alpha,
+        DTYPE_FLOAT_t n,
+        np.ndarray[DTYPE_FLOAT_t, ndim=1, mode='c'] z,
+        DTYPE_INT_t start,
+        DTYPE_INT_t stop):
+    """Erode node elevations for part of the stack, releasing the GIL.
+
+    Only the nodes at positions *start* to *stop* of *src_nodes* are eroded.
+    If this part of the stack holds whole drainage basins, it is independent
+    of the rest of the stack and so can be eroded in a separate thread.
 
-            if next_z < z[src_id]:
-                z[src_id] = next_z
\ No newline at end of file
+    Parameters
+    ----------
+    src_nodes : array_like
+        Ordered upstream node ids.
+    dst_nodes : array_like
+        Node ids of nodes receiving flow.
+    threshsxdt : float or array_like
+        Incision thresholds multiplied by the timestep, either uniform or
+        at nodes (C-contiguous and of type float).
+    alpha : array_like
+        Erosion factor scaled by link length to the *n - 1*.
+    n : float
+        Exponent.
+    z : array_like
+        Node elevations.
+    start : int
+        Stack position of the first node to erode.
+    stop : int
+        Stack position after the last node to erode.
+    """
+    cdef np.ndarray[DTYPE_FLOAT_t, ndim=1, mode='c'] thresh_array
+    cdef DTYPE_FLOAT_t * thresh_ptr = NULL
+    cdef DTYPE_FLOAT_t thresh = 0.
+
+    if isinstance(threshsxdt, np.ndarray):
+        thresh_array = threshsxdt
+        thresh_ptr = <DTYPE_FLOAT_t *> thresh_array.data
+    else:
+        thresh = threshsxdt
+
+    with nogil:
+        _erode_with_link_alpha(<DTYPE_INT_t *> src_nodes.data,
+                               <DTYPE_INT_t *> dst_nodes.data,
+                               thresh_ptr, thresh,
+                               <DTYPE_FLOAT_t *> alpha.data, n,
+                               <DTYPE_FLOAT_t *> z.data, start, stop)
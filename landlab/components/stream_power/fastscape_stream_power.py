@@ -7,6 +7,7 @@ Created DEJH, March 2014.
 from __future__ import print_function
 
 import numpy
+import threading
 import warnings
 from landlab import ModelParameterDictionary, Component
 from landlab.core.model_parameter_dictionary import MissingKeyError, \
@@ -48,7 +49,7 @@ class FastscapeEroder(Component):
     Construction::
 
         FastscapeEroder(grid, K_sp=None, m_sp=0.5, n_sp=1., threshold_sp=0.,
-                        rainfall_intensity=1.)
+                        rainfall_intensity=1., n_threads=1)
 
     Parameters
     ----------
@@ -69,6 +70,11 @@ class FastscapeEroder(Component):
         varying rainfall intensity, pass rainfall_intensity_if_used to
         `run_one_step`. For a spatially variable rainfall, use the
         StreamPowerEroder component.
+    n_threads : int, optional
+        Number of threads over which to share the erosion. Drainage basins
+        are independent of one another, so the upstream node order is split
+        into groups of whole basins that are eroded simultaneously. The
+        result is identical to that with a single thread.
 
     Examples
     --------
@@ -131,6 +137,24 @@ class FastscapeEroder(Component):
     >>> sp3.run_one_step(1., rainfall_intensity_if_used=0.)
     >>> np.allclose(z, previous_z)
     True
+
+    Erosion can be shared among threads, one group of drainage basins to
+    each:
+
+    >>> mg4 = RasterModelGrid((6, 8), 10.)
+    >>> z = mg4.add_field('node', 'topographic__elevation',
+    ...                   mg4.node_x + mg4.node_y ** 2 / 100.)
+    >>> fr4 = FlowRouter(mg4)
+    >>> sp4 = FastscapeEroder(mg4, K_sp=0.1, n_threads=4)
+    >>> fr4.run_one_step()
+    >>> z_serial = z.copy()
+    >>> sp4.run_one_step(dt=1.)
+    >>> mg5 = RasterModelGrid((6, 8), 10.)
+    >>> _ = mg5.add_field('node', 'topographic__elevation', z_serial)
+    >>> FlowRouter(mg5).run_one_step()
+    >>> FastscapeEroder(mg5, K_sp=0.1).run_one_step(dt=1.)
+    >>> np.all(z == mg5.at_node['topographic__elevation'])
+    True
     '''
 
     _name = 'FastscapeEroder'
@@ -180,7 +204,7 @@ class FastscapeEroder(Component):
 
     @use_file_name_or_kwds
     def __init__(self, grid, K_sp=None, m_sp=0.5, n_sp=1., threshold_sp=0.,
-                 rainfall_intensity=1., **kwds):
+                 rainfall_intensity=1., n_threads=1, **kwds):
         """
         Initialize the Fastscape stream power component. Note: a timestep,
         dt, can no longer be supplied to this component through the input file.
@@ -199,8 +223,11 @@ class FastscapeEroder(Component):
         rainfall intensity : float, array, or field name; optional
             Modifying factor on drainage area to convert it to a true water
             volume flux in (m/time). i.e., E = K * (r_i*A)**m * S**n
+        n_threads : int, optional
+            Number of threads among which to share the drainage basins.
         """
         self._grid = grid
+        self._n_threads = int(n_threads)
 
         self.K = K_sp  # overwritten below in special cases
         self.m = float(m_sp)
@@ -363,8 +390,15 @@ class FastscapeEroder(Component):
                                        flow_link_lengths**(self.n - 1.))
         alpha_divided = self.alpha_by_flow_link_lengthtothenless1
         n = float(self.n)
-        threshdt = self.thresholds * dt
         if type(self.thresholds) is float:
+            threshdt = self.thresholds * dt
+        else:
+            threshdt = numpy.ascontiguousarray(self.thresholds * dt,
+                                               dtype=float)
+        if self._n_threads > 1:
+            self._erode_basins_in_threads(upstream_order_IDs, flow_receivers,
+                                          threshdt, alpha_divided, n, z)
+        elif type(self.thresholds) is float:
             from .cfuncs import erode_with_link_alpha_fixthresh
             erode_with_link_alpha_fixthresh(upstream_order_IDs, flow_receivers,
                                             threshdt, alpha_divided, n, z)
@@ -376,7 +410,7 @@ class FastscapeEroder(Component):
             # for i in range(upstream_order_IDs.size):
             #     src_id = upstream_order_IDs[i]
             #     dst_id = flow_receivers[src_id]
-            #     thresh = threshdt[i]
+            #     thresh = threshdt[src_id]
             #     if src_id != dst_id:
             #         next_z = z[src_id]
             #         prev_z = 0.
@@ -403,6 +437,35 @@ class FastscapeEroder(Component):
 
         return self._grid
 
+    def _erode_basins_in_threads(self, upstream_order_IDs, flow_receivers,
+                                 threshdt, alpha_divided, n, z):
+        """Erode groups of whole drainage basins in separate threads.
+
+        Nodes within each basin are eroded in the same order as they are in
+        the upstream node order, so results are identical to the serial
+        version.
+        """
+        from .cfuncs import erode_with_link_alpha_in_range
+
+        order, basin_start = _group_stack_by_basin(upstream_order_IDs,
+                                                   flow_receivers)
+
+        # Cut the stack at basin boundaries into roughly equal parts
+        targets = numpy.linspace(0, order.size, self._n_threads + 1)[1:-1]
+        cuts = basin_start[numpy.searchsorted(basin_start, targets).clip(
+            max=basin_start.size - 1)]
+        bounds = numpy.unique(numpy.concatenate(([0], cuts, [order.size])))
+
+        threads = [threading.Thread(
+            target=erode_with_link_alpha_in_range,
+            args=(order, flow_receivers, threshdt, alpha_divided, n, z,
+                  start, stop))
+            for (start, stop) in zip(bounds[:-1], bounds[1:])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
     def run_one_step(self, dt, flooded_nodes=None,
                      rainfall_intensity_if_used=None, **kwds):
         """
@@ -428,3 +491,67 @@ class FastscapeEroder(Component):
         """
         self.erode(grid_in=self._grid, dt=dt, flooded_nodes=flooded_nodes,
                    rainfall_intensity_if_used=rainfall_intensity_if_used)
+
+
+def _group_stack_by_basin(upstream_order_IDs, flow_receivers):
+    """Arrange the upstream node order as contiguous drainage basins.
+
+    An upstream node order built by the FlowRouter is already a sequence of
+    drainage basins, one after another. If it isn't (for instance, after
+    rerouting across depressions), nodes are grouped by the outlet at the
+    bottom of their basin, keeping their order within each basin.
+
+    Parameters
+    ----------
+    upstream_order_IDs : ndarray of int
+        Downstream-to-upstream ordered node IDs.
+    flow_receivers : ndarray of int
+        Receiver of each node.
+
+    Returns
+    -------
+    tuple
+        Tuple of (upstream_order_IDs, basin_start) where *basin_start* is
+        the position of the start of each basin.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.stream_power.fastscape_stream_power import (
+    ...     _group_stack_by_basin)
+    >>> r = np.array([0, 0, 1, 3, 3, 4])
+    >>> s = np.array([0, 3, 1, 4, 2, 5])
+    >>> (order, start) = _group_stack_by_basin(s, r)
+    >>> order
+    array([0, 1, 2, 3, 4, 5])
+    >>> start
+    array([0, 3])
+    """
+    is_outlet = flow_receivers[upstream_order_IDs] == upstream_order_IDs
+    (basin_start, ) = numpy.where(is_outlet)
+
+    outlet_at_node = numpy.empty_like(flow_receivers)
+    outlet_at_node[upstream_order_IDs] = numpy.repeat(
+        upstream_order_IDs[basin_start],
+        numpy.diff(numpy.append(basin_start, upstream_order_IDs.size)))
+    if (basin_start.size > 0 and basin_start[0] == 0 and numpy.all(
+            outlet_at_node[flow_receivers] == outlet_at_node)):
+        return upstream_order_IDs, basin_start
+
+    # Follow receivers down to the outlets, doubling the jump each time
+    outlet_at_node = flow_receivers.copy()
+    for _ in range(int(numpy.log2(max(outlet_at_node.size, 2))) + 2):
+        next_outlet = outlet_at_node[outlet_at_node]
+        if numpy.all(next_outlet == outlet_at_node):
+            break
+        outlet_at_node = next_outlet
+    else:
+        # receivers don't form a forest; treat everything as one basin
+        return upstream_order_IDs, numpy.array([0])
+
+    regroup = numpy.argsort(outlet_at_node[upstream_order_IDs],
+                            kind='mergesort')
+    order = upstream_order_IDs[regroup]
+    (basin_start, ) = numpy.where(flow_receivers[order] == order)
+
+    return order, basin_start
@@ -7,11 +7,13 @@ fastscape stream power component.
 import os
 
 import numpy
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from nose.tools import assert_true
 
 from landlab import RasterModelGrid
 from landlab import ModelParameterDictionary
-from landlab.components.flow_routing import FlowRouter
+from landlab.components.flow_routing import (FlowRouter,
+                                             DepressionFinderAndRouter)
 from landlab.components.stream_power import FastscapeEroder as Fsc
 
 
@@ -120,3 +122,92 @@ def test_fastscape_new():
                          3.15428351e-04,   3.63710771e-04])
 
     assert_array_almost_equal(mg.at_node['topographic__elevation'], z_trg)
+
+
+def test_fastscape_threads_match_serial():
+    """Test that eroding basins in threads gives the serial result."""
+    for (n_sp, threshold, lakes) in ((1., 0., False), (2., 0., True),
+                                     (1., 'threshold', True)):
+        z_final = []
+        for n_threads in (1, 3):
+            mg = RasterModelGrid((20, 25), 10.)
+            z = mg.add_field('node', 'topographic__elevation',
+                             numpy.random.RandomState(1).rand(
+                                 mg.number_of_nodes) + 0.1 * mg.node_y)
+            mg.add_field('node', 'threshold', numpy.random.RandomState(
+                2).rand(mg.number_of_nodes) * 0.001)
+            fr = FlowRouter(mg)
+            df = DepressionFinderAndRouter(mg)
+            sp = Fsc(mg, K_sp=0.001, n_sp=n_sp, threshold_sp=threshold,
+                     n_threads=n_threads)
+            for _ in range(5):
+                fr.run_one_step()
+                if lakes:
+                    df.map_depressions()
+                sp.run_one_step(dt=10.)
+                z[mg.core_nodes] += 0.01
+            z_final.append(z)
+        assert_array_equal(z_final[0], z_final[1])
+
+
+def _erode_with_thresholds_at_nodes(stack, receivers, threshdt, alpha, n, z):
+    """Erode as the compiled kernel should, reading thresholds by node."""
+    for src_id in stack:
+        dst_id = receivers[src_id]
+        if src_id == dst_id:
+            continue
+        next_z = z[src_id]
+        prev_z = 0.
+        while True:
+            z_diff = next_z - z[dst_id]
+            f = alpha[src_id] * pow(z_diff, n - 1.)
+            excess = max(f * z_diff - threshdt[src_id], 0.)
+            next_z = next_z - (next_z - z[src_id] + excess) / (1. + n * f)
+            if next_z < z[dst_id]:
+                next_z = z[dst_id] + 1.e-15
+            if next_z == 0. or n == 1. or (
+                    abs((next_z - prev_z) / next_z) < 1.48e-08):
+                break
+            prev_z = next_z
+        if next_z < z[src_id]:
+            z[src_id] = next_z
+
+
+def test_fastscape_threshold_at_nodes():
+    """Test that thresholds are read by node, not by position in stack."""
+    for (n_sp, n_threads) in ((1., 1), (2., 1), (1., 3)):
+        mg = RasterModelGrid((12, 15), 10.)
+        z = mg.add_field('node', 'topographic__elevation',
+                         numpy.random.RandomState(1).rand(
+                             mg.number_of_nodes) + 0.1 * mg.node_y)
+        threshold = mg.add_field('node', 'threshold', 1e-4 * mg.node_x)
+        FlowRouter(mg).run_one_step()
+        sp = Fsc(mg, K_sp=0.01, n_sp=n_sp, threshold_sp='threshold',
+                 n_threads=n_threads)
+
+        z_before = z.copy()
+        sp.run_one_step(dt=10.)
+
+        z_expected = z_before.copy()
+        _erode_with_thresholds_at_nodes(
+            mg.at_node['flow__upstream_node_order'],
+            mg.at_node['flow__receiver_node'], threshold * 10.,
+            sp.alpha_by_flow_link_lengthtothenless1, n_sp, z_expected)
+        assert_array_equal(z, z_expected)
+        assert_true(numpy.any(z != z_before))
+
+
+def test_fastscape_threshold_any_array():
+    """Test integer and non-contiguous threshold arrays."""
+    z_final = []
+    for threshold in (numpy.zeros(300), numpy.zeros(300, dtype=int),
+                      numpy.zeros(600)[::2]):
+        mg = RasterModelGrid((15, 20), 10.)
+        z = mg.add_field('node', 'topographic__elevation',
+                         numpy.random.RandomState(1).rand(
+                             mg.number_of_nodes) + 0.1 * mg.node_y)
+        FlowRouter(mg).run_one_step()
+        Fsc(mg, K_sp=0.001, threshold_sp=threshold).run_one_step(dt=10)
+        z_final.append(z)
+    assert_array_equal(z_final[0], z_final[1])
+    assert_array_equal(z_final[0], z_final[2])
@@ -0,0 +1,7 @@
+cdef void vegetation_at_cell(
+        long vegtype, double WUE, double LAImax, double cb, double cd,
+        double ksg, double kdd, double kws, double w, double Tdmax,
+        double PETthreshold, double PET, double PET30, double ActualET,
+        double water_stress, double Tb, double Tr, double Blive_ini,
+        double Bdead_ini, double * LAIlive, double * LAIdead,
+        double * VegCov, double * Blive, double * Bdead) nogil
@@ -0,0 +1,141 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+
+
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
+
+DTYPE_INT = np.int
+ctypedef np.int_t DTYPE_INT_t
+
+
+cdef extern from "math.h":
+    double exp(double x) nogil
+
+
+@cython.cdivision(True)
+cdef void vegetation_at_cell(
+        long vegtype, double WUE, double LAImax, double cb, double cd,
+        double ksg, double kdd, double kws, double w, double Tdmax,
+        double PETthreshold, double PET, double PET30, double ActualET,
+        double water_stress, double Tb, double Tr, double Blive_ini,
+        double Bdead_ini, double * LAIlive, double * LAIdead,
+        double * VegCov, double * Blive, double * Bdead) nogil:
+    """Vegetation at a cell after one storm-interstorm period.
+
+    Updates live and dead biomass from their values at the start of the
+    period, *Blive_ini* and *Bdead_ini*, and sets the live and dead leaf
+    area indices and the vegetation cover fraction.
+    """
+    cdef double live_lai, dead_lai, NPP, Bmax, Yconst, B_live, B_dead
+    cdef double loss, pet_ratio
+
+    live_lai = cb*Blive_ini
+    if LAImax < live_lai:
+        live_lai = LAImax
+    dead_lai = cd*Bdead_ini
+    if (LAImax - live_lai) < dead_lai:
+        dead_lai = LAImax - live_lai
+    NPP = (ActualET/(Tb+Tr)) * WUE*24.*w*1000
+    if 0.001 > NPP:
+        NPP = 0.001
+    pet_ratio = PET/Tdmax
+    if 1. < pet_ratio:
+        pet_ratio = 1.
+
+    if vegtype == 0:
+        if PET30 > PETthreshold:              # Growing Season
+            Bmax = (LAImax - dead_lai)/cb
+            Yconst = (1/((1/Bmax)+(((kws*water_stress) + ksg)/NPP)))
+            B_live = ((Blive_ini - Yconst) *
+                      exp(-(NPP/Yconst) * ((Tb+Tr)/24.)) + Yconst)
+            loss = B_live * exp(-ksg * Tb/24.)
+            if 0.00001 > loss:
+                loss = 0.00001
+            B_dead = ((Bdead_ini + (B_live - loss)) *
+                      exp(-kdd * pet_ratio * Tb/24.))
+        else:                                 # Senescense
+            B_live = Blive_ini * exp(-2. * ksg * Tb/24.)
+            if 1 > B_live:
+                B_live = 1
+            loss = Blive_ini*exp(-2. * ksg*Tb/24.)
+            if 0.000001 > loss:
+                loss = 0.000001
+            B_dead = Bdead_ini+(Blive_ini - loss)*exp(
+                -kdd * pet_ratio * Tb/24.)
+            if 0. > B_dead:
+                B_dead = 0.
+
+    elif vegtype == 3:
+        B_live = 0.
+        B_dead = 0.
+
+    else:
+        Bmax = LAImax/cb
+        Yconst = (1./((1./Bmax)+(((kws*water_stress) + ksg)/NPP)))
+        B_live = ((Blive_ini - Yconst) *
+                  exp(-(NPP/Yconst) * ((Tb+Tr)/24.)) + Yconst)
+        loss = B_live * exp(-ksg * Tb/24.)
+        if 0.00001 > loss:
+            loss = 0.00001
+        B_dead = ((Bdead_ini + (B_live - loss)) *
+                  exp(-kdd * pet_ratio * Tb/24.))
+
+    live_lai = cb * (B_live + Blive_ini)/2.
+    if LAImax < live_lai:
+        live_lai = LAImax
+    dead_lai = cd * (B_dead + Bdead_ini)/2.
+    if (LAImax - live_lai) < dead_lai:
+        dead_lai = LAImax - live_lai
+
+    if vegtype == 0:
+        VegCov[0] = 1. - exp(-0.75 * (live_lai + dead_lai))
+    else:
+        VegCov[0] = 1.
+    LAIlive[0] = live_lai
+    LAIdead[0] = dead_lai
+    Blive[0] = B_live
+    Bdead[0] = B_dead
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def update_vegetation(const DTYPE_INT_t[:] vegtype,
+                      const DTYPE_FLOAT_t[:] WUE,
+                      const DTYPE_FLOAT_t[:] LAI_max,
+                      const DTYPE_FLOAT_t[:] cb,
+                      const DTYPE_FLOAT_t[:] cd,
+                      const DTYPE_FLOAT_t[:] ksg,
+                      const DTYPE_FLOAT_t[:] kdd,
+                      const DTYPE_FLOAT_t[:] kws,
+                      double w, double Tdmax, double PETthreshold,
+                      const DTYPE_FLOAT_t[:] PET,
+                      const DTYPE_FLOAT_t[:] PET30,
+                      const DTYPE_FLOAT_t[:] ActualET,
+                      const DTYPE_FLOAT_t[:] water_stress,
+                      double Tb, double Tr,
+                      const DTYPE_FLOAT_t[:] Blive_ini,
+                      const DTYPE_FLOAT_t[:] Bdead_ini,
+                      DTYPE_FLOAT_t[:] LAIlive,
+                      DTYPE_FLOAT_t[:] LAIdead,
+                      DTYPE_FLOAT_t[:] VegCov,
+                      DTYPE_FLOAT_t[:] Blive,
+                      DTYPE_FLOAT_t[:] Bdead):
+    """Update vegetation at every cell over one storm-interstorm period.
+
+    Biomass, leaf area indices and vegetation cover are updated in place
+    for each cell in turn, exactly as in the per-cell formulation of
+    *Vegetation.update*. *Blive_ini* and *Bdead_ini* may be the same arrays
+    as *Blive* and *Bdead*.
+    """
+    cdef int cell
+
+    with nogil:
+        for cell in range(vegtype.shape[0]):
+            vegetation_at_cell(
+                vegtype[cell], WUE[cell], LAI_max[cell], cb[cell], cd[cell],
+                ksg[cell], kdd[cell], kws[cell], w, Tdmax, PETthreshold,
+                PET[cell], PET30[cell], ActualET[cell], water_stress[cell],
+                Tb, Tr, Blive_ini[cell], Bdead_ini[cell], &LAIlive[cell],
+                &LAIdead[cell], &VegCov[cell], &Blive[cell], &Bdead[cell])
@@ -2,6 +2,7 @@
 from landlab import Component
 from ...utils.decorators import use_file_name_or_kwds
 import numpy as np
+from .cfuncs import update_vegetation
 
 _VALID_METHODS = set(['Grid'])
 
@@ -11,6 +12,10 @@ def assert_method_is_valid(method):
         raise ValueError('%s: Invalid method name' % method)
 
 
+def _as_float(array):
+    return np.ascontiguousarray(array, dtype=float)
+
+
 class Vegetation(Component):
     """
     Landlab component that simulates net primary productivity, biomass
@@ -403,71 +408,16 @@ class Vegetation(Component):
         else:
             PETthreshold = self._ETthresholddown
 
-        for cell in range(0, self.grid.number_of_cells):
-
-            WUE = self._WUE[cell]
-            LAImax = self._LAI_max[cell]
-            cb = self._cb[cell]
-            cd = self._cd[cell]
-            ksg = self._ksg[cell]
-            kdd = self._kdd[cell]
-            kws = self._kws[cell]
-            # ETdmax = self._ETdmax[cell]
-            LAIlive = min(cb*self._Blive_ini[cell], LAImax)
-            LAIdead = min(cd * self._Bdead_ini[cell], (LAImax -
-                          LAIlive))
-            NPP = max((ActualET[cell]/(Tb+Tr)) *
-                      WUE*24.*self._w*1000, 0.001)
-
-            if self._vegtype[cell] == 0:
-                if PET30_[cell] > PETthreshold:
-                                # Growing Season
-                    Bmax = (LAImax - LAIdead)/cb
-                    Yconst = (1/((1/Bmax)+(((kws*Water_stress[cell]) +
-                              ksg)/NPP)))
-                    Blive = ((self._Blive_ini[cell] - Yconst) *
-                             np.exp(-(NPP/Yconst) * ((Tb+Tr)/24.)) + Yconst)
-                    Bdead = ((self._Bdead_ini[cell] + (Blive - max(Blive *
-                             np.exp(-1 * ksg * Tb/24.), 0.00001))) *
-                             np.exp(-1 * kdd *
-                             min(PET[cell]/self._Tdmax, 1.) * Tb/24.))
-                else:                                 # Senescense
-                    Blive = max(self._Blive_ini[cell] * np.exp((-2) * ksg *
-                                Tb/24.), 1)
-                    Bdead = max((self._Bdead_ini[cell]+(self._Blive_ini[cell] -
-                                (max(self._Blive_ini[cell]*np.exp((-2) *
-                                 ksg*Tb/24.), 0.000001)))*np.exp((-1)*kdd *
-                                 min(PET[cell]/self._Tdmax, 1.) * Tb/24.), 0.))
-
-            elif self._vegtype[cell] == 3:
-                Blive = 0.
-                Bdead = 0.
-
-            else:
-                Bmax = LAImax/cb
-                Yconst = (1./((1./Bmax)+(((kws*Water_stress[cell]) +
-                          ksg)/NPP)))
-                Blive = ((self._Blive_ini[cell] - Yconst) *
-                         np.exp(-(NPP/Yconst) * ((Tb+Tr)/24.)) + Yconst)
-                Bdead = ((self._Bdead_ini[cell] + (Blive - max(Blive *
-                         np.exp(-ksg * Tb/24.), 0.00001))) *
-                         np.exp(-kdd * min(PET[cell]/self._Tdmax, 1.) *
-                         Tb/24.))
-
-            LAIlive = min(cb * (Blive + self._Blive_ini[cell])/2., LAImax)
-            LAIdead = min(cd * (Bdead + self._Bdead_ini[cell])/2.,
-                          (LAImax - LAIlive))
-            if self._vegtype[cell] == 0:
-                Vt = 1. - np.exp(-0.75 * (LAIlive + LAIdead))
-            else:
-                # Vt = 1 - np.exp(-0.75 * LAIlive)
-                Vt = 1.
-
-            self._LAIlive[cell] = LAIlive
-            self._LAIdead[cell] = LAIdead
-            self._VegCov[cell] = Vt
-            self._Blive[cell] = Blive
-            self._Bdead[cell] = Bdead
+        update_vegetation(
+            np.ascontiguousarray(self._vegtype, dtype=np.int),
+            _as_float(self._WUE), _as_float(self._LAI_max),
+            _as_float(self._cb), _as_float(self._cd), _as_float(self._ksg),
+            _as_float(self._kdd), _as_float(self._kws), self._w,
+            self._Tdmax, PETthreshold, _as_float(PET), _as_float(PET30_),
+            _as_float(ActualET), _as_float(Water_stress), Tb, Tr,
+            _as_float(self._Blive_ini), _as_float(self._Bdead_ini),
+            self._LAIlive, self._LAIdead, self._VegCov, self._Blive,
+            self._Bdead)
 
         self._Blive_ini = self._Blive
         self._Bdead_ini = self._Bdead
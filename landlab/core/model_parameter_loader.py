@@ -2,22 +2,35 @@ import os
 import re
 
 import six
-import yaml
 
 from .model_parameter_dictionary import ModelParameterDictionary
 
 
-_loader = yaml.SafeLoader
-_loader.add_implicit_resolver(
-    u'tag:yaml.org,2002:float',
-    re.compile(u'''^(?:
-               [-+]?(?:[0-9][0-9_]*)\\.[0-9_]*(?:[eE][-+]?[0-9]+)?
-               |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
-               |\\.[0-9_]+(?:[eE][-+][0-9]+)?
-               |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\\.[0-9_]*
-               |[-+]?\\.(?:inf|Inf|INF)
-               |\\.(?:nan|NaN|NAN))$''', re.X),
-    list(u'-+0123456789.'))
+_loader = None
+
+
+def _get_loader():
+    """Get the YAML loader for parameter files.
+
+    yaml is imported, and the loader set up, the first time parameters are
+    loaded rather than when landlab is imported.
+    """
+    global _loader
+    if _loader is None:
+        import yaml
+
+        _loader = yaml.SafeLoader
+        _loader.add_implicit_resolver(
+            u'tag:yaml.org,2002:float',
+            re.compile(u'''^(?:
+                       [-+]?(?:[0-9][0-9_]*)\\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+                       |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+                       |\\.[0-9_]+(?:[eE][-+][0-9]+)?
+                       |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\\.[0-9_]*
+                       |[-+]?\\.(?:inf|Inf|INF)
+                       |\\.(?:nan|NaN|NAN))$''', re.X),
+            list(u'-+0123456789.'))
+    return _loader
 
 
 def load_file_contents(file_like):
@@ -88,10 +101,12 @@ def load_params(file_like):
     >>> params['start'], params['stop'], params['step']
     (0.0, 10.0, 2.0)
     """
+    import yaml
+
     contents = load_file_contents(file_like)
 
     try:
-        params = yaml.load(contents, Loader=_loader)
+        params = yaml.load(contents, Loader=_get_loader())
     except yaml.YAMLError:
         file_like = six.StringIO(contents)
         params = ModelParameterDictionary(from_file=file_like, auto_type=True)
@@ -298,9 +298,11 @@ def add_module_functions_to_class(cls, module, pattern=None):
     import inspect
     import imp
     import os
-    
-    caller = inspect.stack()[1]
-    path = os.path.join(os.path.dirname(caller[1]), os.path.dirname(module))
+
+    # Only the caller's file name is needed. inspect.stack reads the source
+    # of every frame on the stack, which is slow at import time.
+    caller_file = inspect.currentframe().f_back.f_code.co_filename
+    path = os.path.join(os.path.dirname(caller_file), os.path.dirname(module))
 
     (module, _) = os.path.splitext(os.path.basename(module))
 
@@ -39,6 +39,7 @@ Information about the grid as a whole
     ~landlab.grid.base.ModelGrid.ndim
     ~landlab.grid.base.ModelGrid.node_axis_coordinates
     ~landlab.grid.base.ModelGrid.number_of_elements
+    ~landlab.grid.base.ModelGrid.release_connectivity
     ~landlab.grid.base.ModelGrid.size
 
 Information about nodes
@@ -765,6 +766,136 @@ def find_true_vector_from_link_vector_pair(L1, L2, b1x, b1y, b2x, b2y):
     return ax, ay
 
 
+def _calc_status_at_link(tail_status, head_status, already_fixed):
+    """Get the status of links from the status of the nodes at their ends.
+
+    A link is active if one of its nodes is core and the other is not
+    closed, and fixed if one of its nodes is core and the other is fixed
+    gradient. Links that are already fixed stay fixed, unless one of their
+    nodes is now fixed value. Links that are neither active nor fixed are
+    inactive.
+
+    Parameters
+    ----------
+    tail_status, head_status : ndarray
+        Status of the nodes at the tail and head of each link. Closed nodes
+        of already fixed links are changed to fixed gradient.
+    already_fixed : ndarray of bool
+        Links that are currently fixed.
+
+    Returns
+    -------
+    ndarray of int
+        Status of each link.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.base import _calc_status_at_link
+    >>> _calc_status_at_link(np.array([0, 0, 1, 4]), np.array([0, 2, 0, 0]),
+    ...                      np.array([False, False, False, False]))
+    array([0, 2, 0, 4])
+    """
+    if not numpy.all((tail_status[already_fixed] ==
+                      FIXED_GRADIENT_BOUNDARY) |
+                     (head_status[already_fixed] ==
+                      FIXED_GRADIENT_BOUNDARY)):
+        assert numpy.all(np.logical_not((tail_status[already_fixed] ==
+                                         CLOSED_BOUNDARY) &
+                                        (head_status[already_fixed] ==
+                                         CLOSED_BOUNDARY)))
+        tail_status[already_fixed] = numpy.where(
+            (tail_status[already_fixed] == CLOSED_BOUNDARY) &
+            (head_status[already_fixed] == CORE_NODE),
+            FIXED_GRADIENT_BOUNDARY,
+            tail_status[already_fixed])
+        head_status[already_fixed] = numpy.where(
+            (head_status[already_fixed] == CLOSED_BOUNDARY) &
+            (tail_status[already_fixed] == CORE_NODE),
+            FIXED_GRADIENT_BOUNDARY,
+            head_status[already_fixed])
+        warnings.warn("""
+              Remember, fixed_links are dominant over node statuses.
+              Your grid may have had an incompatibility between
+              fixed_links and closed nodes, which has been resolved by
+              converting the closed nodes to fixed gradient nodes. If
+              you were trying to deliberately close a node which had
+              once been set to fixed gradient, you need to open the
+              links before changing the node statuses. If you were
+              setting a node to fixed_value, you can ignore this
+              message.
+              """)
+
+    active_links = (((tail_status == CORE_NODE) & ~
+                     (head_status == CLOSED_BOUNDARY)) |
+                    ((head_status == CORE_NODE) & ~
+                     (tail_status == CLOSED_BOUNDARY)))
+    # ...this still includes things that will become fixed_link
+
+    fixed_links = ((((tail_status == FIXED_GRADIENT_BOUNDARY) &
+                     (head_status == CORE_NODE)) |
+                    ((head_status == FIXED_GRADIENT_BOUNDARY) &
+                     (tail_status == CORE_NODE))) |
+                   already_fixed)
+
+    fixed_link_fixed_val = (((tail_status == FIXED_VALUE_BOUNDARY) |
+                             (head_status == FIXED_VALUE_BOUNDARY)) &
+                            already_fixed)
+    # these are the "special cases", where the user is probably trying to
+    # adjust an individual fixed_link back to fixed value. We'll allow it:
+    fixed_links[fixed_link_fixed_val] = False
+
+    status_at_link = numpy.full(tail_status.size, INACTIVE_LINK, dtype=int)
+    status_at_link[active_links] = ACTIVE_LINK
+    status_at_link[fixed_links] = FIXED_LINK
+
+    return status_at_link
+
+
+def _update_sorted_ids(ids, candidates, is_member):
+    """Add and remove candidates from a sorted array of ids.
+
+    Parameters
+    ----------
+    ids : ndarray of int
+        Sorted, unique ids.
+    candidates : ndarray of int
+        Sorted, unique ids to add to, or remove from, *ids*.
+    is_member : ndarray of bool
+        If each candidate should be in *ids*.
+
+    Returns
+    -------
+    ndarray of int
+        The updated ids, still sorted.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.base import _update_sorted_ids
+    >>> _update_sorted_ids(np.array([1, 3, 5, 7]), np.array([2, 3, 4, 8]),
+    ...                    np.array([True, False, False, True]))
+    array([1, 2, 5, 7, 8])
+    """
+    at = numpy.searchsorted(ids, candidates)
+    is_present = numpy.zeros(candidates.size, dtype=bool)
+    in_range = at < ids.size
+    is_present[in_range] = ids[at[in_range]] == candidates[in_range]
+
+    removed = at[is_present & ~ is_member]
+    added = candidates[is_member & ~ is_present]
+    if removed.size > 0:
+        pieces = numpy.split(ids, removed)
+        ids = numpy.concatenate(pieces[:1] +
+                                [piece[1:] for piece in pieces[1:]])
+    if added.size > 0:
+        pieces = numpy.split(ids, numpy.searchsorted(ids, added))
+        ids = numpy.concatenate(
+            pieces[:1] + [piece for (new_id, after) in zip(added, pieces[1:])
+                          for piece in ([new_id], after)])
+    return as_id_array(ids)
+
+
 class ModelGrid(ModelDataFieldsMixIn):
     """Base class for 2D structured or unstructured grids for numerical models.
 
@@ -816,10 +947,38 @@ class ModelGrid(ModelDataFieldsMixIn):
     at_active_link = {}  # : Values defined at active links
     at_active_face = {}  # : Values defined at active faces
 
-    # : Nodes on the other end of links pointing into a node.
-    _node_inlink_matrix = numpy.array([], dtype=numpy.int32)
-    # : Nodes on the other end of links pointing out of a node.
-    _node_outlink_matrix = numpy.array([], dtype=numpy.int32)
+    # : Connectivity arrays that are created when first used, and the
+    # : methods that create them.
+    _LAZY_CONNECTIVITY = {
+        '_node_active_inlink_matrix':
+            '_setup_active_inlink_and_outlink_matrices',
+        '_node_active_outlink_matrix':
+            '_setup_active_inlink_and_outlink_matrices',
+        '_node_active_inlink_matrix2':
+            '_setup_active_inlink_and_outlink_matrices',
+        '_node_active_outlink_matrix2':
+            '_setup_active_inlink_and_outlink_matrices',
+        '_node_numactiveinlink': '_setup_active_inlink_and_outlink_matrices',
+        '_node_numactiveoutlink': '_setup_active_inlink_and_outlink_matrices',
+        '_active_faces': '_create_active_faces',
+        '_activelink_fromnode': '_create_active_link_ends',
+        '_activelink_tonode': '_create_active_link_ends',
+        '_spatial_index_at_node': '_create_spatial_index_at_node',
+        '_spatial_index_at_cell': '_create_spatial_index_at_cell',
+        '_spatial_index_at_link': '_create_spatial_index_at_link',
+    }
+    # : Lazy connectivity arrays that depend on the status of nodes.
+    _BC_DEPENDENT_CONNECTIVITY = (
+        '_node_active_inlink_matrix', '_node_active_outlink_matrix',
+        '_node_active_inlink_matrix2', '_node_active_outlink_matrix2',
+        '_node_numactiveinlink', '_node_numactiveoutlink', '_active_faces',
+        '_activelink_fromnode', '_activelink_tonode',
+    )
+    # : Lazy spatial indexes, which depend on the coordinates of nodes.
+    _SPATIAL_INDEXES = (
+        '_spatial_index_at_node', '_spatial_index_at_cell',
+        '_spatial_index_at_link',
+    )
 
     def __init__(self, **kwds):
         super(ModelGrid, self).__init__()
@@ -849,6 +1008,48 @@ class ModelGrid(ModelDataFieldsMixIn):
             ModelDataFields.new_field_location(self, loc, size=None)
         ModelDataFields.set_default_group(self, 'node')
 
+    def __getattr__(self, name):
+        """Create lazy connectivity arrays when they are first used."""
+        try:
+            create = type(self)._LAZY_CONNECTIVITY[name]
+        except KeyError:
+            raise AttributeError(
+                '{cls!r} object has no attribute {name!r}'.format(
+                    cls=type(self).__name__, name=name))
+        getattr(self, create)()
+        return self.__dict__[name]
+
+    def release_connectivity(self):
+        """Free connectivity arrays that can be rebuilt when needed.
+
+        Connectivity arrays, such as the links at each node or the neighbors
+        of each node, are created the first time they are used and then
+        kept. This frees those arrays; any that are used again are rebuilt.
+        This can save a lot of memory on a large grid once a model no longer
+        needs them.
+
+        Spatial indexes (see :meth:`spatial_index`) are also freed, so call
+        this after moving nodes.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((3, 4))
+        >>> grid.links_at_node[5]
+        array([ 8, 11,  7,  4])
+        >>> grid.release_connectivity()
+        >>> grid.links_at_node[5]
+        array([ 8, 11,  7,  4])
+
+        LLCATS: GINF CONN
+        """
+        self._release_connectivity(self._LAZY_CONNECTIVITY)
+
+    def _release_connectivity(self, names):
+        """Free lazy connectivity arrays, by name."""
+        for name in names:
+            self.__dict__.pop(name, None)
+
     def _create_link_face_coords(self):
         """Create x, y coordinates for link-face intersections.
 
@@ -2211,11 +2412,11 @@ class ModelGrid(ModelDataFieldsMixIn):
         >>> mg.number_of_links_at_node
         array([2, 3, 3, 2, 3, 4, 4, 3, 2, 3, 3, 2])
         """
-        self._number_of_links_at_node = np.zeros(self.number_of_nodes,
-                                                 dtype=np.int)
-        for ln in range(self.number_of_links):
-            self._number_of_links_at_node[self.node_at_link_tail[ln]] += 1
-            self._number_of_links_at_node[self.node_at_link_head[ln]] += 1
+        self._number_of_links_at_node = (
+            np.bincount(self.node_at_link_tail,
+                        minlength=self.number_of_nodes) +
+            np.bincount(self.node_at_link_head,
+                        minlength=self.number_of_nodes))
 
     @property
     def number_of_links_at_node(self):
@@ -2270,7 +2471,6 @@ class ModelGrid(ModelDataFieldsMixIn):
         nlpn = self.number_of_links_at_node
         # ^this fn should become member and property
         max_num_links = np.amax(nlpn)
-        nlpn[:] = 0  # we'll zero it out, then rebuild it
 
         # Create arrays for link-at-node information
         self._links_at_node = - np.ones((self.number_of_nodes, max_num_links),
@@ -2278,21 +2478,23 @@ class ModelGrid(ModelDataFieldsMixIn):
         self._link_dirs_at_node = np.zeros((self.number_of_nodes,
                                             max_num_links), dtype=np.int8)
 
-        # Sweep over all links
-        for lk in range(self.number_of_links):
-            # Find the IDs of the tail and head nodes
-            t = self.node_at_link_tail[lk]
-            h = self.node_at_link_head[lk]
-
-            # Add this link to the list for this node, set the direction
-            # (outgoing, indicated by -1), and increment the number found so
-            # far
-            self._links_at_node[t][nlpn[t]] = lk
-            self._links_at_node[h][nlpn[h]] = lk
-            self._link_dirs_at_node[t][nlpn[t]] = -1
-            self._link_dirs_at_node[h][nlpn[h]] = 1
-            nlpn[t] += 1
-            nlpn[h] += 1
+        # Each link is at its tail node (outgoing, indicated by -1) and its
+        # head node (incoming, 1). Sort these by node, and then by link, so
+        # the links at each node are in increasing order, and place them in
+        # successive columns of their node's row.
+        links = np.arange(self.number_of_links)
+        node = np.concatenate((self.node_at_link_tail,
+                               self.node_at_link_head))
+        link = np.concatenate((links, links))
+        direction = np.repeat(np.array([-1, 1], dtype=np.int8),
+                              self.number_of_links)
+
+        order = np.lexsort((link, node))
+        node = node[order]
+        column = np.arange(len(node)) - (np.cumsum(nlpn) - nlpn)[node]
+
+        self._links_at_node[node, column] = link[order]
+        self._link_dirs_at_node[node, column] = direction[order]
 
         # Sort the links at each node by angle, counter-clockwise from +x
         self._sort_links_at_node_by_angle()
@@ -3374,7 +3576,7 @@ class ModelGrid(ModelDataFieldsMixIn):
         >>> from landlab import RasterModelGrid, HexModelGrid
         >>> mg = RasterModelGrid((3, 4), (1., 2.))
         >>> mg.width_of_face
-        array([ 2.,  2.,  2.,  1.,  1.,  1.,  1.])
+        array([ 2.,  2.,  1.,  1.,  1.,  2.,  2.])
         >>> mg = HexModelGrid(3, 3)
         >>> np.allclose(mg.width_of_face, 0.57735027)
         True
@@ -3422,15 +3624,10 @@ class ModelGrid(ModelDataFieldsMixIn):
         >>> hg.link_at_face
         array([ 3,  4,  5,  6,  8,  9, 10, 12, 13, 14, 15])
         """
-        num_faces = len(self.width_of_face)
-        self._link_at_face = numpy.empty(num_faces, dtype=int)
-        face_id = 0
-        for link in range(self.number_of_links):
-            tc = self.cell_at_node[self.node_at_link_tail[link]]
-            hc = self.cell_at_node[self.node_at_link_head[link]]
-            if tc != BAD_INDEX_VALUE or hc != BAD_INDEX_VALUE:
-                self._link_at_face[face_id] = link
-                face_id += 1
+        tc = self.cell_at_node[self.node_at_link_tail]
+        hc = self.cell_at_node[self.node_at_link_head]
+        (self._link_at_face, ) = numpy.where((tc != BAD_INDEX_VALUE) |
+                                             (hc != BAD_INDEX_VALUE))
 
         return self._link_at_face
 
@@ -3635,79 +3832,124 @@ class ModelGrid(ModelDataFieldsMixIn):
         except AttributeError:
             already_fixed = numpy.zeros(self.number_of_links, dtype=bool)
 
-        fromnode_status = self._node_status[self.node_at_link_tail]
-        tonode_status = self._node_status[self.node_at_link_head]
-
-        if not numpy.all((fromnode_status[already_fixed] ==
-                          FIXED_GRADIENT_BOUNDARY) |
-                         (tonode_status[already_fixed] ==
-                          FIXED_GRADIENT_BOUNDARY)):
-            assert numpy.all(np.logical_not((fromnode_status[already_fixed] ==
-                                             CLOSED_BOUNDARY) &
-                                            (tonode_status[already_fixed] ==
-                                             CLOSED_BOUNDARY)))
-            fromnode_status[already_fixed] = numpy.where(
-                (fromnode_status[already_fixed] == CLOSED_BOUNDARY) &
-                (tonode_status[already_fixed] == CORE_NODE),
-                FIXED_GRADIENT_BOUNDARY,
-                fromnode_status[already_fixed])
-            tonode_status[already_fixed] = numpy.where(
-                (tonode_status[already_fixed] == CLOSED_BOUNDARY) &
-                (fromnode_status[already_fixed] == CORE_NODE),
-                FIXED_GRADIENT_BOUNDARY,
-                tonode_status[already_fixed])
-            warnings.warn("""
-                  Remember, fixed_links are dominant over node statuses.
-                  Your grid may have had an incompatibility between
-                  fixed_links and closed nodes, which has been resolved by
-                  converting the closed nodes to fixed gradient nodes. If
-                  you were trying to deliberately close a node which had
-                  once been set to fixed gradient, you need to open the
-                  links before changing the node statuses. If you were
-                  setting a node to fixed_value, you can ignore this
-                  message.
-                  """)
-
-        active_links = (((fromnode_status == CORE_NODE) & ~
-                         (tonode_status == CLOSED_BOUNDARY)) |
-                        ((tonode_status == CORE_NODE) & ~
-                         (fromnode_status == CLOSED_BOUNDARY)))
-        # ...this still includes things that will become fixed_link
-
-        fixed_links = ((((fromnode_status == FIXED_GRADIENT_BOUNDARY) &
-                         (tonode_status == CORE_NODE)) |
-                        ((tonode_status == FIXED_GRADIENT_BOUNDARY) &
-                         (fromnode_status == CORE_NODE))) |
-                       already_fixed)
-
-        fixed_link_fixed_val = (((fromnode_status == FIXED_VALUE_BOUNDARY) |
-                                 (tonode_status == FIXED_VALUE_BOUNDARY)) &
-                                already_fixed)
-        # these are the "special cases", where the user is probably trying to
-        # adjust an individual fixed_link back to fixed value. We'll allow it:
-        fixed_links[fixed_link_fixed_val] = False
+        (fromnode_status, tonode_status) = self._node_status_at_link_ends()
+        status_at_link = _calc_status_at_link(fromnode_status, tonode_status,
+                                              already_fixed)
 
         try:
-            self._status_at_link.fill(INACTIVE_LINK)
+            self._status_at_link[:] = status_at_link
         except AttributeError:
-            self._status_at_link = numpy.empty(self.number_of_links, dtype=int)
-            self._status_at_link.fill(INACTIVE_LINK)
-
-        self._status_at_link[active_links] = ACTIVE_LINK
-
-        self._status_at_link[fixed_links] = FIXED_LINK
+            self._status_at_link = status_at_link
 
-        active_links = self._status_at_link == ACTIVE_LINK  # now it's correct
-        (self._active_links, ) = numpy.where(active_links)
-        (self._fixed_links, ) = numpy.where(fixed_links)
+        (self._active_links, ) = numpy.where(
+            self._status_at_link == ACTIVE_LINK)
+        (self._fixed_links, ) = numpy.where(self._status_at_link == FIXED_LINK)
         self._active_links = as_id_array(self._active_links)
         self._fixed_links = as_id_array(self._fixed_links)
 
-        self._activelink_fromnode = self.node_at_link_tail[active_links]
-        self._activelink_tonode = self.node_at_link_head[active_links]
+        # Active inlink and outlink matrices, and active faces, are rebuilt
+        # when next used
+        self._release_connectivity(self._BC_DEPENDENT_CONNECTIVITY)
 
-        # Set up active inlink and outlink matrices
-        self._setup_active_inlink_and_outlink_matrices()
+    def _node_status_at_link_ends(self):
+        """Get the status of the nodes at the tail and head of each link.
+
+        Returns
+        -------
+        tuple of ndarray
+            Status of the node at the tail, and at the head, of each link.
+        """
+        return (self._node_status[self.node_at_link_tail],
+                self._node_status[self.node_at_link_head])
+
+    def _create_active_link_ends(self):
+        """Create the nodes at the tail and head of each active link."""
+        self._activelink_fromnode = self.node_at_link_tail[self.active_links]
+        self._activelink_tonode = self.node_at_link_head[self.active_links]
+
+    def _nodes_at_some_links(self, links):
+        """Get the nodes at the tail and head of some links.
+
+        Parameters
+        ----------
+        links : ndarray of int
+            Link IDs.
+
+        Returns
+        -------
+        tuple of ndarray of int
+            The node at the tail, and at the head, of each link.
+        """
+        return (self.node_at_link_tail[links], self.node_at_link_head[links])
+
+    def _links_at_some_nodes(self, nodes):
+        """Get the links of some nodes.
+
+        Parameters
+        ----------
+        nodes : ndarray of int
+            Node IDs.
+
+        Returns
+        -------
+        (N, M) ndarray of int
+            Links of each node, as in *links_at_node*, padded with -1.
+        """
+        return self.links_at_node[nodes]
+
+    def _reset_link_status_at_nodes(self, nodes):
+        """Reset the status of the links of some nodes.
+
+        Only the links that touch *nodes* are checked, with the same rules
+        as :meth:`_reset_link_status_list`, and the active and fixed links
+        are updated to match.
+
+        Parameters
+        ----------
+        nodes : ndarray of int
+            Nodes whose status has changed.
+
+        Returns
+        -------
+        ndarray of int
+            The links that were checked, sorted.
+        """
+        links = self._links_at_some_nodes(nodes).reshape((-1, ))
+        links = numpy.unique(links[links >= 0])
+
+        (tails, heads) = self._nodes_at_some_links(links)
+        status_at_link = _calc_status_at_link(
+            self._node_status[tails], self._node_status[heads],
+            self._status_at_link[links] == FIXED_LINK)
+        self._status_at_link[links] = status_at_link
+
+        self._active_links = _update_sorted_ids(
+            self._active_links, links, status_at_link == ACTIVE_LINK)
+        self._fixed_links = _update_sorted_ids(
+            self._fixed_links, links, status_at_link == FIXED_LINK)
+
+        self._release_connectivity(self._BC_DEPENDENT_CONNECTIVITY)
+
+        return links
+
+    def _reset_active_link_dirs_at_nodes(self, nodes=None):
+        """Reset active link directions of nodes, if they have been created.
+
+        Parameters
+        ----------
+        nodes : ndarray of int, optional
+            Nodes to reset. If not given, reset all nodes.
+        """
+        if '_active_link_dirs_at_node' not in self.__dict__:
+            return
+        if nodes is None:
+            nodes = slice(None)
+
+        link_dirs = self.link_dirs_at_node[nodes]
+        is_inactive = ((self.status_at_link[self.links_at_node[nodes]] ==
+                        INACTIVE_LINK) & (link_dirs != 0))
+        self._active_link_dirs_at_node[nodes] = numpy.where(is_inactive, 0,
+                                                            link_dirs)
 
     def _reset_lists_of_nodes_cells(self):
         """Create of reset lists of nodes and cells based on their status.
@@ -3736,6 +3978,48 @@ class ModelGrid(ModelDataFieldsMixIn):
         self._boundary_nodes = as_id_array(
             numpy.where(self._node_status != CORE_NODE)[0])
 
+    def _reset_lists_of_nodes_cells_at_nodes(self, nodes):
+        """Update lists of nodes and cells for some nodes.
+
+        Core and boundary nodes, and core cells, are updated for only the
+        nodes in *nodes*.
+
+        Parameters
+        ----------
+        nodes : ndarray of int
+            Nodes whose status has changed, sorted.
+        """
+        is_core = self._node_status[nodes] == CORE_NODE
+
+        self._core_nodes = _update_sorted_ids(self._core_nodes, nodes,
+                                              is_core)
+        self._boundary_nodes = _update_sorted_ids(self._boundary_nodes,
+                                                  nodes, ~ is_core)
+
+        cells = self.cell_at_node[nodes]
+        if (numpy.all(cells != BAD_INDEX_VALUE) and
+                numpy.all(self._core_cells != BAD_INDEX_VALUE)):
+            self._core_cells = _update_sorted_ids(self._core_cells, cells,
+                                                  is_core)
+        else:
+            self._core_cells = self.cell_at_node[self._core_nodes]
+
+    def _nodes_with_new_status(self):
+        """Get the nodes whose status changed since the last BC update.
+
+        Returns
+        -------
+        ndarray of int or None
+            The changed nodes, or ``None`` if there has not been an update.
+        """
+        try:
+            status_at_last_update = self._status_at_last_bc_update
+        except AttributeError:
+            return None
+        else:
+            return numpy.flatnonzero(self._node_status !=
+                                     status_at_last_update)
+
     def _update_links_nodes_cells_to_new_BCs(self):
         """Update grid element connectivity, status.
 
@@ -3743,17 +4027,38 @@ class ModelGrid(ModelDataFieldsMixIn):
         by node status (e.g., core nodes, active links, etc) when you change
         node statuses. Call it if your method or driver makes changes to the
         boundary conditions of nodes in the grid.
+
+        If only a few nodes have changed status since the last update, only
+        the links and lists of nodes that touch those nodes are updated.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid, CLOSED_BOUNDARY
+        >>> grid = RasterModelGrid((4, 5))
+        >>> grid.status_at_node[6] = CLOSED_BOUNDARY
+        >>> grid.bc_set_code
+        1
+        >>> grid.status_at_node[12] = CLOSED_BOUNDARY
+        >>> grid.bc_set_code
+        2
+        >>> grid.active_links
+        array([ 6,  7, 11, 12, 16, 18, 21, 23, 25])
+        >>> grid.core_nodes
+        array([ 7,  8, 11, 13])
         """
-        self._reset_link_status_list()
-        self._reset_lists_of_nodes_cells()
-        self._create_active_faces()
-        try:
-            inactive_links = (self.status_at_link[self.links_at_node] ==
-                              INACTIVE_LINK)
-            inactive_links[self.link_dirs_at_node == 0] = False
-            self._active_link_dirs_at_node[inactive_links] = 0
-        except AttributeError:  # doesn't exist yet
-            pass
+        nodes = self._nodes_with_new_status()
+        if (nodes is None or nodes.size == 0 or
+                nodes.size > max(self.number_of_nodes // 1000, 16)):
+            self._reset_link_status_list()
+            self._reset_lists_of_nodes_cells()
+            self._reset_active_link_dirs_at_nodes()
+            self._status_at_last_bc_update = self._node_status.copy()
+        else:
+            links = self._reset_link_status_at_nodes(nodes)
+            self._reset_lists_of_nodes_cells_at_nodes(nodes)
+            self._reset_active_link_dirs_at_nodes(
+                numpy.unique(self._nodes_at_some_links(links)))
+            self._status_at_last_bc_update[nodes] = self._node_status[nodes]
         try:
             if self.diagonal_list_created:
                 self.diagonal_list_created = False
@@ -4020,15 +4325,13 @@ class ModelGrid(ModelDataFieldsMixIn):
         accordingly. Assumes that self.number_of_nodes, self.node_at_link_tail,
         and self.node_at_link_head have already been set up.
 
-        Algorithm works by simply looping through all links; for each, the
-        endpoints are neighbors of one another, so we increment the number of
-        neighbors for both the endpoint nodes.
+        Algorithm works by simply counting the links of each node; for each
+        link, the endpoints are neighbors of one another.
         """
-        num_nbrs = numpy.zeros(self.number_of_nodes, dtype=int)
-        for link in range(self.number_of_links):
-            num_nbrs[self.node_at_link_tail[link]] += 1
-            num_nbrs[self.node_at_link_head[link]] += 1
-        return num_nbrs
+        return (numpy.bincount(self.node_at_link_tail,
+                               minlength=self.number_of_nodes) +
+                numpy.bincount(self.node_at_link_head,
+                               minlength=self.number_of_nodes))
 
     def _create_active_faces(self):
         self._active_faces = self.face_at_link[self.active_links]
@@ -4691,13 +4994,13 @@ class ModelGrid(ModelDataFieldsMixIn):
         >>> m = ll.HexModelGrid(5, 3, 1.0)
         >>> [r,t,l,b] = m._assign_boundary_nodes_to_grid_sides()
         >>> l
-        array([ 7, 12,  3])
+        array([ 3,  7, 12])
         >>> r
-        array([11, 15,  6])
+        array([ 6, 11, 15])
         >>> t
-        array([16, 18, 17])
+        array([16, 17, 18])
         >>> b
-        array([0, 2, 1])
+        array([0, 1, 2])
         """
         # Calculate x and y distance from centerpoint
         diff_x = self.node_x[self.boundary_nodes] - numpy.mean(self.node_x)
@@ -4915,6 +5218,100 @@ class ModelGrid(ModelDataFieldsMixIn):
         else:
             return out_distance
 
+    def spatial_index(self, at='node'):
+        """Get a spatial index of nodes, cells or links.
+
+        The index finds the elements nearest a point, within some distance
+        of a point, or inside a rectangle, without measuring the distance to
+        every element. Elements are located by the coordinates of nodes, of
+        the nodes at cells, or of link midpoints. The index is created when
+        first used, and is rebuilt if the grid is moved with
+        :meth:`move_origin`. If nodes are moved in some other way, call
+        :meth:`release_connectivity` so that it is rebuilt.
+
+        Parameters
+        ----------
+        at : {'node', 'cell', 'link'}, optional
+            Grid elements to index.
+
+        Returns
+        -------
+        SpatialIndex
+            Spatial index of the elements.
+
+        Examples
+        --------
+        >>> from landlab import HexModelGrid
+        >>> grid = HexModelGrid(3, 3)
+        >>> nodes = grid.spatial_index()
+        >>> nodes.nearest((1.4, 0.9))
+        5
+        >>> nodes.nearest((1.4, 0.9), k=3)
+        array([5, 4, 8])
+        >>> nodes.within_radius((1.5, 0.866), 1.01)
+        array([1, 2, 4, 5, 6, 8, 9])
+        >>> grid.spatial_index(at='link').in_bounding_box((0., 1.), (0., .5))
+        array([0, 3, 4])
+        >>> grid.spatial_index(at='cell').nearest((2., 1.))
+        1
+
+        LLCATS: NINF CINF LINF SUBSET
+        """
+        if at not in ('node', 'cell', 'link'):
+            raise ValueError('{at}: spatial index must be at node, cell '
+                             'or link'.format(at=at))
+        return getattr(self, '_spatial_index_at_' + at)
+
+    def _create_spatial_index_at_node(self):
+        """Create the spatial index of nodes."""
+        from .spatial_index import SpatialIndex
+
+        self._spatial_index_at_node = SpatialIndex(self.x_of_node,
+                                                   self.y_of_node)
+
+    def _create_spatial_index_at_cell(self):
+        """Create the spatial index of cells."""
+        from .spatial_index import SpatialIndex
+
+        self._spatial_index_at_cell = SpatialIndex(self.x_of_cell,
+                                                   self.y_of_cell)
+
+    def _create_spatial_index_at_link(self):
+        """Create the spatial index of links."""
+        from .spatial_index import SpatialIndex
+
+        self._spatial_index_at_link = SpatialIndex(self.x_of_link,
+                                                   self.y_of_link)
+
+    def find_nearest_node(self, coords):
+        """Node nearest a point.
+
+        Find the index to the node nearest the given x, y coordinates.
+        Coordinates are provided as numpy arrays in the *coords* tuple.
+
+        Parameters
+        ----------
+        coords : tuple of array-like
+            Coordinates of points.
+
+        Returns
+        -------
+        array-like
+            IDs of the nearest nodes.
+
+        Examples
+        --------
+        >>> from landlab import HexModelGrid
+        >>> grid = HexModelGrid(3, 3)
+        >>> grid.find_nearest_node((1.4, 0.9))
+        5
+        >>> grid.find_nearest_node((np.array([0., 2.9]), np.array([0., 1.])))
+        array([0, 6])
+
+        LLCATS: NINF SUBSET
+        """
+        return self.spatial_index(at='node').nearest(coords)
+
     @property
     def all_node_distances_map(self):
         """Get distances from every node to every other node.
@@ -5011,17 +5408,22 @@ class ModelGrid(ModelDataFieldsMixIn):
         self._all_node_azimuths_map = numpy.empty((self.number_of_nodes,
                                                    self.number_of_nodes))
 
-        node_coords = numpy.empty((self.number_of_nodes, 2))
-        node_coords[:, 0] = self.node_x
-        node_coords[:, 1] = self.node_y
+        x_displacement = numpy.subtract(self.node_x,
+                                        self.node_x.reshape((-1, 1)))
+        y_displacement = numpy.subtract(self.node_y,
+                                        self.node_y.reshape((-1, 1)))
 
-        for i in range(self.number_of_nodes):
-            (self._all_node_distances_map[i, :],
-             self._all_node_azimuths_map[i, :]) = (
-                 self.calc_distances_of_nodes_to_point(
-                     (node_coords[i, 0], node_coords[i, 1]), get_az='angles'))
+        numpy.arctan2(x_displacement, y_displacement,
+                      out=self._all_node_azimuths_map)
+        self._all_node_azimuths_map[self._all_node_azimuths_map < 0.] += (
+            2. * numpy.pi)
 
-        assert numpy.all(self._all_node_distances_map >= 0.)
+        numpy.square(x_displacement, out=x_displacement)
+        numpy.square(y_displacement, out=y_displacement)
+        numpy.add(x_displacement, y_displacement,
+                  out=self._all_node_distances_map)
+        numpy.sqrt(self._all_node_distances_map,
+                   out=self._all_node_distances_map)
 
         return self._all_node_distances_map, self._all_node_azimuths_map
 
@@ -5076,6 +5478,7 @@ class ModelGrid(ModelDataFieldsMixIn):
         """
         self._node_x += origin[0]
         self._node_y += origin[1]
+        self._release_connectivity(self._SPATIAL_INDEXES)
 
 
 add_module_functions_to_class(ModelGrid, 'mappers.py', pattern='map_*')
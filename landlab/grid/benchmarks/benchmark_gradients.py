@@ -23,3 +23,21 @@ def bench_max_gradients():
     node_values = rmg.zeros()
     (grads, nodes) = rmg.calculate_max_gradient_across_adjacent_cells(
         node_values, method='d8', return_node=True)
+
+
+def bench_gradient_at_links():
+    rmg = RasterModelGrid((1000, 1000))
+    node_values = rmg.zeros()
+    rmg.calc_grad_at_link(node_values)
+
+
+def bench_flux_divergence_at_nodes():
+    rmg = RasterModelGrid((1000, 1000))
+    unit_flux = rmg.zeros(at='link')
+    rmg.calc_flux_div_at_node(unit_flux)
+
+
+def bench_mean_of_link_nodes():
+    rmg = RasterModelGrid((1000, 1000))
+    node_values = rmg.zeros()
+    rmg.map_mean_of_link_nodes_to_link(node_values)
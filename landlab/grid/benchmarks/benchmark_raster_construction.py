@@ -0,0 +1,66 @@
+"""Benchmark creating raster grids, and the memory they use.
+
+Connectivity arrays of a RasterModelGrid are created when first used. This
+times creating grids of several sizes, and reports the memory held by the
+new grid, by the grid once the connectivity that flow routing and linear
+diffusion use has been created, and by the grid once its connectivity has
+been released. Run as a script, grids have up to 4,000 by 4,000 nodes, or
+the number of rows and columns given as an argument.
+"""
+import sys
+import tracemalloc
+
+from landlab import RasterModelGrid
+
+
+def _use_connectivity(grid):
+    """Use the connectivity of flow routing and linear diffusion."""
+    grid.links_at_node
+    grid.active_link_dirs_at_node
+    grid.neighbors_at_node
+    grid._diagonal_neighbors_at_node
+    grid.length_of_link
+    grid.face_at_link
+    grid.area_of_cell
+
+
+def bench_create_1000x1000():
+    RasterModelGrid((1000, 1000))
+
+
+def bench_create_and_use_1000x1000():
+    _use_connectivity(RasterModelGrid((1000, 1000)))
+
+
+if __name__ == '__main__':
+    import time
+
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    sizes = [n for n in (250, 500, 1000, 2000, 4000) if n < n_rows]
+    sizes.append(n_rows)
+
+    print('{0:>12} {1:>10} {2:>10} {3:>10} {4:>10} {5:>10}'.format(
+        'nodes', 'create (s)', 'new (MB)', 'use (s)', 'used (MB)',
+        'freed (MB)'))
+
+    tracemalloc.start()
+    for n in sizes:
+        tracemalloc.clear_traces()
+        start = time.time()
+        grid = RasterModelGrid((n, n))
+        create_time = time.time() - start
+        new_size = tracemalloc.get_traced_memory()[0]
+
+        start = time.time()
+        _use_connectivity(grid)
+        use_time = time.time() - start
+        used_size = tracemalloc.get_traced_memory()[0]
+
+        grid.release_connectivity()
+        freed_size = tracemalloc.get_traced_memory()[0]
+
+        print('{0:>12} {1:>10.2f} {2:>10.1f} {3:>10.2f} {4:>10.1f} '
+              '{5:>10.1f}'.format(n * n, create_time, new_size / 2. ** 20,
+                                  use_time, used_size / 2. ** 20,
+                                  freed_size / 2. ** 20))
+        del grid
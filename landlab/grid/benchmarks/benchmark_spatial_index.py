@@ -0,0 +1,53 @@
+"""Benchmark finding the nodes nearest points.
+
+Finds the nodes nearest random points on a raster grid with the grid's
+spatial index, and by measuring the distance from each point to every node
+with *calc_distances_of_nodes_to_point*. Run as a script, the grid has
+1,000 by 1,000 nodes, or the number of rows and columns given as an
+argument.
+"""
+import sys
+
+import numpy as np
+
+from landlab import RasterModelGrid
+
+
+def _random_points(grid, n_points):
+    rng = np.random.RandomState(0)
+    return (rng.uniform(0., grid.x_of_node[-1], n_points),
+            rng.uniform(0., grid.y_of_node[-1], n_points))
+
+
+def bench_spatial_index():
+    grid = RasterModelGrid((500, 500))
+    grid.spatial_index().nearest(_random_points(grid, 1000))
+
+
+def bench_distances_to_every_node():
+    grid = RasterModelGrid((500, 500))
+    for point in zip(*_random_points(grid, 10)):
+        np.argmin(grid.calc_distances_of_nodes_to_point(point))
+
+
+if __name__ == '__main__':
+    import time
+
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    grid = RasterModelGrid((n_rows, n_rows))
+    (x, y) = _random_points(grid, 1000)
+
+    start = time.time()
+    index = grid.spatial_index()
+    print('build spatial index: {t:.3f} s'.format(t=time.time() - start))
+
+    start = time.time()
+    nearest = index.nearest((x, y))
+    print('nearest node to {n} points with spatial index: {t:.3f} s'.format(
+        n=x.size, t=time.time() - start))
+
+    start = time.time()
+    for (point_x, point_y) in zip(x[:100], y[:100]):
+        np.argmin(grid.calc_distances_of_nodes_to_point((point_x, point_y)))
+    print('nearest node to 100 points from all distances: '
+          '{t:.3f} s'.format(t=time.time() - start))
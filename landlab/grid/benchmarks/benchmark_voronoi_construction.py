@@ -0,0 +1,59 @@
+"""Benchmark creating hex, radial and Voronoi-Delaunay grids.
+
+Times creating a VoronoiDelaunayGrid from random points, a HexModelGrid and
+a RadialModelGrid, each with about the same number of nodes. Run as a
+script, grids have up to 1,000,000 nodes, or the number of nodes given as
+an argument.
+"""
+import sys
+
+import numpy as np
+
+from landlab import HexModelGrid, RadialModelGrid, VoronoiDelaunayGrid
+
+
+def _create_voronoi(n_nodes):
+    rng = np.random.RandomState(0)
+    return VoronoiDelaunayGrid(rng.rand(n_nodes) * 1000.,
+                               rng.rand(n_nodes) * 1000.)
+
+
+def _create_hex(n_nodes):
+    n_rows = int(np.sqrt(n_nodes))
+    return HexModelGrid(n_rows, n_rows, shape='rect')
+
+
+def _create_radial(n_nodes):
+    # A radial grid with n shells has about 3 * n ** 2 nodes.
+    return RadialModelGrid(num_shells=int(np.sqrt(n_nodes / 3.)))
+
+
+def bench_create_voronoi_10000():
+    _create_voronoi(10000)
+
+
+def bench_create_hex_10000():
+    _create_hex(10000)
+
+
+def bench_create_radial_10000():
+    _create_radial(10000)
+
+
+if __name__ == '__main__':
+    import time
+
+    n_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    sizes = [n for n in (10000, 100000) if n < n_nodes]
+    sizes.append(n_nodes)
+
+    print('{0:>12} {1:>12} {2:>10}'.format('grid', 'nodes', 'create (s)'))
+    for n in sizes:
+        for (name, create) in (('voronoi', _create_voronoi),
+                               ('hex', _create_hex),
+                               ('radial', _create_radial)):
+            start = time.time()
+            grid = create(n)
+            print('{0:>12} {1:>12} {2:>10.2f}'.format(
+                name, grid.number_of_nodes, time.time() - start))
+            del grid
@@ -40,19 +40,39 @@ def find_rows_containing_ID(np.ndarray[DTYPE_INT_t, ndim=2] input_array,
 def create_patches_at_element(
         np.ndarray[DTYPE_INT_t, ndim=2] elements_at_patch,
         int number_of_elements, np.ndarray[DTYPE_INT_t, ndim=2] out):
-    """
-    """
-    cdef int i
-    cdef np.ndarray[DTYPE_INT_t, ndim=2] element_with_value = np.empty_like(
-        (elements_at_patch), dtype=int)
-    cdef np.ndarray[DTYPE_INTP_t, ndim=1] patches_with_element
-    cdef int num_elements_here
+    """Find the patches that touch each element.
 
-    for i in range(number_of_elements):
-        np.equal(elements_at_patch, i, out=element_with_value)
-        patches_with_element = np.argwhere(element_with_value)[:, 0]
-        num_elements_here = patches_with_element.size
-        out[i, :num_elements_here] = patches_with_element
+    Patches are listed in increasing order. Rows of *out* for elements
+    that touch fewer patches than there are columns keep their remaining
+    values (normally -1).
+
+    Parameters
+    ----------
+    elements_at_patch : 2d array of ints
+        Elements (nodes or links) of each patch. Negative values are
+        ignored.
+    number_of_elements : int
+        Number of elements.
+    out : 2d array of ints, number_of_elements x max_patches_at_element
+        The patches that touch each element.
+    """
+    cdef int n_patches = elements_at_patch.shape[0]
+    cdef int n_cols = elements_at_patch.shape[1]
+    cdef int max_patches = out.shape[1]
+    cdef int patch, i, element
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] count = np.zeros(
+        number_of_elements, dtype=int)
+
+    for patch in range(n_patches):
+        for i in range(n_cols):
+            element = elements_at_patch[patch, i]
+            if element >= 0 and element < number_of_elements:
+                if count[element] == max_patches:
+                    raise ValueError(
+                        'element {0} touches more than {1} '
+                        'patches'.format(element, max_patches))
+                out[element, count[element]] = patch
+                count[element] += 1
 
 
 @cython.boundscheck(False)
@@ -60,24 +80,56 @@ def create_links_at_patch(np.ndarray[DTYPE_INT_t, ndim=2] nodes_at_patch,
                           np.ndarray[DTYPE_INT_t, ndim=2] links_at_node,
                           int number_of_patches,
                           np.ndarray[DTYPE_INT_t, ndim=2] out):
+    """Find the links that join the nodes of each patch.
 
-    cdef int i
-    cdef np.ndarray[DTYPE_INT_t, ndim=1] nodes_on_patch = np.empty(
-        nodes_at_patch.shape[1], dtype=int)
-    cdef np.ndarray[DTYPE_INT_t, ndim=2] links_at_patch_nodes = np.empty(
-        (nodes_at_patch.shape[1], links_at_node.shape[1]), dtype=int)
-    cdef np.ndarray[DTYPE_INT_t, ndim=1] vals
-    cdef np.ndarray[DTYPE_INTP_t, ndim=1] counts
-    cdef np.ndarray[DTYPE_INT_t, ndim=1] duplicated_vals
-
-    for i in range(number_of_patches):
-        nodes_on_patch = nodes_at_patch[i, :]
-        links_at_patch_nodes = links_at_node[nodes_on_patch, :]
-        vals, counts = np.unique(links_at_patch_nodes,
-                                 return_counts=True)
-        duplicated_vals = vals[counts == 2]
-        # if len==4, contains a -1; strip it
-        out[i, :] = duplicated_vals[-3:]  # out of order, so far
+    A link is on a patch if it is at two of the nodes of the patch. The
+    links of each patch are listed in increasing order; if there are fewer
+    links than columns of *out*, the row starts with -1.
+
+    Parameters
+    ----------
+    nodes_at_patch : 2d array of ints
+        Nodes of each patch.
+    links_at_node : 2d array of ints
+        Links at each node, padded with -1.
+    number_of_patches : int
+        Number of patches.
+    out : 2d array of ints, number_of_patches x links_per_patch
+        The links of each patch.
+    """
+    cdef int n_nodes = nodes_at_patch.shape[1]
+    cdef int n_spokes = links_at_node.shape[1]
+    cdef int n_out = out.shape[1]
+    cdef int patch, i, j, m, n, k, n_found, link, node_i, node_j
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] found = np.empty(
+        max(n_nodes * (n_nodes - 1) // 2, n_out), dtype=int)
+
+    for patch in range(number_of_patches):
+        n_found = 0
+        for i in range(n_nodes - 1):
+            node_i = nodes_at_patch[patch, i]
+            for j in range(i + 1, n_nodes):
+                node_j = nodes_at_patch[patch, j]
+                for m in range(n_spokes):
+                    link = links_at_node[node_i, m]
+                    if link < 0:
+                        continue
+                    for n in range(n_spokes):
+                        if links_at_node[node_j, n] == link:
+                            # Insert, keeping the links found so far sorted.
+                            k = n_found
+                            while k > 0 and found[k - 1] > link:
+                                found[k] = found[k - 1]
+                                k -= 1
+                            found[k] = link
+                            n_found += 1
+                            break
+
+        for k in range(n_out):
+            if k < n_out - n_found:
+                out[patch, k] = -1
+            else:
+                out[patch, k] = found[n_found - n_out + k]
 
 
 @cython.boundscheck(False)
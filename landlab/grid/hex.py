@@ -43,6 +43,7 @@ Information about the grid as a whole
     ~landlab.grid.hex.HexModelGrid.number_of_elements
     ~landlab.grid.hex.HexModelGrid.number_of_node_columns
     ~landlab.grid.hex.HexModelGrid.number_of_node_rows
+    ~landlab.grid.hex.HexModelGrid.release_connectivity
     ~landlab.grid.hex.HexModelGrid.save
     ~landlab.grid.hex.HexModelGrid.size
 
@@ -718,10 +719,10 @@ class HexModelGrid(VoronoiDelaunayGrid):
         xshift = 0.
         i = 0
         for r in range(num_rows):
-            for c in range(base_num_cols + extra_cols):
-                pts[i, 0] = c * dxh + xshift
-                pts[i, 1] = r * dxv
-                i += 1
+            n_cols = base_num_cols + extra_cols
+            pts[i:i + n_cols, 0] = numpy.arange(n_cols) * dxh + xshift
+            pts[i:i + n_cols, 1] = r * dxv
+            i += n_cols
             if r < middle_row:
                 extra_cols += 1
             else:
@@ -768,16 +769,10 @@ class HexModelGrid(VoronoiDelaunayGrid):
         dxv = dxh * numpy.sqrt(3.) / 2.
         half_dxh = dxh / 2.
 
-        npts = num_rows * num_cols
-        pts = numpy.zeros((npts, 2))
-        xshift = 0.
-        i = 0
-        for r in range(num_rows):
-            for c in range(num_cols):
-                xshift = half_dxh * (r % 2)
-                pts[i, 0] = c * dxh + xshift
-                pts[i, 1] = r * dxv
-                i += 1
+        (rows, cols) = numpy.mgrid[:num_rows, :num_cols]
+        pts = numpy.empty((num_rows * num_cols, 2))
+        pts[:, 0] = (cols * dxh + half_dxh * (rows % 2)).flat
+        pts[:, 1] = (rows * dxv).flat
 
         return pts
 
@@ -830,10 +825,10 @@ class HexModelGrid(VoronoiDelaunayGrid):
         yshift = 0.
         i = 0
         for c in range(num_cols):
-            for r in range(base_num_rows + extra_rows):
-                pts[i, 1] = r * dxv + yshift
-                pts[i, 0] = c * dxh
-                i += 1
+            n_rows = base_num_rows + extra_rows
+            pts[i:i + n_rows, 1] = numpy.arange(n_rows) * dxv + yshift
+            pts[i:i + n_rows, 0] = c * dxh
+            i += n_rows
             if c < middle_col:
                 extra_rows += 1
             else:
@@ -879,16 +874,10 @@ class HexModelGrid(VoronoiDelaunayGrid):
         dxh = dxv * numpy.sqrt(3.) / 2.
         half_dxv = dxv / 2.
 
-        npts = num_rows * num_cols
-        pts = numpy.zeros((npts, 2))
-        yshift = 0.
-        i = 0
-        for c in range(num_cols):
-            for r in range(num_rows):
-                yshift = half_dxv * (c % 2)
-                pts[i, 1] = r * dxv + yshift
-                pts[i, 0] = c * dxh
-                i += 1
+        (cols, rows) = numpy.mgrid[:num_cols, :num_rows]
+        pts = numpy.empty((num_rows * num_cols, 2))
+        pts[:, 1] = (rows * dxv + half_dxv * (cols % 2)).flat
+        pts[:, 0] = (cols * dxh).flat
 
         return pts
 
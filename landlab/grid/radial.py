@@ -42,6 +42,7 @@ Information about the grid as a whole
     ~landlab.grid.radial.RadialModelGrid.number_of_elements
     ~landlab.grid.radial.RadialModelGrid.number_of_nodes_in_shell
     ~landlab.grid.radial.RadialModelGrid.number_of_shells
+    ~landlab.grid.radial.RadialModelGrid.release_connectivity
     ~landlab.grid.radial.RadialModelGrid.save
     ~landlab.grid.radial.RadialModelGrid.size
     ~landlab.grid.radial.RadialModelGrid.spacing_of_shells
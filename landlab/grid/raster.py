@@ -55,6 +55,7 @@ Information about the grid as a whole
     ~landlab.grid.raster.RasterModelGrid.number_of_elements
     ~landlab.grid.raster.RasterModelGrid.number_of_node_columns
     ~landlab.grid.raster.RasterModelGrid.number_of_node_rows
+    ~landlab.grid.raster.RasterModelGrid.release_connectivity
     ~landlab.grid.raster.RasterModelGrid.save
     ~landlab.grid.raster.RasterModelGrid.shape
     ~landlab.grid.raster.RasterModelGrid.size
@@ -528,8 +529,6 @@ from .base import (CORE_NODE, FIXED_VALUE_BOUNDARY,
 from landlab.field.scalar_data_fields import FieldError
 from landlab.utils.decorators import make_return_array_immutable, deprecated
 from . import raster_funcs as rfuncs
-from ..io import write_esri_ascii
-from ..io.netcdf import write_netcdf
 from landlab.grid.structured_quad import links as squad_links
 from landlab.grid.structured_quad import faces as squad_faces
 from landlab.grid.structured_quad import cells as squad_cells
@@ -846,6 +845,29 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
     or set it up such that one can create a zero-node grid.
     """
 
+    # : Connectivity arrays that are created when first used, and the
+    # : methods that create them.
+    _LAZY_CONNECTIVITY = dict(ModelGrid._LAZY_CONNECTIVITY, **{
+        '_neighbors_at_node': '_create_neighbors_at_node',
+        '_RasterModelGrid__diagonal_neighbors_at_node':
+            '_create_diagonal_neighbors_at_node',
+        '_links_at_node': '_create_links_at_node',
+        '_node_inlink_matrix': '_setup_inlink_and_outlink_matrices',
+        '_node_outlink_matrix': '_setup_inlink_and_outlink_matrices',
+        '_node_numinlink': '_setup_inlink_and_outlink_matrices',
+        '_node_numoutlink': '_setup_inlink_and_outlink_matrices',
+        '_link_dirs_at_node': '_create_link_dirs_at_node',
+        '_active_link_dirs_at_node': '_create_link_dirs_at_node',
+        '_link_unit_vec_x': '_create_link_unit_vectors',
+        '_link_unit_vec_y': '_create_link_unit_vectors',
+        '_node_unit_vector_sum_x': '_create_link_unit_vectors',
+        '_node_unit_vector_sum_y': '_create_link_unit_vectors',
+        '_face_at_link': '_create_face_at_link',
+        '_area_of_cell': '_create_cell_areas_array',
+        '_node_at_link_tail': '_create_link_ends',
+        '_node_at_link_head': '_create_link_ends',
+    })
+
     def __init__(self, *args, **kwds):
         """Create a 2D grid with equal spacing.
 
@@ -1102,12 +1124,9 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         #    self.shape).reshape((-1, ))
         self._core_cells = sgrid.core_cell_index(self.shape)
 
-        self._neighbors_at_node = (
-            sgrid.neighbor_node_ids(self.shape).transpose().copy())
-        self.__diagonal_neighbors_at_node = sgrid.diagonal_node_array(self.shape,
-                                                            contiguous=True)
-
-        self._links_at_node = squad_links.links_at_node(self.shape)
+        # Connectivity (neighbors, links at nodes, inlink and outlink
+        # matrices, link directions and unit vectors, faces at links and
+        # cell areas) is created when first used (see _LAZY_CONNECTIVITY).
 
         # Link lists:
         # For all links, we encode the "tail" and "head" nodes, and the face
@@ -1134,46 +1153,17 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         #  |       |       |       |       |
         #  *---0-->*---1-->*---2-->*---3-->*
         #
-        #   create the tail-node and head-node lists
-        (self._node_at_link_tail,
-         self._node_at_link_head) = sgrid.node_index_at_link_ends(self.shape)
+        # The tail-node and head-node lists follow from this numbering, and
+        # so are created only when first used.
 
         self._status_at_link = np.full(squad_links.number_of_links(self.shape),
                                        INACTIVE_LINK, dtype=int)
 
-        # Sort them by midpoint coordinates
-        self._sort_links_by_midpoint()
-
-        #   set up in-link and out-link matrices and numbers
-        self._setup_inlink_and_outlink_matrices()
-
         # Flag indicating whether we have created diagonal links.
         self._diagonal_links_created = False
 
-        #   set up the list of active links
-        self._reset_link_status_list()
-
-        # Create 2D array containing, for each node, direction of connected
-        # link (1=incoming, -1=outgoing, 0=no link present at this position)
-        # needs to come after BC setting
-        self._create_link_dirs_at_node()
-
-        #   set up link unit vectors and node unit-vector sums
-        self._create_link_unit_vectors()
-
-        #   set up link faces
-        #
-        #   Here we assume that we've already created a list of active links
-        # in which all 4 boundaries are "open", such that each boundary node
-        # (except the 4 corners) is connected to an adjacent interior node. In
-        # this case, there will be the same number of faces as active links,
-        # and the numbering of faces will be the same as the corresponding
-        # active links. We start off creating a list of all None values. Only
-        # those links that cross a face will have this None value replaced with
-        # a face ID.
-        self._face_at_link = sgrid.face_at_link(self.shape,
-                                                actives=self.active_links)
-        self._create_cell_areas_array()
+        # The list of active links is set up along with the boundary
+        # conditions, once the grid is initialized.
 
         # List of neighbors for each cell: we will start off with no
         # list. If a caller requests it via active_neighbors_at_node or
@@ -1333,6 +1323,70 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
             raise ValueError('value for edge not understood')
         return getattr(self, 'nodes_at_{edge}_edge'.format(edge=edge))
 
+    def _create_neighbors_at_node(self):
+        """Set up array of the neighbors of each node."""
+        self._neighbors_at_node = (
+            sgrid.neighbor_node_ids(self.shape).transpose().copy())
+        return self._neighbors_at_node
+
+    def _create_diagonal_neighbors_at_node(self):
+        """Set up array of the diagonal neighbors of each node."""
+        self.__diagonal_neighbors_at_node = sgrid.diagonal_node_array(
+            self.shape, contiguous=True)
+        return self.__diagonal_neighbors_at_node
+
+    def _create_links_at_node(self):
+        """Set up array of the links at each node."""
+        self._links_at_node = squad_links.links_at_node(self.shape)
+        return self._links_at_node
+
+    def _create_link_ends(self):
+        """Set up arrays of the nodes at the tail and head of each link.
+
+        Links are numbered by row, so the nodes at their ends are already
+        sorted by link midpoint.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((3, 4))
+        >>> grid._create_link_ends()
+        >>> grid._node_at_link_tail[:7]
+        array([0, 1, 2, 0, 1, 2, 3])
+        >>> grid._node_at_link_head[:7]
+        array([1, 2, 3, 4, 5, 6, 7])
+        """
+        self._node_at_link_tail = squad_links.node_id_at_link_start(
+            self.shape)
+        self._node_at_link_head = squad_links.node_id_at_link_end(self.shape)
+
+    def _nodes_at_some_links(self, links):
+        """Get the nodes at the tail and head of some links.
+
+        Nodes are calculated from rows and columns of links, without using
+        the arrays of the nodes at link ends.
+        """
+        return squad_links.nodes_at_some_links(self.shape, links)
+
+    def _links_at_some_nodes(self, nodes):
+        """Get the links of some nodes.
+
+        Links are calculated from rows and columns of nodes, without using
+        the array of links at nodes.
+        """
+        return squad_links.links_at_some_nodes(self.shape, nodes)
+
+    def _node_status_at_link_ends(self):
+        """Get the status of the nodes at the tail and head of each link.
+
+        Node status is read from rows and columns of nodes, without using
+        the arrays of the nodes at link ends.
+        """
+        return (squad_links.node_value_at_link_start(self.shape,
+                                                     self._node_status),
+                squad_links.node_value_at_link_end(self.shape,
+                                                   self._node_status))
+
     def _create_cell_areas_array(self):
         """Set up array of cell areas.
 
@@ -1614,15 +1668,14 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         n_diagonal_links = 2 * (self._nrows - 1) * (self._ncols - 1)
         self._diag_link_fromnode = np.zeros(n_diagonal_links, dtype=int)
         self._diag_link_tonode = np.zeros(n_diagonal_links, dtype=int)
-        i = 0
-        for r in range(self._nrows - 1):
-            for c in range(self._ncols - 1):
-                self._diag_link_fromnode[i] = c + r * self._ncols
-                self._diag_link_tonode[i] = (c + 1) + (r + 1) * self._ncols
-                i += 1
-                self._diag_link_fromnode[i] = (c + 1) + r * self._ncols
-                self._diag_link_tonode[i] = c + (r + 1) * self._ncols
-                i += 1
+        # each lower-left node of a patch has a link to the upper right (NE)
+        # followed by a link from its right neighbor to the upper left (NW)
+        lower_left = np.arange(self.number_of_nodes).reshape(self.shape)[
+            :-1, :-1].reshape((-1, ))
+        self._diag_link_fromnode[0::2] = lower_left
+        self._diag_link_tonode[0::2] = lower_left + self._ncols + 1
+        self._diag_link_fromnode[1::2] = lower_left + 1
+        self._diag_link_tonode[1::2] = lower_left + self._ncols
 
         self._diagonal_links_created = True
 
@@ -1633,26 +1686,12 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         self._diag_links_at_node.fill(-1)
 
         # Number of patches is number_of_diagonal_nodes / 2
-        self._diag_links_at_node[:, 0][np.setdiff1d(np.arange(
-            self.number_of_nodes), np.union1d(
-                self.nodes_at_right_edge, self.nodes_at_top_edge))] = \
-            (np.arange(0, self.number_of_patches*2, 2) +
-             self.number_of_links)
-        self._diag_links_at_node[:, 1][np.setdiff1d(np.arange(
-            self.number_of_nodes), np.union1d(
-                self.nodes_at_left_edge, self.nodes_at_top_edge))] = \
-            (np.arange(0, self.number_of_patches*2, 2) + 1 +
-             self.number_of_links)
-        self._diag_links_at_node[:, 2][np.setdiff1d(np.arange(
-            self.number_of_nodes), np.union1d(
-                self.nodes_at_left_edge, self.nodes_at_bottom_edge))] = \
-            (np.arange(0, self.number_of_patches*2, 2) +
-             self.number_of_links)
-        self._diag_links_at_node[:, 3][np.setdiff1d(np.arange(
-            self.number_of_nodes), np.union1d(
-                self.nodes_at_right_edge, self.nodes_at_bottom_edge))] = \
-            (np.arange(0, self.number_of_patches*2, 2) + 1 +
-             self.number_of_links)
+        ne_links = (np.arange(0, self.number_of_patches*2, 2) +
+                    self.number_of_links)
+        self._diag_links_at_node[lower_left, 0] = ne_links
+        self._diag_links_at_node[lower_left + 1, 1] = ne_links + 1
+        self._diag_links_at_node[lower_left + self._ncols + 1, 2] = ne_links
+        self._diag_links_at_node[lower_left + self._ncols, 3] = ne_links + 1
 
         # now set up the supporting data strs:
         self._diag__link_dirs_at_node = np.empty((self.number_of_nodes, 4),
@@ -1905,32 +1944,17 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         self._link_dirs_at_node = np.zeros((self.number_of_nodes, 4),
                                            dtype=np.int8)
         num_links_per_row = (self.number_of_node_columns * 2) - 1
-        # Sweep over all links
-        for lk in range(self.number_of_links):
-            # Find the orientation
-            is_horiz = ((lk % num_links_per_row) <
-                        (self.number_of_node_columns - 1))
-            # Find the IDs of the tail and head nodes
-            t = self.node_at_link_tail[lk]
-            h = self.node_at_link_head[lk]
-
-            # If the link is horizontal, the index (row) in the links_at_node
-            # array should be 0 (east) for the tail node, and 2 (west) for the
-            # head node.
-            # If vertical, the index should be 1 (north) for the tail node and
-            # 3 (south) for the head node.
-            if is_horiz:
-                tail_index = 0
-                head_index = 2
-            else:
-                tail_index = 1
-                head_index = 3
-
-            # Add this link to the list for this node, set the direction
-            # (outgoing, indicated by -1), and increment the number found so
-            # far
-            self._link_dirs_at_node[t][tail_index] = -1
-            self._link_dirs_at_node[h][head_index] = 1
+        # If a link is horizontal, the index (column) in the links_at_node
+        # array should be 0 (east) for the tail node, and 2 (west) for the
+        # head node. If vertical, the index should be 1 (north) for the tail
+        # node and 3 (south) for the head node. Links are outgoing (-1) at
+        # their tails and incoming (1) at their heads.
+        is_horiz = ((np.arange(self.number_of_links) % num_links_per_row) <
+                    (self.number_of_node_columns - 1))
+        self._link_dirs_at_node[self.node_at_link_tail,
+                                np.where(is_horiz, 0, 1)] = -1
+        self._link_dirs_at_node[self.node_at_link_head,
+                                np.where(is_horiz, 2, 3)] = 1
 
         # setup the active link equivalent
         self._active_link_dirs_at_node = self._link_dirs_at_node.copy()
@@ -2067,11 +2091,11 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         self._diag_active_links = _diag_active_links + self.number_of_links
         self._diag_fixed_links = diag_fixed_links + self.number_of_links
 
-        self._diag_inactive_links = np.setdiff1d(np.arange(
-            self.number_of_links, self._number_of_d8_links),
-            self._diag_active_links)
-        self._diag_inactive_links = np.setdiff1d(
-            self._diag_inactive_links, self._diag_fixed_links)
+        self._diag_inactive_links = np.arange(
+            self.number_of_links, self._number_of_d8_links)[
+                ~ diag_active_links]
+        self._diag_inactive_links = self._diag_inactive_links[~ np.in1d(
+            self._diag_inactive_links, self._diag_fixed_links)]
 
         self._all__d8_active_links = np.concatenate((self.active_links,
                                                      self._diag_active_links))
@@ -2170,6 +2194,18 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
             self._reset_list_of_active_diagonal_links()
             self._reset_diag_active_link_dirs()
 
+    def _reset_link_status_at_nodes(self, nodes):
+        """Reset the status of the links of some nodes.
+
+        Diagonal links, if they have been created, are all reset.
+        """
+        links = super(RasterModelGrid, self)._reset_link_status_at_nodes(
+            nodes)
+        if self._diagonal_links_created:
+            self._reset_list_of_active_diagonal_links()
+            self._reset_diag_active_link_dirs()
+        return links
+
     def _create_link_unit_vectors(self):
         """Make arrays to store the unit vectors associated with each link.
 
@@ -2545,6 +2581,21 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         """
         return self._nrows - 2
 
+    @property
+    def number_of_faces(self):
+        """Total number of faces.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((3, 4))
+        >>> grid.number_of_faces
+        7
+
+        LLCATS: FINF
+        """
+        return squad_faces.number_of_faces(self.shape)
+
     @property
     def number_of_patches(self):
         """Number of patches.
@@ -3031,10 +3082,10 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
             self._link_length[self.number_of_links:] = np.sqrt(
                 self._dy ** 2. + self._dx ** 2.)
 
-            vertical_links = squad_links.vertical_link_ids(self.shape)
-
             self._link_length[:self.number_of_links] = self.dx
-            self._link_length[vertical_links] = self._dy
+            squad_links.vertical_links_view(
+                self.shape, self._link_length[:self.number_of_links])[:] = (
+                    self._dy)
 
         return self._link_length
 
@@ -4361,7 +4412,7 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         Returns
         -------
         ndarray of float
-            Width of faces (listed as horizontal, then vertical).
+            Width of faces.
 
         Examples
         --------
@@ -4369,12 +4420,19 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         >>> grid = RasterModelGrid((3, 3))
         >>> grid.width_of_face
         array([ 1.,  1.,  1.,  1.])
-        """
-        n_horizontal_faces = (self.shape[0] - 2) * (self.shape[1] - 1)
 
+        Faces that cross vertical links are *dx* wide, and faces that
+        cross horizontal links are *dy* wide.
+
+        >>> grid = RasterModelGrid((3, 4), spacing=(2., 1.))
+        >>> grid.width_of_face
+        array([ 1.,  1.,  2.,  2.,  2.,  1.,  1.])
+        """
         self._face_width = np.empty(squad_faces.number_of_faces(self.shape))
-        self._face_width[:n_horizontal_faces] = self.dx
-        self._face_width[n_horizontal_faces:] = self.dy
+        squad_faces.horizontal_faces_view(self.shape, self._face_width)[:] = (
+            self.dx)
+        squad_faces.vertical_faces_view(self.shape, self._face_width)[:] = (
+            self.dy)
         return self._face_width
 
     def _unit_test(self):
@@ -4706,6 +4764,9 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
 
         LLCATS: GINF
         """
+        from ..io import write_esri_ascii
+        from ..io.netcdf import write_netcdf
+
         format = format or _guess_format_from_name(path)
         path = _add_format_extension(path, format)
 
@@ -5635,6 +5696,8 @@ add_module_functions_to_class(RasterModelGrid, 'raster_mappers.py',
                               pattern='map_*')
 add_module_functions_to_class(RasterModelGrid, 'raster_gradients.py',
                               pattern='calc_*')
+add_module_functions_to_class(RasterModelGrid, 'raster_divergence.py',
+                              pattern='calc_*')
 add_module_functions_to_class(RasterModelGrid, 'raster_steepest_descent.py',
                               pattern='calc_*')
 add_module_functions_to_class(RasterModelGrid, 'raster_steepest_descent.py',
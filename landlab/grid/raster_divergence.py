@@ -0,0 +1,158 @@
+#! /usr/bin/env python
+"""Calculate vector divergence and related quantities on a raster grid.
+
+Divergence calculators for raster grids
++++++++++++++++++++++++++++++++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.grid.raster_divergence.calc_net_flux_at_node
+    ~landlab.grid.raster_divergence.calc_flux_div_at_node
+
+"""
+import numpy as np
+
+from landlab.grid.structured_quad import links, faces
+from landlab.utils.decorators import use_field_name_or_array
+
+
+def _net_flux_at_cells(grid, unit_flux):
+    """Net outflux at each cell, as rows and columns of cells.
+
+    The fluxes across the east, north, west and south faces of each cell
+    are read from rows and columns of links (or faces), without using the
+    arrays of the links and faces of each cell.
+    """
+    if unit_flux.size == grid.number_of_links:
+        at_horizontal = links.horizontal_links_view(grid.shape, unit_flux)
+        at_vertical = links.vertical_links_view(grid.shape, unit_flux)
+        (east, west) = (at_horizontal[1:-1, 1:], at_horizontal[1:-1, :-1])
+        (north, south) = (at_vertical[1:, 1:-1], at_vertical[:-1, 1:-1])
+    elif unit_flux.size == grid.number_of_faces:
+        at_horizontal = faces.horizontal_faces_view(grid.shape, unit_flux)
+        at_vertical = faces.vertical_faces_view(grid.shape, unit_flux)
+        (east, west) = (at_vertical[:, 1:], at_vertical[:, :-1])
+        (north, south) = (at_horizontal[1:], at_horizontal[:-1])
+    else:
+        raise ValueError('Parameter unit_flux must be num links or num faces '
+                         'long')
+
+    return (east * grid.dy + north * grid.dx - west * grid.dy -
+            south * grid.dx)
+
+
+def _cells_view(grid, values_at_nodes):
+    """View of the values at nodes that have cells, as rows and columns."""
+    if values_at_nodes.size != grid.number_of_nodes:
+        raise ValueError('output buffer length mismatch with number of nodes')
+    values = values_at_nodes.view()
+    values.shape = grid.shape
+    return values[1:-1, 1:-1]
+
+
+@use_field_name_or_array('link')
+def calc_net_flux_at_node(grid, unit_flux_at_links, out=None):
+    """Calculate net link fluxes at nodes.
+
+    Given a flux per unit width along each link in the grid, calculate the net
+    outflux (or influx, if negative) at each node. Fluxes are treated as zero
+    for links that have no faces, and net fluxes are treated as zero for nodes
+    that have no cell.
+
+    Fluxes are summed over rows and columns of links, without using the
+    arrays of the faces and links of each cell.
+
+    Construction::
+
+        calc_net_flux_at_node(grid, unit_flux_at_links, out=None)
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A grid.
+    unit_flux_at_links : ndarray or field name
+        Flux per unit width associated with links.
+    out : ndarray, optional
+        Buffer to hold the result.
+
+    Returns
+    -------
+    ndarray (x number of nodes)
+        Net flux at nodes.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> rg = RasterModelGrid(3, 4, 10.0)
+    >>> z = rg.add_zeros('node', 'topographic__elevation')
+    >>> z[5] = 50.0
+    >>> z[6] = 36.0
+    >>> lg = rg.calc_grad_at_link(z)
+    >>> rg.calc_net_flux_at_node(-lg)
+    array([   0.,    0.,    0.,    0.,    0.,  164.,   94.,    0.,    0.,
+              0.,    0.,    0.])
+
+    LLCATS: NINF GRAD
+    """
+    if out is None:
+        out = grid.zeros(at='node')
+
+    _cells_view(grid, out)[:] = _net_flux_at_cells(grid, unit_flux_at_links)
+    return out
+
+
+@use_field_name_or_array('link')
+def calc_flux_div_at_node(grid, unit_flux, out=None):
+    """Calculate divergence of link-based fluxes at nodes.
+
+    Given a flux per unit width across each face in the grid, calculate the net
+    outflux (or influx, if negative) divided by cell area, at each node (zero
+    or "out" value for nodes without cells).
+
+    Fluxes are summed over rows and columns of links (or faces), without
+    using the arrays of the faces and links of each cell.
+
+    Construction::
+
+        calc_flux_div_at_node(grid, unit_flux_at_links, out=None)
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A grid.
+    unit_flux : ndarray or field name
+        Flux per unit width along links (x number of links) or across faces
+        (x number of faces).
+    out : ndarray, optional
+        Buffer to hold the result.
+
+    Returns
+    -------
+    ndarray (x number of nodes)
+        Flux divergence at nodes.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> rg = RasterModelGrid(3, 4, 10.0)
+    >>> z = rg.add_zeros('node', 'topographic__elevation')
+    >>> z[5] = 50.0
+    >>> z[6] = 36.0
+    >>> lg = rg.calc_grad_at_link(z)
+    >>> rg.calc_flux_div_at_node(-lg)
+    array([ 0.  ,  0.  ,  0.  ,  0.  ,  0.  ,  1.64,  0.94,  0.  ,  0.  ,
+            0.  ,  0.  ,  0.  ])
+    >>> rg.calc_flux_div_at_node(-lg[rg.link_at_face])
+    array([ 0.  ,  0.  ,  0.  ,  0.  ,  0.  ,  1.64,  0.94,  0.  ,  0.  ,
+            0.  ,  0.  ,  0.  ])
+
+    LLCATS: NINF GRAD
+    """
+    if out is None:
+        out = grid.zeros(at='node')
+
+    net_flux = _net_flux_at_cells(grid, unit_flux)
+    np.divide(net_flux, grid.area_of_cell.reshape(net_flux.shape),
+              out=_cells_view(grid, out))
+    return out
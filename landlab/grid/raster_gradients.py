@@ -7,6 +7,7 @@ Gradient calculators for raster grids
 .. autosummary::
     :toctree: generated/
 
+    ~landlab.grid.raster_gradients.calc_diff_at_link
     ~landlab.grid.raster_gradients.calc_grad_at_link
     ~landlab.grid.raster_gradients.calc_grad_at_active_link
     ~landlab.grid.raster_gradients.calc_grad_across_cell_faces
@@ -19,10 +20,58 @@ import numpy as np
 from landlab.core.utils import make_optional_arg_into_id_array
 from landlab.grid import gradients
 from landlab.grid.base import BAD_INDEX_VALUE, CLOSED_BOUNDARY
+from landlab.grid.structured_quad import links
 from landlab.utils.decorators import use_field_name_or_array
 from collections import deque
 
 
+@use_field_name_or_array('node')
+def calc_diff_at_link(grid, node_values, out=None):
+    """Calculate differences in node_values over links.
+
+    Differences are calculated over rows and columns of nodes, without
+    using the arrays of the nodes at link ends.
+
+    Construction::
+
+        calc_diff_at_link(grid, node_values, out=None)
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A grid.
+    node_values : array_like or field name
+        Values at nodes.
+    out : ndarray, optional
+        Buffer to hold result. If `None`, create a new array.
+
+    Returns
+    -------
+    ndarray
+        Differences of the nodes values over each link.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> grid = RasterModelGrid((3, 3))
+    >>> node_values = [0., 0., 0.,
+    ...                1., 3., 1.,
+    ...                2., 2., 2.]
+    >>> grid.calc_diff_at_link(node_values)
+    array([ 0.,  0.,  1.,  3.,  1.,  2., -2.,  1., -1.,  1.,  0.,  0.])
+
+    LLCATS: LINF GRAD
+    """
+    if out is None:
+        out = grid.empty(at='link')
+    node_values = np.asarray(node_values).reshape(grid.shape)
+    np.subtract(node_values[:, 1:], node_values[:, :-1],
+                out=links.horizontal_links_view(grid.shape, out))
+    np.subtract(node_values[1:, :], node_values[:-1, :],
+                out=links.vertical_links_view(grid.shape, out))
+    return out
+
+
 @use_field_name_or_array('node')
 def calc_grad_at_link(grid, node_values, out=None):
     """Calculate gradients in node_values at links.
@@ -71,12 +120,12 @@ def calc_grad_at_link(grid, node_values, out=None):
 
     LLCATS: LINF GRAD
     """
-    grads = gradients.calc_diff_at_link(grid, node_values, out=out)
-    grads /= grid.length_of_link[:grid.number_of_links]
+    grads = calc_diff_at_link(grid, node_values, out=out)
 
-#    n_vertical_links = (grid.shape[0] - 1) * grid.shape[1]
-#    diffs[:n_vertical_links] /= grid.dy
-#    diffs[n_vertical_links:] /= grid.dx
+    horizontal_grads = links.horizontal_links_view(grid.shape, grads)
+    horizontal_grads /= grid.dx
+    vertical_grads = links.vertical_links_view(grid.shape, grads)
+    vertical_grads /= grid.dy
 
     return grads
 
@@ -159,7 +208,7 @@ def calc_grad_at_active_link(grid, node_values, out=None):
 
     # grads = gradients.calculate_diff_at_active_links(grid, node_values,
     #                                                  out=out)
-    grads = gradients.calc_diff_at_link(grid, node_values)
+    grads = calc_diff_at_link(grid, node_values)
     out[:] = grads[grid.active_links]
     out /= grid.length_of_link[grid.active_links]
 
@@ -7,6 +7,11 @@ Mapping functions unique to raster grids
 .. autosummary::
     :toctree: generated/
 
+    ~landlab.grid.raster_mappers.map_link_head_node_to_link
+    ~landlab.grid.raster_mappers.map_link_tail_node_to_link
+    ~landlab.grid.raster_mappers.map_min_of_link_nodes_to_link
+    ~landlab.grid.raster_mappers.map_max_of_link_nodes_to_link
+    ~landlab.grid.raster_mappers.map_mean_of_link_nodes_to_link
     ~landlab.grid.raster_mappers.map_sum_of_inlinks_to_node
     ~landlab.grid.raster_mappers.map_mean_of_inlinks_to_node
     ~landlab.grid.raster_mappers.map_max_of_inlinks_to_node
@@ -30,6 +35,237 @@ import numpy as np
 from landlab.grid.structured_quad import links
 
 
+def _map_link_nodes_to_link(grid, var_name, func, out=None):
+    """Map a function of the values at the nodes of each link to the link.
+
+    Values at the head and tail nodes of links are read from rows and
+    columns of nodes, without using the arrays of the nodes at link ends.
+    *func* is called as ``func(at_head, at_tail, out=out)`` for the
+    horizontal, and then the vertical, links.
+    """
+    if type(var_name) is str:
+        var_name = grid.at_node[var_name]
+    if out is None:
+        out = grid.empty(at='link')
+
+    values = np.asarray(var_name).reshape(grid.shape)
+    func(values[:, 1:], values[:, :-1],
+         out=links.horizontal_links_view(grid.shape, out))
+    func(values[1:, :], values[:-1, :],
+         out=links.vertical_links_view(grid.shape, out))
+
+    return out
+
+
+def _head(at_head, at_tail, out=None):
+    out[:] = at_head
+
+
+def _tail(at_head, at_tail, out=None):
+    out[:] = at_tail
+
+
+def _mean(at_head, at_tail, out=None):
+    np.add(at_head, at_tail, out=out)
+    out *= 0.5
+
+
+def map_link_head_node_to_link(grid, var_name, out=None):
+    """Map values from a link head nodes to links.
+
+    Construction::
+
+        map_link_head_node_to_link(grid, var_name, out=None)
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A landlab RasterModelGrid.
+    var_name : array or field name
+        Values defined at nodes.
+    out : ndarray, optional
+        Buffer to place mapped values into or `None` to create a new array.
+
+    Returns
+    -------
+    ndarray
+        Mapped values at links.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.raster_mappers import map_link_head_node_to_link
+    >>> from landlab import RasterModelGrid
+
+    >>> rmg = RasterModelGrid((3, 4))
+    >>> _ = rmg.add_field('node', 'z', np.arange(12.))
+    >>> map_link_head_node_to_link(rmg, 'z')
+    array([  1.,   2.,   3.,   4.,   5.,   6.,   7.,   5.,   6.,   7.,   8.,
+             9.,  10.,  11.,   9.,  10.,  11.])
+
+    LLCATS: NINF LINF MAP
+    """
+    return _map_link_nodes_to_link(grid, var_name, _head, out=out)
+
+
+def map_link_tail_node_to_link(grid, var_name, out=None):
+    """Map values from a link tail nodes to links.
+
+    Construction::
+
+        map_link_tail_node_to_link(grid, var_name, out=None)
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A landlab RasterModelGrid.
+    var_name : array or field name
+        Values defined at nodes.
+    out : ndarray, optional
+        Buffer to place mapped values into or `None` to create a new array.
+
+    Returns
+    -------
+    ndarray
+        Mapped values at links.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.raster_mappers import map_link_tail_node_to_link
+    >>> from landlab import RasterModelGrid
+
+    >>> rmg = RasterModelGrid((3, 4))
+    >>> _ = rmg.add_field('node', 'z', np.arange(12.))
+    >>> map_link_tail_node_to_link(rmg, 'z')
+    array([  0.,   1.,   2.,   0.,   1.,   2.,   3.,   4.,   5.,   6.,   4.,
+             5.,   6.,   7.,   8.,   9.,  10.])
+
+    LLCATS: NINF LINF MAP
+    """
+    return _map_link_nodes_to_link(grid, var_name, _tail, out=out)
+
+
+def map_min_of_link_nodes_to_link(grid, var_name, out=None):
+    """Map the minimum of a link's nodes to the link.
+
+    Construction::
+
+        map_min_of_link_nodes_to_link(grid, var_name, out=None)
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A landlab RasterModelGrid.
+    var_name : array or field name
+        Values defined at nodes.
+    out : ndarray, optional
+        Buffer to place mapped values into or `None` to create a new array.
+
+    Returns
+    -------
+    ndarray
+        Mapped values at links.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.raster_mappers import map_min_of_link_nodes_to_link
+    >>> from landlab import RasterModelGrid
+
+    >>> rmg = RasterModelGrid((3, 4))
+    >>> _ = rmg.add_field('node', 'z',
+    ...                   np.array([[ 0,  1,  2,  3],
+    ...                             [ 7,  6,  5,  4],
+    ...                             [ 8,  9, 10, 11]]))
+    >>> map_min_of_link_nodes_to_link(rmg, 'z')
+    array([  0.,   1.,   2.,   0.,   1.,   2.,   3.,   6.,   5.,   4.,   7.,
+             6.,   5.,   4.,   8.,   9.,  10.])
+
+    LLCATS: NINF LINF MAP
+    """
+    return _map_link_nodes_to_link(grid, var_name, np.minimum, out=out)
+
+
+def map_max_of_link_nodes_to_link(grid, var_name, out=None):
+    """Map the maximum of a link's nodes to the link.
+
+    Construction::
+
+        map_max_of_link_nodes_to_link(grid, var_name, out=None)
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A landlab RasterModelGrid.
+    var_name : array or field name
+        Values defined at nodes.
+    out : ndarray, optional
+        Buffer to place mapped values into or `None` to create a new array.
+
+    Returns
+    -------
+    ndarray
+        Mapped values at links.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.raster_mappers import map_max_of_link_nodes_to_link
+    >>> from landlab import RasterModelGrid
+
+    >>> rmg = RasterModelGrid((3, 4))
+    >>> _ = rmg.add_field('node', 'z',
+    ...                   np.array([[0, 1, 2, 3],
+    ...                             [7, 6, 5, 4],
+    ...                             [8, 9, 10, 11]]))
+    >>> map_max_of_link_nodes_to_link(rmg, 'z')
+    array([  1.,   2.,   3.,   7.,   6.,   5.,   4.,   7.,   6.,   5.,   8.,
+             9.,  10.,  11.,   9.,  10.,  11.])
+
+    LLCATS: NINF LINF MAP
+    """
+    return _map_link_nodes_to_link(grid, var_name, np.maximum, out=out)
+
+
+def map_mean_of_link_nodes_to_link(grid, var_name, out=None):
+    """Map the mean of a link's nodes to the link.
+
+    Construction::
+
+        map_mean_of_link_nodes_to_link(grid, var_name, out=None)
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A landlab RasterModelGrid.
+    var_name : array or field name
+        Values defined at nodes.
+    out : ndarray, optional
+        Buffer to place mapped values into or `None` to create a new array.
+
+    Returns
+    -------
+    ndarray
+        Mapped values at links.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.raster_mappers import map_mean_of_link_nodes_to_link
+    >>> from landlab import RasterModelGrid
+
+    >>> rmg = RasterModelGrid((3, 4))
+    >>> _ = rmg.add_field('node', 'z', np.arange(12.))
+    >>> map_mean_of_link_nodes_to_link(rmg, 'z')
+    array([  0.5,   1.5,   2.5,   2. ,   3. ,   4. ,   5. ,   4.5,   5.5,
+             6.5,   6. ,   7. ,   8. ,   9. ,   8.5,   9.5,  10.5])
+
+    LLCATS: NINF LINF MAP
+    """
+    return _map_link_nodes_to_link(grid, var_name, _mean, out=out)
+
+
 def map_sum_of_inlinks_to_node(grid, var_name, out=None):
     """Map the sum of links entering a node to the node.
 
@@ -59,6 +59,71 @@ def face_at_link(shape, bad_index_value=BAD_INDEX_VALUE):
     return out
 
 
+def horizontal_faces_view(shape, values_at_faces):
+    """View of face values as a grid of horizontal faces.
+
+    Horizontal faces cross vertical links. Each row of faces has NC - 2
+    horizontal faces followed by NC - 1 vertical faces, so the values at
+    horizontal faces are a strided view of an array of values at all
+    faces. Writing to the view writes to *values_at_faces*.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    values_at_faces : ndarray
+        Values at every face of the grid.
+
+    Returns
+    -------
+    (M, N) ndarray :
+        View of the values at horizontal faces.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.structured_quad.faces import horizontal_faces_view
+    >>> horizontal_faces_view((4, 5), np.arange(17))
+    array([[ 0,  1,  2],
+           [ 7,  8,  9],
+           [14, 15, 16]])
+    """
+    return links._strided_links_view(
+        values_at_faces, 0, (shape[0] - 1, shape[1] - 2), 2 * shape[1] - 3)
+
+
+def vertical_faces_view(shape, values_at_faces):
+    """View of face values as a grid of vertical faces.
+
+    Vertical faces cross horizontal links. The values at vertical faces
+    are a strided view of an array of values at all faces. Writing to the
+    view writes to *values_at_faces*.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    values_at_faces : ndarray
+        Values at every face of the grid.
+
+    Returns
+    -------
+    (M, N) ndarray :
+        View of the values at vertical faces.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.structured_quad.faces import vertical_faces_view
+    >>> vertical_faces_view((4, 5), np.arange(17))
+    array([[ 3,  4,  5,  6],
+           [10, 11, 12, 13]])
+    """
+    return links._strided_links_view(
+        values_at_faces, shape[1] - 2, (shape[0] - 2, shape[1] - 1),
+        2 * shape[1] - 3)
+
+
 def link_at_face(shape):
     """Get the link at each face.
 
@@ -166,14 +166,8 @@ def vertical_link_ids(shape):
     array([[ 3,  4,  5,  6],
            [10, 11, 12, 13]])
     """
-    #link_ids = np.arange(number_of_vertical_links(shape), dtype=np.int)
-    #return link_ids.reshape(shape_of_vertical_links(shape))
-    a = shape[1] - 1  # num horiz links in each row
-    num_links_per_row = 2*shape[1] - 1  # each row has C-1 horiz + C vert
-    link_ids = np.zeros(shape_of_vertical_links(shape), dtype=np.int)
-    for r in range(shape[0]-1):  # num rows - 1
-        link_ids[r,:] = a + (r * num_links_per_row) + np.arange(shape[1])
-    return link_ids
+    return vertical_links_view(
+        shape, np.arange(number_of_links(shape), dtype=np.int)).copy()
 
 
 def horizontal_link_ids(shape):
@@ -197,11 +191,169 @@ def horizontal_link_ids(shape):
            [ 7,  8,  9],
            [14, 15, 16]])
     """
-    num_links_per_row = 2*shape[1] - 1  # each row has C-1 horiz + C vert
-    link_ids = np.zeros(shape_of_horizontal_links(shape), dtype=np.int)
-    for r in range(shape[0]):  # number of rows
-        link_ids[r,:] = (r * num_links_per_row) + np.arange(shape[1]-1)
-    return link_ids
+    return horizontal_links_view(
+        shape, np.arange(number_of_links(shape), dtype=np.int)).copy()
+
+
+def vertical_links_view(shape, values_at_links):
+    """View of link values as a grid of vertical links.
+
+    Vertical links are every (2 * NC - 1)-th link, starting after the
+    first row of horizontal links, so their values are a strided view of
+    an array of values at all links. Writing to the view writes to
+    *values_at_links*.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    values_at_links : ndarray
+        Values at every link of the grid.
+
+    Returns
+    -------
+    (M, N) ndarray :
+        View of the values at vertical links.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.structured_quad.links import vertical_links_view
+    >>> values = np.arange(17.)
+    >>> vertical_links_view((3, 4), values)
+    array([[  3.,   4.,   5.,   6.],
+           [ 10.,  11.,  12.,  13.]])
+    >>> vertical_links_view((3, 4), values)[1] = 0.
+    >>> values[10:14]
+    array([ 0.,  0.,  0.,  0.])
+    """
+    return _strided_links_view(values_at_links, shape[1] - 1,
+                               shape_of_vertical_links(shape),
+                               2 * shape[1] - 1)
+
+
+def horizontal_links_view(shape, values_at_links):
+    """View of link values as a grid of horizontal links.
+
+    Horizontal links are the first NC - 1 of every (2 * NC - 1) links, so
+    their values are a strided view of an array of values at all links.
+    Writing to the view writes to *values_at_links*.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    values_at_links : ndarray
+        Values at every link of the grid.
+
+    Returns
+    -------
+    (M, N) ndarray :
+        View of the values at horizontal links.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.structured_quad.links import horizontal_links_view
+    >>> values = np.arange(17.)
+    >>> horizontal_links_view((3, 4), values)
+    array([[  0.,   1.,   2.],
+           [  7.,   8.,   9.],
+           [ 14.,  15.,  16.]])
+    """
+    return _strided_links_view(values_at_links, 0,
+                               shape_of_horizontal_links(shape),
+                               2 * shape[1] - 1)
+
+
+def _strided_links_view(values, start, view_shape, row_stride):
+    """View every *row_stride* values, from *start*, as rows."""
+    if values.ndim != 1:
+        raise ValueError('values must be 1D')
+    view_shape = (max(view_shape[0], 0), max(view_shape[1], 0))
+    if view_shape[0] > 0 and view_shape[1] > 0:
+        if start + (view_shape[0] - 1) * row_stride + view_shape[1] > (
+                values.size):
+            raise ValueError('not enough values for the shape of the grid')
+    item_stride = values.strides[0]
+    return np.lib.stride_tricks.as_strided(
+        values[start:], shape=view_shape,
+        strides=(row_stride * item_stride, item_stride))
+
+
+def node_value_at_link_start(shape, values_at_nodes, out=None):
+    """Values at nodes at the start of links.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    values_at_nodes : ndarray
+        Values at every node of the grid.
+    out : ndarray, optional
+        Buffer to hold the values at links.
+
+    Returns
+    -------
+    ndarray :
+        Value at the node at the start of each link.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.structured_quad.links import (
+    ...     node_value_at_link_start)
+    >>> node_value_at_link_start((3, 4), np.arange(12) * 10)
+    ...     # doctest: +NORMALIZE_WHITESPACE
+    array([ 0, 10, 20,
+            0, 10, 20, 30,
+           40, 50, 60,
+           40, 50, 60, 70,
+           80, 90, 100])
+    """
+    values_at_nodes = np.asarray(values_at_nodes).reshape(shape)
+    if out is None:
+        out = np.empty(number_of_links(shape), dtype=values_at_nodes.dtype)
+    horizontal_links_view(shape, out)[:] = values_at_nodes[:, :-1]
+    vertical_links_view(shape, out)[:] = values_at_nodes[:-1, :]
+    return out
+
+
+def node_value_at_link_end(shape, values_at_nodes, out=None):
+    """Values at nodes at the end of links.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    values_at_nodes : ndarray
+        Values at every node of the grid.
+    out : ndarray, optional
+        Buffer to hold the values at links.
+
+    Returns
+    -------
+    ndarray :
+        Value at the node at the end of each link.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.structured_quad.links import node_value_at_link_end
+    >>> node_value_at_link_end((3, 4), np.arange(12) * 10)
+    ...     # doctest: +NORMALIZE_WHITESPACE
+    array([ 10,  20,  30,
+            40,  50,  60,  70,
+            50,  60,  70,
+            80,  90, 100, 110,
+            90, 100, 110])
+    """
+    values_at_nodes = np.asarray(values_at_nodes).reshape(shape)
+    if out is None:
+        out = np.empty(number_of_links(shape), dtype=values_at_nodes.dtype)
+    horizontal_links_view(shape, out)[:] = values_at_nodes[:, 1:]
+    vertical_links_view(shape, out)[:] = values_at_nodes[1:, :]
+    return out
 
 
 def number_of_links_per_node(shape):
@@ -483,6 +635,83 @@ def links_at_node(shape):
                       west_links.flat, south_links.flat)).transpose().copy()
 
 
+def links_at_some_nodes(shape, nodes):
+    """Get link ids for some nodes.
+
+    Links are calculated from the row and column of each node.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    nodes : array_like of int
+        Node ids.
+
+    Returns
+    -------
+    (N, 4) ndarray of int
+        Array of link ids, as in :func:`links_at_node`.
+
+    Examples
+    --------
+    >>> from landlab.grid.structured_quad.links import links_at_some_nodes
+    >>> links_at_some_nodes((4, 3), [0, 4, 11])
+    array([[ 0,  2, -1, -1],
+           [ 6,  8,  5,  3],
+           [-1, -1, 16, 14]])
+    """
+    nodes = np.asarray(nodes, dtype=int).reshape((-1, ))
+    (row, col) = (nodes // shape[1], nodes % shape[1])
+    east = row * (2 * shape[1] - 1) + col
+    north = east + shape[1] - 1
+
+    links = np.empty((nodes.size, 4), dtype=int)
+    links[:, 0] = np.where(col < shape[1] - 1, east, -1)
+    links[:, 1] = np.where(row < shape[0] - 1, north, -1)
+    links[:, 2] = np.where(col > 0, east - 1, -1)
+    links[:, 3] = np.where(row > 0, north - (2 * shape[1] - 1), -1)
+
+    return links
+
+
+def nodes_at_some_links(shape, links):
+    """Get the nodes at the ends of some links.
+
+    Nodes are calculated from the position of each link in its row of
+    links.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of grid of nodes.
+    links : array_like of int
+        Link ids.
+
+    Returns
+    -------
+    tuple of ndarray of int
+        Node at the start, and at the end, of each link.
+
+    Examples
+    --------
+    >>> from landlab.grid.structured_quad.links import nodes_at_some_links
+    >>> (tails, heads) = nodes_at_some_links((3, 4), [0, 3, 9, 13, 16])
+    >>> tails
+    array([ 0,  0,  6,  7, 10])
+    >>> heads
+    array([ 1,  4,  7, 11, 11])
+    """
+    links = np.asarray(links, dtype=int).reshape((-1, ))
+    (row, col) = (links // (2 * shape[1] - 1), links % (2 * shape[1] - 1))
+    is_horizontal = col < shape[1] - 1
+
+    tails = row * shape[1] + np.where(is_horizontal, col,
+                                      col - (shape[1] - 1))
+    heads = tails + np.where(is_horizontal, 1, shape[1])
+
+    return tails, heads
+
+
 def link_dirs_at_node(shape):
     """Construct a matrix of link directions at each node.
 
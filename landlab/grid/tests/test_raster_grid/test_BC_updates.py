@@ -3,7 +3,7 @@ from numpy.testing import assert_array_equal
 from nose.tools import with_setup, assert_true, assert_equal, assert_not_equal
 
 from landlab import FIXED_GRADIENT_BOUNDARY, CLOSED_BOUNDARY, INACTIVE_LINK, \
-    FIXED_LINK
+    FIXED_LINK, CORE_NODE
 from landlab import RasterModelGrid
 
 
@@ -36,3 +36,40 @@ def test_bc_set_code_init():
 def test_bc_set_code_change():
     rmg.status_at_node[rmg.nodes_at_bottom_edge] = CLOSED_BOUNDARY
     assert_not_equal(rmg.bc_set_code, 0)
+
+
+def _assert_same_bc_lists(grid, expected):
+    for name in ('status_at_link', 'active_links', 'fixed_links',
+                 'core_nodes', 'boundary_nodes', 'core_cells',
+                 'active_link_dirs_at_node', 'active_faces'):
+        assert_array_equal(getattr(grid, name), getattr(expected, name))
+
+
+def test_update_some_nodes_matches_new_grid():
+    grid = RasterModelGrid((6, 7))
+    grid.active_link_dirs_at_node
+    grid.status_at_node[[9, 17, 18]] = CLOSED_BOUNDARY
+    grid.status_at_node[30] = FIXED_GRADIENT_BOUNDARY
+    grid.status_at_node[17] = CORE_NODE
+
+    expected = RasterModelGrid((6, 7))
+    expected.status_at_node[[9, 18]] = CLOSED_BOUNDARY
+    expected.status_at_node[30] = FIXED_GRADIENT_BOUNDARY
+
+    _assert_same_bc_lists(grid, expected)
+
+
+def test_bc_set_code_each_update():
+    grid = RasterModelGrid((4, 5))
+    grid.status_at_node[6] = CLOSED_BOUNDARY
+    grid.status_at_node[12] = CLOSED_BOUNDARY
+    assert_equal(grid.bc_set_code, 2)
+
+
+def test_reopened_node_has_active_links():
+    grid = RasterModelGrid((4, 5))
+    dirs = grid.active_link_dirs_at_node.copy()
+    grid.status_at_node[7] = CLOSED_BOUNDARY
+    assert_true(np.all(grid.active_link_dirs_at_node[7] == 0))
+    grid.status_at_node[7] = CORE_NODE
+    assert_array_equal(grid.active_link_dirs_at_node, dirs)
@@ -0,0 +1,56 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+from nose.tools import assert_true, assert_false
+
+from landlab import RasterModelGrid, CLOSED_BOUNDARY
+
+
+def test_connectivity_not_created():
+    grid = RasterModelGrid((4, 5))
+    for name in ('_links_at_node', '_neighbors_at_node', '_link_dirs_at_node',
+                 '_node_active_inlink_matrix', '_face_at_link'):
+        assert_false(name in grid.__dict__)
+
+
+def test_connectivity_created_when_used():
+    grid = RasterModelGrid((4, 5))
+    grid.links_at_node
+    assert_true('_links_at_node' in grid.__dict__)
+    assert_false('_neighbors_at_node' in grid.__dict__)
+
+
+def test_release_connectivity():
+    grid = RasterModelGrid((4, 5))
+    links = grid.links_at_node.copy()
+    neighbors = grid.neighbors_at_node.copy()
+    dirs = grid.active_link_dirs_at_node.copy()
+    faces = grid.face_at_link.copy()
+
+    grid.release_connectivity()
+    assert_false('_links_at_node' in grid.__dict__)
+    assert_false('_active_link_dirs_at_node' in grid.__dict__)
+
+    assert_array_equal(grid.links_at_node, links)
+    assert_array_equal(grid.neighbors_at_node, neighbors)
+    assert_array_equal(grid.active_link_dirs_at_node, dirs)
+    assert_array_equal(grid.face_at_link, faces)
+
+
+def test_active_connectivity_after_bc_change():
+    grid = RasterModelGrid((4, 5))
+    grid._node_active_inlink_matrix
+    grid.status_at_node[grid.nodes_at_left_edge] = CLOSED_BOUNDARY
+
+    expected = RasterModelGrid((4, 5))
+    expected.status_at_node[expected.nodes_at_left_edge] = CLOSED_BOUNDARY
+    expected.release_connectivity()
+
+    assert_array_equal(grid._node_active_inlink_matrix,
+                       expected._node_active_inlink_matrix)
+    assert_array_equal(grid._node_active_outlink_matrix,
+                       expected._node_active_outlink_matrix)
+    assert_array_equal(grid.active_link_dirs_at_node,
+                       expected.active_link_dirs_at_node)
+    assert_array_equal(grid.active_faces, expected.active_faces)
+    assert_true(np.all(grid.active_link_dirs_at_node[grid.nodes_at_left_edge]
+                       == 0))
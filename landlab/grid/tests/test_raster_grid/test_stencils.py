@@ -0,0 +1,57 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+from nose.tools import assert_false
+
+from landlab import RasterModelGrid
+from landlab.grid import gradients, divergence, mappers
+
+
+def _grid_and_values():
+    grid = RasterModelGrid((5, 7), spacing=(2., 3.))
+    values = np.random.RandomState(0).rand(grid.number_of_nodes)
+    return grid, values
+
+
+def test_diff_and_grad_at_link():
+    grid, z = _grid_and_values()
+    assert_array_equal(grid.calc_diff_at_link(z),
+                       gradients.calc_diff_at_link(grid, z))
+    assert_array_equal(grid.calc_grad_at_link(z),
+                       gradients.calc_grad_at_link(grid, z))
+
+
+def test_link_node_mappers():
+    grid, z = _grid_and_values()
+    for name in ('map_link_head_node_to_link', 'map_link_tail_node_to_link',
+                 'map_min_of_link_nodes_to_link',
+                 'map_max_of_link_nodes_to_link',
+                 'map_mean_of_link_nodes_to_link'):
+        assert_array_equal(getattr(grid, name)(z),
+                           getattr(mappers, name)(grid, z))
+
+
+def test_flux_div_at_node():
+    grid, z = _grid_and_values()
+    q = - grid.calc_grad_at_link(z)
+    assert_array_equal(grid.calc_net_flux_at_node(q),
+                       divergence.calc_net_flux_at_node(grid, q))
+    assert_array_equal(grid.calc_flux_div_at_node(q),
+                       divergence.calc_flux_div_at_node(grid, q))
+    assert_array_equal(
+        grid.calc_flux_div_at_node(q[grid.link_at_face]),
+        divergence.calc_flux_div_at_node(grid, q[grid.link_at_face]))
+
+
+def test_flux_div_out_keeps_perimeter():
+    grid, z = _grid_and_values()
+    out = np.full(grid.number_of_nodes, -1.)
+    grid.calc_flux_div_at_node(grid.calc_grad_at_link(z), out=out)
+    assert_array_equal(out[grid.boundary_nodes], -1.)
+
+
+def test_kernels_do_not_create_link_nodes():
+    grid, z = _grid_and_values()
+    grid.calc_flux_div_at_node(- grid.calc_grad_at_link(z))
+    grid.map_mean_of_link_nodes_to_link(z)
+    assert_false('_node_at_link_tail' in grid.__dict__)
+    assert_false('_node_at_link_head' in grid.__dict__)
@@ -0,0 +1,85 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+from nose.tools import assert_equal, assert_false, assert_raises
+
+from landlab import (RasterModelGrid, HexModelGrid, RadialModelGrid,
+                     VoronoiDelaunayGrid)
+
+
+def _grids():
+    rng = np.random.RandomState(0)
+    return (RasterModelGrid((6, 7), spacing=(2., 3.)),
+            HexModelGrid(6, 5),
+            RadialModelGrid(num_shells=3),
+            VoronoiDelaunayGrid(rng.rand(40) * 10., rng.rand(40) * 10.))
+
+
+def _coords(grid, at):
+    return {'node': (grid.x_of_node, grid.y_of_node),
+            'cell': (grid.x_of_cell, grid.y_of_cell),
+            'link': (grid.x_of_link, grid.y_of_link)}[at]
+
+
+def _check_queries(grid, at):
+    (x, y) = _coords(grid, at)
+    index = grid.spatial_index(at=at)
+    rng = np.random.RandomState(1)
+    points = (rng.uniform(x.min() - 1., x.max() + 1., 20),
+              rng.uniform(y.min() - 1., y.max() + 1., 20))
+
+    for (px, py) in zip(*points):
+        distance = np.hypot(x - px, y - py)
+        assert_equal(distance[index.nearest((px, py))], distance.min())
+        assert_array_equal(distance[index.nearest((px, py), k=3)],
+                           np.sort(distance)[:3])
+        assert_array_equal(index.within_radius((px, py), 2.5),
+                           np.where(distance <= 2.5)[0])
+        assert_array_equal(
+            index.in_bounding_box((px - 1., px + 3.), (py - 2., py + 1.)),
+            np.where((x >= px - 1.) & (x <= px + 3.) &
+                     (y >= py - 2.) & (y <= py + 1.))[0])
+
+    distance = np.hypot(x - points[0].reshape((-1, 1)),
+                        y - points[1].reshape((-1, 1)))
+    assert_array_equal(distance[np.arange(20), index.nearest(points)],
+                       distance.min(axis=1))
+
+
+def test_queries_match_brute_force():
+    for grid in _grids():
+        for at in ('node', 'cell', 'link'):
+            _check_queries(grid, at)
+
+
+def test_find_nearest_node():
+    for grid in _grids()[1:]:
+        assert_array_equal(
+            grid.find_nearest_node((grid.x_of_node + .01,
+                                    grid.y_of_node - .01)),
+            np.arange(grid.number_of_nodes))
+
+
+def test_k_larger_than_number_of_points():
+    grid = HexModelGrid(3, 3)
+    ids = grid.spatial_index(at='cell').nearest((0., 0.), k=3)
+    assert_array_equal(ids[2], -1)
+
+
+def test_index_is_lazy():
+    grid = HexModelGrid(3, 3)
+    assert_false('_spatial_index_at_node' in grid.__dict__)
+    grid.find_nearest_node((0., 0.))
+    grid.release_connectivity()
+    assert_false('_spatial_index_at_node' in grid.__dict__)
+
+
+def test_index_follows_move_origin():
+    grid = HexModelGrid(3, 3)
+    assert_equal(grid.find_nearest_node((1.4, .9)), 5)
+    grid.move_origin((10., 0.))
+    assert_equal(grid.find_nearest_node((11.4, .9)), 5)
+
+
+def test_bad_element():
+    grid = HexModelGrid(3, 3)
+    assert_raises(ValueError, grid.spatial_index, at='patch')
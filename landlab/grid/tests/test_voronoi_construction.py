@@ -0,0 +1,78 @@
+import numpy as np
+from numpy.testing import assert_array_equal, assert_array_almost_equal
+from nose.tools import assert_equal
+
+from landlab import HexModelGrid, RadialModelGrid, VoronoiDelaunayGrid
+from landlab.grid.voronoi import calculate_region_areas, simple_poly_area
+
+
+def _grids():
+    rng = np.random.RandomState(0)
+    return (HexModelGrid(6, 5),
+            HexModelGrid(5, 4, shape='rect', orientation='vertical'),
+            RadialModelGrid(num_shells=3),
+            VoronoiDelaunayGrid(rng.rand(60) * 10., rng.rand(60) * 10.))
+
+
+def test_region_areas():
+    from scipy.spatial import Voronoi
+
+    rng = np.random.RandomState(1)
+    vor = Voronoi(rng.rand(50, 2))
+    areas = calculate_region_areas(vor)
+    assert_equal(len(areas), len(vor.regions))
+    for (region, vertices) in enumerate(vor.regions):
+        if len(vertices) > 0 and -1 not in vertices:
+            assert_array_almost_equal(
+                areas[region], simple_poly_area(vor.vertices[vertices, 0],
+                                                vor.vertices[vertices, 1]))
+
+
+def test_node_and_cell_connectivity():
+    for grid in _grids():
+        has_cell = grid.cell_at_node != -1
+        assert_array_equal(grid.node_at_cell, np.where(has_cell)[0])
+        assert_array_equal(grid.cell_at_node[grid.node_at_cell],
+                           np.arange(grid.number_of_cells))
+
+
+def test_links_at_node():
+    for grid in _grids():
+        for node in range(grid.number_of_nodes):
+            links = grid.links_at_node[node]
+            dirs = grid.link_dirs_at_node[node]
+            assert_array_equal(
+                np.sort(links[links != -1]),
+                np.where((grid.node_at_link_tail == node) |
+                         (grid.node_at_link_head == node))[0])
+            assert_array_equal(dirs[links == -1], 0)
+            assert_array_equal(
+                dirs[links != -1],
+                np.where(grid.node_at_link_head[links[links != -1]] == node,
+                         1, -1))
+
+
+def test_patches_at_node():
+    for grid in _grids():
+        for node in range(grid.number_of_nodes):
+            patches = grid.patches_at_node[node]
+            assert_array_equal(
+                patches[patches != -1],
+                np.where(np.any(grid.nodes_at_patch == node, axis=1))[0])
+
+
+def test_links_at_patch():
+    for grid in _grids():
+        for patch in range(grid.number_of_patches):
+            nodes = grid.nodes_at_patch[patch]
+            links = grid.links_at_patch[patch]
+            assert_array_equal(
+                np.sort(links[links != -1]),
+                np.where(np.in1d(grid.node_at_link_tail, nodes) &
+                         np.in1d(grid.node_at_link_head, nodes))[0])
+
+
+def test_boundary_nodes_sorted():
+    for grid in _grids():
+        assert_array_equal(grid.boundary_nodes,
+                           np.where(grid.status_at_node != 0)[0])
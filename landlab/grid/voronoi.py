@@ -39,6 +39,7 @@ Information about the grid as a whole
     ~landlab.grid.voronoi.VoronoiDelaunayGrid.ndim
     ~landlab.grid.voronoi.VoronoiDelaunayGrid.node_axis_coordinates
     ~landlab.grid.voronoi.VoronoiDelaunayGrid.number_of_elements
+    ~landlab.grid.voronoi.VoronoiDelaunayGrid.release_connectivity
     ~landlab.grid.voronoi.VoronoiDelaunayGrid.save
     ~landlab.grid.voronoi.VoronoiDelaunayGrid.size
 
@@ -424,7 +425,6 @@ from landlab.core.utils import (as_id_array, sort_points_by_x_then_y,
                                 anticlockwise_argsort_points)
 from .decorators import return_readonly_id_array
 
-from scipy.spatial import Voronoi
 
 
 def simple_poly_area(x, y):
@@ -505,6 +505,60 @@ def calculate_link_lengths(pts, link_from, link_to):
     return link_length
 
 
+def calculate_region_areas(vor):
+    """Calculates and returns the area of each region of a Voronoi diagram.
+
+    The areas of all regions are calculated together, from a flat array of
+    the vertices of every region, rather than one polygon at a time. Areas
+    of regions that are not closed (that is, they include the vertex at
+    infinity) are not meaningful.
+
+    Parameters
+    ----------
+    vor : scipy.spatial.Voronoi
+        A Voronoi diagram.
+
+    Returns
+    -------
+    out : ndarray
+        1D numpy array containing the area of each region, in the order of
+        *vor.regions*.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scipy.spatial import Voronoi
+    >>> from landlab.grid.voronoi import calculate_region_areas
+    >>> x, y = np.meshgrid([0., 1., 2., 3.], [0., 2., 4.])
+    >>> vor = Voronoi(np.column_stack((x.flat, y.flat)))
+    >>> areas = calculate_region_areas(vor)
+    >>> areas[vor.point_region[[5, 6]]]
+    array([ 2.,  2.])
+    """
+    from landlab.graph.voronoi.voronoi_helpers import (
+        flatten_vertices_at_region)
+
+    (vertices_at_region, vertices_per_region) = flatten_vertices_at_region(
+        vor.regions)
+
+    # Each vertex is joined to the next vertex of its region, and the last
+    # vertex of a region to the first.
+    first_vertex = np.cumsum(vertices_per_region) - vertices_per_region
+    has_vertices = vertices_per_region > 0
+    next_vertex = np.arange(1, vertices_at_region.size + 1)
+    next_vertex[(first_vertex + vertices_per_region - 1)[has_vertices]] = (
+        first_vertex[has_vertices])
+
+    x = vor.vertices[vertices_at_region, 0]
+    y = vor.vertices[vertices_at_region, 1]
+    twice_area = np.bincount(
+        np.repeat(np.arange(len(vertices_per_region)), vertices_per_region),
+        weights=x * y[next_vertex] - x[next_vertex] * y,
+        minlength=len(vertices_per_region))
+
+    return .5 * np.abs(twice_area)
+
+
 class VoronoiDelaunayGrid(ModelGrid):
     """
     This inherited class implements an unstructured grid in which cells are
@@ -637,14 +691,12 @@ class VoronoiDelaunayGrid(ModelGrid):
 
         # ACTIVE CELLS: Construct Voronoi diagram and calculate surface area of
         # each active cell.
+        from scipy.spatial import Voronoi
+
         vor = Voronoi(self.pts)
         self.vor = vor
-        self._area_of_cell = np.zeros(self.number_of_cells)
-        for node in self._node_at_cell:
-            xv = vor.vertices[vor.regions[vor.point_region[node]], 0]
-            yv = vor.vertices[vor.regions[vor.point_region[node]], 1]
-            self._area_of_cell[self.cell_at_node[node]] = (
-                simple_poly_area(xv, yv))
+        self._area_of_cell = calculate_region_areas(vor)[
+            vor.point_region[self._node_at_cell]]
 
         # LINKS: Construct Delaunay triangulation and construct lists of link
         # "from" and "to" nodes.
@@ -819,10 +871,9 @@ class VoronoiDelaunayGrid(ModelGrid):
         # The ConvexHull object lists the edges that form the hull. We need to
         # get from this list of edges the unique set of nodes. To do this, we
         # first flatten the list of vertices that make up all the hull edges
-        # ("simplices"), so it becomes a 1D array. With that, we can use the
-        # set() function to turn the array into a set, which removes duplicate
-        # vertices. Then we turn it back into an array, which now contains the
-        # set of IDs for the nodes that make up the convex hull.
+        # ("simplices"), so it becomes a 1D array. With that, we can use
+        # np.unique to remove duplicate vertices, which leaves the set of IDs
+        # for the nodes that make up the convex hull.
         #   The next thing to worry about is the fact that the mesh perimeter
         # might contain nodes that are co-planar (that is, co-linear in our 2D
         # world). For example, if you make a set of staggered points for a
@@ -833,10 +884,10 @@ class VoronoiDelaunayGrid(ModelGrid):
         # the list of boundary_nodes. To deal with this, we pass the 'Qt'
         # option to ConvexHull, which makes it generate a list of coplanar
         # points. We include these in our set of boundary nodes.
-        convex_hull_nodes = np.array(list(set(hull.simplices.flatten())))
+        convex_hull_nodes = np.unique(hull.simplices)
         coplanar_nodes = hull.coplanar[:, 0]
-        boundary_nodes = as_id_array(np.concatenate(
-            (convex_hull_nodes, coplanar_nodes)))
+        boundary_nodes = as_id_array(np.union1d(convex_hull_nodes,
+                                                coplanar_nodes))
 
         # Now we'll create the "node_status" array, which contains the code
         # indicating whether the node is interior and active (=0) or a
@@ -898,14 +949,9 @@ class VoronoiDelaunayGrid(ModelGrid):
         assert ncells == np.count_nonzero(node_status == CORE_NODE), \
             'ncells must equal number of CORE_NODE values in node_status'
 
-        cell = 0
-        node_cell = np.ones(len(node_status), dtype=int) * BAD_INDEX_VALUE
-        cell_node = np.zeros(ncells, dtype=int)
-        for node in range(len(node_cell)):
-            if node_status[node] == CORE_NODE:
-                node_cell[node] = cell
-                cell_node[cell] = node
-                cell += 1
+        cell_node = np.where(node_status == CORE_NODE)[0].astype(int)
+        node_cell = np.full(len(node_status), BAD_INDEX_VALUE, dtype=int)
+        node_cell[cell_node] = np.arange(ncells)
 
         return node_cell, cell_node
 
@@ -989,6 +1035,20 @@ class VoronoiDelaunayGrid(ModelGrid):
                 np.amax(np.abs(vor.vertices[
                     vor.ridge_vertices[n]])) < SUSPICIOUSLY_BIG)
 
+    @staticmethod
+    def _is_valid_voronoi_ridges(vor, ridge_vertices):
+        """Check, for each of some ridges, if it is a valid face.
+
+        This is the same test as *_is_valid_voronoi_ridge*, for an array of
+        the vertices of ridges.
+        """
+        SUSPICIOUSLY_BIG = 40000000.0
+        is_valid = np.all(ridge_vertices != -1, axis=1)
+        is_valid[is_valid] = np.amax(
+            np.abs(vor.vertices[ridge_vertices[is_valid]]),
+            axis=(1, 2)) < SUSPICIOUSLY_BIG
+        return is_valid
+
     @staticmethod
     def _create_links_and_faces_from_voronoi_diagram(vor):
         """
@@ -1036,11 +1096,8 @@ class VoronoiDelaunayGrid(ModelGrid):
         # attribute ridge_points that contains the IDs of the nodes on either
         # side (including ridges that have one of their endpoints undefined).
         # So, we set the number of links equal to the number of ridges.
-        num_links = len(vor.ridge_points)
-
-        # Create the arrays for link from and to nodes
-        link_fromnode = -np.ones(num_links, dtype=int)
-        link_tonode = -np.ones(num_links, dtype=int)
+        ridge_points = vor.ridge_points
+        ridge_vertices = np.array(vor.ridge_vertices, dtype=int)
 
         # Ridges along the perimeter of the grid will have one of their
         # endpoints undefined. The endpoints of each ridge are contained in
@@ -1050,40 +1107,36 @@ class VoronoiDelaunayGrid(ModelGrid):
         # links. So, to find the number of active links, we subtract from the
         # total number of links the number of occurrences of an undefined
         # vertex.
-        num_active_links = num_links \
-            - np.count_nonzero(np.array(vor.ridge_vertices) == -1)
+        num_active_links = len(ridge_points) - np.count_nonzero(
+            ridge_vertices == -1)
+
+        # Find the order to sort by link midpoints
+        link_midpoints = (vor.points[ridge_points[:, 0]] +
+                          vor.points[ridge_points[:, 1]]) / 2.
+        ind = argsort_points_by_x_then_y(link_midpoints)
+
+        # For each ridge, there is a link, and its "from" and "to" nodes are
+        # the associated "points". In addition, if the ridge endpoints are
+        # defined, we have a face and an active link.
+        link_fromnode = ridge_points[ind, 0].astype(int)
+        link_tonode = ridge_points[ind, 1].astype(int)
+
+        ridge_vertices = ridge_vertices[ind]
+        is_face = VoronoiDelaunayGrid._is_valid_voronoi_ridges(
+            vor, ridge_vertices)
 
         # Create arrays for active links and width of faces (which are Voronoi
         # ridges).
         active_links = -np.ones(num_active_links, dtype=int)
         face_width = -np.ones(num_active_links)
 
-        # Find the order to sort by link midpoints
-        link_midpoints = np.zeros((num_links, 2))
-        for i in range(num_links):
-            link_midpoints[i][:] = (vor.points[vor.ridge_points[i, 0]] +
-                                    vor.points[vor.ridge_points[i, 1]])/2.
-        ind = argsort_points_by_x_then_y(link_midpoints)
-
-        # Loop through the list of ridges. For each ridge, there is a link, and
-        # its "from" and "to" nodes are the associated "points". In addition,
-        # if the ridge endpoints are defined, we have a face and an active
-        # link, so we add them to our arrays as well.
-        j = 0
-        for i in range(num_links):
-            link_fromnode[i] = vor.ridge_points[ind[i], 0]
-            link_tonode[i] = vor.ridge_points[ind[i], 1]
-            face_corner1 = vor.ridge_vertices[ind[i]][0]
-            face_corner2 = vor.ridge_vertices[ind[i]][1]
-            # means it's a valid face
-            if VoronoiDelaunayGrid._is_valid_voronoi_ridge(vor, ind[i]):
-                dx = vor.vertices[face_corner2, 0] - \
-                    vor.vertices[face_corner1, 0]
-                dy = vor.vertices[face_corner2, 1] - \
-                    vor.vertices[face_corner1, 1]
-                face_width[j] = np.sqrt(dx * dx + dy * dy)
-                active_links[j] = i
-                j += 1
+        (faces, ) = np.where(is_face)
+        dx = (vor.vertices[ridge_vertices[faces, 1], 0] -
+              vor.vertices[ridge_vertices[faces, 0], 0])
+        dy = (vor.vertices[ridge_vertices[faces, 1], 1] -
+              vor.vertices[ridge_vertices[faces, 0], 1])
+        face_width[:len(faces)] = np.sqrt(dx * dx + dy * dy)
+        active_links[:len(faces)] = faces
 
         return link_fromnode, link_tonode, active_links, face_width
 
@@ -1153,8 +1206,7 @@ class VoronoiDelaunayGrid(ModelGrid):
         """
         from scipy.spatial import Delaunay
         from landlab.core.utils import anticlockwise_argsort_points_multiline
-        from .cfuncs import find_rows_containing_ID, \
-            create_patches_at_element, create_links_at_patch
+        from .cfuncs import create_patches_at_element, create_links_at_patch
         tri = Delaunay(pts)
         assert np.array_equal(tri.points, vor.points)
         nodata = -1
@@ -0,0 +1,111 @@
+"""Benchmark reading and writing ESRI ASCII files.
+
+Reads and writes a raster of random elevations with read_esri_ascii and
+write_esri_ascii, and reads the same data with numpy.loadtxt (which
+read_esri_ascii used to call) for comparison. Reading the data is timed
+separately from reading into a new grid, which includes creating the
+grid. Run as a script, the raster is 10,000 by 10,000 nodes (about 2.5 GB
+of text), or the number of rows and columns given as an argument.
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.io.esri_ascii import (read_esri_ascii, write_esri_ascii,
+                                   read_asc_header, _read_asc_data)
+
+
+def _make_grid(shape):
+    grid = RasterModelGrid(shape)
+    grid.add_field('node', 'topographic__elevation',
+                   np.random.RandomState(0).uniform(0., 1000.,
+                                                    grid.number_of_nodes))
+    return grid
+
+
+def _write_test_file(shape):
+    (fd, path) = tempfile.mkstemp(suffix='.asc')
+    os.close(fd)
+    write_esri_ascii(path, _make_grid(shape), clobber=True)
+    return path
+
+
+def _loadtxt(path):
+    with open(path, 'r') as asc_file:
+        read_asc_header(asc_file)
+        return np.loadtxt(asc_file)
+
+
+def _read_data(path, **kwds):
+    with open(path, 'r') as asc_file:
+        header = read_asc_header(asc_file)
+        return _read_asc_data(asc_file, (header['nrows'], header['ncols']),
+                              **kwds)
+
+
+def bench_read_1000x1000():
+    path = _write_test_file((1000, 1000))
+    try:
+        read_esri_ascii(path)
+    finally:
+        os.remove(path)
+
+
+def bench_read_window_1000x1000():
+    path = _write_test_file((1000, 1000))
+    try:
+        read_esri_ascii(path, rows=(900, 1000), cols=(0, 100))
+    finally:
+        os.remove(path)
+
+
+def bench_write_1000x1000():
+    grid = _make_grid((1000, 1000))
+    (fd, path) = tempfile.mkstemp(suffix='.asc')
+    os.close(fd)
+    try:
+        write_esri_ascii(path, grid, clobber=True)
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    import time
+
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    shape = (n_rows, n_rows)
+    grid = _make_grid(shape)
+    (fd, path) = tempfile.mkstemp(suffix='.asc')
+    os.close(fd)
+
+    try:
+        for n_threads in (1, 4):
+            start = time.time()
+            write_esri_ascii(path, grid, clobber=True, n_threads=n_threads)
+            print('write_esri_ascii, {n} thread(s): {t:.1f} s'.format(
+                n=n_threads, t=time.time() - start))
+
+        start = time.time()
+        _read_data(path)
+        print('read data: {t:.1f} s'.format(t=time.time() - start))
+
+        start = time.time()
+        _read_data(path, rows=(n_rows - n_rows // 10, n_rows),
+                   cols=(0, n_rows // 10), halo=1)
+        print('read data, window of top tenth of rows: {t:.1f} s'.format(
+            t=time.time() - start))
+
+        start = time.time()
+        _loadtxt(path)
+        print('read data with numpy.loadtxt: {t:.1f} s'.format(
+            t=time.time() - start))
+
+        start = time.time()
+        read_esri_ascii(path)
+        print('read_esri_ascii, including grid: {t:.1f} s'.format(
+            t=time.time() - start))
+    finally:
+        os.remove(path)
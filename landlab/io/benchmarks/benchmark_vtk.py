@@ -0,0 +1,69 @@
+"""Benchmark writing VTK files with appended binary data.
+
+Writes the node fields of a raster grid as VTK image data (.vti) and as a
+VTK unstructured grid (.vtu), with and without compression. Run as a
+script, the raster has 10,000,000 nodes and is written as a time series of
+several steps.
+"""
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.io.vtk import write_vtk, VtkTimeSeriesWriter
+
+
+def _add_fields(grid):
+    rng = np.random.RandomState(0)
+    grid.add_field('node', 'topographic__elevation',
+                   rng.uniform(0., 1000., grid.number_of_nodes))
+    grid.add_field('node', 'water__depth',
+                   rng.uniform(0., 1., grid.number_of_nodes))
+    return grid
+
+
+def _write_in_temp_dir(grid, ext='.vti', compress=False):
+    temp_dir = tempfile.mkdtemp()
+    try:
+        write_vtk(os.path.join(temp_dir, 'bench' + ext), grid,
+                  compress=compress)
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def bench_raster_1m():
+    _write_in_temp_dir(_add_fields(RasterModelGrid((1000, 1000))))
+
+
+def bench_raster_1m_compressed():
+    _write_in_temp_dir(_add_fields(RasterModelGrid((1000, 1000))),
+                       compress=True)
+
+
+def bench_unstructured_1m():
+    _write_in_temp_dir(_add_fields(RasterModelGrid((1000, 1000))),
+                       ext='.vtu')
+
+
+if __name__ == '__main__':
+    import time
+
+    n_steps = 5
+    grid = _add_fields(RasterModelGrid((3163, 3163)))
+    for ext in ('.vti', '.vtu'):
+        for compress in (False, True):
+            temp_dir = tempfile.mkdtemp()
+            try:
+                start = time.time()
+                with VtkTimeSeriesWriter(os.path.join(temp_dir, 'bench'),
+                                         grid, ext=ext,
+                                         compress=compress) as writer:
+                    for _ in range(n_steps):
+                        writer.write()
+                print('10m nodes, {ext}, compress={compress}: {t:.2f} s per '
+                      'step'.format(ext=ext, compress=compress,
+                                    t=(time.time() - start) / n_steps))
+            finally:
+                shutil.rmtree(temp_dir)
@@ -0,0 +1,135 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+
+from libc.math cimport fabs, isnan
+from libc.stdio cimport snprintf
+from libc.stdlib cimport strtod
+
+
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
+
+
+cdef inline bint _is_space(char c):
+    return c == b' ' or c == b'\n' or c == b'\r' or c == b'\t'
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _parse_floats(bytes text):
+    """Parse whitespace-separated numbers.
+
+    Parameters
+    ----------
+    text : bytes
+        Numbers separated by spaces, tabs or line endings.
+
+    Returns
+    -------
+    ndarray of float
+        The numbers, in order.
+
+    Raises
+    ------
+    ValueError
+        If *text* contains something that is not a number.
+
+    Examples
+    --------
+    >>> from landlab.io.cfuncs import _parse_floats
+    >>> _parse_floats(b' 1. 2.5e1\\n-3\\t4 ').tolist()
+    [1.0, 25.0, -3.0, 4.0]
+    """
+    cdef Py_ssize_t n_chars = len(text)
+    cdef np.ndarray[DTYPE_FLOAT_t, ndim=1] values = np.empty(
+        n_chars // 2 + 1, dtype=DTYPE_FLOAT)
+    cdef char* start = text
+    cdef char* stop = start + n_chars
+    cdef char* ptr = start
+    cdef char* end
+    cdef Py_ssize_t n_values = 0
+
+    while True:
+        while ptr < stop and _is_space(ptr[0]):
+            ptr += 1
+        if ptr >= stop:
+            break
+        values[n_values] = strtod(ptr, &end)
+        if end == ptr or (end < stop and not _is_space(end[0])):
+            raise ValueError('unable to parse number at {position}'.format(
+                position=ptr - start))
+        n_values += 1
+        ptr = end
+
+    return values[:n_values]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _format_floats(const DTYPE_FLOAT_t[:, :] values, bytes fmt):
+    """Format rows of numbers as text.
+
+    Numbers in a row are separated by a space, and each row ends with a
+    newline. The GIL is released while formatting, so that blocks of rows
+    can be formatted in parallel threads. NaNs are written without a sign,
+    as by Python (and so *numpy.savetxt*), whatever their sign bit.
+
+    Parameters
+    ----------
+    values : ndarray of float, shape (n_rows, n_cols)
+        Numbers to format.
+    fmt : bytes
+        A C (or Python) format for a single number.
+
+    Returns
+    -------
+    bytes
+        The formatted rows.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.io.cfuncs import _format_floats
+    >>> _format_floats(np.array([[1., 2.], [3., -4.5]]), b'%.2f')
+    b'1.00 2.00\\n3.00 -4.50\\n'
+    """
+    cdef Py_ssize_t n_rows = values.shape[0]
+    cdef Py_ssize_t n_cols = values.shape[1]
+    cdef Py_ssize_t width = 64
+    cdef np.ndarray[np.uint8_t, ndim=1] text = np.empty(
+        n_rows * n_cols * width + n_rows, dtype=np.uint8)
+    cdef char* start = <char*>text.data
+    cdef char* ptr = start
+    cdef const char* c_fmt = fmt
+    cdef Py_ssize_t row, col
+    cdef DTYPE_FLOAT_t value
+    cdef int n_chars
+    cdef bint truncated = False
+
+    with nogil:
+        for row in range(n_rows):
+            for col in range(n_cols):
+                value = values[row, col]
+                if isnan(value):
+                    # The NaNs of 0/0 or inf - inf have their sign bit set,
+                    # which would be written as "-nan".
+                    value = fabs(value)
+                n_chars = snprintf(ptr, width, c_fmt, value)
+                if n_chars < 0 or n_chars >= width:
+                    truncated = True
+                    break
+                ptr += n_chars
+                ptr[0] = b' '
+                ptr += 1
+            if truncated:
+                break
+            if n_cols > 0:
+                ptr -= 1
+            ptr[0] = b'\n'
+            ptr += 1
+
+    if truncated:
+        raise ValueError('formatted number is too long')
+
+    return text[:ptr - start].tobytes()
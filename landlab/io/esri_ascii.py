@@ -18,6 +18,14 @@ import six
 
 import numpy as np
 
+from .cfuncs import _parse_floats, _format_floats
+
+
+# Number of characters of data to parse at a time
+_CHUNK_SIZE = 2 ** 24
+# Number of values to format at a time
+_VALUES_PER_BLOCK = 2 ** 20
+
 _VALID_HEADER_KEYS = [
     'ncols', 'nrows', 'xllcorner', 'xllcenter', 'yllcorner',
     'yllcenter', 'cellsize', 'nodata_value',
@@ -304,28 +312,185 @@ def read_asc_header(asc_file):
     return header
 
 
-def _read_asc_data(asc_file):
+def _iter_asc_rows(asc_file, shape, chunk_size=_CHUNK_SIZE):
+    """Iterate over blocks of rows of an ESRI ASCII data file.
+
+    The file is read and parsed *chunk_size* characters at a time, so that
+    it need not fit in memory.
+
+    Parameters
+    ----------
+    asc_file : file-like
+        File-like object of the data file pointing to the start of the data.
+    shape : tuple of int
+        Number of rows and columns of data.
+    chunk_size : int, optional
+        Number of characters to read at a time.
+
+    Yields
+    ------
+    ndarray of float
+        Complete rows of data, in the order they are in the file.
+
+    Raises
+    ------
+    DataSizeError
+        There are more or fewer data than indicated by *shape*.
+    """
+    (n_rows, n_cols) = shape
+    leftover = np.empty(0)
+    tail = b''
+    n_read = 0
+    while True:
+        text = asc_file.read(chunk_size)
+        if isinstance(text, six.text_type):
+            text = text.encode('ascii')
+        text = tail + text
+        if len(text) > len(tail):
+            cut = max(text.rfind(sep) for sep in (b' ', b'\n', b'\r', b'\t'))
+            (text, tail) = (text[:max(cut, 0)], text[max(cut, 0):])
+        else:
+            tail = b''
+
+        values = _parse_floats(text)
+        if len(leftover) > 0:
+            values = np.concatenate((leftover, values))
+        n_read += len(values) - len(leftover)
+        if n_read > n_rows * n_cols:
+            raise DataSizeError(n_read, n_rows * n_cols)
+
+        n_complete = len(values) // n_cols
+        if n_complete > 0:
+            yield values[:n_complete * n_cols].reshape((n_complete, n_cols))
+        leftover = values[n_complete * n_cols:]
+
+        if len(text) == 0 and len(tail) == 0:
+            break
+
+    if n_read != n_rows * n_cols:
+        raise DataSizeError(n_read, n_rows * n_cols)
+
+
+def _read_asc_data(asc_file, shape, rows=None, cols=None, halo=0,
+                   nodata_value=-9999., chunk_size=_CHUNK_SIZE):
     """Read gridded data from an ESRI ASCII data file.
 
+    Data are read a block of rows at a time into an array, with rows
+    ordered from the bottom of the raster to the top (as are the rows of
+    nodes of a grid) and padded with a halo of *nodata_value*.
+
     Parameters
     ----------
     asc_file : file-like
         File-like object of the data file pointing to the start of the data.
+    shape : tuple of int
+        Number of rows and columns of data in the file.
+    rows : tuple of int, optional
+        Start and stop of the rows to read, counting from the bottom row.
+    cols : tuple of int, optional
+        Start and stop of the columns to read, counting from the left.
+    halo : int, optional
+        Width of the halo.
+    nodata_value : float, optional
+        Value of the halo.
+    chunk_size : int, optional
+        Number of characters to read at a time.
+
+    Returns
+    -------
+    ndarray of float
+        The data, including any halo.
 
     .. note::
         First row of the data is at the top of the raster grid, the second
         row is the second from the top, and so on.
     """
-    return np.loadtxt(asc_file)
+    (n_rows, n_cols) = shape
+    (row_start, row_stop) = rows or (0, n_rows)
+    (col_start, col_stop) = cols or (0, n_cols)
+    if not (0 <= row_start < row_stop <= n_rows and
+            0 <= col_start < col_stop <= n_cols):
+        raise ValueError('window is outside of the data')
+
+    data = np.empty((row_stop - row_start + 2 * halo,
+                     col_stop - col_start + 2 * halo))
+    if halo > 0:
+        data.fill(nodata_value)
+    window = data[halo:data.shape[0] - halo, halo:data.shape[1] - halo]
+
+    # Rows of the window, in the order they are in the file.
+    window = window[::-1]
+    (first_row, last_row) = (n_rows - row_stop, n_rows - row_start)
+    is_windowed = rows is not None or cols is not None
+
+    file_row = 0
+    for block in _iter_asc_rows(asc_file, shape, chunk_size=chunk_size):
+        start = max(file_row, first_row)
+        stop = min(file_row + len(block), last_row)
+        if start < stop:
+            window[start - first_row:stop - first_row] = (
+                block[start - file_row:stop - file_row, col_start:col_stop])
+        file_row += len(block)
+        if is_windowed and file_row >= last_row:
+            break
+
+    return data
+
+
+def _write_asc_data(asc_file, data, fmt=b'%.18e', n_threads=1,
+                    values_per_block=_VALUES_PER_BLOCK):
+    """Write gridded data to an ESRI ASCII data file.
+
+    Rows are formatted in blocks, by *n_threads* threads.
+
+    Parameters
+    ----------
+    asc_file : file-like
+        Binary file-like object to write to.
+    data : ndarray of float, shape (n_rows, n_cols)
+        Data, with rows ordered from the top of the raster to the bottom.
+    fmt : bytes, optional
+        Format of each value.
+    n_threads : int, optional
+        Number of threads that format the data.
+    values_per_block : int, optional
+        Approximate number of values formatted at a time.
+    """
+    data = np.asarray(data, dtype=float)
+    rows_per_block = max(1, values_per_block // max(data.shape[1], 1))
+    blocks = (data[row:row + rows_per_block]
+              for row in range(0, data.shape[0], rows_per_block))
 
+    def format_block(block):
+        return _format_floats(block, fmt)
 
-def read_esri_ascii(asc_file, grid=None, reshape=False, name=None, halo=0):
+    if n_threads > 1:
+        from multiprocessing.pool import ThreadPool
+
+        pool = ThreadPool(n_threads)
+        try:
+            for text in pool.imap(format_block, blocks):
+                asc_file.write(text)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for block in blocks:
+            asc_file.write(format_block(block))
+
+
+def read_esri_ascii(asc_file, grid=None, reshape=False, name=None, halo=0,
+                    rows=None, cols=None):
     """Read :py:class:`~landlab.RasterModelGrid` from an ESRI ASCII file.
 
     Read data from *asc_file*, an ESRI_ ASCII file, into a
     :py:class:`~landlab.RasterModelGrid`.  *asc_file* is either the name of
     the data file or is a file-like object.
 
+    The data are parsed a block of rows at a time, straight into the array
+    of node values. If a window of *rows* and *cols* is given, only that
+    window is kept, and reading stops once the window has been read.
+
     The grid and data read from the file are returned as a tuple
     (*grid*, *data*) where *grid* is an instance of
     :py:class:`~landlab.RasterModelGrid` and *data* is a numpy
@@ -346,6 +511,12 @@ def read_esri_ascii(asc_file, grid=None, reshape=False, name=None, halo=0):
         Adds data to an existing *grid* instead of creating a new one.
     halo : integer, optional
         Adds outer border of depth halo to the *grid*. 
+    rows : tuple of int, optional
+        Read only a window of the data, from the start row to the stop row
+        of the raster (counting from the bottom).
+    cols : tuple of int, optional
+        Read only a window of the data, from the start column to the stop
+        column of the raster (counting from the left).
 
     Returns
     -------
@@ -388,62 +559,42 @@ def read_esri_ascii(asc_file, grid=None, reshape=False, name=None, halo=0):
     >>> #  -9999, 3., 4., 5., -9999,
     >>> #  -9999, 0., 1., 2. -9999,
     >>> #  -9999, -9999, -9999, -9999, -9999, -9999]
+
+    Read only the upper right two by two nodes.
+
+    >>> (grid, data) = read_esri_ascii('fop', rows=(2, 4),
+    ...                                cols=(1, 3)) # doctest: +SKIP
+    >>> #data is [4., 5., 1., 2.]
     """
     from ..grid import RasterModelGrid
 
+    #There is no reason for halo to be negative.
+    #Assume that if a negative value is given it should be 0.
+    halo = max(halo, 0)
+
     if isinstance(asc_file, six.string_types):
         file_name = asc_file
         with open(file_name, 'r') as asc_file:
             header = read_asc_header(asc_file)
-            data = _read_asc_data(asc_file)
+            data = _read_asc_data(
+                asc_file, (header['nrows'], header['ncols']), rows=rows,
+                cols=cols, halo=halo,
+                nodata_value=header.get('nodata_value', -9999.))
     else:
         header = read_asc_header(asc_file)
-        data = _read_asc_data(asc_file)
-    
-    #There is no reason for halo to be negative.
-    #Assume that if a negative value is given it should be 0.
-    if halo <= 0:
-        shape = (header['nrows'], header['ncols'])
-        if data.size != shape[0] * shape[1]:
-            raise DataSizeError(shape[0] * shape[1], data.size)
-    else:
-        shape = (header['nrows'] + 2 * halo, header['ncols'] + 2 * halo)
-        #check to see if a nodata_value was given.  If not, assign -9999.
-        if 'nodata_value' in header.keys():
-            nodata_value = header['nodata_value']
-        else:
-            header['nodata_value'] = -9999.
-            nodata_value = header['nodata_value']
-        if data.size != (shape[0] - 2 * halo) * (shape[1] - 2 * halo):
-            raise DataSizeError(shape[0] * shape[1], data.size)
+        data = _read_asc_data(
+            asc_file, (header['nrows'], header['ncols']), rows=rows,
+            cols=cols, halo=halo,
+            nodata_value=header.get('nodata_value', -9999.))
+
+    #REMEMBER, shape contains the size with halo in place
+    shape = data.shape
     spacing = (header['cellsize'], header['cellsize'])
     #origin = (header['xllcorner'], header['yllcorner'])   
-    
-    data = np.flipud(data)
 
-    #REMEMBER, shape contains the size with halo in place
-    #header contains the shape of the original data
-    #Add halo below
-    if halo > 0:
-        helper_row = np.ones(shape[1]) * nodata_value
-        #for the first halo row(s), add num cols worth of nodata vals to data
-        for i in range(0, halo):
-            data = np.insert(data,0,helper_row)
-        #then for header['nrows'] add halo number nodata vals, header['ncols'] 
-        #of data, then halo number of nodata vals
-        helper_row_ends = np.ones(halo) * nodata_value
-        for i in range(halo, header['nrows']+halo):
-            #this adds at the beginning of the row
-            data = np.insert(data,i * shape[1],helper_row_ends)
-            #this adds at the end of the row
-            data = np.insert(data,(i + 1) * shape[1] - halo,helper_row_ends)
-        #for the last halo row(s), add num cols worth of nodata vals to data
-        for i in range(header['nrows']+halo,shape[0]):
-            data = np.insert(data,data.size,helper_row)
-        
     if not reshape:
-        data = data.flatten()
-        
+        data = data.reshape((-1, ))
+
     if grid is not None:
         if (grid.number_of_node_rows != shape[0]) or \
         (grid.number_of_node_columns != shape[1]):
@@ -458,7 +609,7 @@ def read_esri_ascii(asc_file, grid=None, reshape=False, name=None, halo=0):
     return (grid, data)
 
 
-def write_esri_ascii(path, fields, names=None, clobber=False):
+def write_esri_ascii(path, fields, names=None, clobber=False, n_threads=1):
     """Write landlab fields to ESRI ASCII.
 
     Write the data and grid information for *fields* to *path* in the ESRI
@@ -476,6 +627,10 @@ def write_esri_ascii(path, fields, names=None, clobber=False):
     clobber : boolean
         If *path* exists, clobber the existing file, otherwise raise an
         exception.
+    n_threads : int, optional
+        Number of threads used to format the data. Values are formatted
+        without holding the GIL, so blocks of rows are formatted in
+        parallel.
 
     Examples
     --------
@@ -530,7 +685,8 @@ def write_esri_ascii(path, fields, names=None, clobber=False):
         header_lines = ['%s %s' % (key, str(val))
                         for key, val in list(header.items())]
         data = fields.at_node[name].reshape(header['nrows'], header['ncols'])
-        np.savetxt(path, np.flipud(data), header=os.linesep.join(header_lines),
-                   comments='')
+        with open(path, 'wb') as asc_file:
+            asc_file.write((os.linesep.join(header_lines) + '\n').encode())
+            _write_asc_data(asc_file, np.flipud(data), n_threads=n_threads)
 
     return paths
@@ -1,5 +1,5 @@
 #! /usr/bin/env python
-"""Read data from a pickled Landlab grid file into a RasterModelGrid.
+"""Read and write Landlab grids in Landlab's native format.
 
 Read Landlab native
 +++++++++++++++++++
@@ -9,26 +9,243 @@ Read Landlab native
 
     ~landlab.io.native_landlab.load_grid
     ~landlab.io.native_landlab.save_grid
+
+A native grid file holds only what is needed to rebuild a grid: the
+parameters that define it, the status of its nodes, and its fields.
+Connectivity is rebuilt when the grid is loaded, rather than stored.
+
+The file starts with an 8 byte magic string, followed by the length of a
+JSON header as a little-endian 32 bit unsigned integer, and then the
+header. The header gives the format version, the type of grid and its
+parameters, and the data type, shape and offset (in bytes, from the start
+of the file) of each array. The raw array data follow the header, each
+array starting at a multiple of 64 bytes so that it can be memory-mapped.
+
+Files written by earlier versions of Landlab, which pickled the grid, can
+still be read.
 """
 
 import os
+import json
+import struct
+
+import numpy as np
 from six.moves import cPickle
+
 from landlab import ModelGrid
 
 
+_MAGIC = b'\x93LANDLAB'
+_FORMAT_VERSION = 1
+_ALIGNMENT = 64
+
+
+def _raster_params(grid):
+    return {'shape': list(grid.shape), 'spacing': [grid.dy, grid.dx],
+            'origin': [float(grid.node_x[0]), float(grid.node_y[0])]}, {}
+
+
+def _raster_from_params(params, arrays):
+    from landlab import RasterModelGrid
+
+    grid = RasterModelGrid(params['shape'], spacing=params['spacing'])
+    if any(params['origin']):
+        grid.move_origin(params['origin'])
+    return grid
+
+
+def _hex_params(grid):
+    if hasattr(grid, '_shape'):
+        shape = 'rect'
+        (base_num_rows, base_num_cols) = grid._shape
+    elif grid.orientation == 'horizontal':
+        shape = 'hex'
+        base_num_rows = grid._nrows
+        base_num_cols = int(np.sum(grid.node_y == grid.node_y.min()))
+    else:
+        shape = 'hex'
+        base_num_rows = int(np.sum(grid.node_x == grid.node_x.min()))
+        base_num_cols = grid._ncols
+    return {'base_num_rows': int(base_num_rows),
+            'base_num_cols': int(base_num_cols), 'dx': grid._dx,
+            'orientation': grid.orientation, 'shape': shape}, {}
+
+
+def _hex_from_params(params, arrays):
+    from landlab import HexModelGrid
+
+    return HexModelGrid(**params)
+
+
+def _radial_params(grid):
+    return {'num_shells': grid._n_shells, 'dr': grid._dr,
+            'origin_x': grid._origin_x, 'origin_y': grid._origin_y}, {}
+
+
+def _radial_from_params(params, arrays):
+    from landlab import RadialModelGrid
+
+    return RadialModelGrid(**params)
+
+
+def _voronoi_params(grid):
+    return {}, {'x': grid.node_x, 'y': grid.node_y}
+
+
+def _voronoi_from_params(params, arrays):
+    from landlab import VoronoiDelaunayGrid
+
+    return VoronoiDelaunayGrid(np.array(arrays['x']), np.array(arrays['y']))
+
+
+_GRID_TYPES = {
+    'RasterModelGrid': (_raster_params, _raster_from_params),
+    'HexModelGrid': (_hex_params, _hex_from_params),
+    'RadialModelGrid': (_radial_params, _radial_from_params),
+    'VoronoiDelaunayGrid': (_voronoi_params, _voronoi_from_params),
+}
+
+
+def _native_grid_type(grid):
+    """Name of the grid type *grid* is saved as, or None if it can't be.
+
+    A subclass of one of the grid types is saved as that type.
+    """
+    from landlab import (RasterModelGrid, HexModelGrid, RadialModelGrid,
+                         VoronoiDelaunayGrid)
+
+    native_types = (RasterModelGrid, HexModelGrid, RadialModelGrid,
+                    VoronoiDelaunayGrid)
+    for cls in type(grid).__mro__:
+        if cls in native_types:
+            return cls.__name__
+    return None
+
+
+def _add_grid_suffix(path):
+    (base, ext) = os.path.splitext(path)
+    if ext != '.grid':
+        ext = ext + '.grid'
+    return base + ext
+
+
+def _aligned(offset):
+    return - (- offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _write_native(grid, path, grid_type):
+    params, grid_arrays = _GRID_TYPES[grid_type][0](grid)
+
+    arrays = []
+    for name, values in grid_arrays.items():
+        arrays.append(('grid', name, None, values))
+    arrays.append(('status', 'status_at_node', None, grid.status_at_node))
+    for group in sorted(grid.groups):
+        for name in sorted(grid[group].keys()):
+            arrays.append(('field', name, group, grid[group][name]))
+
+    entries = []
+    for (kind, name, group, values) in arrays:
+        values = np.ascontiguousarray(values)
+        if values.dtype.hasobject:
+            raise TypeError('{name}: arrays of objects cannot be '
+                            'saved'.format(name=name))
+        entry = {'kind': kind, 'name': name, 'dtype': values.dtype.str,
+                 'shape': list(values.shape)}
+        if kind == 'field':
+            entry['at'] = group
+            entry['units'] = grid[group].units[name]
+        entries.append((entry, values))
+
+    header = {'version': _FORMAT_VERSION, 'grid_type': grid_type,
+              'params': params, 'arrays': [entry for entry, _ in entries]}
+
+    # The offsets are part of the header, so its length must be known to
+    # place the arrays. Reserve space for the offsets, then fill them in.
+    for entry, _ in entries:
+        entry['offset'] = 0
+    header_size = len(json.dumps(header).encode('utf-8'))
+    data_start = _aligned(len(_MAGIC) + 4 + header_size +
+                          len(entries) * 20 + _ALIGNMENT)
+    offset = data_start
+    for entry, values in entries:
+        entry['offset'] = offset
+        offset = _aligned(offset + values.nbytes)
+
+    header_bytes = json.dumps(header).encode('utf-8')
+    header_bytes += b' ' * (data_start - len(_MAGIC) - 4 - len(header_bytes))
+
+    with open(path, 'wb') as file_like:
+        file_like.write(_MAGIC)
+        file_like.write(struct.pack('<I', len(header_bytes)))
+        file_like.write(header_bytes)
+        for entry, values in entries:
+            file_like.seek(entry['offset'])
+            file_like.write(values.tobytes())
+        file_like.truncate(offset)
+
+
+def _read_native_header(file_like):
+    (header_size, ) = struct.unpack('<I', file_like.read(4))
+    header = json.loads(file_like.read(header_size).decode('utf-8'))
+    if header['version'] > _FORMAT_VERSION:
+        raise ValueError(
+            'native grid format version {version} is newer than this '
+            'version of landlab can read ({supported})'.format(
+                version=header['version'], supported=_FORMAT_VERSION))
+    return header
+
+
+def _read_native(path, mmap_mode=None):
+    with open(path, 'rb') as file_like:
+        file_like.seek(len(_MAGIC))
+        header = _read_native_header(file_like)
+
+        def read_array(entry, mmap_mode=None):
+            dtype = np.dtype(str(entry['dtype']))
+            shape = tuple(entry['shape'])
+            if mmap_mode is not None:
+                return np.memmap(path, dtype=dtype, mode=mmap_mode,
+                                 offset=entry['offset'], shape=shape)
+            file_like.seek(entry['offset'])
+            count = int(np.prod(shape))
+            return np.fromfile(file_like, dtype=dtype,
+                               count=count).reshape(shape)
+
+        grid_arrays = dict((entry['name'], read_array(entry))
+                           for entry in header['arrays']
+                           if entry['kind'] == 'grid')
+        try:
+            from_params = _GRID_TYPES[header['grid_type']][1]
+        except KeyError:
+            raise ValueError('{grid_type}: unknown grid type'.format(
+                grid_type=header['grid_type']))
+        grid = from_params(header['params'], grid_arrays)
+
+        for entry in header['arrays']:
+            if entry['kind'] == 'status':
+                status = read_array(entry)
+                if not np.array_equal(status, grid.status_at_node):
+                    grid.status_at_node = status
+            elif entry['kind'] == 'field':
+                grid.add_field(entry['at'], entry['name'],
+                               read_array(entry, mmap_mode=mmap_mode),
+                               units=entry['units'], noclobber=False)
+    return grid
+
+
 def save_grid(grid, path, clobber=False):
     """Save a grid and fields to a Landlab "native" format.
 
-    This method uses cPickle to save a grid as a cPickle file.
-    All fields will be saved, along with the grid.
+    The grid is saved as the parameters that define it, the status of its
+    nodes, and its fields. All fields will be saved, along with the grid.
+    Raster, hex, radial and Voronoi-Delaunay grids, and their subclasses,
+    are saved this way; a subclass is loaded as the grid type it derives
+    from. Any other type of grid is pickled.
 
     The recommended suffix for the save file is '.grid'. This will
     be added to your save if you don't include it.
 
-    Caution: Pickling can be slow, and can produce very large files.
-    Caution 2: Future updates to Landlab could potentially render old
-    saves unloadable.
-
     Parameters
     ----------
     grid : object of subclass ModelGrid
@@ -53,30 +270,30 @@ def save_grid(grid, path, clobber=False):
     # test it's a grid
     assert issubclass(type(grid), ModelGrid)
 
-    (base, ext) = os.path.splitext(path)
-    if ext != '.grid':
-        ext = ext + '.grid'
-    path = base + ext
-
-    with open(path, 'wb') as file_like:
-        cPickle.dump(grid, file_like)
+    path = _add_grid_suffix(path)
+    grid_type = _native_grid_type(grid)
+    if grid_type is None:
+        with open(path, 'wb') as file_like:
+            cPickle.dump(grid, file_like)
+    else:
+        _write_native(grid, path, grid_type)
 
 
-def load_grid(path):
+def load_grid(path, mmap_mode=None):
     """Load a grid and its fields from a Landlab "native" format.
 
-    This method uses cPickle to load a saved grid.
-    It assumes you saved using vmg.save() or save_grid, i.e., that the
-    pickle file is a .grid file.
-
-    Caution: Pickling can be slow, and can produce very large files.
-    Caution 2: Future updates to Landlab could potentially render old
-    saves unloadable.
+    It assumes you saved using save_grid, i.e., that the file is a .grid
+    file. The grid's connectivity is rebuilt from its parameters. Grids
+    pickled by earlier versions of Landlab can also be loaded.
 
     Parameters
     ----------
     path : str
         Path to output file, either without suffix, or '.grid'
+    mmap_mode : {None, 'r', 'r+', 'c'}, optional
+        If given, memory-map the fields from the file, with this mode (see
+        *numpy.memmap*), rather than reading them into memory. With 'r',
+        the fields are read-only.
 
     Examples
     --------
@@ -87,14 +304,30 @@ def load_grid(path):
     >>> x = np.random.rand(20)
     >>> y = np.random.rand(20)
     >>> grid_out = VoronoiDelaunayGrid(x, y)
+    >>> _ = grid_out.add_field('node', 'topographic__elevation', x + y,
+    ...                        units='m')
     >>> save_grid(grid_out, 'testsavedgrid.grid', clobber=True)
     >>> grid_in = load_grid('testsavedgrid.grid')
+    >>> np.all(grid_in.at_node['topographic__elevation'] == x + y)
+    True
+    >>> grid_in.at_node.units['topographic__elevation']
+    'm'
+
+    Fields can be memory-mapped rather than read.
+
+    >>> grid_in = load_grid('testsavedgrid.grid', mmap_mode='r')
+    >>> grid_in.at_node['topographic__elevation'].flags.writeable
+    False
+    >>> del grid_in
     >>> os.remove('testsavedgrid.grid') #to remove traces of this test
     """
-    (base, ext) = os.path.splitext(path)
-    if ext != '.grid':
-        ext = ext + '.grid'
-    path = base + ext
+    path = _add_grid_suffix(path)
+    with open(path, 'rb') as file_like:
+        is_native = file_like.read(len(_MAGIC)) == _MAGIC
+
+    if is_native:
+        return _read_native(path, mmap_mode=mmap_mode)
+
     with open(path, 'rb') as file_like:
         loaded_grid = cPickle.load(file_like)
     assert issubclass(type(loaded_grid), ModelGrid)
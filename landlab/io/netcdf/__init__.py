@@ -1,7 +1,7 @@
 import os
 
 from .read import read_netcdf
-from .write import write_netcdf
+from .write import write_netcdf, NetcdfTimeSeriesWriter
 from .errors import NotRasterGridError
 
 try:
@@ -18,6 +18,7 @@ NETCDF4_EXAMPLE_FILE = os.path.join(os.path.dirname(__file__), 'tests', 'data',
 NETCDF3_64BIT_EXAMPLE_FILE = os.path.join(os.path.dirname(__file__), 'tests',
                                           'data', 'test-netcdf3-64bit.nc')
 
-__all__ = ('read_netcdf', 'write_netcdf', 'NotRasterGridError',
+__all__ = ('read_netcdf', 'write_netcdf', 'NetcdfTimeSeriesWriter',
+           'NotRasterGridError',
            'WITH_NETCDF4', 'NETCDF4_EXAMPLE_FILE',
            'NETCDF3_64BIT_EXAMPLE_FILE')
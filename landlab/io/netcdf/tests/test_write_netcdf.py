@@ -301,3 +301,123 @@ def test_netcdf_write_at_cells():
                      set(['x_bnds', 'y_bnds', 'topographic__elevation',
                           'uplift_rate']))
         root.close()
+
+
+def _write_time_series(path, grid, n_times, **kwds):
+    from landlab.io.netcdf import NetcdfTimeSeriesWriter
+
+    with NetcdfTimeSeriesWriter(path, grid, **kwds) as writer:
+        for time in range(n_times):
+            for name in grid.at_node:
+                grid.at_node[name] += 1
+            writer.write(time=time * .5)
+    return writer
+
+
+def test_time_series_writer():
+    """Test NetcdfTimeSeriesWriter writes a slice per call."""
+    if not WITH_NETCDF4:
+        raise SkipTest('netCDF4 package not installed')
+
+    grid = RasterModelGrid((4, 3))
+    grid.add_field('node', 'topographic__elevation', np.arange(12.),
+                   units='m')
+    grid.add_field('node', 'soil__depth', np.arange(12, dtype=np.int32))
+
+    with cdtemp() as _:
+        writer = _write_time_series('test.nc', grid, 7, buffer_size=3)
+        assert_equal(writer.number_of_times, 7)
+
+        root = nc.Dataset('test.nc', 'r')
+        assert_true(root.dimensions['nt'].isunlimited())
+        assert_equal(len(root.dimensions['nt']), 7)
+        assert_array_equal(root.variables['t'][:], np.arange(7) * .5)
+        assert_array_equal(np.ravel(root.variables['x'][:]), grid.node_x)
+        assert_array_equal(np.ravel(root.variables['y'][:]), grid.node_y)
+        for time in range(7):
+            assert_array_equal(
+                np.ravel(root.variables['topographic__elevation'][time]),
+                np.arange(12.) + time + 1)
+            assert_array_equal(np.ravel(root.variables['soil__depth'][time]),
+                               np.arange(12) + time + 1)
+        assert_equal(root.variables['soil__depth'].dtype, 'int32')
+        assert_equal(root.variables['topographic__elevation'].units, 'm')
+        root.close()
+
+
+def test_time_series_writer_compressed():
+    """Test NetcdfTimeSeriesWriter with compression and chunking."""
+    if not WITH_NETCDF4:
+        raise SkipTest('netCDF4 package not installed')
+
+    grid = RasterModelGrid((5, 4))
+    grid.add_field('node', 'topographic__elevation', np.zeros(20))
+
+    with cdtemp() as _:
+        _write_time_series('test.nc', grid, 4, zlib=True, complevel=6,
+                           chunksizes=(2, 5, 4))
+
+        root = nc.Dataset('test.nc', 'r')
+        var = root.variables['topographic__elevation']
+        assert_equal(var.chunking(), [2, 5, 4])
+        assert_true(var.filters()['zlib'])
+        assert_array_equal(var[:, 2, 2], [1., 2., 3., 4.])
+        root.close()
+
+
+def test_time_series_writer_netcdf3():
+    """Test NetcdfTimeSeriesWriter with netcdf3 output."""
+    from scipy.io import netcdf
+
+    grid = RasterModelGrid((4, 3))
+    grid.add_field('node', 'topographic__elevation', np.arange(12.))
+
+    with cdtemp() as _:
+        _write_time_series('test.nc', grid, 5, format='NETCDF3_64BIT',
+                           buffer_size=2)
+
+        f = netcdf.netcdf_file('test.nc', 'r')
+        assert_array_equal(f.variables['t'][:], np.arange(5) * .5)
+        assert_array_equal(f.variables['topographic__elevation'][4].flat,
+                           np.arange(12.) + 5)
+        f.close()
+
+
+def test_time_series_writer_at_cells():
+    """Test NetcdfTimeSeriesWriter with cell fields."""
+    if not WITH_NETCDF4:
+        raise SkipTest('netCDF4 package not installed')
+
+    from landlab.io.netcdf import NetcdfTimeSeriesWriter
+
+    grid = RasterModelGrid((4, 3))
+    grid.add_field('cell', 'air__temperature', np.arange(2.))
+
+    with cdtemp() as _:
+        with NetcdfTimeSeriesWriter('test.nc', grid, at='cell') as writer:
+            writer.write()
+            grid.at_cell['air__temperature'] *= 2.
+            writer.write()
+
+        root = nc.Dataset('test.nc', 'r')
+        assert_array_equal(root.variables['t'][:], [0., 1.])
+        assert_array_equal(np.ravel(root.variables['air__temperature'][1]),
+                           [0., 2.])
+        assert_true('x_bnds' in root.variables)
+        root.close()
+
+
+def test_time_series_writer_bad_options():
+    """Test NetcdfTimeSeriesWriter rejects bad options."""
+    from landlab.io.netcdf import NetcdfTimeSeriesWriter
+
+    grid = RasterModelGrid((4, 3))
+    grid.add_field('node', 'topographic__elevation', np.arange(12.))
+
+    with cdtemp() as _:
+        assert_raises(ValueError, NetcdfTimeSeriesWriter, 'test.nc', grid,
+                      format='NETCDF3_64BIT', zlib=True)
+        assert_raises(ValueError, NetcdfTimeSeriesWriter, 'test.nc', grid,
+                      buffer_size=0)
+        assert_raises(ValueError, NetcdfTimeSeriesWriter, 'test.nc', grid,
+                      format='HDF5')
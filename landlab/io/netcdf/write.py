@@ -8,6 +8,7 @@ Write netcdf
     :toctree: generated/
 
     ~landlab.io.netcdf.write.write_netcdf
+    ~landlab.io.netcdf.write.NetcdfTimeSeriesWriter
 """
 
 
@@ -579,3 +580,209 @@ def write_netcdf(path, fields, attrs=None, append=False,
         _set_netcdf_cell_variables(root, fields, names=names)
 
     root.close()
+
+
+def _open_netcdf(path, mode, format):
+    """Open a NetCDF file for writing, preferably with netCDF4."""
+    try:
+        return nc4.Dataset(path, mode, format=format)
+    except NameError:
+        if format == 'NETCDF3_CLASSIC':
+            return nc.netcdf_file(path, mode, version=1)
+        elif format == 'NETCDF3_64BIT':
+            return nc.netcdf_file(path, mode, version=2)
+        raise
+
+
+class NetcdfTimeSeriesWriter(object):
+
+    """Write a time series of landlab fields to netcdf.
+
+    The file is created, and its dimensions and variables defined, once.
+    Each call to *write* then adds the current values of the fields as a
+    new time slice along the unlimited time dimension, ``nt``. Time slices
+    are kept in memory until *buffer_size* of them have been collected, and
+    are then written together.
+
+    Parameters
+    ----------
+    path : str
+        Path to output file.
+    grid : RasterModelGrid
+        Grid that holds the fields.
+    names : iterable of str, optional
+        Names of the fields to include in the netcdf file. If not provided,
+        write all fields.
+    at : {'node', 'cell'}, optional
+        The location where values are defined.
+    format : {'NETCDF3_CLASSIC', 'NETCDF3_64BIT', 'NETCDF4_CLASSIC', 'NETCDF4'}
+        Format of output netcdf file.
+    attrs : dict, optional
+        Attributes to add to netcdf file.
+    buffer_size : int, optional
+        Number of time slices to collect before they are written.
+    time_units : str, optional
+        Units of time.
+    time_reference : str, optional
+        Reference time.
+    zlib : boolean, optional
+        Compress variables (NETCDF4 formats only).
+    complevel : int, optional
+        Level of compression, from 1 to 9.
+    chunksizes : tuple of int, optional
+        Chunk shapes of the field variables, including the time dimension
+        (NETCDF4 formats only). By default, a chunk is one time slice.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.io.netcdf import NetcdfTimeSeriesWriter
+
+    >>> rmg = RasterModelGrid(4, 3)
+    >>> z = rmg.add_zeros('node', 'topographic__elevation')
+
+    >>> import tempfile, os
+    >>> temp_dir = tempfile.mkdtemp()
+    >>> os.chdir(temp_dir)
+
+    Write the elevations every step of a model run, two steps at a time.
+
+    >>> with NetcdfTimeSeriesWriter('test.nc', rmg, buffer_size=2,
+    ...                             zlib=True) as writer:
+    ...     for time in range(5):
+    ...         z += 1.
+    ...         writer.write(time=time * 10.)
+
+    >>> from netCDF4 import Dataset
+    >>> root = Dataset('test.nc')
+    >>> np.asarray(root.variables['t'][:])
+    array([  0.,  10.,  20.,  30.,  40.])
+    >>> np.asarray(root.variables['topographic__elevation'][:, 0, 0])
+    array([ 1.,  2.,  3.,  4.,  5.])
+    >>> root.close()
+    """
+
+    def __init__(self, path, grid, names=None, at=None, format='NETCDF4',
+                 attrs=None, buffer_size=1, time_units='days',
+                 time_reference='00:00:00 UTC', zlib=False, complevel=4,
+                 chunksizes=None):
+        if format not in _VALID_NETCDF_FORMATS:
+            raise ValueError('format not understood')
+        if at not in (None, 'cell', 'node'):
+            raise ValueError('value location not understood')
+        if buffer_size < 1:
+            raise ValueError('buffer size must be at least one')
+        is_netcdf4 = format.startswith('NETCDF4')
+        if (zlib or chunksizes is not None) and not is_netcdf4:
+            raise ValueError('compression and chunking need a NETCDF4 format')
+
+        if isinstance(names, six.string_types):
+            names = (names, )
+
+        at = at or _guess_at_location(grid, names) or 'node'
+        names = list(names or grid[at].keys())
+
+        if not set(grid[at].keys()).issuperset(names):
+            raise ValueError('values must be on either cells or nodes, '
+                             'not both')
+
+        root = _open_netcdf(path, 'w', format)
+        _set_netcdf_attributes(root, attrs or {})
+        if at == 'node':
+            _set_netcdf_structured_dimensions(root, grid.shape)
+            _add_spatial_variables(root, grid)
+            shape = tuple(grid.shape)
+        else:
+            _set_netcdf_cell_structured_dimensions(root, grid.shape)
+            _add_cell_spatial_variables(root, grid)
+            shape = tuple(dim - 2 for dim in grid.shape)
+        dimensions = ['nt'] + _get_dimension_names(shape)
+
+        time_var = root.createVariable('t', 'f8', ('nt', ))
+        time_var.units = ' '.join([time_units, 'since', time_reference])
+        time_var.long_name = 'time'
+
+        options = {}
+        if is_netcdf4:
+            options = {'zlib': zlib, 'complevel': complevel,
+                       'chunksizes': chunksizes or (1, ) + shape}
+
+        self._buffers = {}
+        for name in names:
+            dtype = grid[at][name].dtype
+            if dtype == bool:
+                dtype = np.dtype(np.int8)
+            var = root.createVariable(name, _NP_TO_NC_TYPE[str(dtype)],
+                                      dimensions, **options)
+            var.units = grid[at].units[name] or '?'
+            var.long_name = name
+            self._buffers[name] = np.empty((buffer_size, ) + shape,
+                                           dtype=dtype)
+
+        self._root = root
+        self._grid = grid
+        self._at = at
+        self._names = names
+        self._shape = shape
+        self._times = np.empty(buffer_size)
+        self._n_buffered = 0
+        self._n_written = 0
+
+    @property
+    def number_of_times(self):
+        """Number of time slices written, or waiting to be written."""
+        return self._n_written + self._n_buffered
+
+    def write(self, time=None):
+        """Add the current values of the fields as a new time slice.
+
+        Parameters
+        ----------
+        time : float, optional
+            Time of the slice. If not given, the index of the slice.
+        """
+        row = self._n_buffered
+        for name in self._names:
+            self._buffers[name][row] = (
+                self._grid[self._at][name].reshape(self._shape))
+        if time is None:
+            time = self.number_of_times
+        self._times[row] = time
+        self._n_buffered += 1
+
+        if self._n_buffered == len(self._times):
+            self.flush()
+
+    def flush(self):
+        """Write any buffered time slices to the file."""
+        n_slices, start = self._n_buffered, self._n_written
+        if n_slices == 0:
+            return
+
+        netcdf_vars = self._root.variables
+        netcdf_vars['t'][start:start + n_slices] = self._times[:n_slices]
+        for name in self._names:
+            netcdf_vars[name][start:start + n_slices] = (
+                self._buffers[name][:n_slices])
+
+        self._n_written += n_slices
+        self._n_buffered = 0
+
+        try:
+            self._root.sync()
+        except AttributeError:
+            pass
+
+    def close(self):
+        """Write any buffered time slices, and close the file."""
+        if self._root is not None:
+            self.flush()
+            self._root.close()
+            self._root = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
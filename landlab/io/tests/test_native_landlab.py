@@ -0,0 +1,143 @@
+#! /usr/bin/env python
+import numpy as np
+from numpy.testing import assert_array_equal
+from nose.tools import assert_equal, assert_false, assert_raises
+
+from six.moves import cPickle
+
+from landlab.testing.tools import cdtemp
+from landlab.io.native_landlab import save_grid, load_grid
+from landlab import (RasterModelGrid, HexModelGrid, RadialModelGrid,
+                     VoronoiDelaunayGrid, CLOSED_BOUNDARY)
+
+
+def _assert_grids_equal(actual, expected):
+    assert_equal(type(actual), type(expected))
+    assert_array_equal(actual.node_x, expected.node_x)
+    assert_array_equal(actual.node_y, expected.node_y)
+    assert_array_equal(actual.status_at_node, expected.status_at_node)
+    assert_array_equal(actual.node_at_link_tail, expected.node_at_link_tail)
+    assert_array_equal(actual.node_at_link_head, expected.node_at_link_head)
+    assert_array_equal(actual.active_links, expected.active_links)
+    assert_equal(actual.groups, expected.groups)
+    for group in expected.groups:
+        assert_equal(set(actual[group].keys()), set(expected[group].keys()))
+        for name in expected[group]:
+            assert_array_equal(actual[group][name], expected[group][name])
+            assert_equal(actual[group][name].dtype,
+                         expected[group][name].dtype)
+            assert_equal(actual[group].units[name],
+                         expected[group].units[name])
+
+
+def _check_round_trip(grid):
+    grid.add_field('node', 'topographic__elevation',
+                   np.arange(grid.number_of_nodes, dtype=float), units='m')
+    grid.add_field('link', 'water__discharge',
+                   np.arange(grid.number_of_links, dtype=np.int32))
+    with cdtemp() as _:
+        save_grid(grid, 'test.grid')
+        _assert_grids_equal(load_grid('test.grid'), grid)
+
+
+def test_raster_round_trip():
+    grid = RasterModelGrid((4, 5), spacing=(2., 3.))
+    grid.move_origin((10., 5.))
+    grid.status_at_node[[6, 7]] = CLOSED_BOUNDARY
+    _check_round_trip(grid)
+
+
+def test_hex_round_trip():
+    for orientation in ('horizontal', 'vertical'):
+        for shape in ('hex', 'rect'):
+            _check_round_trip(HexModelGrid(4, 3, 2., orientation=orientation,
+                                           shape=shape))
+
+
+def test_radial_round_trip():
+    _check_round_trip(RadialModelGrid(3, 2.))
+
+
+def test_voronoi_round_trip():
+    x, y = np.random.rand(2, 30)
+    _check_round_trip(VoronoiDelaunayGrid(x, y))
+
+
+def test_suffix_added():
+    grid = RasterModelGrid((4, 5))
+    with cdtemp() as _:
+        save_grid(grid, 'test')
+        _assert_grids_equal(load_grid('test.grid'), grid)
+        _assert_grids_equal(load_grid('test'), grid)
+
+
+def test_no_clobber():
+    grid = RasterModelGrid((4, 5))
+    with cdtemp() as _:
+        save_grid(grid, 'test.grid')
+        assert_raises(ValueError, save_grid, grid, 'test.grid')
+        save_grid(grid, 'test.grid', clobber=True)
+
+
+def test_memory_mapped_fields():
+    grid = RasterModelGrid((4, 5))
+    grid.add_field('node', 'topographic__elevation', np.arange(20.))
+    with cdtemp() as _:
+        save_grid(grid, 'test.grid')
+        loaded = load_grid('test.grid', mmap_mode='r')
+        elevation = loaded.at_node['topographic__elevation']
+        assert_array_equal(elevation, np.arange(20.))
+        assert_false(elevation.flags.writeable)
+        del loaded, elevation
+
+
+def test_array_offsets_are_aligned():
+    from landlab.io.native_landlab import _MAGIC, _read_native_header
+
+    grid = RasterModelGrid((4, 5))
+    grid.add_field('node', 'topographic__elevation', np.arange(20.))
+    grid.add_field('cell', 'soil__depth', np.ones(6, dtype=np.float32))
+    with cdtemp() as _:
+        save_grid(grid, 'test.grid')
+        with open('test.grid', 'rb') as file_like:
+            assert_equal(file_like.read(len(_MAGIC)), _MAGIC)
+            header = _read_native_header(file_like)
+    assert_equal(header['grid_type'], 'RasterModelGrid')
+    for entry in header['arrays']:
+        assert_equal(entry['offset'] % 64, 0)
+
+
+def test_load_pickled_grid():
+    grid = RasterModelGrid((4, 5))
+    with cdtemp() as _:
+        with open('test.grid', 'wb') as file_like:
+            cPickle.dump(grid, file_like)
+        _assert_grids_equal(load_grid('test.grid'), grid)
+
+
+class _MyRasterGrid(RasterModelGrid):
+    pass
+
+
+class _MyHexGrid(HexModelGrid):
+    pass
+
+
+def test_subclass_round_trip():
+    from landlab.io.native_landlab import _MAGIC
+
+    for grid in (_MyRasterGrid((4, 5), spacing=2.), _MyHexGrid(4, 3, 2.)):
+        grid.status_at_node[[5, 6]] = CLOSED_BOUNDARY
+        grid.add_field('node', 'topographic__elevation',
+                       np.arange(grid.number_of_nodes, dtype=float))
+        with cdtemp() as _:
+            save_grid(grid, 'test.grid')
+            with open('test.grid', 'rb') as file_like:
+                assert_equal(file_like.read(len(_MAGIC)), _MAGIC)
+            grid_in = load_grid('test.grid')
+        assert_equal(type(grid_in), type(grid).__bases__[0])
+        assert_array_equal(grid_in.node_x, grid.node_x)
+        assert_array_equal(grid_in.node_y, grid.node_y)
+        assert_array_equal(grid_in.status_at_node, grid.status_at_node)
+        assert_array_equal(grid_in.at_node['topographic__elevation'],
+                           grid.at_node['topographic__elevation'])
@@ -324,5 +324,63 @@ def test_halo_keyword_no_nodata_value():
                                  -9999., -9999., -9999., -9999., -9999.]))
 
 
+def test_window_keywords():
+    (grid, field) = read_esri_ascii(os.path.join(_TEST_DATA_DIR,
+                                                 '4_x_3.asc'),
+                                    rows=(1, 4), cols=(0, 3))
+
+    assert_equal(grid.shape, (3, 3))
+    assert_array_equal(field, [6., 7., 8., 3., 4., 5., 0., 1., 2.])
+
+
+def test_window_keywords_with_halo():
+    (grid, field) = read_esri_ascii(os.path.join(_TEST_DATA_DIR,
+                                                 '4_x_3.asc'),
+                                    rows=(0, 3), cols=(1, 3), halo=1,
+                                    reshape=True)
+
+    assert_equal(grid.shape, (5, 4))
+    assert_array_equal(field,
+                       [[-9999., -9999., -9999., -9999.],
+                        [-9999.,    10.,    11., -9999.],
+                        [-9999.,     7.,     8., -9999.],
+                        [-9999.,     4.,     5., -9999.],
+                        [-9999., -9999., -9999., -9999.]])
+
+
+def test_window_outside_of_data():
+    assert_raises(ValueError, read_esri_ascii,
+                  os.path.join(_TEST_DATA_DIR, '4_x_3.asc'), rows=(2, 5))
+    assert_raises(ValueError, read_esri_ascii,
+                  os.path.join(_TEST_DATA_DIR, '4_x_3.asc'), cols=(2, 2))
+
+
+def test_read_in_chunks():
+    from landlab.io.esri_ascii import _read_asc_data
+
+    values = np.arange(5 * 7.) / 3.
+    text = '\n'.join(' '.join(repr(x) for x in row)
+                     for row in values.reshape((5, 7)))
+
+    for chunk_size in (1, 5, 64, len(text)):
+        data = _read_asc_data(StringIO(text), (5, 7), chunk_size=chunk_size)
+        assert_array_equal(data, values.reshape((5, 7))[::-1])
+
+
+def test_bad_value():
+    asc_file = StringIO("""
+nrows         4
+ncols         3
+xllcorner     1.
+yllcorner     2.
+cellsize      10.
+0. 1. 2.
+3. 4. 5.
+6. 7. x
+9. 10. 11.
+""")
+    assert_raises(ValueError, read_esri_ascii, asc_file)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,8 +2,9 @@
 import os
 
 import numpy as np
+from six import BytesIO
 from numpy.testing import assert_array_almost_equal
-from nose.tools import assert_true, assert_equal, assert_raises
+from nose.tools import assert_true, assert_false, assert_equal, assert_raises
 try:
     from nose.tools import assert_list_equal
 except ImportError:
@@ -110,3 +111,64 @@ def test_write_then_read():
     assert_array_almost_equal(grid.node_x, new_grid.node_x)
     assert_array_almost_equal(grid.node_y, new_grid.node_y)
     assert_array_almost_equal(field, grid.at_node['air__temperature'])
+
+
+def test_write_same_as_savetxt():
+    grid = RasterModelGrid((4, 5), spacing=(2., 2.))
+    values = grid.add_field('node', 'air__temperature',
+                            np.random.uniform(-1e6, 1e6, 20))
+    values[3] = np.nan
+
+    with cdtemp() as _:
+        write_esri_ascii('test.asc', grid)
+        np.savetxt('test.txt', np.flipud(values.reshape((4, 5))))
+        with open('test.asc', 'rb') as asc_file:
+            lines = asc_file.read().splitlines(True)
+        with open('test.txt', 'rb') as txt_file:
+            assert_equal(b''.join(lines[5:]), txt_file.read())
+
+
+def test_write_special_values():
+    grid = RasterModelGrid((4, 5), spacing=(2., 2.))
+    values = grid.add_field('node', 'air__temperature', np.arange(20.))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        values[:6] = (np.nan, np.copysign(np.nan, -1.), np.zeros(1) / 0.,
+                      -0., np.inf, -np.inf)
+
+    with cdtemp() as _:
+        write_esri_ascii('test.asc', grid)
+        np.savetxt('test.txt', np.flipud(values.reshape((4, 5))))
+        with open('test.asc', 'rb') as asc_file:
+            data = b''.join(asc_file.read().splitlines(True)[5:])
+        with open('test.txt', 'rb') as txt_file:
+            assert_equal(data, txt_file.read())
+        _, field = read_esri_ascii('test.asc')
+
+    assert_false(b'-nan' in data)
+    assert_true(np.all(np.isnan(field[:3])))
+    assert_equal(field[3], 0.)
+    assert_true(np.signbit(field[3]))
+    assert_equal(field[4], np.inf)
+    assert_equal(field[5], - np.inf)
+    assert_array_almost_equal(field[6:], values[6:])
+
+
+def test_write_with_threads():
+    from landlab.io.esri_ascii import _write_asc_data
+
+    values = np.random.uniform(-1e6, 1e6, (40, 6))
+    expected = BytesIO()
+    _write_asc_data(expected, values)
+
+    for n_threads in (1, 2, 4):
+        actual = BytesIO()
+        _write_asc_data(actual, values, n_threads=n_threads,
+                        values_per_block=18)
+        assert_equal(actual.getvalue(), expected.getvalue())
+
+    grid = RasterModelGrid((4, 5))
+    grid.add_field('node', 'air__temperature', np.arange(20.))
+    with cdtemp() as _:
+        write_esri_ascii('test.asc', grid, n_threads=2)
+        _, field = read_esri_ascii('test.asc')
+    assert_array_almost_equal(field, np.arange(20.))
@@ -0,0 +1,4 @@
+from .appended import write_vtk, VtkTimeSeriesWriter
+
+
+__all__ = ['write_vtk', 'VtkTimeSeriesWriter']
@@ -0,0 +1,530 @@
+#! /usr/bin/env python
+"""Write landlab grids to VTK XML files with appended binary data.
+
+Write VTK
++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.io.vtk.appended.write_vtk
+    ~landlab.io.vtk.appended.VtkTimeSeriesWriter
+
+Raster grids are written as VTK image data (``.vti``), and all other
+grids (or rasters, if asked) as unstructured grids (``.vtu``). Nodes are
+VTK points and patches are VTK cells, so node fields are written as point
+data and patch fields as cell data.
+
+Rather than building an XML document, the short XML header is written
+first and the arrays are then streamed to the file as raw binary data,
+appended after the header, and optionally compressed with zlib. A time
+series of files is tied together by a ParaView collection (``.pvd``) file.
+"""
+
+import os
+import sys
+import zlib
+from xml.sax.saxutils import quoteattr
+
+import numpy as np
+import six
+
+from landlab.io.vtk.vtktypes import (SYS_TO_VTK_ENDIAN, NUMPY_TO_VTK_TYPE,
+                                     EDGE_COUNT_TO_TYPE, VtkPolygon)
+
+
+# Number of bytes compressed at a time
+_BLOCK_SIZE = 2 ** 20
+
+
+def _as_vtk_array(array):
+    """Convert an array to one that can be written to a VTK file."""
+    array = np.asarray(array)
+    if array.dtype == bool:
+        array = array.astype(np.uint8)
+    array = np.ascontiguousarray(array,
+                                 dtype=array.dtype.newbyteorder('='))
+    if str(array.dtype) not in NUMPY_TO_VTK_TYPE:
+        raise TypeError('{dtype}: unable to write arrays of this type to '
+                        'VTK'.format(dtype=array.dtype))
+    return array
+
+
+def _encode_array(array, compress=False, level=6, block_size=_BLOCK_SIZE):
+    """Encode an array as a block of VTK appended data.
+
+    Parameters
+    ----------
+    array : ndarray
+        Contiguous array to encode.
+    compress : boolean, optional
+        Compress the data with zlib.
+    level : int, optional
+        Level of compression, from 1 to 9.
+    block_size : int, optional
+        Number of bytes to compress at a time.
+
+    Returns
+    -------
+    list of bytes-like
+        Header of the block, followed by the data.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.io.vtk.appended import _encode_array
+    >>> (header, data) = _encode_array(np.arange(3.))
+    >>> header.tolist()
+    [24]
+
+    Compressed data are split into blocks, each of which is compressed
+    separately. The header gives the number of blocks, the uncompressed
+    size of each block and of the last block, and the compressed size of
+    each block.
+
+    >>> blocks = _encode_array(np.arange(3.), compress=True, block_size=16)
+    >>> blocks[0].tolist()[:3]
+    [2, 16, 8]
+    >>> len(blocks)
+    3
+    """
+    data = array.reshape((-1, )).view(np.uint8)
+    if not compress:
+        return [np.array([data.size], dtype=np.uint64), data]
+
+    blocks = [zlib.compress(data[start:start + block_size].tobytes(), level)
+              for start in range(0, data.size, block_size)]
+    if len(blocks) > 0:
+        last_block_size = data.size - block_size * (len(blocks) - 1)
+    else:
+        last_block_size = 0
+    header = np.array([len(blocks), block_size, last_block_size] +
+                      [len(block) for block in blocks], dtype=np.uint64)
+    return [header] + blocks
+
+
+def _number_of_bytes(blocks):
+    return sum(block.nbytes if isinstance(block, np.ndarray) else len(block)
+               for block in blocks)
+
+
+class _AppendedData(object):
+
+    """Arrays to write as the appended data of a VTK file."""
+
+    def __init__(self, compress=False, level=6):
+        self._compress = compress
+        self._level = level
+        self._blocks = []
+        self._offset = 0
+
+    def encode(self, array):
+        """Encode an array, so that it can be added more than once.
+
+        Parameters
+        ----------
+        array : ndarray
+            Values of the array. Two dimensional arrays have a component
+            for each column.
+
+        Returns
+        -------
+        tuple
+            VTK type, number of components and encoded data of the array.
+        """
+        array = _as_vtk_array(array)
+        if array.ndim > 1:
+            n_components = array.shape[1]
+        else:
+            n_components = 1
+        return (NUMPY_TO_VTK_TYPE[str(array.dtype)], n_components,
+                _encode_array(array, compress=self._compress,
+                              level=self._level))
+
+    def add(self, name, array):
+        """Add an array, and return the XML that describes it.
+
+        Parameters
+        ----------
+        name : str
+            Name of the array.
+        array : ndarray or tuple
+            Values of the array, or the array as encoded by *encode*.
+
+        Returns
+        -------
+        str
+            XML DataArray element.
+        """
+        if isinstance(array, tuple):
+            (vtk_type, n_components, blocks) = array
+        else:
+            (vtk_type, n_components, blocks) = self.encode(array)
+
+        xml = ('<DataArray type="{type}" Name={name} NumberOfComponents='
+               '"{n_components}" format="appended" offset="{offset}"/>\n'
+               .format(type=vtk_type, name=quoteattr(name),
+                       n_components=n_components, offset=self._offset))
+
+        self._blocks.extend(blocks)
+        self._offset += _number_of_bytes(blocks)
+
+        return xml
+
+    def write(self, stream):
+        """Write the appended data to a binary stream."""
+        for block in self._blocks:
+            stream.write(block)
+
+
+def _vtk_file_tag(vtk_type, compress):
+    attrs = ('type="{type}" version="1.0" byte_order="{byte_order}" '
+             'header_type="UInt64"'.format(
+                 type=vtk_type,
+                 byte_order=SYS_TO_VTK_ENDIAN[sys.byteorder]))
+    if compress:
+        attrs += ' compressor="vtkZLibDataCompressor"'
+    return '<VTKFile {attrs}>\n'.format(attrs=attrs)
+
+
+def _data_xml(tag, fields, appended):
+    if len(fields) == 0:
+        return ''
+    return '<{tag}>\n{arrays}</{tag}>\n'.format(
+        tag=tag, arrays=''.join(appended.add(name, values)
+                                for (name, values) in fields))
+
+
+def _points_and_cells(grid):
+    """Points, cell connectivity, offsets and types of an unstructured grid.
+    """
+    points = np.zeros((grid.number_of_nodes, 3))
+    points[:, 0] = grid.node_x
+    points[:, 1] = grid.node_y
+
+    nodes_at_patch = np.asarray(grid.nodes_at_patch)
+    is_node = nodes_at_patch >= 0
+    connectivity = nodes_at_patch[is_node].astype(np.int64)
+    nodes_per_patch = is_node.sum(axis=1)
+    offsets = np.cumsum(nodes_per_patch, dtype=np.int64)
+
+    types = np.full(len(nodes_per_patch), int(VtkPolygon), dtype=np.uint8)
+    for (n_nodes, cell_type) in EDGE_COUNT_TO_TYPE.items():
+        types[nodes_per_patch == n_nodes] = int(cell_type)
+
+    return [('Points', points), ('connectivity', connectivity),
+            ('offsets', offsets), ('types', types)]
+
+
+def _write_image_data(stream, grid, point_data, cell_data, compress=False,
+                      level=6):
+    appended = _AppendedData(compress=compress, level=level)
+    extent = '0 {0} 0 {1} 0 0'.format(grid.number_of_node_columns - 1,
+                                      grid.number_of_node_rows - 1)
+    origin = '{0!r} {1!r} 0.0'.format(float(grid.node_x[0]),
+                                      float(grid.node_y[0]))
+    spacing = '{0!r} {1!r} 1.0'.format(float(grid.dx), float(grid.dy))
+
+    xml = [
+        '<?xml version="1.0"?>\n',
+        _vtk_file_tag('ImageData', compress),
+        '<ImageData WholeExtent="{extent}" Origin="{origin}" '
+        'Spacing="{spacing}">\n'.format(extent=extent, origin=origin,
+                                        spacing=spacing),
+        '<Piece Extent="{extent}">\n'.format(extent=extent),
+        _data_xml('PointData', point_data, appended),
+        _data_xml('CellData', cell_data, appended),
+        '</Piece>\n',
+        '</ImageData>\n',
+    ]
+    _write_xml_and_appended_data(stream, xml, appended)
+
+
+def _write_unstructured_grid(stream, grid, point_data, cell_data,
+                             compress=False, level=6, geometry=None):
+    appended = _AppendedData(compress=compress, level=level)
+    geometry = geometry or dict(
+        (name, appended.encode(values))
+        for (name, values) in _points_and_cells(grid))
+
+    xml = [
+        '<?xml version="1.0"?>\n',
+        _vtk_file_tag('UnstructuredGrid', compress),
+        '<UnstructuredGrid>\n',
+        '<Piece NumberOfPoints="{n_points}" NumberOfCells="{n_cells}">\n'
+        .format(n_points=grid.number_of_nodes,
+                n_cells=grid.number_of_patches),
+        _data_xml('PointData', point_data, appended),
+        _data_xml('CellData', cell_data, appended),
+    ]
+    xml += [
+        '<Points>\n',
+        appended.add('Points', geometry['Points']),
+        '</Points>\n',
+        '<Cells>\n',
+        appended.add('connectivity', geometry['connectivity']),
+        appended.add('offsets', geometry['offsets']),
+        appended.add('types', geometry['types']),
+        '</Cells>\n',
+    ]
+    xml += ['</Piece>\n', '</UnstructuredGrid>\n']
+
+    _write_xml_and_appended_data(stream, xml, appended)
+
+
+def _write_xml_and_appended_data(stream, xml, appended):
+    stream.write(''.join(xml).encode('utf-8'))
+    stream.write(b'<AppendedData encoding="raw">\n_')
+    appended.write(stream)
+    stream.write(b'\n</AppendedData>\n</VTKFile>\n')
+
+
+def _fields_to_write(grid, names=None):
+    """Names and values of the node and patch fields to write."""
+    if isinstance(names, six.string_types):
+        names = [names]
+
+    if names is None:
+        point_names = sorted(grid.at_node.keys())
+        cell_names = sorted(grid.at_patch.keys())
+    else:
+        point_names = [name for name in names if name in grid.at_node]
+        cell_names = [name for name in names if name in grid.at_patch]
+        bad_names = set(names) - set(point_names) - set(cell_names)
+        if len(bad_names) > 0:
+            raise ValueError('unknown field name(s): %s' %
+                             ','.join(sorted(bad_names)))
+
+    return ([(name, grid.at_node[name]) for name in point_names],
+            [(name, grid.at_patch[name]) for name in cell_names])
+
+
+def _vtk_extension(path, grid):
+    """Extension of the VTK file to write a grid to."""
+    from landlab import RasterModelGrid
+
+    ext = os.path.splitext(path)[1]
+    if ext not in ('.vti', '.vtu'):
+        if isinstance(grid, RasterModelGrid):
+            ext = '.vti'
+        else:
+            ext = '.vtu'
+    elif ext == '.vti' and not isinstance(grid, RasterModelGrid):
+        raise ValueError('only raster grids can be written as VTK image data')
+    return ext
+
+
+def _write_vtk_file(path, grid, point_data, cell_data, compress=False,
+                    level=6, geometry=None):
+    with open(path, 'wb') as stream:
+        if path.endswith('.vti'):
+            _write_image_data(stream, grid, point_data, cell_data,
+                              compress=compress, level=level)
+        else:
+            _write_unstructured_grid(stream, grid, point_data, cell_data,
+                                     compress=compress, level=level,
+                                     geometry=geometry)
+
+
+def write_vtk(path, grid, names=None, compress=False, level=6):
+    """Write landlab fields to a VTK XML file.
+
+    Node fields are written as point data, and patch fields as cell data.
+    A raster grid is written as VTK image data (``.vti``), unless *path*
+    ends with ``.vtu``, and all other grids as a VTK unstructured grid
+    (``.vtu``). The extension is added to *path* if it does not already
+    have it.
+
+    Parameters
+    ----------
+    path : str
+        Path to output file.
+    grid : ModelGrid
+        Grid that holds the fields.
+    names : iterable of str, optional
+        Names of the node and patch fields to include in the file. If not
+        provided, write all node and patch fields.
+    compress : boolean, optional
+        Compress the data with zlib.
+    level : int, optional
+        Level of compression, from 1 to 9.
+
+    Returns
+    -------
+    str
+        Path to the file that was written.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid, HexModelGrid
+    >>> from landlab.io.vtk import write_vtk
+    >>> from landlab.testing.tools import cdtemp
+
+    >>> grid = RasterModelGrid((4, 5))
+    >>> _ = grid.add_field('node', 'topographic__elevation', np.arange(20.))
+    >>> with cdtemp() as _:
+    ...     write_vtk('test', grid)
+    'test.vti'
+
+    >>> grid = HexModelGrid(3, 3)
+    >>> _ = grid.add_ones('patch', 'water__depth')
+    >>> with cdtemp() as _:
+    ...     write_vtk('test', grid, compress=True)
+    'test.vtu'
+    """
+    ext = _vtk_extension(path, grid)
+    if not path.endswith(ext):
+        path += ext
+
+    point_data, cell_data = _fields_to_write(grid, names)
+    _write_vtk_file(path, grid, point_data, cell_data, compress=compress,
+                    level=level)
+
+    return path
+
+
+def _write_pvd(path, data_sets):
+    """Write a ParaView collection of time steps."""
+    lines = ['<?xml version="1.0"?>',
+             '<VTKFile type="Collection" version="0.1" byte_order='
+             '"{byte_order}">'.format(
+                 byte_order=SYS_TO_VTK_ENDIAN[sys.byteorder]),
+             '<Collection>']
+    for (time, file_name) in data_sets:
+        lines.append('<DataSet timestep="{time!r}" group="" part="0" '
+                     'file={file_name}/>'.format(
+                         time=time, file_name=quoteattr(file_name)))
+    lines += ['</Collection>', '</VTKFile>', '']
+
+    with open(path, 'w') as pvd_file:
+        pvd_file.write('\n'.join(lines))
+
+
+class VtkTimeSeriesWriter(object):
+
+    """Write a time series of landlab fields to VTK.
+
+    Each call to *write* writes the current values of the fields to a new
+    VTK file, and adds it to a ParaView collection (``.pvd``) file. The
+    collection file is rewritten after every step, so it is always
+    complete. The files of each step are named after the collection file,
+    with the step number, and are written to the same directory.
+
+    The geometry of an unstructured grid (its points and cells) is encoded
+    once, and the same bytes written to every file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the collection file. ``.pvd`` is added if *path* does not
+        already end with it.
+    grid : ModelGrid
+        Grid that holds the fields.
+    names : iterable of str, optional
+        Names of the node and patch fields to include in the files. If not
+        provided, write all node and patch fields.
+    ext : {'.vti', '.vtu'}, optional
+        Type of VTK file to write. By default, ``.vti`` for raster grids
+        and ``.vtu`` for all other grids.
+    compress : boolean, optional
+        Compress the data with zlib.
+    level : int, optional
+        Level of compression, from 1 to 9.
+
+    Examples
+    --------
+    >>> import os
+    >>> import numpy as np
+    >>> from landlab import HexModelGrid
+    >>> from landlab.io.vtk import VtkTimeSeriesWriter
+    >>> from landlab.testing.tools import cdtemp
+
+    >>> grid = HexModelGrid(3, 3)
+    >>> z = grid.add_zeros('node', 'topographic__elevation')
+
+    >>> with cdtemp() as _:
+    ...     with VtkTimeSeriesWriter('run', grid, compress=True) as writer:
+    ...         for time in range(3):
+    ...             z += 1.
+    ...             _ = writer.write(time=time * 10.)
+    ...     files = sorted(os.listdir('.'))
+    >>> files
+    ['run.pvd', 'run_0000.vtu', 'run_0001.vtu', 'run_0002.vtu']
+    """
+
+    def __init__(self, path, grid, names=None, ext=None, compress=False,
+                 level=6):
+        if not path.endswith('.pvd'):
+            path += '.pvd'
+        ext = _vtk_extension(ext or '', grid)
+
+        point_data, cell_data = _fields_to_write(grid, names)
+        self._names = ([name for (name, _) in point_data],
+                       [name for (name, _) in cell_data])
+
+        if ext == '.vtu':
+            appended = _AppendedData(compress=compress, level=level)
+            self._geometry = dict(
+                (name, appended.encode(values))
+                for (name, values) in _points_and_cells(grid))
+        else:
+            self._geometry = None
+
+        self._path = path
+        self._prefix = os.path.splitext(path)[0]
+        self._ext = ext
+        self._grid = grid
+        self._compress = compress
+        self._level = level
+        self._data_sets = []
+
+    @property
+    def number_of_times(self):
+        """Number of time steps written."""
+        return len(self._data_sets)
+
+    def write(self, time=None):
+        """Write the current values of the fields as a new time step.
+
+        Parameters
+        ----------
+        time : float, optional
+            Time of the step. If not given, the index of the step.
+
+        Returns
+        -------
+        str
+            Path to the VTK file that was written.
+        """
+        if time is None:
+            time = self.number_of_times
+        path = '{prefix}_{count:04d}{ext}'.format(
+            prefix=self._prefix, count=self.number_of_times, ext=self._ext)
+
+        point_names, cell_names = self._names
+        _write_vtk_file(
+            path, self._grid,
+            [(name, self._grid.at_node[name]) for name in point_names],
+            [(name, self._grid.at_patch[name]) for name in cell_names],
+            compress=self._compress, level=self._level,
+            geometry=self._geometry)
+
+        self._data_sets.append((float(time), os.path.basename(path)))
+        _write_pvd(self._path, self._data_sets)
+
+        return path
+
+    def close(self):
+        """Finish the time series.
+
+        The collection file is always complete, so there is nothing left
+        to write.
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,182 @@
+#! /usr/bin/env python
+"""
+Unit tests for landlab.io.vtk.appended module.
+"""
+import zlib
+import xml.etree.ElementTree as ET
+
+import numpy as np
+from numpy.testing import assert_array_equal
+from nose.tools import assert_equal, assert_raises
+
+from landlab import RasterModelGrid, HexModelGrid, VoronoiDelaunayGrid
+from landlab.io.vtk import write_vtk, VtkTimeSeriesWriter
+from landlab.io.vtk.vtktypes import VTK_TO_NUMPY_TYPE
+from landlab.testing.tools import cdtemp
+
+
+_APPENDED_DATA_START = b'<AppendedData encoding="raw">\n_'
+
+
+def _read_block(data, offset, compressed):
+    if not compressed:
+        n_bytes = int(np.frombuffer(data, dtype=np.uint64, count=1,
+                                    offset=offset)[0])
+        return data[offset + 8:offset + 8 + n_bytes]
+
+    n_blocks = int(np.frombuffer(data, dtype=np.uint64, count=1,
+                                 offset=offset)[0])
+    header = np.frombuffer(data, dtype=np.uint64, count=3 + n_blocks,
+                           offset=offset).astype(int)
+    start = offset + 8 * (3 + n_blocks)
+    blocks = []
+    for size in header[3:]:
+        blocks.append(zlib.decompress(data[start:start + size]))
+        start += size
+    return b''.join(blocks)
+
+
+def _read_vtk(path):
+    """Read the arrays of a VTK file with appended data."""
+    with open(path, 'rb') as vtk_file:
+        contents = vtk_file.read()
+    (header, data) = contents.split(_APPENDED_DATA_START)
+    root = ET.fromstring(header + b'</VTKFile>')
+    compressed = root.get('compressor') == 'vtkZLibDataCompressor'
+
+    arrays = {}
+    for element in root.iter('DataArray'):
+        values = np.frombuffer(
+            _read_block(data, int(element.get('offset')), compressed),
+            dtype=VTK_TO_NUMPY_TYPE[element.get('type')])
+        n_components = int(element.get('NumberOfComponents'))
+        if n_components > 1:
+            values = values.reshape((-1, n_components))
+        arrays[element.get('Name')] = values
+    return root, arrays
+
+
+def test_raster_as_image_data():
+    grid = RasterModelGrid((4, 5), spacing=(2., 3.))
+    grid.add_field('node', 'topographic__elevation', np.arange(20.))
+    grid.add_field('patch', 'water__depth', np.arange(12, dtype=np.int32))
+
+    with cdtemp() as _:
+        path = write_vtk('test', grid)
+        root, arrays = _read_vtk(path)
+
+    assert_equal(path, 'test.vti')
+    assert_equal(root.get('type'), 'ImageData')
+    image = root.find('ImageData')
+    assert_equal(image.get('WholeExtent'), '0 4 0 3 0 0')
+    assert_equal(image.get('Spacing'), '3.0 2.0 1.0')
+    assert_array_equal(arrays['topographic__elevation'], np.arange(20.))
+    assert_array_equal(arrays['water__depth'], np.arange(12))
+    assert_equal(
+        root.find('ImageData/Piece/CellData/DataArray').get('Name'),
+        'water__depth')
+
+
+def test_raster_as_unstructured_grid():
+    grid = RasterModelGrid((3, 4))
+    grid.add_field('node', 'topographic__elevation', np.arange(12.))
+
+    with cdtemp() as _:
+        path = write_vtk('test.vtu', grid)
+        root, arrays = _read_vtk(path)
+
+    assert_equal(root.get('type'), 'UnstructuredGrid')
+    assert_array_equal(arrays['Points'][:, 0], grid.node_x)
+    assert_array_equal(arrays['Points'][:, 1], grid.node_y)
+    assert_array_equal(arrays['connectivity'],
+                       grid.nodes_at_patch.reshape((-1, )))
+    assert_array_equal(arrays['offsets'], [4, 8, 12, 16, 20, 24])
+    assert_array_equal(arrays['types'], [9] * 6)
+
+
+def test_hex_compressed():
+    grid = HexModelGrid(5, 4)
+    z = grid.add_field('node', 'topographic__elevation',
+                       np.random.rand(grid.number_of_nodes))
+    grid.add_field('node', 'is_wet', z > .5)
+
+    for compress in (False, True):
+        with cdtemp() as _:
+            path = write_vtk('test', grid, compress=compress)
+            root, arrays = _read_vtk(path)
+
+        assert_equal(path, 'test.vtu')
+        assert_array_equal(arrays['topographic__elevation'], z)
+        assert_array_equal(arrays['is_wet'], z > .5)
+        assert_array_equal(arrays['types'], [5] * grid.number_of_patches)
+        assert_equal(
+            root.find('UnstructuredGrid/Piece').get('NumberOfCells'),
+            str(grid.number_of_patches))
+
+
+def test_compressed_in_blocks():
+    grid = RasterModelGrid((400, 400))
+    z = grid.add_field('node', 'topographic__elevation',
+                       np.random.rand(grid.number_of_nodes))
+
+    with cdtemp() as _:
+        _, arrays = _read_vtk(write_vtk('test', grid, compress=True))
+
+    assert_array_equal(arrays['topographic__elevation'], z)
+
+
+def test_voronoi():
+    x = np.random.rand(30)
+    y = np.random.rand(30)
+    grid = VoronoiDelaunayGrid(x, y)
+    grid.add_field('node', 'topographic__elevation', x + y)
+
+    with cdtemp() as _:
+        _, arrays = _read_vtk(write_vtk('test', grid))
+
+    assert_array_equal(arrays['topographic__elevation'], x + y)
+    assert_equal(arrays['offsets'][-1], arrays['connectivity'].size)
+
+
+def test_names_keyword():
+    grid = RasterModelGrid((3, 4))
+    grid.add_ones('node', 'topographic__elevation')
+    grid.add_ones('node', 'air__temperature')
+
+    with cdtemp() as _:
+        _, arrays = _read_vtk(write_vtk('test', grid,
+                                        names='air__temperature'))
+        assert_raises(ValueError, write_vtk, 'test', grid,
+                      names=['not_a_field'])
+    assert_equal(list(arrays), ['air__temperature'])
+
+
+def test_vti_with_hex_grid():
+    grid = HexModelGrid(3, 3)
+    with cdtemp() as _:
+        assert_raises(ValueError, write_vtk, 'test.vti', grid)
+
+
+def test_time_series():
+    grid = HexModelGrid(4, 4)
+    z = grid.add_zeros('node', 'topographic__elevation')
+
+    with cdtemp() as _:
+        with VtkTimeSeriesWriter('run.pvd', grid, compress=True) as writer:
+            for time in range(4):
+                z += 1.
+                writer.write(time=time * .5)
+        assert_equal(writer.number_of_times, 4)
+
+        collection = ET.parse('run.pvd').getroot()
+        data_sets = collection.findall('Collection/DataSet')
+        assert_equal([data_set.get('file') for data_set in data_sets],
+                     ['run_%04d.vtu' % step for step in range(4)])
+        assert_equal([float(data_set.get('timestep'))
+                      for data_set in data_sets], [0., .5, 1., 1.5])
+
+        for step in range(4):
+            _, arrays = _read_vtk('run_%04d.vtu' % step)
+            assert_array_equal(arrays['topographic__elevation'],
+                               np.full(grid.number_of_nodes, step + 1.))
+            assert_array_equal(arrays['Points'][:, 0], grid.node_x)
@@ -0,0 +1,50 @@
+#! /usr/bin/env python
+"""
+Unit tests for lazy imports at import of landlab.
+"""
+import os
+import subprocess
+import sys
+
+from nose.tools import assert_equal
+
+import landlab
+
+
+_LAZY_MODULES = ('matplotlib', 'nose', 'netCDF4', 'scipy.spatial', 'yaml',
+                 'landlab.plot', 'landlab.io.netcdf')
+
+
+def _modules_imported_with(statement):
+    script = '; '.join([
+        'import sys',
+        statement,
+        'print(" ".join(name for name in {names!r} '
+        'if name in sys.modules))'.format(names=_LAZY_MODULES)])
+
+    # Run from the directory that contains landlab, so that it is imported
+    # whatever the current directory.
+    output = subprocess.check_output(
+        [sys.executable, '-c', script],
+        cwd=os.path.dirname(os.path.dirname(landlab.__file__)))
+    return output.decode().split()
+
+
+def test_import_landlab():
+    """Test heavy modules are not imported with landlab."""
+    assert_equal(_modules_imported_with('import landlab'), [])
+
+
+def test_import_grid():
+    """Test heavy modules are not imported by creating a grid."""
+    assert_equal(_modules_imported_with(
+        'from landlab import RasterModelGrid; RasterModelGrid((3, 4))'), [])
+
+
+def test_lazy_attributes():
+    from landlab.plot import imshow_grid
+    from landlab.testing.nosetester import LandlabTester
+
+    assert_equal(landlab.imshow_grid, imshow_grid)
+    assert_equal(landlab.LandlabTester, LandlabTester)
+    assert_equal(landlab.plot.imshow_grid, imshow_grid)
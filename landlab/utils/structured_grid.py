@@ -406,7 +406,8 @@ def interior_iter(shape):
 
 def interior_nodes(shape):
     """Array of interior nodes."""
-    return np.fromiter(interior_iter(shape), dtype=np.int)
+    ids = np.arange(shape[0] * shape[1], dtype=np.int).reshape(shape)
+    return ids[1:-1, 1:-1].reshape((-1, ))
 
 
 def node_coords(shape, *args):
@@ -1620,11 +1621,8 @@ def node_index_with_halo(shape, halo_indices=BAD_INDEX_VALUE):
 
     ids = np.empty(shape_with_halo, dtype=np.int)
 
-    (interiors, boundaries) = (interior_nodes(shape_with_halo),
-                               boundary_nodes(shape_with_halo))
-
-    ids.flat[interiors] = range(interior_node_count(shape_with_halo))
-    ids.flat[boundaries] = halo_indices
+    ids.flat[boundary_nodes(shape_with_halo)] = halo_indices
+    ids[1:-1, 1:-1] = np.arange(shape[0] * shape[1]).reshape(shape)
 
     return ids
 
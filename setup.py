@@ -26,6 +26,20 @@ ext_modules = [
               ['landlab/components/stream_power/cfuncs.pyx']),
     Extension('landlab.components.drainage_density.cfuncs',
               ['landlab/components/drainage_density/cfuncs.pyx']),
+    Extension('landlab.components.overland_flow.cfuncs',
+              ['landlab/components/overland_flow/cfuncs.pyx']),
+    Extension('landlab.components.soil_moisture.cfuncs',
+              ['landlab/components/soil_moisture/cfuncs.pyx']),
+    Extension('landlab.components.vegetation_dynamics.cfuncs',
+              ['landlab/components/vegetation_dynamics/cfuncs.pyx']),
+    Extension('landlab.components.ecohydrology.cfuncs',
+              ['landlab/components/ecohydrology/cfuncs.pyx']),
+    Extension('landlab.components.chi_index.cfuncs',
+              ['landlab/components/chi_index/cfuncs.pyx']),
+    Extension('landlab.components.steepness_index.cfuncs',
+              ['landlab/components/steepness_index/cfuncs.pyx']),
+    Extension('landlab.io.cfuncs',
+              ['landlab/io/cfuncs.pyx']),
     Extension('landlab.utils.ext.jaggedarray',
               ['landlab/utils/ext/jaggedarray.pyx']),
     Extension('landlab.graph.structured_quad.ext.at_node',